@@ -14,6 +14,11 @@ from werkzeug.middleware.proxy_fix import ProxyFix
 from .commands.user_commands import create_user, create_superadmin, rotate_superadmin_password
 from .commands.setup_commands import setup_command
 from .commands.seed_commands import seed_command
+from .commands.log_commands import logs_archive_command
+from .commands.counter_commands import recount_submissions_command
+from .commands.search_commands import search_reindex
+from .commands.dedup_commands import dedup_reindex
+from .commands.agreement_commands import agreement_refresh
 
 
 from app.routes import register_blueprints
@@ -24,6 +29,7 @@ load_dotenv()
 # Import configuration after loading .env
 from .config import config, Config
 from .extensions import jwt, db, migrate, ma
+from app.utils.db_engine import init_db_engine, attach_db_engine
 from .security import init_jwt_callbacks
 from .models import *
 from app.models.enumerations import Role
@@ -131,7 +137,9 @@ def create_app(config_name=None):
         app.wsgi_app = ProxyFix(app.wsgi_app, x_for=num_proxies, x_proto=num_proxies, x_host=num_proxies, x_port=num_proxies, x_prefix=num_proxies)
         app.logger.info("ProxyFix enabled for %d proxies", num_proxies)
     
+    init_db_engine(app, db)
     db.init_app(app)
+    attach_db_engine(app, db)
     migrate.init_app(app, db)
     ma.init_app(app)
     jwt.init_app(app)
@@ -141,6 +149,11 @@ def create_app(config_name=None):
     app.cli.add_command(rotate_superadmin_password)
     app.cli.add_command(setup_command)
     app.cli.add_command(seed_command)
+    app.cli.add_command(logs_archive_command)
+    app.cli.add_command(recount_submissions_command)
+    app.cli.add_command(search_reindex)
+    app.cli.add_command(dedup_reindex)
+    app.cli.add_command(agreement_refresh)
 
     # ------------------------------------------------------------------
     # Logging & Access log middleware
@@ -149,6 +162,33 @@ def create_app(config_name=None):
     def _log_request():
         log_structured("request", method=request.method, path=request.path, ip=request.remote_addr, args=dict(request.args))
 
+    # ------------------------------------------------------------------
+    # Read-your-writes pinning for replica reads
+    # A client that wrote within REPLICA_READ_YOUR_WRITES_SECONDS keeps its
+    # opt-in replica reads on the primary (see app.extensions.replica_reads).
+    # ------------------------------------------------------------------
+    RYW_COOKIE = 'db_rw_until'
+
+    @app.before_request
+    def _pin_primary_after_write():
+        if not app.config.get('SQLALCHEMY_BINDS', {}).get('replica'):
+            return
+        try:
+            until = float(request.cookies.get(RYW_COOKIE, 0) or 0)
+        except ValueError:
+            until = 0
+        g.db_primary_pinned = until > datetime.now(timezone.utc).timestamp()
+
+    @app.after_request
+    def _stamp_recent_write(resp):
+        if getattr(g, 'db_wrote', False) and app.config.get('SQLALCHEMY_BINDS', {}).get('replica'):
+            window = int(app.config.get('REPLICA_READ_YOUR_WRITES_SECONDS', 5) or 0)
+            if window > 0:
+                until = datetime.now(timezone.utc).timestamp() + window
+                resp.set_cookie(RYW_COOKIE, f"{until:.3f}", max_age=window, httponly=True,
+                                samesite='Lax', secure=app.config.get('JWT_COOKIE_SECURE', True))
+        return resp
+
     @app.after_request
     def _log_response(resp):
         # log_structured("response", method=request.method, path=request.path, status=resp.status_code)
@@ -0,0 +1,42 @@
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+
+from app.extensions import db
+from app.models.enumerations import GradingFor
+from app.services.agreement_service import refresh_agreement
+from app.utils.model_utils.review_phase_utils import TARGETS
+
+
+@click.command('agreement-refresh')
+@click.option(
+    '--entity',
+    'entities',
+    multiple=True,
+    type=click.Choice([entity_type.value for entity_type in TARGETS]),
+    help='Entity type to refresh (repeatable); defaults to all.',
+)
+@click.option('--force', is_flag=True, help='Recompute every scope, not only those with new grades.')
+@with_appcontext
+def agreement_refresh(entities, force):
+    """Recompute inter-rater agreement statistics for scopes with new grades.
+
+    Safe to run from cron: scopes whose gradings are unchanged since the last
+    run are skipped, and each recomputed scope commits on its own.
+    """
+    def progress(entity_type, scope):
+        cycle_id, review_phase, verification_level = scope
+        click.echo(f'  {entity_type.value}: cycle {cycle_id} phase {review_phase} level {verification_level}')
+
+    try:
+        totals = refresh_agreement(
+            entity_types=[GradingFor(entity) for entity in entities] or None,
+            force=force,
+            on_scope=progress,
+        )
+    except Exception as e:
+        db.session.rollback()
+        current_app.logger.exception('agreement-refresh failed: %s', e)
+        raise click.ClickException(f'Agreement refresh failed: {e}')
+    summary = ', '.join(f'{key}={count}' for key, count in totals.items())
+    click.echo(f'✔ Inter-rater agreement refreshed ({summary})')
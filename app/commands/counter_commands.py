@@ -0,0 +1,24 @@
+import click
+from flask.cli import with_appcontext
+
+from app.extensions import db
+from app.models.SubmissionCounter import recount_submission_counters
+
+
+@click.command("recount-submissions")
+@with_appcontext
+def recount_submissions_command():
+    """Rebuild submission_counters from the abstracts, awards and best_papers tables.
+
+    ``flask setup`` runs this on deploy; run it again after any bulk SQL
+    maintenance that bypasses the ORM. Safe to run while the app is serving
+    traffic.
+    """
+    try:
+        totals = recount_submission_counters()
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        raise click.ClickException(f"Recount failed: {e}")
+    summary = ", ".join(f"{entity}={count}" for entity, count in totals.items())
+    click.echo(f"✔ Submission counters rebuilt ({summary})")
@@ -0,0 +1,40 @@
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+
+from app.extensions import db
+from app.models.SubmissionFingerprint import FINGERPRINTED_MODELS, rebuild_fingerprints
+from app.models.enumerations import GradingFor
+
+
+@click.command('dedup-reindex')
+@click.option(
+    '--entity',
+    'entities',
+    multiple=True,
+    type=click.Choice([entity_type.value for entity_type in FINGERPRINTED_MODELS]),
+    help='Entity type to rebuild (repeatable); defaults to all.',
+)
+@click.option('--batch-size', type=click.IntRange(min=1), default=500, show_default=True, help='Rows per transaction.')
+@with_appcontext
+def dedup_reindex(entities, batch_size):
+    """Rebuild the MinHash fingerprints and LSH buckets used for duplicate detection.
+
+    Run once after the tables are created and after any bulk SQL maintenance
+    that bypasses the ORM. Each batch commits on its own.
+    """
+    def progress(entity_type, done):
+        click.echo(f'  {entity_type.value}: {done} rows')
+
+    try:
+        totals = rebuild_fingerprints(
+            entity_types=[GradingFor(entity) for entity in entities] or None,
+            batch_size=batch_size,
+            on_batch=progress,
+        )
+    except Exception as e:
+        db.session.rollback()
+        current_app.logger.exception('dedup-reindex failed: %s', e)
+        raise click.ClickException(f'Fingerprint rebuild failed: {e}')
+    summary = ', '.join(f'{entity}={count}' for entity, count in totals.items())
+    click.echo(f'✔ Submission fingerprints rebuilt ({summary})')
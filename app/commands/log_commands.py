@@ -0,0 +1,36 @@
+import json
+
+import click
+from flask.cli import with_appcontext
+
+from app.utils.logging_utils import logger_manager
+
+
+@click.command("logs-archive")
+@click.option('--older-than-days', type=int, default=None,
+              help='Archive files not modified for this many days (defaults to LOGGING_AUTO_ARCHIVE_DAYS).')
+@click.option('--dest', 'destination_dir', default=None, help='Destination directory (defaults to LOGGING_ARCHIVE_DIR).')
+@click.option('--metrics/--no-metrics', default=True, help='Print archive metrics as JSON after the run.')
+@with_appcontext
+def logs_archive_command(older_than_days, destination_dir, metrics):
+    """Compress old log files into the archive directory.
+
+    Intended for cron / a maintenance container. Safe to run concurrently with
+    the app: a cross-process lock ensures only one archiver works at a time.
+    """
+    manager = logger_manager()
+    if older_than_days is None:
+        older_than_days = manager.auto_archive_after_days
+    if older_than_days is None:
+        click.echo("⚠ No --older-than-days given and LOGGING_AUTO_ARCHIVE_DAYS is not set; nothing to do.")
+        return
+
+    archives = manager.archive_logs(older_than_days=older_than_days, destination_dir=destination_dir)
+    stats = manager.archive_metrics()["process"]
+    if stats["skipped_locked_total"] and not stats["runs_total"]:
+        click.echo("ℹ Another process is archiving logs; skipped.")
+    else:
+        click.echo(f"✔ Archived {len(archives)} file(s) in {stats['last_duration_seconds']}s, "
+                   f"saved {stats['bytes_saved_total']} bytes.")
+    if metrics:
+        click.echo(json.dumps(manager.archive_metrics(), indent=2))
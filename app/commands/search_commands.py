@@ -1,66 +1,48 @@
 import click
 from flask import current_app
+from flask.cli import with_appcontext
+
 from app.extensions import db
+from app.models.SearchIndex import SEARCH_SOURCES, rebuild_search_vectors
+from app.models.enumerations import GradingFor
 
 
 @click.command('search-reindex')
-def search_reindex():
-    """Rebuild videos.search_vec for all rows (PostgreSQL only).
+@click.option(
+    '--entity',
+    'entities',
+    multiple=True,
+    type=click.Choice([entity_type.value for entity_type in SEARCH_SOURCES]),
+    help='Entity type to rebuild (repeatable); defaults to all.',
+)
+@click.option('--batch-size', type=click.IntRange(min=1), default=None, help='Rows per transaction.')
+@with_appcontext
+def search_reindex(entities, batch_size):
+    """Rebuild search_vec on abstracts, awards and best_papers (PostgreSQL only).
 
-    Safe to run multiple times; skips on non-Postgres. Logs number of updated rows.
+    Rows are updated in primary-key batches, each in its own transaction, so
+    the command is safe to run while the app is serving traffic and can be
+    re-run after an interruption. Skips on non-PostgreSQL engines.
     """
-    engine = db.engine
-    if getattr(engine, 'name', '').lower() != 'postgresql':
+    if db.engine.dialect.name != 'postgresql':
         current_app.logger.info('search-reindex: skipped (non-PostgreSQL engine)')
         click.echo('Skipped: non-PostgreSQL engine')
         return
-    try:
-        with engine.begin() as conn:
-            # Ensure videos.search_vec exists
-            has_col = False
-            try:
-                res = conn.execute(db.text("SELECT 1 FROM information_schema.columns WHERE table_name='videos' AND column_name='search_vec'"))
-                has_col = bool(res.scalar())
-            except Exception:
-                has_col = False
-            if not has_col:
-                current_app.logger.warning('search-reindex: videos.search_vec column missing; skipping')
-                click.echo('Skipped: videos.search_vec column missing')
-                return
+    batch_size = batch_size or current_app.config.get('SEARCH_REINDEX_BATCH_SIZE', 500)
 
-            # Detect unaccent availability
-            try:
-                res = conn.execute(db.text("SELECT 1 FROM pg_proc WHERE proname='unaccent' LIMIT 1"))
-                has_unaccent = bool(res.scalar())
-            except Exception:
-                has_unaccent = False
+    def progress(entity_type, done):
+        click.echo(f'  {entity_type.value}: {done} rows')
 
-            def wrap(expr: str) -> str:
-                return f"unaccent({expr})" if has_unaccent else expr
-
-            # Build UPDATE that aggregates category, tags, surgeons into a single TSV
-            sql = f"""
-                UPDATE videos v
-                SET search_vec = to_tsvector('simple',
-                    {wrap("coalesce(v.title,'')")} || ' ' ||
-                    {wrap("coalesce(v.description,'')")} || ' ' ||
-                    {wrap("coalesce(v.transcript,'')")} || ' ' ||
-                    coalesce((SELECT {wrap('c.name')} FROM categories c WHERE c.id = v.category_id),'') || ' ' ||
-                    coalesce((
-                        SELECT string_agg({wrap('t.name')}, ' ')
-                        FROM video_tags vt JOIN tags t ON t.id = vt.tag_id
-                        WHERE vt.video_id = v.uuid
-                    ), '') || ' ' ||
-                    coalesce((
-                        SELECT string_agg({wrap('s.name')}, ' ')
-                        FROM video_surgeons vs JOIN surgeons s ON s.id = vs.surgeon_id
-                        WHERE vs.video_id = v.uuid
-                    ), '')
-                )
-            """
-            res = conn.execute(db.text(sql))
-            current_app.logger.info('search-reindex: vectors rebuilt for videos (rowcount=%s)', getattr(res, 'rowcount', '?'))
-            click.echo(f'Reindexed videos.search_vec (rowcount={getattr(res, "rowcount", "?")})')
+    try:
+        totals = rebuild_search_vectors(
+            entity_types=[GradingFor(entity) for entity in entities] or None,
+            batch_size=batch_size,
+            on_batch=progress,
+        )
     except Exception as e:
+        db.session.rollback()
         current_app.logger.exception('search-reindex failed: %s', e)
-        click.echo(f'Error: {e}', err=True)
+        raise click.ClickException(f'Reindex failed: {e}')
+    summary = ', '.join(f'{entity}={count}' for entity, count in totals.items())
+    current_app.logger.info('search-reindex: vectors rebuilt (%s)', summary)
+    click.echo(f'✔ Search vectors rebuilt ({summary})')
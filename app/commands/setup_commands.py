@@ -3,11 +3,37 @@ from flask import current_app
 from flask.cli import with_appcontext
 from flask_migrate import upgrade as alembic_upgrade, stamp as alembic_stamp
 from app.extensions import db
+from app.models.SearchIndex import rebuild_search_vectors
+from app.models.SubmissionCounter import recount_submission_counters
 from app.models.User import User, UserRole
 from app.models.enumerations import Role
+from app.services.submission_status_service import invalidate_status_summaries
+from app.utils import metrics_cache
 from sqlalchemy import inspect as sa_inspect
 
 
+# Extensions the schema itself depends on, created before the Alembic upgrade
+# (autogenerated revisions do not emit CREATE EXTENSION):
+# - btree_gist: the cycle_windows exclusion constraint compares UUID and enum
+#   columns with ``=`` inside a GiST index.
+# - pg_trgm: the ``gin_trgm_ops`` indexes on users, authors, categories and
+#   submission titles (typeahead and search).
+REQUIRED_EXTENSIONS = ("btree_gist", "pg_trgm")
+
+
+def ensure_extension(engine, name):
+    """CREATE EXTENSION IF NOT EXISTS ``name``; returns the error on failure."""
+    try:
+        with engine.begin() as conn:
+            conn.execute(db.text(f'CREATE EXTENSION IF NOT EXISTS "{name}"'))
+    except Exception as e:
+        current_app.logger.warning("setup: could not create %s: %s", name, e)
+        click.echo(f"⚠ Could not create {name} extension: {e}")
+        return e
+    click.echo(f"✔ {name} extension ensured")
+    return None
+
+
 def create_user_if_not_exists(username, email, employee_id, mobile, password, roles):
     """Create a user with specified roles if they don't already exist."""
     try:
@@ -50,7 +76,8 @@ def create_user_if_not_exists(username, email, employee_id, mobile, password, ro
 
 
 @click.command("setup")
-@click.option("--reindex/--no-reindex", default=True, help="Rebuild FTS vectors after migrations (PostgreSQL only)")
+@click.option("--reindex/--no-reindex", default=True, help="Rebuild search_vec on abstracts, awards and best papers (PostgreSQL only)")
+@click.option("--recount/--no-recount", default=True, help="Rebuild submission_counters from the submission tables")
 @click.option("--create-unaccent/--no-create-unaccent", default=True, help="Ensure unaccent extension (PostgreSQL only)")
 @click.option("--create-superadmin/--no-create-superadmin", default=True, help="Create superadmin if none exists (uses env or provided password)")
 @click.option("--create-admin/--no-create-admin", default=True, help="Create admin user (development environment)")
@@ -63,16 +90,18 @@ def create_user_if_not_exists(username, email, employee_id, mobile, password, ro
 @click.option("--user-password", default=None, help="User password (falls back to USER_PASSWORD env)")
 @click.option("--viewer-password", default=None, help="Viewer password (falls back to VIEWER_PASSWORD env)")
 @with_appcontext
-def setup_command(reindex: bool, create_unaccent: bool, create_superadmin: bool, 
+def setup_command(reindex: bool, recount: bool, create_unaccent: bool, create_superadmin: bool, 
                   create_admin: bool, create_verifier: bool, create_user: bool, create_viewer: bool,
                   superadmin_password: str | None, admin_password: str | None, 
                   verifier_password: str | None, user_password: str | None, viewer_password: str | None):
     """One-shot project setup for fresh systems.
 
     - Upgrades DB schema to head (Alembic)
-    - Ensures unaccent extension (PostgreSQL)
+    - Ensures the extensions the schema needs, plus unaccent (PostgreSQL)
     - Creates user accounts from config if they don't exist
-    - Rebuilds videos.search_vec for all rows (PostgreSQL)
+    - Rebuilds search_vec on abstracts, awards and best papers (PostgreSQL)
+    - Rebuilds submission_counters, which status summaries and dashboard
+      totals read, from the submission tables
 
     Safe to run multiple times; all steps are idempotent.
     """
@@ -80,16 +109,14 @@ def setup_command(reindex: bool, create_unaccent: bool, create_superadmin: bool,
     engine_name = getattr(engine, 'name', '').lower()
     current_app.logger.info("setup: starting (engine=%s)", engine_name)
 
-    # 1) Ensure Postgres unaccent extension (if requested)
-    if engine_name == 'postgresql' and create_unaccent:
-        try:
-            with engine.begin() as conn:
-                conn.execute(db.text("CREATE EXTENSION IF NOT EXISTS unaccent"))
-            click.echo("✔ unaccent extension ensured")
-        except Exception as e:
-            # Non-fatal: migrations may still run; surface message
-            current_app.logger.warning("setup: could not create unaccent: %s", e)
-            click.echo(f"⚠ Could not create unaccent extension: {e}")
+    # 1) Ensure Postgres extensions: the required ones, then unaccent (if
+    # requested). Failures are reported but non-fatal; a missing required
+    # extension makes the upgrade below fail with the underlying error.
+    if engine_name == 'postgresql':
+        for name in REQUIRED_EXTENSIONS:
+            ensure_extension(engine, name)
+        if create_unaccent:
+            ensure_extension(engine, "unaccent")
 
     # 2) Upgrade schema to head
     try:
@@ -241,17 +268,29 @@ def setup_command(reindex: bool, create_unaccent: bool, create_superadmin: bool,
     # 8) Reindex FTS vectors (optional; Postgres only)
     if reindex and engine_name == 'postgresql':
         try:
-            with engine.begin() as conn:
-                res = conn.execute(db.text(
-                    """
-                    UPDATE videos v
-                    SET search_vec = compute_video_search_vec(v.uuid, v.title, v.description, v.transcript, v.category_id)
-                    """
-                ))
-                click.echo(f"✔ Reindexed videos.search_vec (rowcount={getattr(res, 'rowcount', '?')})")
+            totals = rebuild_search_vectors(
+                batch_size=current_app.config.get('SEARCH_REINDEX_BATCH_SIZE', 500),
+            )
+            summary = ', '.join(f'{entity}={count}' for entity, count in totals.items())
+            click.echo(f"✔ Search vectors rebuilt ({summary})")
         except Exception as e:
             # Non-fatal; keep setup overall successful
+            db.session.rollback()
             current_app.logger.warning('setup: reindex failed: %s', e)
             click.echo(f"⚠ Reindex failed: {e}")
 
+    # 9) Rebuild submission counters (a new table starts empty)
+    if recount:
+        try:
+            totals = recount_submission_counters()
+            db.session.commit()
+            invalidate_status_summaries()
+            metrics_cache.invalidate()
+            summary = ', '.join(f'{entity}={count}' for entity, count in totals.items())
+            click.echo(f"✔ Submission counters rebuilt ({summary})")
+        except Exception as e:
+            db.session.rollback()
+            current_app.logger.warning('setup: recount failed: %s', e)
+            click.echo(f"⚠ Recount failed: {e}")
+
     click.echo("✅ Setup complete")
@@ -52,6 +52,28 @@ class Config:
         'pool_recycle': 300,
     }
     
+    # Database engine profile (see app/utils/db_engine.py). Pool sizing is
+    # derived from the gunicorn process model unless explicitly overridden.
+    GUNICORN_WORKERS = get_int_env("GUNICORN_WORKERS", get_int_env("WEB_CONCURRENCY", 4))
+    GUNICORN_THREADS = get_int_env("GUNICORN_THREADS", 1)
+    DB_MAX_CONNECTIONS = get_int_env("DB_MAX_CONNECTIONS", 0)  # 0 = no global budget
+    DB_POOL_SIZE = get_int_env("DB_POOL_SIZE", 0)  # 0 = derive from workers/threads
+    DB_MAX_OVERFLOW = get_int_env("DB_MAX_OVERFLOW", -1)  # -1 = derive
+    DB_POOL_TIMEOUT = get_int_env("DB_POOL_TIMEOUT", 10)
+    DB_POOL_RECYCLE = get_int_env("DB_POOL_RECYCLE", 1800)
+    DB_POOL_PRE_PING = get_bool_env("DB_POOL_PRE_PING", True)
+    DB_PGBOUNCER_MODE = os.getenv("DB_PGBOUNCER_MODE", "")  # "transaction" behind PgBouncer
+    DB_STATEMENT_TIMEOUT_MS = get_int_env("DB_STATEMENT_TIMEOUT_MS", 30000)
+    DB_EXPORT_STATEMENT_TIMEOUT_MS = get_int_env("DB_EXPORT_STATEMENT_TIMEOUT_MS", 300000)
+    DB_SLOW_QUERY_MS = get_int_env("DB_SLOW_QUERY_MS", 0)  # 0 = slow-query log off
+    
+    # Read replica (optional). Opt-in reads (lists, dashboards, exports) use
+    # the "replica" bind; a client that wrote within the read-your-writes
+    # window keeps reading from the primary.
+    REPLICA_DATABASE_URI = os.getenv("REPLICA_DATABASE_URI", "").replace("postgres://", "postgresql://", 1)
+    SQLALCHEMY_BINDS = {"replica": REPLICA_DATABASE_URI} if REPLICA_DATABASE_URI else {}
+    REPLICA_READ_YOUR_WRITES_SECONDS = get_int_env("REPLICA_READ_YOUR_WRITES_SECONDS", 5)
+    
     # JWT Settings
     JWT_BLACKLIST_ENABLED = True
     JWT_BLACKLIST_TOKEN_CHECKS = ["access", "refresh"]
@@ -160,6 +182,15 @@ class Config:
     LOG_FILE = os.getenv("LOG_FILE", "/tmp/research_excellence_app.log")
     LOG_MAX_BYTES = get_int_env("LOG_MAX_BYTES", 10485760)  # 10MB
     LOG_BACKUP_COUNT = get_int_env("LOG_BACKUP_COUNT", 5)
+    # Category log pipeline: with LOGGING_ASYNC records are handed to one
+    # writer thread per process through a bounded queue (see LoggerManager).
+    LOGGING_ASYNC = get_bool_env("LOGGING_ASYNC", False)
+    LOGGING_QUEUE_SIZE = get_int_env("LOGGING_QUEUE_SIZE", 10000)
+    LOGGING_QUEUE_DROP_POLICY = os.getenv("LOGGING_QUEUE_DROP_POLICY", "drop")  # drop | block
+    # Log archiving runs outside requests: `flask logs-archive` (cron) or an
+    # in-process background thread; a file lock lets one process win per run.
+    LOGGING_AUTO_ARCHIVE_DAYS = os.getenv("LOGGING_AUTO_ARCHIVE_DAYS")
+    LOGGING_ARCHIVE_BACKGROUND = get_bool_env("LOGGING_ARCHIVE_BACKGROUND", False)
     
     # Email Configuration
     MAIL_SERVER = os.getenv("MAIL_SERVER", "smtp.gmail.com")
@@ -195,6 +226,24 @@ class Config:
     # Cache Configuration
     CACHE_TYPE = os.getenv("CACHE_TYPE", "simple")
     CACHE_DEFAULT_TIMEOUT = get_int_env("CACHE_DEFAULT_TIMEOUT", 300)
+    STATUS_SUMMARY_CACHE_SECONDS = get_int_env("STATUS_SUMMARY_CACHE_SECONDS", 10)  # 0 = no caching
+    CYCLE_CALENDAR_MAX_AGE = get_int_env("CYCLE_CALENDAR_MAX_AGE", 300)  # reload cached windows at least this often
+    
+    # Bulk review operations
+    BULK_REVIEW_MAX_IDS = get_int_env("BULK_REVIEW_MAX_IDS", 5000)
+    NOTIFY_ASYNC = get_bool_env("NOTIFY_ASYNC", True)  # deliver bulk mail/SMS on a background thread
+    AUTO_ASSIGN_MAX_PER_SUBMISSION = get_int_env("AUTO_ASSIGN_MAX_PER_SUBMISSION", 10)
+    AGREEMENT_AUTO_REFRESH = get_bool_env("AGREEMENT_AUTO_REFRESH", True)  # refresh agreement stats after grading commits
+
+    # Full-text search
+    SEARCH_TEXT_CONFIG = os.getenv("SEARCH_TEXT_CONFIG", "english")  # PostgreSQL text search configuration
+    SEARCH_REINDEX_BATCH_SIZE = get_int_env("SEARCH_REINDEX_BATCH_SIZE", 500)
+    TYPEAHEAD_CACHE_SIZE = get_int_env("TYPEAHEAD_CACHE_SIZE", 512)  # cached queries per worker; 0 disables
+    TYPEAHEAD_CACHE_SECONDS = get_int_env("TYPEAHEAD_CACHE_SECONDS", 30)
+    TYPEAHEAD_STATEMENT_TIMEOUT_MS = get_int_env("TYPEAHEAD_STATEMENT_TIMEOUT_MS", 300)  # latency budget per lookup
+    GRADING_TYPE_CACHE_MAX_AGE = get_int_env("GRADING_TYPE_CACHE_MAX_AGE", 300)  # reload cached criteria at least this often
+    RANKING_CACHE_SIZE = get_int_env("RANKING_CACHE_SIZE", 32)  # leaderboards (kind, cycle, phase) kept per worker
+    REFERENCE_DATA_MAX_AGE = get_int_env("REFERENCE_DATA_MAX_AGE", 300)  # reference-data snapshot reload / Cache-Control max-age
     
     @staticmethod
     def init_app(app):
@@ -302,6 +351,8 @@ class TestingConfig(Config):
     
     # Disable CSRF for testing
     WTF_CSRF_ENABLED = False
+    NOTIFY_ASYNC = False
+    AGREEMENT_AUTO_REFRESH = False
     
     # In-memory database for faster tests
     SQLALCHEMY_DATABASE_URI = os.getenv("TEST_DATABASE_URI", "sqlite:///:memory:")
@@ -1,7 +1,12 @@
 
+import time
+from contextlib import contextmanager
 
+from flask import g, has_request_context
 from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy.session import Session as _FlaskSession
 from flask_marshmallow import Marshmallow
+from sqlalchemy import event
 
 from faker import Faker
 from flask_migrate import Migrate
@@ -16,7 +21,74 @@ from flask_jwt_extended import JWTManager
 jwt = JWTManager()
 
 
-db = SQLAlchemy()
+# ------------------------------------------------------------------
+# Read-replica routing
+# ------------------------------------------------------------------
+# When SQLALCHEMY_BINDS contains a ``replica`` entry (REPLICA_DATABASE_URI),
+# code that opts in via ``replica_reads()`` sends its SELECTs there. Writes,
+# SELECT ... FOR UPDATE and any read issued after this session (or, via the
+# app-level cookie hook, this client) wrote recently stay on the primary so
+# callers always see their own writes.
+REPLICA_BIND = "replica"
+
+
+class RoutingSession(_FlaskSession):
+    """Flask-SQLAlchemy session that can route plain reads to a replica."""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and self._should_use_replica(clause):
+            engine = self._db.engines.get(REPLICA_BIND)
+            if engine is not None:
+                return engine
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+    def _should_use_replica(self, clause) -> bool:
+        if not self.info.get("replica_depth"):
+            return False
+        if clause is None or not getattr(clause, "is_select", False):
+            return False
+        if getattr(clause, "_for_update_arg", None) is not None:
+            return False
+        if self._flushing or self.new or self.dirty or self.deleted:
+            return False
+        return not wrote_recently(self)
+
+
+def wrote_recently(session) -> bool:
+    """True while read-your-writes requires ``session`` to stay on the primary."""
+    if session.info.get("last_write_at") is not None:
+        return True
+    return bool(has_request_context() and getattr(g, "db_primary_pinned", False))
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _mark_write(session, flush_context):
+    # Models flagged ``__replica_pin__ = False`` (e.g. audit rows) are never
+    # read back through replica-routed code, so writing them does not pin.
+    touched = list(session.new) + list(session.dirty) + list(session.deleted)
+    if touched and all(getattr(obj, "__replica_pin__", True) is False for obj in touched):
+        return
+    session.info["last_write_at"] = time.monotonic()
+    if has_request_context():
+        g.db_wrote = True
+
+
+@contextmanager
+def replica_reads(session=None):
+    """Route reads issued inside the block (or decorated view) to the replica.
+
+    Nesting is supported; without a configured replica bind it is a no-op.
+    """
+    sess = session if session is not None else db.session
+    info = sess.info
+    info["replica_depth"] = info.get("replica_depth", 0) + 1
+    try:
+        yield sess
+    finally:
+        info["replica_depth"] -= 1
+
+
+db = SQLAlchemy(session_options={"class_": RoutingSession})
 migrate = Migrate(db=db)
 
 ma = Marshmallow()
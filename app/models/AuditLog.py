@@ -5,6 +5,8 @@ from app.extensions import db
 
 class AuditLog(db.Model):
     __tablename__ = 'audit_logs'
+    # Audit writes do not pin replica reads to the primary (app.extensions).
+    __replica_pin__ = False
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     event = db.Column(db.String(64), nullable=False)
     user_id = db.Column(db.String(64), nullable=True)  # actor
@@ -2,18 +2,24 @@ from datetime import datetime
 import uuid
 
 from sqlalchemy import (
+    Boolean,
     CheckConstraint,
+    ClauseElement,
+    ColumnElement,
     Computed,
+    Date,
     Enum as SqlEnum,
     Identity,
     Index,
     UniqueConstraint,
     and_,
     event,
-    select,
+    literal,
 )
-from sqlalchemy.dialects.postgresql import DATERANGE, ExcludeConstraint, UUID
-from sqlalchemy.orm import synonym, validates
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.visitors import InternalTraversal
+from sqlalchemy.dialects.postgresql import DATERANGE, TSVECTOR, ExcludeConstraint, UUID
+from sqlalchemy.orm import deferred, object_session, synonym, validates
 
 from ..extensions import db
 from app.models.enumerations import CyclePhase, GradingFor, Status
@@ -70,8 +76,56 @@ class Cycle(db.Model):
     )
 
 
+class WindowOpenOn(ColumnElement):
+    """``win @> :date`` on PostgreSQL, a plain date-range comparison elsewhere.
+
+    The PostgreSQL form can use the GiST index behind the cycle window
+    exclusion constraint.
+    """
+
+    __visit_name__ = "window_open_on"
+    inherit_cache = True
+    type = Boolean()
+    _traverse_internals = [
+        ("win", InternalTraversal.dp_clauseelement),
+        ("start", InternalTraversal.dp_clauseelement),
+        ("end", InternalTraversal.dp_clauseelement),
+        ("on", InternalTraversal.dp_clauseelement),
+    ]
+
+    def __init__(self, win, start, end, on):
+        self.win = win
+        self.start = start
+        self.end = end
+        self.on = literal(on, Date()) if not isinstance(on, ClauseElement) else on
+
+
+@compiles(WindowOpenOn)
+def _compile_window_open_on(element, compiler, **kw):
+    condition = and_(element.start <= element.on, element.end >= element.on)
+    return f"({compiler.process(condition, **kw)})"
+
+
+@compiles(WindowOpenOn, "postgresql")
+def _compile_window_open_on_pg(element, compiler, **kw):
+    return f"{compiler.process(element.win, **kw)} @> {compiler.process(element.on, **kw)}"
+
+
 class CycleWindow(db.Model):
     __tablename__ = "cycle_windows"
+    __table_args__ = (
+        # Windows of the same cycle and phase may not overlap. The GiST index
+        # behind the constraint also serves ``win @> :date`` lookups.
+        # Comparing UUID and enum columns with ``=`` in GiST needs btree_gist,
+        # which ``flask setup`` creates before the migrations run.
+        ExcludeConstraint(
+            ("cycle_id", "="),
+            ("phase", "="),
+            ("win", "&&"),
+            name="ex_cycle_windows_no_overlap",
+            using="gist",
+        ),
+    )
 
     id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
 
@@ -105,8 +159,40 @@ class CycleWindow(db.Model):
         onupdate=db.func.current_timestamp(),
     )
 
+    @classmethod
+    def open_on(cls, on) -> WindowOpenOn:
+        """Filter for windows whose date range contains ``on``."""
+        return WindowOpenOn(cls.win, cls.start_date, cls.end_date, on)
+
+
+def trigram_index(table: str, column: str) -> Index:
+    """GIN trigram index; serves ``ILIKE`` prefix/substring and similarity lookups on PostgreSQL.
+
+    The ``pg_trgm`` operator class is created by ``flask setup`` before the
+    migrations run.
+    """
+    return Index(
+        f"ix_{table}_{column}_trgm",
+        column,
+        postgresql_using="gin",
+        postgresql_ops={column: "gin_trgm_ops"},
+    )
+
+
+def _search_indexes(table: str):
+    """GIN indexes for the full-text vector and trigram title matching."""
+    return (
+        Index(f"ix_{table}_search_vec", "search_vec", postgresql_using="gin"),
+        trigram_index(table, "title"),
+    )
+
+
 class Author(db.Model):
     __tablename__ = "authors"
+    __table_args__ = (
+        trigram_index("authors", "name"),
+        trigram_index("authors", "email"),
+    )
 
     id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = db.Column(db.String(200), nullable=False)
@@ -124,6 +210,10 @@ class Author(db.Model):
     best_papers = db.relationship("BestPaper", back_populates="author", lazy=True)
 
 
+# Serves the case-insensitive identity lookup in get_or_create_author.
+Index("ix_authors_lower_name_email", db.func.lower(Author.name), db.func.lower(Author.email))
+
+
 user_categories = db.Table(
     "user_categories",
     db.Column(
@@ -193,6 +283,7 @@ user_award_categories = db.Table(
 
 class Category(db.Model):
     __tablename__ = "categories"
+    __table_args__ = (trigram_index("categories", "name"),)
 
     id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = db.Column(db.String(100), nullable=False, unique=True)
@@ -207,8 +298,16 @@ class Category(db.Model):
     )
 
 
+
+
+def _search_vec_column():
+    # Maintained by app.models.SearchIndex; deferred so listings never load it.
+    return deferred(db.Column(TSVECTOR().with_variant(db.Text(), "sqlite"), nullable=True))
+
+
 class Abstracts(db.Model):
     __tablename__ = "abstracts"
+    __table_args__ = _search_indexes("abstracts")
 
     id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     title = db.Column(db.String(500), nullable=False)
@@ -294,6 +393,8 @@ class Abstracts(db.Model):
 
     consent = db.Column(db.Boolean, default=False, nullable=False)
 
+    search_vec = _search_vec_column()
+
     verifiers = db.relationship(
         "User",
         secondary="abstract_verifiers",
@@ -400,6 +501,7 @@ class AbstractCoordinators(db.Model):
 
 class PaperCategory(db.Model):
     __tablename__ = "paper_categories"
+    __table_args__ = (trigram_index("paper_categories", "name"),)
 
     id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = db.Column(db.String(100), nullable=False, unique=True)
@@ -425,6 +527,7 @@ class PaperCategory(db.Model):
 
 class Awards(db.Model):
     __tablename__ = "awards"
+    __table_args__ = _search_indexes("awards")
 
     id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     title = db.Column(db.String(500), nullable=False)
@@ -521,6 +624,8 @@ class Awards(db.Model):
         unique=True,
     )
 
+    search_vec = _search_vec_column()
+
     complete_pdf_path = synonym("full_paper_path")
     complete_pdf = synonym("full_paper_path")
     covering_letter_pdf_path = synonym("forwarding_letter_path")
@@ -599,6 +704,7 @@ class AwardCoordinators(db.Model):
 
 class BestPaper(db.Model):
     __tablename__ = "best_papers"
+    __table_args__ = _search_indexes("best_papers")
 
     id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     title = db.Column(db.String(500), nullable=False)
@@ -698,6 +804,8 @@ class BestPaper(db.Model):
         unique=True,
     )
 
+    search_vec = _search_vec_column()
+
     complete_pdf_path = synonym("full_paper_path")
     complete_pdf = synonym("full_paper_path")
     covering_letter_pdf_path = synonym("forwarding_letter_path")
@@ -717,6 +825,7 @@ class BestPaper(db.Model):
         server_default="1",
     )
 
+
 class BestPaperVerifiers(db.Model):
     __tablename__ = "best_paper_verifiers"
 
@@ -787,6 +896,13 @@ class GradingType(db.Model):
         server_default="0",
     )
     max_score = db.Column(db.Integer, nullable=False)
+    # Relative weight of the criterion in a submission's total (see ranking_service).
+    weight = db.Column(
+        db.Float,
+        nullable=False,
+        default=1.0,
+        server_default="1",
+    )
     grading_for = db.Column(SqlEnum(GradingFor), nullable=False)
     verification_level = db.Column(
         db.Integer,
@@ -816,6 +932,14 @@ class GradingType(db.Model):
 
 class Grading(db.Model):
     __tablename__ = "gradings"
+    # Serve the grading-completeness anti-join (submission, phase, verifier, type)
+    # and, being unique, the grading-sheet upsert's ON CONFLICT target: one grade
+    # per verifier, criterion and phase.
+    __table_args__ = (
+        Index("ix_gradings_abstract_completeness", "abstract_id", "review_phase", "graded_by_id", "grading_type_id", unique=True),
+        Index("ix_gradings_award_completeness", "award_id", "review_phase", "graded_by_id", "grading_type_id", unique=True),
+        Index("ix_gradings_best_paper_completeness", "best_paper_id", "review_phase", "graded_by_id", "grading_type_id", unique=True),
+    )
 
     id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     score = db.Column(db.Integer, nullable=False)
@@ -898,6 +1022,17 @@ class Grading(db.Model):
     created_at = synonym("graded_on")
     updated_at = synonym("updated_on")
 
+    def _grading_type_info(self):
+        """The criterion being graded: the loaded relationship, else the shared cache."""
+        grading_type = self.__dict__.get("grading_type")
+        if grading_type is not None:
+            return grading_type
+        if self.grading_type_id is None:
+            return None
+        from app.utils import grading_type_cache
+
+        return grading_type_cache.get(self.grading_type_id)
+
     @validates("score")
     def validate_score(self, key, value):
         if value is None:
@@ -905,14 +1040,8 @@ class Grading(db.Model):
         if value < 0:
             raise ValueError("A grade score cannot be negative.")
 
-        max_score = None
-        grading_type = getattr(self, "grading_type", None)
-        if grading_type is not None:
-            max_score = grading_type.max_score
-        elif self.grading_type_id is not None:
-            grading_type = db.session.get(GradingType, self.grading_type_id)
-            if grading_type is not None:
-                max_score = grading_type.max_score
+        grading_type = self._grading_type_info()
+        max_score = grading_type.max_score if grading_type is not None else None
 
         if max_score is not None and value > max_score:
             raise ValueError("A grade score cannot exceed the configured maximum.")
@@ -924,9 +1053,7 @@ class Grading(db.Model):
         if value is None or value <= 0:
             raise ValueError("A verification level must be a positive integer.")
 
-        grading_type = getattr(self, "grading_type", None)
-        if grading_type is None and self.grading_type_id is not None:
-            grading_type = db.session.get(GradingType, self.grading_type_id)
+        grading_type = self._grading_type_info()
 
         if grading_type is not None and grading_type.verification_level != value:
             raise ValueError(
@@ -958,30 +1085,16 @@ def _ensure_submission_window(connection, submission_model):
         # Fallback to general submission for other types
         required_phase = CyclePhase.SUBMISSION
 
-    stmt = select(CycleWindow.id).where(
-        CycleWindow.cycle_id == cycle_id,
-        CycleWindow.phase == required_phase,
-        CycleWindow.start_date <= submission_date,
-        CycleWindow.end_date >= submission_date,
-    )
+    # Served from the in-process window calendar; see app.utils.cycle_calendar.
+    # A general SUBMISSION window still admits every kind for backward
+    # compatibility.
+    from app.utils import cycle_calendar
 
-    if connection.execute(stmt).first() is None:
-        # If specific phase window is not found, check if general submission window exists
-        general_stmt = select(CycleWindow.id).where(
-            CycleWindow.cycle_id == cycle_id,
-            CycleWindow.phase == CyclePhase.SUBMISSION,
-            CycleWindow.start_date <= submission_date,
-            CycleWindow.end_date >= submission_date,
+    phases = (required_phase, CyclePhase.SUBMISSION)
+    if cycle_calendar.open_window_id(connection, cycle_id, phases, submission_date) is None:
+        raise ValueError(
+            f"Submissions are allowed only during the {required_phase} period for the cycle.",
         )
-        
-        if connection.execute(general_stmt).first() is None:
-            raise ValueError(
-                f"Submissions are allowed only during the {required_phase} period for the cycle.",
-            )
-        else:
-            # If general window exists but specific doesn't, allow submission
-            # This maintains backward compatibility
-            pass
 
 
 @event.listens_for(Abstracts, "before_insert")
@@ -997,3 +1110,22 @@ def enforce_award_submission_window(mapper, connection, target):
 @event.listens_for(BestPaper, "before_insert")
 def enforce_best_paper_submission_window(mapper, connection, target):
     _ensure_submission_window(connection, target)
+
+
+@event.listens_for(CycleWindow, "after_insert")
+@event.listens_for(CycleWindow, "after_update")
+@event.listens_for(CycleWindow, "after_delete")
+@event.listens_for(Cycle, "after_delete")
+def invalidate_cycle_calendar(mapper, connection, target):
+    from app.utils import cycle_calendar
+
+    cycle_calendar.mark_changed(object_session(target))
+
+
+@event.listens_for(GradingType, "after_insert")
+@event.listens_for(GradingType, "after_update")
+@event.listens_for(GradingType, "after_delete")
+def invalidate_grading_type_cache(mapper, connection, target):
+    from app.utils import grading_type_cache
+
+    grading_type_cache.mark_changed(object_session(target))
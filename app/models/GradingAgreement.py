@@ -0,0 +1,83 @@
+"""Stored inter-rater agreement statistics.
+
+Statistics are computed in batch by ``app.services.agreement_service`` for
+each scope, meaning one (entity type, cycle, review phase, verification
+level) set of gradings. They are read back by the agreement endpoint.
+``GradingAgreementScope`` records which gradings each scope was computed
+from, so ``flask agreement-refresh`` only recomputes scopes whose gradings
+changed since the last run.
+"""
+from __future__ import annotations
+
+import uuid
+
+from sqlalchemy import Enum as SqlEnum
+from sqlalchemy.dialects.postgresql import UUID
+
+from ..extensions import db
+from app.models.enumerations import GradingFor
+
+
+class GradingAgreementScope(db.Model):
+    __tablename__ = "grading_agreement_scopes"
+
+    entity_type = db.Column(SqlEnum(GradingFor), primary_key=True)
+    cycle_id = db.Column(UUID(as_uuid=True), primary_key=True)
+    review_phase = db.Column(db.Integer, primary_key=True)
+    verification_level = db.Column(db.Integer, primary_key=True)
+    # Stamp of the gradings the stored statistics were computed from.
+    grading_count = db.Column(db.Integer, nullable=False)
+    graded_through = db.Column(db.DateTime, nullable=True)
+    computed_at = db.Column(db.DateTime, nullable=False, default=db.func.current_timestamp())
+
+
+class GradingAgreement(db.Model):
+    """Krippendorff's alpha (interval) and ICC(1) for one slice of a scope.
+
+    ``category_id`` / ``grading_type_id`` are NULL for the slice pooling all
+    categories / all criteria (pooled criteria are compared on their 0-100
+    scaled scores, one unit per submission and criterion).
+    """
+    __tablename__ = "grading_agreements"
+    __table_args__ = (
+        db.Index(
+            "ix_grading_agreements_scope",
+            "entity_type", "cycle_id", "review_phase", "verification_level",
+        ),
+    )
+
+    id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    entity_type = db.Column(SqlEnum(GradingFor), nullable=False)
+    cycle_id = db.Column(UUID(as_uuid=True), nullable=False)
+    review_phase = db.Column(db.Integer, nullable=False)
+    verification_level = db.Column(db.Integer, nullable=False)
+    category_id = db.Column(UUID(as_uuid=True), nullable=True)
+    grading_type_id = db.Column(UUID(as_uuid=True), nullable=True)
+
+    alpha = db.Column(db.Float, nullable=True)  # NULL when fewer than two pairable ratings vary
+    icc = db.Column(db.Float, nullable=True)
+    units = db.Column(db.Integer, nullable=False)  # units rated by at least two graders
+    graders = db.Column(db.Integer, nullable=False)
+    ratings = db.Column(db.Integer, nullable=False)
+    computed_at = db.Column(db.DateTime, nullable=False, default=db.func.current_timestamp())
+
+
+class GraderDisagreement(db.Model):
+    """How far one grader's scores sit from their co-graders' on shared units.
+
+    ``deviation`` is the mean absolute difference (0-100 scale) between the
+    grader's score and the mean of the other graders of the same submission
+    and criterion; ``bias`` is the signed mean (negative = harsher).
+    """
+    __tablename__ = "grader_disagreements"
+
+    entity_type = db.Column(SqlEnum(GradingFor), primary_key=True)
+    cycle_id = db.Column(UUID(as_uuid=True), primary_key=True)
+    review_phase = db.Column(db.Integer, primary_key=True)
+    verification_level = db.Column(db.Integer, primary_key=True)
+    graded_by_id = db.Column(UUID(as_uuid=True), primary_key=True)
+
+    ratings = db.Column(db.Integer, nullable=False)  # ratings on units shared with another grader
+    deviation = db.Column(db.Float, nullable=False)
+    bias = db.Column(db.Float, nullable=False)
+    computed_at = db.Column(db.DateTime, nullable=False, default=db.func.current_timestamp())
@@ -0,0 +1,233 @@
+"""Full-text search vectors for abstracts, awards and best papers.
+
+Each submission table carries a ``search_vec`` tsvector built from weighted
+fields (title A, body or author B, category C). Mapper events rebuild the
+vector inside the flushing transaction whenever a source field changes, and
+renaming a category or author refreshes the dependent rows with one UPDATE.
+``unaccent`` is applied when the extension is installed.
+
+``search`` turns a user query into a filter plus a rank: ``@@
+websearch_to_tsquery`` against the GIN-indexed vector, plus trigram
+(``pg_trgm``) matching on the title so typos and partial words still hit. On
+other databases it degrades to ``ILIKE``.
+
+Raw SQL writes bypass the mapper events; run ``flask search-reindex`` after
+such maintenance (or on first deploy) to rebuild the vectors in batches.
+"""
+from __future__ import annotations
+
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional
+
+from flask import current_app, has_app_context
+from sqlalchemy import case, cast, event, func, inspect, literal, or_, select, update
+from sqlalchemy.dialects.postgresql import REGCONFIG, TSVECTOR
+
+from ..extensions import db
+from app.models.Cycle import Abstracts, Author, Awards, BestPaper, Category, PaperCategory
+from app.models.enumerations import GradingFor
+
+_DEFAULT_TEXT_CONFIG = "english"
+
+# entity type -> (model, [(weight, source attribute or (related model, fk attribute))])
+SEARCH_SOURCES = {
+    GradingFor.ABSTRACT: (Abstracts, [("A", "title"), ("B", "content"), ("C", (Category, "category_id"))]),
+    GradingFor.AWARD: (Awards, [("A", "title"), ("B", (Author, "author_id")), ("C", (PaperCategory, "paper_category_id"))]),
+    GradingFor.BEST_PAPER: (BestPaper, [("A", "title"), ("B", (Author, "author_id")), ("C", (PaperCategory, "paper_category_id"))]),
+}
+
+_unaccent_by_engine: Dict[str, bool] = {}
+
+
+class TextSearch(NamedTuple):
+    condition: object
+    rank: object
+
+
+def text_config() -> str:
+    if has_app_context():
+        return current_app.config.get("SEARCH_TEXT_CONFIG", _DEFAULT_TEXT_CONFIG)
+    return _DEFAULT_TEXT_CONFIG
+
+
+def has_unaccent(connection) -> bool:
+    """Whether ``unaccent()`` is callable on this database (cached per engine)."""
+    key = str(connection.engine.url)
+    if key not in _unaccent_by_engine:
+        found = connection.exec_driver_sql("SELECT 1 FROM pg_proc WHERE proname = 'unaccent' LIMIT 1").scalar()
+        _unaccent_by_engine[key] = bool(found)
+    return _unaccent_by_engine[key]
+
+
+def search_document(entity_type: GradingFor, source, *, unaccent: bool = False, config: Optional[str] = None):
+    """Weighted tsvector expression for one submission (PostgreSQL only).
+
+    ``source`` is the model class, giving a column expression for UPDATE
+    statements, or an instance, giving an expression over its current values
+    for an INSERT/UPDATE during flush.
+    """
+    _, fields = SEARCH_SOURCES[entity_type]
+    regconfig = cast(literal(config or text_config()), REGCONFIG)
+    document = None
+    for weight, field in fields:
+        if isinstance(field, tuple):
+            related, fk = field
+            value = select(related.name).where(related.id == getattr(source, fk)).scalar_subquery()
+        else:
+            value = getattr(source, field)
+        text = func.coalesce(value, "")
+        if unaccent:
+            text = func.unaccent(text)
+        part = func.setweight(func.to_tsvector(regconfig, text, type_=TSVECTOR), weight, type_=TSVECTOR)
+        document = part if document is None else document.op("||", return_type=TSVECTOR)(part)
+    return document
+
+
+def _source_attrs(entity_type: GradingFor) -> List[str]:
+    _, fields = SEARCH_SOURCES[entity_type]
+    return [field[1] if isinstance(field, tuple) else field for _, field in fields]
+
+
+def _register(entity_type: GradingFor, model) -> None:
+    names = _source_attrs(entity_type)
+
+    def _set_vector(connection, target):
+        target.search_vec = search_document(entity_type, target, unaccent=has_unaccent(connection))
+
+    @event.listens_for(model, "before_insert")
+    def _index_insert(mapper, connection, target):
+        if connection.dialect.name == "postgresql":
+            _set_vector(connection, target)
+
+    @event.listens_for(model, "before_update")
+    def _index_update(mapper, connection, target):
+        if connection.dialect.name != "postgresql":
+            return
+        state = inspect(target)
+        if any(state.attrs[name].history.has_changes() for name in names):
+            _set_vector(connection, target)
+
+
+def _register_related(related) -> None:
+    dependants = []
+    for entity_type, (model, fields) in SEARCH_SOURCES.items():
+        for _, field in fields:
+            if isinstance(field, tuple) and field[0] is related:
+                dependants.append((entity_type, model, field[1]))
+
+    @event.listens_for(related, "after_update")
+    def _reindex_dependants(mapper, connection, target):
+        if connection.dialect.name != "postgresql":
+            return
+        if not inspect(target).attrs["name"].history.has_changes():
+            return
+        unaccent = has_unaccent(connection)
+        for entity_type, model, fk in dependants:
+            connection.execute(
+                update(model)
+                .where(getattr(model, fk) == target.id)
+                .values(
+                    search_vec=search_document(entity_type, model, unaccent=unaccent),
+                    updated_at=model.updated_at,  # not a content change
+                )
+                .execution_options(synchronize_session=False)
+            )
+
+
+for _entity_type, (_model, _) in SEARCH_SOURCES.items():
+    _register(_entity_type, _model)
+for _related in (Category, PaperCategory, Author):
+    _register_related(_related)
+
+
+def _like_pattern(q: str) -> str:
+    escaped = q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def search(
+    entity_type,
+    q: str,
+    *,
+    dialect: Optional[str] = None,
+    unaccent: Optional[bool] = None,
+) -> TextSearch:
+    """Filter and relevance rank for a free-text query on one submission kind.
+
+    On PostgreSQL a row matches when its vector matches
+    ``websearch_to_tsquery(q)`` (quoted phrases, ``or`` and ``-word`` work)
+    or its title contains ``q`` or is trigram-similar to it; the rank
+    combines ``ts_rank_cd`` with title word similarity. When the documents
+    are built with ``unaccent`` (``unaccent=None`` asks the database), the
+    tsquery term is unaccented too, so "etude" and "étude" find the same
+    rows. The title ILIKE and trigram operands compare ``q`` with the raw
+    title, the column the trigram index is built on.
+    """
+    entity_type = GradingFor(entity_type)
+    model, fields = SEARCH_SOURCES[entity_type]
+    dialect = dialect or db.session.get_bind().dialect.name
+    pattern = _like_pattern(q)
+    if dialect == "postgresql":
+        if unaccent is None:
+            unaccent = has_unaccent(db.session.connection())
+        term = func.unaccent(q) if unaccent else literal(q)
+        query = func.websearch_to_tsquery(cast(literal(text_config()), REGCONFIG), term)
+        title_hit = model.title.ilike(pattern, escape="\\")
+        similar = literal(q).op("<%", is_comparison=True)(model.title)
+        condition = or_(model.search_vec.op("@@", is_comparison=True)(query), title_hit, similar)
+        rank = func.ts_rank_cd(model.search_vec, query) + func.word_similarity(q, model.title)
+        return TextSearch(condition, rank)
+
+    title_hit = model.title.ilike(pattern, escape="\\")
+    clauses = [title_hit]
+    for _, field in fields:
+        if isinstance(field, tuple):
+            related, fk = field
+            clauses.append(getattr(model, fk).in_(select(related.id).where(related.name.ilike(pattern, escape="\\"))))
+        elif field != "title":
+            clauses.append(getattr(model, field).ilike(pattern, escape="\\"))
+    return TextSearch(or_(*clauses), case((title_hit, 1), else_=0))
+
+
+def rebuild_search_vectors(
+    session=None,
+    *,
+    entity_types: Optional[Iterable[GradingFor]] = None,
+    batch_size: int = 500,
+    on_batch: Optional[Callable[[GradingFor, int], None]] = None,
+) -> Dict[str, int]:
+    """Recompute ``search_vec`` for every submission, ``batch_size`` rows per transaction.
+
+    Rows are walked in primary-key order and each batch is committed on its
+    own, so row locks are short-lived and an interrupted run can simply be
+    restarted. Returns the number of rows rebuilt per entity type.
+    """
+    session = session or db.session
+    connection = session.connection()
+    unaccent = has_unaccent(connection)
+    totals: Dict[str, int] = {}
+    for entity_type in entity_types or SEARCH_SOURCES:
+        entity_type = GradingFor(entity_type)
+        model, _ = SEARCH_SOURCES[entity_type]
+        document = search_document(entity_type, model, unaccent=unaccent)
+        done = 0
+        last_id = None
+        while True:
+            batch = select(model.id).order_by(model.id).limit(batch_size)
+            if last_id is not None:
+                batch = batch.where(model.id > last_id)
+            ids = session.scalars(batch).all()
+            if not ids:
+                break
+            session.execute(
+                update(model)
+                .where(model.id.in_(ids))
+                .values(search_vec=document, updated_at=model.updated_at)
+                .execution_options(synchronize_session=False)
+            )
+            session.commit()
+            done += len(ids)
+            last_id = ids[-1]
+            if on_batch is not None:
+                on_batch(entity_type, done)
+        totals[entity_type.value] = done
+    return totals
@@ -0,0 +1,188 @@
+"""Materialized submission counts kept exact on every ORM write.
+
+One row per (entity type, cycle, category, status, review phase) holds the
+number of submissions in that bucket. Mapper events on Abstracts, Awards and
+BestPaper adjust the affected rows inside the flushing transaction, so the
+counters commit or roll back together with the submission itself.
+
+Bulk ``query.update()`` / ``delete()`` and raw SQL bypass mapper events; run
+``flask recount-submissions`` after such maintenance to rebuild the table from
+the source rows. ``flask setup`` runs the same rebuild, so a newly created
+table is filled on deploy.
+"""
+from __future__ import annotations
+
+from typing import Dict, Optional
+
+from sqlalchemy import Enum as SqlEnum, delete, event, func, insert, inspect, select, text, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.dialects.postgresql import UUID
+
+from ..extensions import db
+from app.models.Cycle import Abstracts, Awards, BestPaper
+from app.models.enumerations import GradingFor, Status
+
+
+class SubmissionCounter(db.Model):
+    __tablename__ = "submission_counters"
+
+    entity_type = db.Column(SqlEnum(GradingFor), primary_key=True)
+    cycle_id = db.Column(UUID(as_uuid=True), primary_key=True)
+    category_id = db.Column(UUID(as_uuid=True), primary_key=True)
+    status = db.Column(SqlEnum(Status), primary_key=True)
+    review_phase = db.Column(db.Integer, primary_key=True)
+    count = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+
+
+# entity type -> (model, category column attribute name)
+COUNTED_MODELS = {
+    GradingFor.ABSTRACT: (Abstracts, "category_id"),
+    GradingFor.AWARD: (Awards, "paper_category_id"),
+    GradingFor.BEST_PAPER: (BestPaper, "paper_category_id"),
+}
+
+_KEY_COLUMNS = ("entity_type", "cycle_id", "category_id", "status", "review_phase")
+
+
+def _attr(target, name: str, previous: bool):
+    if previous:
+        history = inspect(target).attrs[name].history
+        if history.deleted:
+            return history.deleted[0]
+    return getattr(target, name)
+
+
+def _key(entity_type: GradingFor, target, *, previous: bool = False) -> Optional[Dict[str, object]]:
+    _, category_attr = COUNTED_MODELS[entity_type]
+    status = _attr(target, "status", previous)
+    key = {
+        "entity_type": entity_type,
+        "cycle_id": _attr(target, "cycle_id", previous),
+        "category_id": _attr(target, category_attr, previous),
+        "status": Status(status) if status is not None else Status.PENDING,
+        "review_phase": _attr(target, "review_phase", previous) or 1,
+    }
+    if key["cycle_id"] is None or key["category_id"] is None:
+        return None
+    return key
+
+
+def _bump(connection, key: Optional[Dict[str, object]], delta: int) -> None:
+    if key is None or not delta:
+        return
+    table = SubmissionCounter.__table__
+    dialect = connection.dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        insert_fn = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        stmt = insert_fn(table).values(**key, count=delta)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(_KEY_COLUMNS),
+            set_={"count": table.c.count + stmt.excluded.count},
+        )
+        connection.execute(stmt)
+        return
+    where = [table.c[name] == key[name] for name in _KEY_COLUMNS]
+    result = connection.execute(update(table).where(*where).values(count=table.c.count + delta))
+    if not result.rowcount:
+        connection.execute(insert(table).values(**key, count=delta))
+
+
+def apply_counter_moves(connection, entity_type: GradingFor, moves) -> None:
+    """Apply counter changes for rows updated outside the ORM unit of work.
+
+    ``moves`` yields ``(cycle_id, category_id, old_status, old_phase,
+    new_status, new_phase)`` tuples, one per updated submission. Moves are
+    folded per bucket first, so a bulk UPDATE of thousands of rows costs one
+    upsert per distinct bucket.
+    """
+    deltas: Dict[tuple, int] = {}
+    for cycle_id, category_id, old_status, old_phase, new_status, new_phase in moves:
+        before = (cycle_id, category_id, Status(old_status), old_phase)
+        after = (cycle_id, category_id, Status(new_status), new_phase)
+        if before == after:
+            continue
+        deltas[before] = deltas.get(before, 0) - 1
+        deltas[after] = deltas.get(after, 0) + 1
+    for (cycle_id, category_id, status, phase), delta in deltas.items():
+        _bump(connection, {
+            "entity_type": entity_type,
+            "cycle_id": cycle_id,
+            "category_id": category_id,
+            "status": status,
+            "review_phase": phase,
+        }, delta)
+
+
+def _load_previous(target, value, oldvalue, initiator):
+    return value
+
+
+def _register(entity_type: GradingFor, model) -> None:
+    _, category_attr = COUNTED_MODELS[entity_type]
+    for name in ("cycle_id", category_attr, "status", "review_phase"):
+        # active_history loads the old value of an expired attribute before
+        # it is replaced, so after_update can decrement the right bucket.
+        event.listen(getattr(model, name), "set", _load_previous, active_history=True, retval=True)
+
+    @event.listens_for(model, "after_insert")
+    def _count_insert(mapper, connection, target):
+        _bump(connection, _key(entity_type, target), 1)
+
+    @event.listens_for(model, "after_update")
+    def _count_update(mapper, connection, target):
+        before = _key(entity_type, target, previous=True)
+        after = _key(entity_type, target)
+        if before != after:
+            _bump(connection, before, -1)
+            _bump(connection, after, 1)
+
+    @event.listens_for(model, "after_delete")
+    def _count_delete(mapper, connection, target):
+        _bump(connection, _key(entity_type, target, previous=True), -1)
+
+
+for _entity_type, (_model, _) in COUNTED_MODELS.items():
+    _register(_entity_type, _model)
+
+
+def recount_submission_counters(session=None) -> Dict[str, int]:
+    """Rebuild ``submission_counters`` from the submission tables.
+
+    Runs in the caller's transaction (the caller commits). Returns the number
+    of counted submissions per entity type.
+    """
+    session = session or db.session
+    table = SubmissionCounter.__table__
+    if session.get_bind().dialect.name == "postgresql":
+        # Wait for in-flight submission writes, and hold new counter upserts
+        # until the rebuilt rows are committed.
+        session.execute(text("LOCK TABLE submission_counters IN EXCLUSIVE MODE"))
+    session.execute(delete(table))
+    totals: Dict[str, int] = {}
+    for entity_type, (model, category_attr) in COUNTED_MODELS.items():
+        category_col = getattr(model, category_attr)
+        grouped = (
+            select(
+                model.cycle_id,
+                category_col,
+                model.status,
+                model.review_phase,
+                func.count().label("count"),
+            )
+            .group_by(model.cycle_id, category_col, model.status, model.review_phase)
+        )
+        rows = session.execute(grouped).all()
+        if rows:
+            session.execute(insert(table), [
+                {
+                    "entity_type": entity_type,
+                    "cycle_id": row[0],
+                    "category_id": row[1],
+                    "status": row[2],
+                    "review_phase": row[3],
+                    "count": row[4],
+                }
+                for row in rows
+            ])
+        totals[entity_type.value] = sum(row[4] for row in rows)
+    return totals
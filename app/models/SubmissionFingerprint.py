@@ -0,0 +1,174 @@
+"""MinHash fingerprints of submissions for near-duplicate detection.
+
+Every abstract, award and best paper gets a ``title`` fingerprint (character
+shingles, comparable across kinds) and abstracts also a ``body`` fingerprint
+(word shingles over title and content). Signatures are stored packed in
+``submission_fingerprints``; their LSH band keys go to
+``submission_lsh_buckets``, whose primary key doubles as the lookup index, so
+finding candidates for one submission is a handful of index probes.
+
+Mapper events refresh both tables in the flushing transaction when a
+submission's title, content or cycle changes and remove them on delete. Run
+``flask dedup-reindex`` after raw SQL maintenance or on first deploy.
+"""
+from __future__ import annotations
+
+from typing import Callable, Dict, Iterable, Optional, Set
+
+from sqlalchemy import Enum as SqlEnum, delete, event, inspect, insert, select
+from sqlalchemy.dialects.postgresql import UUID
+
+from ..extensions import db
+from app.models.Cycle import Abstracts, Awards, BestPaper
+from app.models.enumerations import GradingFor
+from app.utils import minhash
+
+FINGERPRINTED_MODELS = {
+    GradingFor.ABSTRACT: Abstracts,
+    GradingFor.AWARD: Awards,
+    GradingFor.BEST_PAPER: BestPaper,
+}
+
+
+class SubmissionFingerprint(db.Model):
+    __tablename__ = "submission_fingerprints"
+
+    entity_type = db.Column(SqlEnum(GradingFor), primary_key=True)
+    submission_id = db.Column(UUID(as_uuid=True), primary_key=True)
+    field = db.Column(db.String(10), primary_key=True)
+    cycle_id = db.Column(UUID(as_uuid=True), nullable=False, index=True)
+    signature = db.Column(db.LargeBinary, nullable=False)
+
+
+class SubmissionLshBucket(db.Model):
+    __tablename__ = "submission_lsh_buckets"
+    __table_args__ = (
+        db.Index("ix_submission_lsh_buckets_submission", "entity_type", "submission_id"),
+    )
+
+    # Leading (field, band, bucket) columns make the primary key the lookup index.
+    field = db.Column(db.String(10), primary_key=True)
+    band = db.Column(db.SmallInteger, primary_key=True)
+    bucket = db.Column(db.BigInteger, primary_key=True)
+    entity_type = db.Column(SqlEnum(GradingFor), primary_key=True)
+    submission_id = db.Column(UUID(as_uuid=True), primary_key=True)
+
+
+def fingerprint_shingles(title: Optional[str], content: Optional[str] = None) -> Dict[str, Set[str]]:
+    """Shingle sets per fingerprint field; fields with no text are omitted."""
+    fields = {"title": minhash.char_shingles(title or "")}
+    if content is not None:
+        fields["body"] = minhash.word_shingles(f"{title or ''}\n{content}")
+    return {name: shingles for name, shingles in fields.items() if shingles}
+
+
+def _source_text(entity_type: GradingFor, row) -> Dict[str, Set[str]]:
+    content = getattr(row, "content", None) if entity_type == GradingFor.ABSTRACT else None
+    return fingerprint_shingles(row.title, content)
+
+
+def _fingerprint_rows(entity_type: GradingFor, submission_id, cycle_id, shingles: Dict[str, Set[str]]):
+    prints, buckets = [], []
+    for name, shingle_set in shingles.items():
+        sig = minhash.signature(shingle_set)
+        prints.append({
+            "entity_type": entity_type,
+            "submission_id": submission_id,
+            "field": name,
+            "cycle_id": cycle_id,
+            "signature": minhash.pack(sig),
+        })
+        buckets.extend(
+            {"field": name, "band": band, "bucket": key, "entity_type": entity_type, "submission_id": submission_id}
+            for band, key in enumerate(minhash.band_buckets(sig))
+        )
+    return prints, buckets
+
+
+def _insert_rows(connection, prints, buckets) -> None:
+    if prints:
+        connection.execute(insert(SubmissionFingerprint.__table__), prints)
+        connection.execute(insert(SubmissionLshBucket.__table__), buckets)
+
+
+def store_fingerprints(connection, entity_type: GradingFor, submission_id, cycle_id, shingles: Dict[str, Set[str]]) -> None:
+    """Replace the fingerprints and bucket keys of one submission."""
+    remove_fingerprints(connection, entity_type, [submission_id])
+    _insert_rows(connection, *_fingerprint_rows(entity_type, submission_id, cycle_id, shingles))
+
+
+def remove_fingerprints(connection, entity_type: GradingFor, submission_ids: Iterable) -> None:
+    submission_ids = list(submission_ids)
+    for table in (SubmissionFingerprint.__table__, SubmissionLshBucket.__table__):
+        connection.execute(
+            delete(table).where(table.c.entity_type == entity_type, table.c.submission_id.in_(submission_ids))
+        )
+
+
+def _register(entity_type: GradingFor, model) -> None:
+    watched = ("title", "content", "cycle_id") if entity_type == GradingFor.ABSTRACT else ("title", "cycle_id")
+
+    @event.listens_for(model, "after_insert")
+    def _fingerprint_insert(mapper, connection, target):
+        store_fingerprints(connection, entity_type, target.id, target.cycle_id, _source_text(entity_type, target))
+
+    @event.listens_for(model, "after_update")
+    def _fingerprint_update(mapper, connection, target):
+        state = inspect(target)
+        if any(state.attrs[name].history.has_changes() for name in watched):
+            store_fingerprints(connection, entity_type, target.id, target.cycle_id, _source_text(entity_type, target))
+
+    @event.listens_for(model, "after_delete")
+    def _fingerprint_delete(mapper, connection, target):
+        remove_fingerprints(connection, entity_type, [target.id])
+
+
+for _entity_type, _model in FINGERPRINTED_MODELS.items():
+    _register(_entity_type, _model)
+
+
+def rebuild_fingerprints(
+    session=None,
+    *,
+    entity_types: Optional[Iterable[GradingFor]] = None,
+    batch_size: int = 500,
+    on_batch: Optional[Callable[[GradingFor, int], None]] = None,
+) -> Dict[str, int]:
+    """Recompute fingerprints for every submission, one transaction per batch.
+
+    Returns the number of submissions fingerprinted per entity type.
+    """
+    session = session or db.session
+    totals: Dict[str, int] = {}
+    for entity_type in entity_types or FINGERPRINTED_MODELS:
+        entity_type = GradingFor(entity_type)
+        model = FINGERPRINTED_MODELS[entity_type]
+        columns = [model.id, model.cycle_id, model.title]
+        if entity_type == GradingFor.ABSTRACT:
+            columns.append(model.content)
+        done = 0
+        last_id = None
+        while True:
+            batch = select(*columns).order_by(model.id).limit(batch_size)
+            if last_id is not None:
+                batch = batch.where(model.id > last_id)
+            rows = session.execute(batch).all()
+            if not rows:
+                break
+            prints, buckets = [], []
+            for row in rows:
+                row_prints, row_buckets = _fingerprint_rows(
+                    entity_type, row.id, row.cycle_id, _source_text(entity_type, row),
+                )
+                prints.extend(row_prints)
+                buckets.extend(row_buckets)
+            connection = session.connection()
+            remove_fingerprints(connection, entity_type, [row.id for row in rows])
+            _insert_rows(connection, prints, buckets)
+            session.commit()
+            done += len(rows)
+            last_id = rows[-1].id
+            if on_batch is not None:
+                on_batch(entity_type, done)
+        totals[entity_type.value] = done
+    return totals
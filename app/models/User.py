@@ -17,6 +17,7 @@ from flask import current_app
 
 from app.models.enumerations import Role, UserType
 from app.models.Cycle import (
+    trigram_index,
     user_categories,
     user_paper_categories,
     user_award_categories,
@@ -74,6 +75,9 @@ class UserSettings(db.Model):
 
 class User(db.Model):
     __tablename__ = 'users'
+    __table_args__ = tuple(
+        trigram_index('users', column) for column in ('username', 'email', 'employee_id', 'mobile')
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     username = Column(String(50), unique=False)
@@ -4,3 +4,7 @@ from .User import User
 from .Token import Token
 from .AuditLog import AuditLog
 from .Cycle import *
+from .SubmissionCounter import SubmissionCounter
+from .SearchIndex import SEARCH_SOURCES
+from .SubmissionFingerprint import SubmissionFingerprint, SubmissionLshBucket
+from .GradingAgreement import GradingAgreement, GradingAgreementScope, GraderDisagreement
@@ -17,6 +17,7 @@ from app.routes.v1.audit_log_route import audit_log_bp
 from app.routes.v1.user_settings_route import user_settings_bp
 from app.routes.v1.user_role_route import user_role_bp
 from app.routes.v1.token_route import token_bp
+from app.routes.v1.health_route import health_bp
 
 def register_blueprints(app):
     """Register application blueprints with the Flask app instance.
@@ -37,4 +38,5 @@ def register_blueprints(app):
     app.register_blueprint(user_settings_bp, url_prefix=f'{BASE}/api/v1')
     app.register_blueprint(user_role_bp, url_prefix=f'{BASE}/api/v1')
     app.register_blueprint(token_bp, url_prefix=f'{BASE}/api/v1')
+    app.register_blueprint(health_bp, url_prefix=BASE)
     app.logger.info("Blueprints registered (core + admin_api + super_api + research)")
\ No newline at end of file
@@ -1,6 +1,28 @@
-from flask import Blueprint
+from flask import Blueprint, request, jsonify, current_app
+from flask_jwt_extended import jwt_required
+
+from app.models.enumerations import Role
+from app.services.dashboard_metrics_service import get_dashboard_metrics
+from app.utils.decorator import require_roles
 
 admin_api_bp = Blueprint('admin_api_bp', __name__)
 
-# Placeholder for admin API routes
-# Actual routes will be added as needed
\ No newline at end of file
+
+@admin_api_bp.route('/dashboard/metrics', methods=['GET'])
+@jwt_required()
+@require_roles(Role.ADMIN.value, Role.SUPERADMIN.value)
+def dashboard_metrics():
+    """Aggregate dashboard counters served from the shared metrics cache.
+
+    Clients revalidate with ``If-None-Match``; an unchanged payload yields 304.
+    """
+    try:
+        payload, etag = get_dashboard_metrics()
+    except Exception as e:
+        current_app.logger.exception("Failed to compute dashboard metrics")
+        return jsonify({"error": str(e)}), 500
+
+    resp = jsonify(payload)
+    resp.set_etag(etag)
+    resp.headers['Cache-Control'] = 'private, max-age=0, must-revalidate'
+    return resp.make_conditional(request)
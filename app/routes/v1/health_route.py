@@ -0,0 +1,69 @@
+"""Health endpoints for load balancers and operators.
+
+``/health`` is the public liveness check. The detailed endpoints expose pool
+and configuration internals and are limited to administrators.
+"""
+import time
+
+from flask import Blueprint, jsonify, current_app
+from flask_jwt_extended import jwt_required
+from sqlalchemy import text
+
+from app.extensions import db
+from app.models.enumerations import Role
+from app.utils.decorator import require_roles
+from app.utils.db_engine import pool_status
+from app.utils.logging_utils import logger_manager
+
+health_bp = Blueprint('health_bp', __name__)
+
+
+@health_bp.route('/health', methods=['GET'])
+def health():
+    """Liveness: the worker is up and serving requests."""
+    return jsonify({"status": "ok"}), 200
+
+
+@health_bp.route('/health/db', methods=['GET'])
+@jwt_required()
+@require_roles(Role.ADMIN.value, Role.SUPERADMIN.value)
+def health_db():
+    """Report database reachability and connection pool usage for this worker."""
+    started = time.perf_counter()
+    ok = True
+    error_msg = None
+    try:
+        db.session.execute(text("SELECT 1"))
+        db.session.rollback()
+    except Exception as e:
+        ok = False
+        error_msg = type(e).__name__
+        current_app.logger.warning("DB health check failed: %s", e)
+        try:
+            db.session.rollback()
+        except Exception:
+            pass
+    latency_ms = round((time.perf_counter() - started) * 1000, 3)
+
+    body = {
+        "status": "ok" if ok else "unavailable",
+        "latency_ms": latency_ms,
+        "pgbouncer_mode": current_app.config.get("DB_PGBOUNCER_MODE") or None,
+        "statement_timeout_ms": current_app.config.get("DB_STATEMENT_TIMEOUT_MS"),
+        "pool": pool_status(db.engine),
+    }
+    if error_msg:
+        body["error"] = error_msg
+    return jsonify(body), 200 if ok else 503
+
+
+@health_bp.route('/health/logs', methods=['GET'])
+@jwt_required()
+@require_roles(Role.ADMIN.value, Role.SUPERADMIN.value)
+def health_logs():
+    """Report async log queue usage and log archive metrics for this worker."""
+    manager = logger_manager()
+    return jsonify({
+        "queue": manager.queue_stats(),
+        "archive": manager.archive_metrics(),
+    }), 200
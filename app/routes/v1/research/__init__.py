@@ -16,5 +16,12 @@ from app.routes.v1.research import (
     abstract_verifiers_route,
     abstract_coordinators_route,
     award_verifiers_coordinators_route,
-    best_paper_verifiers_coordinators_route
+    best_paper_verifiers_coordinators_route,
+    bulk_review_route,
+    auto_assignment_route,
+    typeahead_route,
+    duplicate_route,
+    ranking_route,
+    agreement_route,
+    reference_data_route
 )
\ No newline at end of file
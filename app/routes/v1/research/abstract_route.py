@@ -14,17 +14,24 @@ from flask import request, jsonify, current_app
 from flask_jwt_extended import get_jwt, get_jwt_identity, jwt_required
 from sqlalchemy import or_, and_
 
-from app.extensions import db
+from app.extensions import db, replica_reads
+from app.utils.db_engine import statement_timeout
+from app.services.submission_status_service import parse_breakdown, status_summary
+from app.utils.model_utils.verifier_assignment_utils import (
+    bulk_assign_verifiers as bulk_assign_verifiers_util,
+    bulk_unassign_verifiers as bulk_unassign_verifiers_util,
+    check_assignment_targets,
+    verifier_counts,
+)
 from app.models.Cycle import (
     AbstractAuthors,
     Abstracts,
     Author,
-    Category,
     Cycle,
-    GradingType,
     Grading,
     GradingFor,
 )
+from app.models.SearchIndex import search as search_submissions
 from app.models.Token import Token
 from app.models.User import User
 from app.models.enumerations import Role, Status
@@ -37,7 +44,7 @@ from app.utils.services.mail import send_mail
 from app.utils.services.sms import send_sms
 from app.models.Cycle import CyclePhase
 from app.utils.model_utils.cycle_utils import get_cycle_by_id as get_cycle_by_id_util
-from app.utils.model_utils.cycle_utils import list_windows
+from app.utils import conditional_get, cycle_calendar, grading_type_cache, sparse_fields
 
 abstract_schema = AbstractSchema()
 abstracts_schema = AbstractSchema(many=True)
@@ -207,10 +214,13 @@ def create_abstract():
             cycle = get_cycle_by_id_util(cycle_id)
             if cycle:
                 from datetime import date
-                active_windows = list_windows(cycle_id=cycle_id, reference_date=date.today())
-                abstract_windows = [
-                    w for w in active_windows if w.phase == CyclePhase.ABSTRACT_SUBMISSION]
-                if not abstract_windows:
+                abstract_window = cycle_calendar.open_window_id(
+                    db.session.connection(),
+                    cycle.id,
+                    (CyclePhase.ABSTRACT_SUBMISSION,),
+                    date.today(),
+                )
+                if abstract_window is None:
                     error_msg = f"Submission validation failed: Abstract submissions are not allowed for cycle {cycle.name} at this time"
                     log_audit_event(
                         event_type="abstract.create.failed",
@@ -601,7 +611,7 @@ def get_abstracts():
         page = max(1, int(request.args.get('page', 1)))
         status = request.args.get('status', '').strip().upper()
         page_size = min(int(request.args.get('page_size', 20)), 100)
-        sort_by = request.args.get('sort', 'id')
+        sort_by = request.args.get('sort') or ('relevance' if q else 'id')
         sort_dir = request.args.get('dir', 'desc').lower()
         verifier_filter = request.args.get('verifier', '').strip().lower() == 'true'
         cycle_id = request.args.get('cycle_id', '').strip()
@@ -621,17 +631,14 @@ def get_abstracts():
             return jsonify({"error": error_msg}), 404
 
         filters = []
+        match = None
         if q:
-            q_int = int(q) if q.isdigit() else None
-            filters.append(
-                or_(
-                    Abstracts.title.ilike(f'%{q}%'),
-                    Abstracts.content.ilike(f'%{q}%'),
-                    Abstracts.abstract_number == q_int,
-                    Abstracts.category.has(Category.name.ilike(f'%{q}%')),
-
-                )
-            )
+            # Full-text + trigram search; see app.models.SearchIndex.
+            match = search_submissions(GradingFor.ABSTRACT, q)
+            if q.isdigit():
+                filters.append(or_(match.condition, Abstracts.abstract_number == int(q)))
+            else:
+                filters.append(match.condition)
 
         if status in {'PENDING', 'UNDER_REVIEW', 'ACCEPTED', 'REJECTED'}:
             filters.append(Abstracts.status == status)
@@ -736,8 +743,10 @@ def get_abstracts():
             order_by = Abstracts.id.asc() if sort_dir == 'asc' else Abstracts.id.desc()
         elif sort_by == 'review_phase':  # Add sorting by review phase
             order_by = Abstracts.review_phase.asc() if sort_dir == 'asc' else Abstracts.review_phase.desc()
+        elif sort_by == 'relevance':
+            order_by = (match.rank.desc(), Abstracts.id.desc()) if match is not None else Abstracts.id.desc()
         else: # invalid sort field
-            error_msg = f"Validation failed: Invalid sort field '{sort_by}'. Valid fields are 'id', 'title', 'created_at', 'review_phase'"
+            error_msg = f"Validation failed: Invalid sort field '{sort_by}'. Valid fields are 'id', 'title', 'created_at', 'review_phase', 'relevance'"
             log_audit_event(
                 event_type="abstract.list.failed",
                 user_id=actor_id,
@@ -746,29 +755,42 @@ def get_abstracts():
             )
             return jsonify({"error": error_msg}), 400
         
+        try:
+            fieldset = sparse_fields.parse_fieldset(AbstractSchema, request.args, extras=("verifiers_count",))
+        except ValueError as exc:
+            error_msg = f"Validation failed: {exc}"
+            log_audit_event(
+                event_type="abstract.list.failed",
+                user_id=actor_id,
+                details={"error": error_msg, "fields": request.args.get('fields'), "include": request.args.get('include')},
+                ip_address=request.remote_addr
+            )
+            return jsonify({"error": error_msg}), 400
+
         current_app.logger.info("Listing abstracts ready")
-        
 
-        abstracts_all = list(
-            abstract_utils.list_abstracts(
-                filters=filters,
-                order_by=order_by,
-                actor_id=actor_id,
-                context={**context, "sort_by": sort_by, "sort_dir": sort_dir},
-            )
+        # The tag query also counts the filtered rows; no second count for `total`.
+        etag, total = conditional_get.list_etag(GradingFor.ABSTRACT, filters, actor_id)
+        cached = conditional_get.not_modified(etag)
+        if cached is not None:
+            return cached
+
+        # Only the requested relations are loaded, for the requested page only.
+        paginated = abstract_utils.list_abstracts(
+            filters=filters,
+            order_by=order_by,
+            limit=page_size,
+            offset=(page - 1) * page_size,
+            query_options=fieldset.options,
+            actor_id=actor_id,
+            context={**context, "sort_by": sort_by, "sort_dir": sort_dir},
         )
 
-        total = len(abstracts_all)
-        start = (page - 1) * page_size
-        end = start + page_size
-        paginated = abstracts_all[start:end]
-
-        abstracts_data = []
-        for abstract in paginated:
-            abstract_dict = abstract_schema.dump(abstract)
-            abstract_dict['verifiers_count'] = len(abstract.verifiers or [])
-            abstract_dict['review_phase'] = abstract.review_phase  # Include review phase in response
-            abstracts_data.append(abstract_dict)
+        abstracts_data = fieldset.schema.dump(paginated)
+        if sparse_fields.wants(fieldset, 'verifiers_count'):
+            counts = verifier_counts(GradingFor.ABSTRACT, [abstract.id for abstract in paginated])
+            for abstract, abstract_dict in zip(paginated, abstracts_data):
+                abstract_dict['verifiers_count'] = counts.get(abstract.id, 0)
 
         response = {
             'items': abstracts_data,
@@ -797,7 +819,7 @@ def get_abstracts():
             ip_address=request.remote_addr
         )
         
-        return jsonify(response), 200
+        return conditional_get.tagged(jsonify(response), etag), 200
     except Exception as exc:
         current_app.logger.exception("Error listing abstracts with parameters")
         error_msg = f"System error occurred while retrieving abstracts: {str(exc)}"
@@ -817,6 +839,11 @@ def get_abstract(abstract_id):
     actor_id, context = _resolve_actor_context("get_abstract")
     abstract = None
     try:
+        etag = conditional_get.detail_etag(GradingFor.ABSTRACT, abstract_id)
+        cached = conditional_get.not_modified(etag)
+        if cached is not None:
+            return cached
+
         abstract = abstract_utils.get_abstract_by_id(
             abstract_id,
             actor_id=actor_id,
@@ -851,7 +878,7 @@ def get_abstract(abstract_id):
             ip_address=request.remote_addr
         )
         
-        return jsonify(data), 200
+        return conditional_get.tagged(jsonify(data), etag), 200
     except Exception as exc:
         current_app.logger.exception("Error retrieving abstract")
         error_msg = f"System error occurred while retrieving abstract: {str(exc)}"
@@ -1040,43 +1067,23 @@ def get_abstract_submission_status():
             )
             return jsonify({"error": error_msg}), 404
 
-        if user.has_role(Role.ADMIN.value) or user.has_role(Role.SUPERADMIN.value):
-            abstracts = abstract_utils.list_abstracts(
-                actor_id=actor_id,
-                context=context,
-            )
-        elif user.has_role(Role.VERIFIER.value):
-            current_app.logger.info("Fetching abstracts for verifier user ID: %s", actor_id)
-            abstracts = abstract_utils.list_abstracts(
-                filters=[Abstracts.verifiers.any(User.id == actor_id)],
-                actor_id=actor_id,
-                context={**context, "scope": "verifier"},
-            )
-        elif user.has_role(Role.COORDINATOR.value):
-            current_app.logger.info("Fetching abstracts for coordinator user ID: %s", actor_id)
-            abstracts = abstract_utils.list_abstracts(
-                filters=[Abstracts.coordinators.any(User.id == actor_id)],
-                actor_id=actor_id,
-                context={**context, "scope": "coordinator"},
-            )
-        else:
-            abstracts = abstract_utils.list_abstracts(
-                filters=[Abstracts.created_by_id == actor_id],
-                actor_id=actor_id,
-                context={**context, "scope": "owner"},
+        try:
+            breakdown = parse_breakdown(request.args.get("breakdown"))
+        except ValueError as exc:
+            error_msg = str(exc)
+            log_audit_event(
+                event_type="abstract.status.get.failed",
+                user_id=actor_id,
+                details={"error": error_msg},
+                ip_address=request.remote_addr
             )
+            return jsonify({"error": error_msg}), 400
 
-        pending_abstracts = sum(1 for abstract in abstracts if abstract.status == Status.PENDING)
-        under_review_abstracts = sum(1 for abstract in abstracts if abstract.status == Status.UNDER_REVIEW)
-        accepted_abstracts = sum(1 for abstract in abstracts if abstract.status == Status.ACCEPTED)
-        rejected_abstracts = sum(1 for abstract in abstracts if abstract.status == Status.REJECTED)
-
-        payload = {
-            "pending": pending_abstracts,
-            "under_review": under_review_abstracts,
-            "accepted": accepted_abstracts,
-            "rejected": rejected_abstracts,
-        }
+        payload = status_summary("abstract", user, breakdown=breakdown)
+        pending_abstracts = payload[Status.PENDING.value]
+        under_review_abstracts = payload[Status.UNDER_REVIEW.value]
+        accepted_abstracts = payload[Status.ACCEPTED.value]
+        rejected_abstracts = payload[Status.REJECTED.value]
 
         # Log successful retrieval
         log_audit_event(
@@ -1390,10 +1397,15 @@ def get_abstracts_for_verifier(user_id):
 @jwt_required()
 @require_roles(Role.COORDINATOR.value, Role.ADMIN.value, Role.SUPERADMIN.value)
 def bulk_assign_verifiers():
-    """Bulk assign verifiers to multiple abstracts."""
+    """Bulk assign verifiers to multiple abstracts.
+
+    Every missing (abstract, verifier) pair is inserted with one
+    statement at the abstract's current review phase (or
+    ``review_phase``); pairs that already exist are reported as skipped.
+    """
     actor_id, context = _resolve_actor_context("bulk_assign_verifiers")
     try:
-        data = request.get_json() or {}
+        data = request.get_json(silent=True) or {}
         abstract_ids = data.get('abstract_ids')
         user_ids = data.get('user_ids')
 
@@ -1408,81 +1420,80 @@ def bulk_assign_verifiers():
             )
             return jsonify({"error": error_msg}), 400
 
-        abstract_ids = [str(abstract_id) for abstract_id in abstract_ids]
-        user_ids = [str(user_id) for user_id in user_ids]
+        try:
+            abstract_ids = list(dict.fromkeys(uuid.UUID(str(item)) for item in abstract_ids))
+            user_ids = list(dict.fromkeys(uuid.UUID(str(item)) for item in user_ids))
+            review_phase = data.get('review_phase')
+            if review_phase is not None:
+                review_phase = int(review_phase)
+                if review_phase < 1:
+                    raise ValueError("review_phase must be positive")
+        except (TypeError, ValueError):
+            error_msg = "Request validation failed: 'abstract_ids' and 'user_ids' must be lists of UUIDs and 'review_phase' a positive integer"
+            log_audit_event(
+                event_type="abstract.verifiers.bulk_assign.failed",
+                user_id=actor_id,
+                details={"error": error_msg},
+                ip_address=request.remote_addr
+            )
+            return jsonify({"error": error_msg}), 400
 
-        abstracts = abstract_utils.list_abstracts(
-            filters=[Abstracts.id.in_(abstract_ids)],
-            actor_id=actor_id,
-            context={**context, "operation": "bulk_assign"},
-        )
-        abstracts_by_id = {str(abstract.id): abstract for abstract in abstracts}
-        missing_abstracts = [abstract_id for abstract_id in abstract_ids if abstract_id not in abstracts_by_id]
-        if missing_abstracts:
-            error_msg = f"Resource validation failed: Abstracts with IDs {missing_abstracts} do not exist"
+        check = check_assignment_targets(GradingFor.ABSTRACT, abstract_ids, user_ids)
+        if check.missing_submissions:
+            error_msg = f"Resource validation failed: Abstracts with IDs {check.missing_submissions} do not exist"
             log_audit_event(
                 event_type="abstract.verifiers.bulk_assign.failed",
                 user_id=actor_id,
-                details={"error": error_msg, "missing_abstracts": missing_abstracts},
+                details={"error": error_msg, "missing_abstracts": check.missing_submissions},
                 ip_address=request.remote_addr
             )
             return jsonify({"error": error_msg}), 404
-
-        users = User.query.filter(User.id.in_(user_ids)).all()
-        if len(users) != len(set(user_ids)):
-            found_ids = {str(user.id) for user in users}
-            missing_ids = [uid for uid in user_ids if uid not in found_ids]
-            error_msg = f"Resource validation failed: Users with IDs {missing_ids} do not exist"
+        if check.missing_users:
+            error_msg = f"Resource validation failed: Users with IDs {check.missing_users} do not exist"
             log_audit_event(
                 event_type="abstract.verifiers.bulk_assign.failed",
                 user_id=actor_id,
-                details={"error": error_msg, "missing_users": missing_ids},
+                details={"error": error_msg, "missing_users": check.missing_users},
                 ip_address=request.remote_addr
             )
             return jsonify({"error": error_msg}), 404
-
-        non_verifiers = [user for user in users if not user.has_role(Role.VERIFIER.value)]
-        if non_verifiers:
-            non_verifier_ids = [str(user.id) for user in non_verifiers]
-            error_msg = f"Validation failed: Users with IDs {non_verifier_ids} are not verifiers"
+        if check.non_verifiers:
+            error_msg = f"Validation failed: Users with IDs {check.non_verifiers} are not verifiers"
             log_audit_event(
                 event_type="abstract.verifiers.bulk_assign.failed",
                 user_id=actor_id,
-                details={"error": error_msg, "non_verifier_ids": non_verifier_ids},
+                details={"error": error_msg, "non_verifier_ids": check.non_verifiers},
                 ip_address=request.remote_addr
             )
             return jsonify({"error": error_msg}), 400
 
-        assignments_created = 0
-        for abstract_id in abstract_ids:
-            abstract = abstracts_by_id[str(abstract_id)]
-            for user in users:
-                if any(verifier.id == user.id for verifier in abstract.verifiers):
-                    continue
-                abstract_utils.assign_verifier(
-                    abstract,
-                    user,
-                    actor_id=actor_id,
-                    context={**context, "verifier_id": str(user.id), "abstract_id": str(abstract.id)},
-                )
-                assignments_created += 1
+        result = bulk_assign_verifiers_util(
+            GradingFor.ABSTRACT,
+            abstract_ids,
+            user_ids,
+            review_phase=review_phase,
+            actor_id=actor_id,
+        )
 
         # Log successful bulk assignment
         log_audit_event(
             event_type="abstract.verifiers.bulk_assign.success",
             user_id=actor_id,
             details={
-                "abstract_ids": abstract_ids,
-                "user_ids": user_ids,
-                "assignments_created": assignments_created,
-                "total_possible_assignments": len(abstract_ids) * len(users)
+                "abstract_ids": [str(item) for item in abstract_ids],
+                "user_ids": [str(item) for item in user_ids],
+                "review_phase": review_phase,
+                "assignments_created": result.changed_count,
+                "assignments_skipped": result.skipped_count,
+                "total_possible_assignments": result.requested
             },
             ip_address=request.remote_addr
         )
-        
+
         return jsonify({
-            "message": f"Successfully created {assignments_created} assignments",
-            "assignments_created": assignments_created
+            "message": f"Successfully created {result.changed_count} assignments",
+            "assignments_created": result.changed_count,
+            "assignments_skipped": result.skipped_count
         }), 201
     except Exception as exc:
         db.session.rollback()
@@ -1501,11 +1512,10 @@ def bulk_assign_verifiers():
 @jwt_required()
 @require_roles(Role.COORDINATOR.value, Role.ADMIN.value, Role.SUPERADMIN.value)
 def bulk_unassign_verifiers():
-    """Bulk unassign verifiers from multiple abstracts."""
+    """Bulk unassign verifiers from multiple abstracts with one DELETE."""
     actor_id, context = _resolve_actor_context("bulk_unassign_verifiers")
     try:
-        data = request.get_json() or {}
-
+        data = request.get_json(silent=True) or {}
         abstract_ids = data.get('abstract_ids')
         user_ids = data.get('user_ids')
 
@@ -1520,78 +1530,70 @@ def bulk_unassign_verifiers():
             )
             return jsonify({"error": error_msg}), 400
 
-        abstract_ids = [str(abstract_id) for abstract_id in abstract_ids]
-        user_ids = [str(user_id) for user_id in user_ids]
-
-        abstracts = abstract_utils.list_abstracts(
-            filters=[Abstracts.id.in_(abstract_ids)],
-            actor_id=actor_id,
-            context={**context, "operation": "bulk_unassign"},
-        )
-        abstracts_by_id = {str(abstract.id): abstract for abstract in abstracts}
-        missing_abstracts = [abstract_id for abstract_id in abstract_ids if abstract_id not in abstracts_by_id]
-        if missing_abstracts:
-            error_msg = f"Resource validation failed: Abstracts with IDs {missing_abstracts} do not exist"
+        try:
+            abstract_ids = list(dict.fromkeys(uuid.UUID(str(item)) for item in abstract_ids))
+            user_ids = list(dict.fromkeys(uuid.UUID(str(item)) for item in user_ids))
+            review_phase = data.get('review_phase')
+            if review_phase is not None:
+                review_phase = int(review_phase)
+                if review_phase < 1:
+                    raise ValueError("review_phase must be positive")
+        except (TypeError, ValueError):
+            error_msg = "Request validation failed: 'abstract_ids' and 'user_ids' must be lists of UUIDs and 'review_phase' a positive integer"
             log_audit_event(
                 event_type="abstract.verifiers.bulk_unassign.failed",
                 user_id=actor_id,
-                details={"error": error_msg, "missing_abstracts": missing_abstracts},
+                details={"error": error_msg},
                 ip_address=request.remote_addr
             )
-            return jsonify({"error": error_msg}), 404
+            return jsonify({"error": error_msg}), 400
 
-        users = User.query.filter(User.id.in_(user_ids)).all()
-        if len(users) != len(set(user_ids)):
-            found_ids = {str(user.id) for user in users}
-            missing_ids = [uid for uid in user_ids if uid not in found_ids]
-            error_msg = f"Resource validation failed: Users with IDs {missing_ids} do not exist"
+        check = check_assignment_targets(GradingFor.ABSTRACT, abstract_ids, user_ids)
+        if check.missing_submissions:
+            error_msg = f"Resource validation failed: Abstracts with IDs {check.missing_submissions} do not exist"
             log_audit_event(
                 event_type="abstract.verifiers.bulk_unassign.failed",
                 user_id=actor_id,
-                details={"error": error_msg, "missing_users": missing_ids},
+                details={"error": error_msg, "missing_abstracts": check.missing_submissions},
                 ip_address=request.remote_addr
             )
             return jsonify({"error": error_msg}), 404
-
-        assignments_deleted = 0
-        for abstract_id in abstract_ids:
-            abstract = abstracts_by_id[str(abstract_id)]
-            for user in users:
-                if any(verifier.id == user.id for verifier in abstract.verifiers):
-                    abstract_utils.remove_verifier(
-                        abstract,
-                        user,
-                        actor_id=actor_id,
-                        context={**context, "verifier_id": str(user.id), "abstract_id": str(abstract.id)},
-                    )
-                    assignments_deleted += 1
-
-        # Explicitly commit the transaction
-        if not safe_commit():
-            error_msg = "Database commit failed during bulk unassignment"
+        if check.missing_users:
+            error_msg = f"Resource validation failed: Users with IDs {check.missing_users} do not exist"
             log_audit_event(
                 event_type="abstract.verifiers.bulk_unassign.failed",
                 user_id=actor_id,
-                details={"error": error_msg},
+                details={"error": error_msg, "missing_users": check.missing_users},
                 ip_address=request.remote_addr
             )
-            return jsonify({"error": error_msg}), 500
+            return jsonify({"error": error_msg}), 404
+
+        result = bulk_unassign_verifiers_util(
+            GradingFor.ABSTRACT,
+            abstract_ids,
+            user_ids,
+            review_phase=review_phase,
+            actor_id=actor_id,
+        )
 
         # Log successful bulk unassignment
         log_audit_event(
             event_type="abstract.verifiers.bulk_unassign.success",
             user_id=actor_id,
             details={
-                "abstract_ids": abstract_ids,
-                "user_ids": user_ids,
-                "assignments_deleted": assignments_deleted
+                "abstract_ids": [str(item) for item in abstract_ids],
+                "user_ids": [str(item) for item in user_ids],
+                "review_phase": review_phase,
+                "assignments_deleted": result.changed_count,
+                "assignments_skipped": result.skipped_count
             },
             ip_address=request.remote_addr
         )
-        
+
         return jsonify({
-            "message": f"Successfully deleted {assignments_deleted} assignments",
-            "assignments_deleted": assignments_deleted
+            "message": f"Successfully deleted {result.changed_count} assignments",
+            "assignments_deleted": result.changed_count,
+            "assignments_skipped": result.skipped_count
         }), 200
     except Exception as exc:
         db.session.rollback()
@@ -1887,6 +1889,8 @@ def create_abstracts_excel(abstracts):
 
 
 @research_bp.route('/abstracts/export-excel', methods=['GET'])
+@statement_timeout('DB_EXPORT_STATEMENT_TIMEOUT_MS')
+@replica_reads()
 @jwt_required()
 @require_roles(Role.ADMIN.value, Role.SUPERADMIN.value)
 def export_abstracts_excel():
@@ -1945,6 +1949,8 @@ def export_abstracts_excel():
 
 
 @research_bp.route('/abstracts/export-pdf-zip', methods=['GET'])
+@statement_timeout('DB_EXPORT_STATEMENT_TIMEOUT_MS')
+@replica_reads()
 @jwt_required()
 @require_roles(Role.ADMIN.value, Role.SUPERADMIN.value)
 def export_abstracts_pdf_zip():
@@ -2054,6 +2060,8 @@ def export_abstracts_pdf_zip():
         )
         return jsonify({"error": error_msg}), 400
 @research_bp.route('/abstracts/export-with-pdfs', methods=['GET'])
+@statement_timeout('DB_EXPORT_STATEMENT_TIMEOUT_MS')
+@replica_reads()
 @jwt_required()
 @require_roles(Role.ADMIN.value, Role.SUPERADMIN.value)
 def export_abstracts_with_pdfs():
@@ -2164,6 +2172,8 @@ def export_abstracts_with_pdfs():
 
 
 @research_bp.route('/abstracts/export-with-grades', methods=['GET'])
+@statement_timeout('DB_EXPORT_STATEMENT_TIMEOUT_MS')
+@replica_reads()
 @jwt_required()
 @require_roles(Role.ADMIN.value, Role.SUPERADMIN.value, Role.COORDINATOR.value)
 def export_abstracts_with_grades():
@@ -2195,7 +2205,7 @@ def export_abstracts_with_grades():
                 return jsonify({"error": error_msg}), 400
             
             # Get grading type
-            grading_type = GradingType.query.get(grading_type_id)
+            grading_type = grading_type_cache.get(grading_type_id)
             if not grading_type:
                 error_msg = f"Resource not found: Grading type with ID {grading_type_id} does not exist"
                 log_audit_event(
@@ -2231,7 +2241,7 @@ def export_abstracts_with_grades():
             all_abstracts = [a for a in all_abstracts if str(a.cycle_id) == cycle_id]
         
         # Build grading type columns: only those with grading_for == ABSTRACT
-        grading_types = GradingType.query.filter(GradingType.grading_for == GradingFor.ABSTRACT).order_by(GradingType.criteria).all()
+        grading_types = grading_type_cache.for_target(GradingFor.ABSTRACT)
 
         # Create Excel workbook and sheet
         wb = openpyxl.Workbook()
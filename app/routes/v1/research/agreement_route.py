@@ -0,0 +1,59 @@
+from flask import request, jsonify, current_app
+from flask_jwt_extended import jwt_required
+
+from app.models.enumerations import Role
+from app.routes.v1.audit_log_route import log_audit_event
+from app.routes.v1.research import research_bp
+from app.routes.v1.user_role_route import _resolve_actor_context
+from app.services.agreement_service import agreement_report
+from app.services.bulk_review_service import ENTITY_SLUGS
+from app.utils.decorator import require_roles
+
+
+@research_bp.route(
+    '/cycles/<uuid:cycle_id>/<any(abstracts, awards, "best-papers"):entity>/agreement',
+    methods=['GET'],
+)
+@jwt_required()
+@require_roles(Role.COORDINATOR.value, Role.ADMIN.value, Role.SUPERADMIN.value)
+def get_agreement(cycle_id, entity):
+    """Stored inter-rater agreement for one kind of submission in a cycle.
+
+    Query: ``review_phase`` and ``verification_level`` (default: all). The
+    statistics are refreshed in the background after grading commits and by
+    ``flask agreement-refresh``; ``stale`` is true when grades changed after
+    the last run. Graders are listed by how far they deviate from their
+    co-graders, worst first.
+    """
+    grading_for = ENTITY_SLUGS[entity]
+    event_prefix = f"{grading_for.value}.agreement"
+    actor_id, context = _resolve_actor_context(f"agreement_{grading_for.value}")
+    try:
+        filters = {}
+        for name in ('review_phase', 'verification_level'):
+            value = request.args.get(name, '').strip()
+            filters[name] = int(value) if value else None
+    except ValueError as exc:
+        error_msg = f"Validation failed: {exc}"
+        log_audit_event(
+            event_type=f"{event_prefix}.failed",
+            user_id=actor_id,
+            details={"error": error_msg, "cycle_id": str(cycle_id)},
+            ip_address=request.remote_addr
+        )
+        return jsonify({"error": error_msg}), 400
+
+    try:
+        report = agreement_report(grading_for, cycle_id, **filters)
+    except Exception as exc:
+        current_app.logger.exception("Error reading %s agreement for cycle %s", grading_for.value, cycle_id)
+        error_msg = f"System error occurred while reading agreement statistics: {str(exc)}"
+        log_audit_event(
+            event_type=f"{event_prefix}.failed",
+            user_id=actor_id,
+            details={"error": error_msg, "exception_type": type(exc).__name__},
+            ip_address=request.remote_addr
+        )
+        return jsonify({"error": error_msg}), 400
+
+    return jsonify(report), 200
@@ -0,0 +1,72 @@
+from flask import request, jsonify, current_app
+from flask_jwt_extended import jwt_required
+
+from app.extensions import db
+from app.models.enumerations import Role
+from app.routes.v1.audit_log_route import log_audit_event
+from app.routes.v1.research import research_bp
+from app.routes.v1.user_role_route import _resolve_actor_context
+from app.services.auto_assignment_service import auto_assign, parse_auto_assign_options
+from app.services.bulk_review_service import ENTITY_SLUGS
+from app.utils.decorator import require_roles
+
+
+@research_bp.route(
+    '/<any(abstracts, awards, "best-papers"):entity>/auto-assign-verifiers',
+    methods=['POST'],
+)
+@jwt_required()
+@require_roles(Role.COORDINATOR.value, Role.ADMIN.value, Role.SUPERADMIN.value)
+def auto_assign_verifiers(entity):
+    """Assign verifiers to a cycle's open submissions, balancing workload.
+
+    Body: ``{"cycle_id": ..., "verifiers_per_submission": 2, "category_id":
+    ..., "max_load": ..., "submission_ids": [...], "statuses": [...],
+    "dry_run": false}``. Only verifiers registered for a submission's
+    category are chosen; with ``dry_run`` the plan is returned unsaved.
+    """
+    grading_for = ENTITY_SLUGS[entity]
+    event_prefix = f"{grading_for.value}.verifiers.auto_assign"
+    actor_id, context = _resolve_actor_context(f"auto_assign_{grading_for.value}_verifiers")
+    payload = request.get_json(silent=True) or {}
+    try:
+        options = parse_auto_assign_options(payload)
+    except ValueError as exc:
+        error_msg = f"Validation failed: {exc}"
+        log_audit_event(
+            event_type=f"{event_prefix}.failed",
+            user_id=actor_id,
+            details={"error": error_msg},
+            ip_address=request.remote_addr
+        )
+        return jsonify({"error": error_msg}), 400
+
+    dry_run = bool(payload.get("dry_run"))
+    try:
+        result = auto_assign(grading_for, actor_id=actor_id, dry_run=dry_run, **options)
+    except Exception as exc:
+        db.session.rollback()
+        current_app.logger.exception("Error in auto assignment for %s", entity)
+        error_msg = f"System error occurred during automatic assignment of verifiers: {str(exc)}"
+        log_audit_event(
+            event_type=f"{event_prefix}.failed",
+            user_id=actor_id,
+            details={"error": error_msg, "exception_type": type(exc).__name__},
+            ip_address=request.remote_addr
+        )
+        return jsonify({"error": error_msg}), 400
+
+    if not dry_run:
+        log_audit_event(
+            event_type=f"{event_prefix}.success",
+            user_id=actor_id,
+            details={
+                "cycle_id": str(options["cycle_id"]),
+                "verifiers_per_submission": options["per_submission"],
+                "submissions_considered": result["submissions_considered"],
+                "assignments_created": result["created_count"],
+                "unfilled_submissions": len(result["unfilled"]),
+            },
+            ip_address=request.remote_addr
+        )
+    return jsonify(result), 200 if dry_run else 201
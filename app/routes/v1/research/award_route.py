@@ -9,11 +9,21 @@ import openpyxl
 from app.models.User import User
 from app.routes.v1.audit_log_route import _resolve_actor_context
 from app.routes.v1.research import research_bp
-from app.models.Cycle import AwardVerifiers, Awards, Author, Category, PaperCategory, Cycle, GradingType, Grading, GradingFor
+from app.models.Cycle import AwardVerifiers, Awards, Author, Category, PaperCategory, Cycle, Grading, GradingFor
+from app.models.SearchIndex import search as search_submissions
 from app.schemas.awards_schema import AwardsSchema
-from app.extensions import db
+from app.extensions import db, replica_reads
+from app.utils.db_engine import statement_timeout
+from app.services.submission_status_service import parse_breakdown, status_summary
+from app.utils.model_utils.verifier_assignment_utils import (
+    bulk_assign_verifiers as bulk_assign_verifiers_util,
+    bulk_unassign_verifiers as bulk_unassign_verifiers_util,
+    check_assignment_targets,
+    verifier_counts,
+)
 from app.utils.decorator import require_roles
-from app.models.enumerations import Role, Status
+from app.utils import conditional_get, cycle_calendar, grading_type_cache, sparse_fields
+from app.models.enumerations import CyclePhase, Role, Status
 from werkzeug.utils import secure_filename
 from openpyxl.styles import Font, PatternFill, Alignment
 from openpyxl.utils import get_column_letter
@@ -247,12 +257,14 @@ def create_award():
             from app.utils.model_utils.cycle_utils import get_cycle_by_id as get_cycle_by_id_util
             cycle = get_cycle_by_id_util(cycle_id)
             if cycle:
-                from app.models.Cycle import CyclePhase
-                from app.utils.model_utils.cycle_utils import list_windows
                 from datetime import date
-                active_windows = list_windows(cycle_id=cycle_id, reference_date=date.today())
-                award_windows = [w for w in active_windows if w.phase == CyclePhase.AWARD_SUBMISSION]
-                if not award_windows:
+                award_window = cycle_calendar.open_window_id(
+                    db.session.connection(),
+                    cycle.id,
+                    (CyclePhase.AWARD_SUBMISSION, CyclePhase.SUBMISSION),
+                    date.today(),
+                )
+                if award_window is None:
                     error_msg = f"Submission validation failed: Award submissions are not allowed for cycle {cycle.name} at this time"
                     log_audit_event(
                         event_type="award.create.failed",
@@ -479,7 +491,7 @@ def get_awards():
         page = int(request.args.get('page', 1))
         status = request.args.get('status', '').strip().upper()
         page_size = int(request.args.get('page_size', 20))
-        sort_by = request.args.get('sort_by', 'id')
+        sort_by = request.args.get('sort_by') or ('relevance' if q else 'id')
         sort_dir = request.args.get('sort_dir', 'desc')
         verifier_filter = request.args.get('verifier', '').strip().lower() == 'true'
         
@@ -502,25 +514,15 @@ def get_awards():
         # Build filters based on user permissions and query parameters
         filters = []
         
-        # Apply search filter
+        # Apply search filter (full-text + trigram; see app.models.SearchIndex)
+        match = None
         if q:
-            q_int = q.isdigit() and int(q) or None
-            search_filters = []
-            
-            # Search in title
-            search_filters.append(Awards.title.ilike(f'%{q}%'))
-            
-            # Search in description if it exists
-            if hasattr(Awards, 'description'):
-                search_filters.append(Awards.description.ilike(f'%{q}%'))
-            
-            # Search by ID if q is numeric
-            if q_int:
-                search_filters.append(Awards.award_number == q_int)
-            
-            if search_filters:
+            match = search_submissions(GradingFor.AWARD, q)
+            if q.isdigit():
                 from sqlalchemy import or_
-                filters.append(or_(*search_filters))
+                filters.append(or_(match.condition, Awards.award_number == int(q)))
+            else:
+                filters.append(match.condition)
         
         # Apply status filter
         if status in ['PENDING', 'UNDER_REVIEW', 'ACCEPTED', 'REJECTED']:
@@ -606,8 +608,10 @@ def get_awards():
             order_by = Awards.created_at.asc() if sort_dir.lower() == 'asc' else Awards.created_at.desc()
         elif sort_by == 'id':
             order_by = Awards.id.asc() if sort_dir.lower() == 'asc' else Awards.id.desc()
+        elif sort_by == 'relevance':
+            order_by = (match.rank.desc(), Awards.id.desc()) if match is not None else Awards.id.desc()
         else:  # invalid sort field
-            error_msg = f"Validation failed: Invalid sort field '{sort_by}'. Valid fields are 'id', 'title', 'created_at'"
+            error_msg = f"Validation failed: Invalid sort field '{sort_by}'. Valid fields are 'id', 'title', 'created_at', 'relevance'"
             log_audit_event(
                 event_type="award.list.failed",
                 user_id=current_user_id,
@@ -616,6 +620,24 @@ def get_awards():
             )
             return jsonify({"error": error_msg}), 400
         
+        try:
+            fieldset = sparse_fields.parse_fieldset(AwardsSchema, request.args, extras=("verifiers_count",))
+        except ValueError as exc:
+            error_msg = f"Validation failed: {exc}"
+            log_audit_event(
+                event_type="award.list.failed",
+                user_id=current_user_id,
+                details={"error": error_msg, "fields": request.args.get('fields'), "include": request.args.get('include')},
+                ip_address=request.remote_addr
+            )
+            return jsonify({"error": error_msg}), 400
+
+        # The tag query also counts the filtered rows; no second count for `total`.
+        etag, total = conditional_get.list_etag(GradingFor.AWARD, filters, current_user_id)
+        cached = conditional_get.not_modified(etag)
+        if cached is not None:
+            return cached
+
         # Calculate offset
         offset = (page - 1) * page_size
         
@@ -625,25 +647,16 @@ def get_awards():
             order_by=order_by,
             limit=page_size,
             offset=offset,
-            eager=True,  # Load related data like author, verifiers
+            query_options=fieldset.options,  # only the requested relations
             actor_id=current_user_id
         )
         
-        # Count total records (without pagination)
-        from sqlalchemy import func
-        total_query = db.session.query(func.count(Awards.id))
-        for f in filters:
-            total_query = total_query.filter(f)
-        total = total_query.scalar()
-        
-        # Add verifiers count to each award
-        awards_data = []
-        for award in awards:
-            award_dict = award_schema.dump(award)
-            # Count verifiers assigned to this award
-            verifiers_count = db.session.query(AwardVerifiers).filter_by(award_id=award.id).count()
-            award_dict['verifiers_count'] = verifiers_count
-            awards_data.append(award_dict)
+        awards_data = fieldset.schema.dump(awards)
+        if sparse_fields.wants(fieldset, 'verifiers_count'):
+            # Count verifiers assigned to the page's awards in one query
+            counts = verifier_counts(GradingFor.AWARD, [award.id for award in awards])
+            for award, award_dict in zip(awards, awards_data):
+                award_dict['verifiers_count'] = counts.get(award.id, 0)
         
         # Prepare response
         response = {
@@ -671,7 +684,7 @@ def get_awards():
             ip_address=request.remote_addr
         )
         
-        return jsonify(response), 200
+        return conditional_get.tagged(jsonify(response), etag), 200
     except Exception as e:
         current_app.logger.exception("Error listing awards with parameters")
         error_msg = f"System error occurred while retrieving awards: {str(e)}"
@@ -689,6 +702,11 @@ def get_award(award_id):
     """Get a specific research award."""
     current_user_id = get_jwt_identity()
     try:
+        etag = conditional_get.detail_etag(GradingFor.AWARD, award_id)
+        cached = conditional_get.not_modified(etag)
+        if cached is not None:
+            return cached
+
         award = get_award_by_id_util(award_id)
         if not award:
             error_msg = f"Resource not found: Award with ID {award_id} does not exist"
@@ -720,7 +738,7 @@ def get_award(award_id):
             ip_address=request.remote_addr
         )
         
-        return jsonify(data), 200
+        return conditional_get.tagged(jsonify(data), etag), 200
     except Exception as e:
         current_app.logger.exception("Error retrieving award")
         error_msg = f"System error occurred while retrieving award: {str(e)}"
@@ -1082,45 +1100,23 @@ def get_award_submission_status():
             )
             return jsonify({"error": error_msg}), 404
 
-        # Build filters based on user permissions
-        filters = []
-        
-        if user.has_role(Role.ADMIN.value) or user.has_role(Role.SUPERADMIN.value):
-            # Admins can see all awards
-            pass
-        elif user.has_role(Role.VERIFIER.value):
-            # Verifiers can see awards assigned to them
-            from sqlalchemy import exists
-            filters.append(
-                exists().where(
-                    (AwardVerifiers.award_id == Awards.id) & 
-                    (AwardVerifiers.user_id == current_user_id)
-                )
+        try:
+            breakdown = parse_breakdown(request.args.get("breakdown"))
+        except ValueError as exc:
+            error_msg = str(exc)
+            log_audit_event(
+                event_type="award.status.get.failed",
+                user_id=current_user_id,
+                details={"error": error_msg},
+                ip_address=request.remote_addr
             )
-        else:
-            # Regular users can only see their own awards
-            filters.append(Awards.created_by_id == current_user_id)
+            return jsonify({"error": error_msg}), 400
 
-        # Count awards by status
-        pending_awards = db.session.query(Awards).filter(
-            *filters,
-            Awards.status == Status.PENDING
-        ).count()
-        
-        under_review_awards = db.session.query(Awards).filter(
-            *filters,
-            Awards.status == Status.UNDER_REVIEW
-        ).count()
-        
-        accepted_awards = db.session.query(Awards).filter(
-            *filters,
-            Awards.status == Status.ACCEPTED
-        ).count()
-        
-        rejected_awards = db.session.query(Awards).filter(
-            *filters,
-            Awards.status == Status.REJECTED
-        ).count()
+        payload = status_summary("award", user, breakdown=breakdown)
+        pending_awards = payload[Status.PENDING.value]
+        under_review_awards = payload[Status.UNDER_REVIEW.value]
+        accepted_awards = payload[Status.ACCEPTED.value]
+        rejected_awards = payload[Status.REJECTED.value]
 
         # Log successful retrieval
         log_audit_event(
@@ -1136,12 +1132,7 @@ def get_award_submission_status():
             ip_address=request.remote_addr
         )
 
-        return jsonify({
-            "pending": pending_awards,
-            "under_review": under_review_awards,
-            "accepted": accepted_awards,
-            "rejected": rejected_awards
-        }), 200
+        return jsonify(payload), 200
     except Exception as e:
         current_app.logger.exception("Error getting award submission status")
         error_msg = f"System error occurred while retrieving award status: {str(e)}"
@@ -1420,13 +1411,20 @@ def get_awards_for_verifier(user_id):
 @jwt_required()
 @require_roles(Role.COORDINATOR.value, Role.ADMIN.value, Role.SUPERADMIN.value)
 def bulk_assign_verifiers_to_awards():
-    """Bulk assign verifiers to multiple awards."""
+    """Bulk assign verifiers to multiple awards.
+
+    Every missing (award, verifier) pair is inserted with one
+    statement at the award's current review phase (or
+    ``review_phase``); pairs that already exist are reported as skipped.
+    """
     current_user_id = get_jwt_identity()
     try:
-        data = request.get_json()
-        
+        data = request.get_json(silent=True) or {}
+        award_ids = data.get('award_ids')
+        user_ids = data.get('user_ids')
+
         # Validate input
-        if not data or 'award_ids' not in data or 'user_ids' not in data:
+        if not award_ids or not user_ids:
             error_msg = "Request validation failed: Missing required fields 'award_ids' or 'user_ids' in request body"
             log_audit_event(
                 event_type="award.verifiers.bulk_assign.failed",
@@ -1435,84 +1433,84 @@ def bulk_assign_verifiers_to_awards():
                 ip_address=request.remote_addr
             )
             return jsonify({"error": error_msg}), 400
-        
-        award_ids = data['award_ids']
-        user_ids = data['user_ids']
-        
-        # Validate that all awards and users exist
-        awards = [get_award_by_id_util(aid) for aid in award_ids]
-        users = [get_user_by_id_util(uid) for uid in user_ids]
-        
-        # Check if any awards or users are None (not found)
-        if None in awards:
-            missing_awards = [aid for i, aid in enumerate(award_ids) if awards[i] is None]
-            error_msg = f"Resource validation failed: Awards with IDs {missing_awards} do not exist"
+
+        try:
+            award_ids = list(dict.fromkeys(uuid.UUID(str(item)) for item in award_ids))
+            user_ids = list(dict.fromkeys(uuid.UUID(str(item)) for item in user_ids))
+            review_phase = data.get('review_phase')
+            if review_phase is not None:
+                review_phase = int(review_phase)
+                if review_phase < 1:
+                    raise ValueError("review_phase must be positive")
+        except (TypeError, ValueError):
+            error_msg = "Request validation failed: 'award_ids' and 'user_ids' must be lists of UUIDs and 'review_phase' a positive integer"
+            log_audit_event(
+                event_type="award.verifiers.bulk_assign.failed",
+                user_id=current_user_id,
+                details={"error": error_msg},
+                ip_address=request.remote_addr
+            )
+            return jsonify({"error": error_msg}), 400
+
+        check = check_assignment_targets(GradingFor.AWARD, award_ids, user_ids)
+        if check.missing_submissions:
+            error_msg = f"Resource validation failed: Awards with IDs {check.missing_submissions} do not exist"
             log_audit_event(
                 event_type="award.verifiers.bulk_assign.failed",
                 user_id=current_user_id,
-                details={"error": error_msg, "missing_awards": missing_awards},
+                details={"error": error_msg, "missing_awards": check.missing_submissions},
                 ip_address=request.remote_addr
             )
             return jsonify({"error": error_msg}), 404
-        if None in users:
-            missing_users = [uid for i, uid in enumerate(user_ids) if users[i] is None]
-            error_msg = f"Resource validation failed: Users with IDs {missing_users} do not exist"
+        if check.missing_users:
+            error_msg = f"Resource validation failed: Users with IDs {check.missing_users} do not exist"
             log_audit_event(
                 event_type="award.verifiers.bulk_assign.failed",
                 user_id=current_user_id,
-                details={"error": error_msg, "missing_users": missing_users},
+                details={"error": error_msg, "missing_users": check.missing_users},
                 ip_address=request.remote_addr
             )
             return jsonify({"error": error_msg}), 404
-        
-        # Check if all users are verifiers
-        non_verifiers = [user for user in users if not user.has_role(Role.VERIFIER.value)]
-        if non_verifiers:
-            non_verifier_ids = [str(user.id) for user in non_verifiers]
-            error_msg = f"Validation failed: Users with IDs {non_verifier_ids} are not verifiers"
+        if check.non_verifiers:
+            error_msg = f"Validation failed: Users with IDs {check.non_verifiers} are not verifiers"
             log_audit_event(
                 event_type="award.verifiers.bulk_assign.failed",
                 user_id=current_user_id,
-                details={"error": error_msg, "non_verifier_ids": non_verifier_ids},
+                details={"error": error_msg, "non_verifier_ids": check.non_verifiers},
                 ip_address=request.remote_addr
             )
             return jsonify({"error": error_msg}), 400
-        
-        # Create assignments using utility functions
-        assignments_created = 0
-        for award_id in award_ids:
-            for user_id in user_ids:
-                # Get the award and user objects
-                award = get_award_by_id_util(award_id)
-                user = get_user_by_id_util(user_id)
-                
-                # Check if already assigned
-                existing_assignment = db.session.query(AwardVerifiers).filter_by(
-                    award_id=award_id, user_id=user_id).first()
-                
-                if not existing_assignment:
-                    # Use the utility function to assign verifier
-                    assign_award_verifier_util(award, user, actor_id=current_user_id)
-                    assignments_created += 1
-        
+
+        result = bulk_assign_verifiers_util(
+            GradingFor.AWARD,
+            award_ids,
+            user_ids,
+            review_phase=review_phase,
+            actor_id=current_user_id,
+        )
+
         # Log successful bulk assignment
         log_audit_event(
             event_type="award.verifiers.bulk_assign.success",
             user_id=current_user_id,
             details={
-                "award_ids": award_ids,
-                "user_ids": user_ids,
-                "assignments_created": assignments_created,
-                "total_possible_assignments": len(award_ids) * len(user_ids)
+                "award_ids": [str(item) for item in award_ids],
+                "user_ids": [str(item) for item in user_ids],
+                "review_phase": review_phase,
+                "assignments_created": result.changed_count,
+                "assignments_skipped": result.skipped_count,
+                "total_possible_assignments": result.requested
             },
             ip_address=request.remote_addr
         )
-        
+
         return jsonify({
-            "message": f"Successfully created {assignments_created} assignments",
-            "assignments_created": assignments_created
+            "message": f"Successfully created {result.changed_count} assignments",
+            "assignments_created": result.changed_count,
+            "assignments_skipped": result.skipped_count
         }), 201
     except Exception as e:
+        db.session.rollback()
         current_app.logger.exception("Error in bulk assigning verifiers to awards")
         error_msg = f"System error occurred during bulk assignment of verifiers: {str(e)}"
         log_audit_event(
@@ -1528,13 +1526,15 @@ def bulk_assign_verifiers_to_awards():
 @jwt_required()
 @require_roles(Role.COORDINATOR.value, Role.ADMIN.value, Role.SUPERADMIN.value)
 def bulk_unassign_verifiers_from_awards():
-    """Bulk unassign verifiers from multiple awards."""
+    """Bulk unassign verifiers from multiple awards with one DELETE."""
     current_user_id = get_jwt_identity()
     try:
-        data = request.get_json()
-        
+        data = request.get_json(silent=True) or {}
+        award_ids = data.get('award_ids')
+        user_ids = data.get('user_ids')
+
         # Validate input
-        if not data or 'award_ids' not in data or 'user_ids' not in data:
+        if not award_ids or not user_ids:
             error_msg = "Request validation failed: Missing required fields 'award_ids' or 'user_ids' in request body"
             log_audit_event(
                 event_type="award.verifiers.bulk_unassign.failed",
@@ -1543,42 +1543,51 @@ def bulk_unassign_verifiers_from_awards():
                 ip_address=request.remote_addr
             )
             return jsonify({"error": error_msg}), 400
-        
-        award_ids = data['award_ids']
-        user_ids = data['user_ids']
-        
-        # Delete assignments
-        assignments_deleted = db.session.query(AwardVerifiers).filter(
-            AwardVerifiers.award_id.in_(award_ids),
-            AwardVerifiers.user_id.in_(user_ids)
-        ).delete(synchronize_session=False)
-        
-        # Explicitly commit the transaction
-        if not safe_commit():
-            error_msg = "Database commit failed during bulk unassignment"
+
+        try:
+            award_ids = list(dict.fromkeys(uuid.UUID(str(item)) for item in award_ids))
+            user_ids = list(dict.fromkeys(uuid.UUID(str(item)) for item in user_ids))
+            review_phase = data.get('review_phase')
+            if review_phase is not None:
+                review_phase = int(review_phase)
+                if review_phase < 1:
+                    raise ValueError("review_phase must be positive")
+        except (TypeError, ValueError):
+            error_msg = "Request validation failed: 'award_ids' and 'user_ids' must be lists of UUIDs and 'review_phase' a positive integer"
             log_audit_event(
                 event_type="award.verifiers.bulk_unassign.failed",
                 user_id=current_user_id,
                 details={"error": error_msg},
                 ip_address=request.remote_addr
             )
-            return jsonify({"error": error_msg}), 500
-        
+            return jsonify({"error": error_msg}), 400
+
+        result = bulk_unassign_verifiers_util(
+            GradingFor.AWARD,
+            award_ids,
+            user_ids,
+            review_phase=review_phase,
+            actor_id=current_user_id,
+        )
+
         # Log successful bulk unassignment
         log_audit_event(
             event_type="award.verifiers.bulk_unassign.success",
             user_id=current_user_id,
             details={
-                "award_ids": award_ids,
-                "user_ids": user_ids,
-                "assignments_deleted": assignments_deleted
+                "award_ids": [str(item) for item in award_ids],
+                "user_ids": [str(item) for item in user_ids],
+                "review_phase": review_phase,
+                "assignments_deleted": result.changed_count,
+                "assignments_skipped": result.skipped_count
             },
             ip_address=request.remote_addr
         )
-        
+
         return jsonify({
-            "message": f"Successfully deleted {assignments_deleted} assignments",
-            "assignments_deleted": assignments_deleted
+            "message": f"Successfully deleted {result.changed_count} assignments",
+            "assignments_deleted": result.changed_count,
+            "assignments_skipped": result.skipped_count
         }), 200
     except Exception as e:
         db.session.rollback()
@@ -1693,6 +1702,8 @@ def create_awards_excel(awards):
 
 
 @research_bp.route('/awards/export-with-grades', methods=['GET'])
+@statement_timeout('DB_EXPORT_STATEMENT_TIMEOUT_MS')
+@replica_reads()
 @jwt_required()
 @require_roles(Role.ADMIN.value, Role.SUPERADMIN.value, Role.COORDINATOR.value)
 def export_awards_with_grades():
@@ -1719,7 +1730,7 @@ def export_awards_with_grades():
                     ip_address=request.remote_addr
                 )
                 return jsonify({"error": error_msg}), 400
-            grading_type = GradingType.query.get(grading_type_id)
+            grading_type = grading_type_cache.get(grading_type_id)
             if not grading_type:
                 error_msg = f"Resource not found: Grading type with ID {grading_type_id} does not exist"
                 log_audit_event(
@@ -1757,7 +1768,7 @@ def export_awards_with_grades():
             awards = [a for a in awards if str(a.cycle_id) == cycle_id]
 
         # Build grading type columns for AWARD
-        grading_types = GradingType.query.filter(GradingType.grading_for == GradingFor.AWARD).order_by(GradingType.criteria).all()
+        grading_types = grading_type_cache.for_target(GradingFor.AWARD)
 
         # Create workbook
         wb = openpyxl.Workbook()
@@ -1887,6 +1898,8 @@ def export_awards_with_grades():
 
 
 @research_bp.route('/awards/export-excel', methods=['GET'])
+@statement_timeout('DB_EXPORT_STATEMENT_TIMEOUT_MS')
+@replica_reads()
 @jwt_required()
 @require_roles(Role.ADMIN.value, Role.SUPERADMIN.value)
 def export_awards_to_excel():
@@ -1945,6 +1958,8 @@ def export_awards_to_excel():
 
 
 @research_bp.route('/awards/export-pdf-zip', methods=['GET'])
+@statement_timeout('DB_EXPORT_STATEMENT_TIMEOUT_MS')
+@replica_reads()
 @jwt_required()
 @require_roles(Role.ADMIN.value, Role.SUPERADMIN.value)
 def export_awards_pdf_zip():
@@ -2055,6 +2070,8 @@ def export_awards_pdf_zip():
         return jsonify({"error": error_msg}), 400
 
 @research_bp.route('/awards/export-with-pdfs', methods=['GET'])
+@statement_timeout('DB_EXPORT_STATEMENT_TIMEOUT_MS')
+@replica_reads()
 @jwt_required()
 @require_roles(Role.ADMIN.value, Role.SUPERADMIN.value)
 def export_awards_with_pdfs():
@@ -7,12 +7,22 @@ import uuid
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from app.models.User import User
 from app.routes.v1.research import research_bp
-from app.models.Cycle import BestPaperVerifiers, BestPaper, Author, Category, PaperCategory, Cycle, GradingType, Grading, GradingFor
+from app.models.Cycle import BestPaperVerifiers, BestPaper, Author, Category, PaperCategory, Cycle, Grading, GradingFor
 from app.routes.v1.user_role_route import _resolve_actor_context
+from app.models.SearchIndex import search as search_submissions
 from app.schemas.best_paper_schema import BestPaperSchema
-from app.extensions import db
+from app.extensions import db, replica_reads
+from app.utils.db_engine import statement_timeout
+from app.services.submission_status_service import parse_breakdown, status_summary
+from app.utils.model_utils.verifier_assignment_utils import (
+    bulk_assign_verifiers as bulk_assign_verifiers_util,
+    bulk_unassign_verifiers as bulk_unassign_verifiers_util,
+    check_assignment_targets,
+    verifier_counts,
+)
 from app.utils.decorator import require_roles
-from app.models.enumerations import Role, Status
+from app.utils import conditional_get, cycle_calendar, grading_type_cache, sparse_fields
+from app.models.enumerations import CyclePhase, Role, Status
 from werkzeug.utils import secure_filename
 
 from app.utils.services.mail import send_mail
@@ -247,12 +257,14 @@ def create_best_paper():
             from app.utils.model_utils.cycle_utils import get_cycle_by_id as get_cycle_by_id_util
             cycle = get_cycle_by_id_util(cycle_id)
             if cycle:
-                from app.models.Cycle import CyclePhase
-                from app.utils.model_utils.cycle_utils import list_windows
                 from datetime import date
-                active_windows = list_windows(cycle_id=cycle_id, reference_date=date.today())
-                best_paper_windows = [w for w in active_windows if w.phase == CyclePhase.BEST_PAPER_SUBMISSION]
-                if not best_paper_windows:
+                best_paper_window = cycle_calendar.open_window_id(
+                    db.session.connection(),
+                    cycle.id,
+                    (CyclePhase.BEST_PAPER_SUBMISSION, CyclePhase.SUBMISSION),
+                    date.today(),
+                )
+                if best_paper_window is None:
                     error_msg = f"Submission validation failed: Best paper submissions are not allowed for cycle {cycle.name} at this time"
                     log_audit_event(
                         event_type="best_paper.create.failed",
@@ -480,7 +492,7 @@ def get_best_papers():
         page = int(request.args.get('page', 1))
         status = request.args.get('status', '').strip().upper()
         page_size = int(request.args.get('page_size', 20))
-        sort_by = request.args.get('sort_by', 'id')
+        sort_by = request.args.get('sort_by') or ('relevance' if q else 'id')
         sort_dir = request.args.get('sort_dir', 'desc')
         verifier_filter = request.args.get('verifier', '').strip().lower() == 'true'
         
@@ -503,25 +515,15 @@ def get_best_papers():
         # Build filters based on user permissions and query parameters
         filters = []
         
-        # Apply search filter
+        # Apply search filter (full-text + trigram; see app.models.SearchIndex)
+        match = None
         if q:
-            q_int = q.isdigit() and int(q) or None
-            search_filters = []
-            
-            # Search in title
-            search_filters.append(BestPaper.title.ilike(f'%{q}%'))
-            
-            # Search in content if it exists
-            if hasattr(BestPaper, 'content'):
-                search_filters.append(BestPaper.content.ilike(f'%{q}%'))
-            
-            # Search by ID if q is numeric
-            if q_int:
-                search_filters.append(BestPaper.bestpaper_number == q_int)
-            
-            if search_filters:
+            match = search_submissions(GradingFor.BEST_PAPER, q)
+            if q.isdigit():
                 from sqlalchemy import or_
-                filters.append(or_(*search_filters))
+                filters.append(or_(match.condition, BestPaper.bestpaper_number == int(q)))
+            else:
+                filters.append(match.condition)
         
         # Apply status filter
         if status in ['PENDING', 'UNDER_REVIEW', 'ACCEPTED', 'REJECTED']:
@@ -607,8 +609,10 @@ def get_best_papers():
             order_by = BestPaper.created_at.asc() if sort_dir.lower() == 'asc' else BestPaper.created_at.desc()
         elif sort_by == 'id':
             order_by = BestPaper.id.asc() if sort_dir.lower() == 'asc' else BestPaper.id.desc()
+        elif sort_by == 'relevance':
+            order_by = (match.rank.desc(), BestPaper.id.desc()) if match is not None else BestPaper.id.desc()
         else: # invalid sort field
-            error_msg = f"Validation failed: Invalid sort field '{sort_by}'. Valid fields are 'id', 'title', 'created_at'"
+            error_msg = f"Validation failed: Invalid sort field '{sort_by}'. Valid fields are 'id', 'title', 'created_at', 'relevance'"
             log_audit_event(
                 event_type="best_paper.list.failed",
                 user_id=current_user_id,
@@ -617,6 +621,24 @@ def get_best_papers():
             )
             return jsonify({"error": error_msg}), 40
         
+        try:
+            fieldset = sparse_fields.parse_fieldset(BestPaperSchema, request.args, extras=("verifiers_count",))
+        except ValueError as exc:
+            error_msg = f"Validation failed: {exc}"
+            log_audit_event(
+                event_type="best_paper.list.failed",
+                user_id=current_user_id,
+                details={"error": error_msg, "fields": request.args.get('fields'), "include": request.args.get('include')},
+                ip_address=request.remote_addr
+            )
+            return jsonify({"error": error_msg}), 400
+
+        # The tag query also counts the filtered rows; no second count for `total`.
+        etag, total = conditional_get.list_etag(GradingFor.BEST_PAPER, filters, current_user_id)
+        cached = conditional_get.not_modified(etag)
+        if cached is not None:
+            return cached
+
         # Calculate offset
         offset = (page - 1) * page_size
         
@@ -626,25 +648,16 @@ def get_best_papers():
             order_by=order_by,
             limit=page_size,
             offset=offset,
-            eager=True,  # Load related data like author, verifiers
+            query_options=fieldset.options,  # only the requested relations
             actor_id=current_user_id
         )
         
-        # Count total records (without pagination)
-        from sqlalchemy import func
-        total_query = db.session.query(func.count(BestPaper.id))
-        for f in filters:
-            total_query = total_query.filter(f)
-        total = total_query.scalar()
-        
-        # Add verifiers count to each best paper
-        best_papers_data = []
-        for best_paper in best_papers:
-            best_paper_dict = best_paper_schema.dump(best_paper)
-            # Count verifiers assigned to this best paper
-            verifiers_count = db.session.query(BestPaperVerifiers).filter_by(best_paper_id=best_paper.id).count()
-            best_paper_dict['verifiers_count'] = verifiers_count
-            best_papers_data.append(best_paper_dict)
+        best_papers_data = fieldset.schema.dump(best_papers)
+        if sparse_fields.wants(fieldset, 'verifiers_count'):
+            # Count verifiers assigned to the page's best papers in one query
+            counts = verifier_counts(GradingFor.BEST_PAPER, [best_paper.id for best_paper in best_papers])
+            for best_paper, best_paper_dict in zip(best_papers, best_papers_data):
+                best_paper_dict['verifiers_count'] = counts.get(best_paper.id, 0)
         
         # Prepare response
         response = {
@@ -672,7 +685,7 @@ def get_best_papers():
             ip_address=request.remote_addr
         )
         
-        return jsonify(response), 200
+        return conditional_get.tagged(jsonify(response), etag), 200
     except Exception as e:
         current_app.logger.exception("Error listing best papers with parameters")
         error_msg = f"System error occurred while retrieving best papers: {str(e)}"
@@ -690,6 +703,11 @@ def get_best_paper(best_paper_id):
     """Get a specific Best Paper submission."""
     current_user_id = get_jwt_identity()
     try:
+        etag = conditional_get.detail_etag(GradingFor.BEST_PAPER, best_paper_id)
+        cached = conditional_get.not_modified(etag)
+        if cached is not None:
+            return cached
+
         best_paper = get_best_paper_by_id_util(best_paper_id)
         if not best_paper:
             error_msg = f"Resource not found: Best paper with ID {best_paper_id} does not exist"
@@ -721,7 +739,7 @@ def get_best_paper(best_paper_id):
             ip_address=request.remote_addr
         )
         
-        return jsonify(data), 200
+        return conditional_get.tagged(jsonify(data), etag), 200
     except Exception as e:
         current_app.logger.exception("Error retrieving best paper")
         error_msg = f"System error occurred while retrieving best paper: {str(e)}"
@@ -966,45 +984,23 @@ def get_best_paper_submission_status():
             )
             return jsonify({"error": error_msg}), 404
 
-        # Build filters based on user permissions
-        filters = []
-        
-        if user.has_role(Role.ADMIN.value) or user.has_role(Role.SUPERADMIN.value):
-            # Admins can see all submissions
-            pass
-        elif user.has_role(Role.VERIFIER.value):
-            # Verifiers can see submissions assigned to them
-            from sqlalchemy import exists
-            filters.append(
-                exists().where(
-                    (BestPaperVerifiers.best_paper_id == BestPaper.id) & 
-                    (BestPaperVerifiers.user_id == current_user_id)
-                )
+        try:
+            breakdown = parse_breakdown(request.args.get("breakdown"))
+        except ValueError as exc:
+            error_msg = str(exc)
+            log_audit_event(
+                event_type="best_paper.status.get.failed",
+                user_id=current_user_id,
+                details={"error": error_msg},
+                ip_address=request.remote_addr
             )
-        else:
-            # Regular users can only see their own submissions
-            filters.append(BestPaper.created_by_id == current_user_id)
+            return jsonify({"error": error_msg}), 400
 
-        # Count best papers by status
-        pending_count = db.session.query(BestPaper).filter(
-            *filters,
-            BestPaper.status == Status.PENDING
-        ).count()
-        
-        under_review_count = db.session.query(BestPaper).filter(
-            *filters,
-            BestPaper.status == Status.UNDER_REVIEW
-        ).count()
-        
-        accepted_count = db.session.query(BestPaper).filter(
-            *filters,
-            BestPaper.status == Status.ACCEPTED
-        ).count()
-        
-        rejected_count = db.session.query(BestPaper).filter(
-            *filters,
-            BestPaper.status == Status.REJECTED
-        ).count()
+        payload = status_summary("best_paper", user, breakdown=breakdown)
+        pending_count = payload[Status.PENDING.value]
+        under_review_count = payload[Status.UNDER_REVIEW.value]
+        accepted_count = payload[Status.ACCEPTED.value]
+        rejected_count = payload[Status.REJECTED.value]
 
         # Log successful retrieval
         log_audit_event(
@@ -1020,12 +1016,7 @@ def get_best_paper_submission_status():
             ip_address=request.remote_addr
         )
 
-        return jsonify({
-            "pending": pending_count,
-            "under_review": under_review_count,
-            "accepted": accepted_count,
-            "rejected": rejected_count
-        }), 200
+        return jsonify(payload), 200
     except Exception as e:
         current_app.logger.exception("Error getting best paper submission status")
         error_msg = f"System error occurred while retrieving best paper status: {str(e)}"
@@ -1413,13 +1404,20 @@ def accept_paper(paper_id):
 @jwt_required()
 @require_roles(Role.COORDINATOR.value, Role.ADMIN.value, Role.SUPERADMIN.value)
 def bulk_assign_verifiers_to_best_papers():
-    """Bulk assign verifiers to multiple best papers."""
+    """Bulk assign verifiers to multiple best papers.
+
+    Every missing (best paper, verifier) pair is inserted with one
+    statement at the best paper's current review phase (or
+    ``review_phase``); pairs that already exist are reported as skipped.
+    """
     current_user_id = get_jwt_identity()
     try:
-        data = request.get_json()
-        
+        data = request.get_json(silent=True) or {}
+        best_paper_ids = data.get('best_paper_ids')
+        user_ids = data.get('user_ids')
+
         # Validate input
-        if not data or 'best_paper_ids' not in data or 'user_ids' not in data:
+        if not best_paper_ids or not user_ids:
             error_msg = "Request validation failed: Missing required fields 'best_paper_ids' or 'user_ids' in request body"
             log_audit_event(
                 event_type="best_paper.verifiers.bulk_assign.failed",
@@ -1428,84 +1426,84 @@ def bulk_assign_verifiers_to_best_papers():
                 ip_address=request.remote_addr
             )
             return jsonify({"error": error_msg}), 400
-        
-        best_paper_ids = data['best_paper_ids']
-        user_ids = data['user_ids']
-        
-        # Validate that all best papers and users exist
-        best_papers = [get_best_paper_by_id_util(bpid) for bpid in best_paper_ids]
-        users = [get_user_by_id_util(uid) for uid in user_ids]
-        
-        # Check if any best papers or users are None (not found)
-        if None in best_papers:
-            missing_best_papers = [bpid for i, bpid in enumerate(best_paper_ids) if best_papers[i] is None]
-            error_msg = f"Resource validation failed: Best papers with IDs {missing_best_papers} do not exist"
+
+        try:
+            best_paper_ids = list(dict.fromkeys(uuid.UUID(str(item)) for item in best_paper_ids))
+            user_ids = list(dict.fromkeys(uuid.UUID(str(item)) for item in user_ids))
+            review_phase = data.get('review_phase')
+            if review_phase is not None:
+                review_phase = int(review_phase)
+                if review_phase < 1:
+                    raise ValueError("review_phase must be positive")
+        except (TypeError, ValueError):
+            error_msg = "Request validation failed: 'best_paper_ids' and 'user_ids' must be lists of UUIDs and 'review_phase' a positive integer"
             log_audit_event(
                 event_type="best_paper.verifiers.bulk_assign.failed",
                 user_id=current_user_id,
-                details={"error": error_msg, "missing_best_papers": missing_best_papers},
+                details={"error": error_msg},
+                ip_address=request.remote_addr
+            )
+            return jsonify({"error": error_msg}), 400
+
+        check = check_assignment_targets(GradingFor.BEST_PAPER, best_paper_ids, user_ids)
+        if check.missing_submissions:
+            error_msg = f"Resource validation failed: Best papers with IDs {check.missing_submissions} do not exist"
+            log_audit_event(
+                event_type="best_paper.verifiers.bulk_assign.failed",
+                user_id=current_user_id,
+                details={"error": error_msg, "missing_best_papers": check.missing_submissions},
                 ip_address=request.remote_addr
             )
             return jsonify({"error": error_msg}), 404
-        if None in users:
-            missing_users = [uid for i, uid in enumerate(user_ids) if users[i] is None]
-            error_msg = f"Resource validation failed: Users with IDs {missing_users} do not exist"
+        if check.missing_users:
+            error_msg = f"Resource validation failed: Users with IDs {check.missing_users} do not exist"
             log_audit_event(
                 event_type="best_paper.verifiers.bulk_assign.failed",
                 user_id=current_user_id,
-                details={"error": error_msg, "missing_users": missing_users},
+                details={"error": error_msg, "missing_users": check.missing_users},
                 ip_address=request.remote_addr
             )
             return jsonify({"error": error_msg}), 404
-        
-        # Check if all users are verifiers
-        non_verifiers = [user for user in users if not user.has_role(Role.VERIFIER.value)]
-        if non_verifiers:
-            non_verifier_ids = [str(user.id) for user in non_verifiers]
-            error_msg = f"Validation failed: Users with IDs {non_verifier_ids} are not verifiers"
+        if check.non_verifiers:
+            error_msg = f"Validation failed: Users with IDs {check.non_verifiers} are not verifiers"
             log_audit_event(
                 event_type="best_paper.verifiers.bulk_assign.failed",
                 user_id=current_user_id,
-                details={"error": error_msg, "non_verifier_ids": non_verifier_ids},
+                details={"error": error_msg, "non_verifier_ids": check.non_verifiers},
                 ip_address=request.remote_addr
             )
-            return jsonify({"error": error_msg}), 40
-        
-        # Create assignments using utility functions
-        assignments_created = 0
-        for best_paper_id in best_paper_ids:
-            for user_id in user_ids:
-                # Get the best paper and user objects
-                best_paper = get_best_paper_by_id_util(best_paper_id)
-                user = get_user_by_id_util(user_id)
-                
-                # Check if already assigned
-                existing_assignment = db.session.query(BestPaperVerifiers).filter_by(
-                    best_paper_id=best_paper_id, user_id=user_id).first()
-                
-                if not existing_assignment:
-                    # Use the utility function to assign verifier
-                    assign_best_paper_verifier_util(best_paper, user, actor_id=current_user_id)
-                    assignments_created += 1
-        
+            return jsonify({"error": error_msg}), 400
+
+        result = bulk_assign_verifiers_util(
+            GradingFor.BEST_PAPER,
+            best_paper_ids,
+            user_ids,
+            review_phase=review_phase,
+            actor_id=current_user_id,
+        )
+
         # Log successful bulk assignment
         log_audit_event(
             event_type="best_paper.verifiers.bulk_assign.success",
             user_id=current_user_id,
             details={
-                "best_paper_ids": best_paper_ids,
-                "user_ids": user_ids,
-                "assignments_created": assignments_created,
-                "total_possible_assignments": len(best_paper_ids) * len(user_ids)
+                "best_paper_ids": [str(item) for item in best_paper_ids],
+                "user_ids": [str(item) for item in user_ids],
+                "review_phase": review_phase,
+                "assignments_created": result.changed_count,
+                "assignments_skipped": result.skipped_count,
+                "total_possible_assignments": result.requested
             },
             ip_address=request.remote_addr
         )
-        
+
         return jsonify({
-            "message": f"Successfully created {assignments_created} assignments",
-            "assignments_created": assignments_created
+            "message": f"Successfully created {result.changed_count} assignments",
+            "assignments_created": result.changed_count,
+            "assignments_skipped": result.skipped_count
         }), 201
     except Exception as e:
+        db.session.rollback()
         current_app.logger.exception("Error in bulk assigning verifiers to best papers")
         error_msg = f"System error occurred during bulk assignment of verifiers: {str(e)}"
         log_audit_event(
@@ -1514,20 +1512,22 @@ def bulk_assign_verifiers_to_best_papers():
             details={"error": error_msg, "exception_type": type(e).__name__, "exception_message": str(e)},
             ip_address=request.remote_addr
         )
-        return jsonify({"error": error_msg}), 40
+        return jsonify({"error": error_msg}), 400
 
 
 @research_bp.route('/best-papers/bulk-unassign-verifiers', methods=['POST'])
 @jwt_required()
 @require_roles(Role.COORDINATOR.value, Role.ADMIN.value, Role.SUPERADMIN.value)
 def bulk_unassign_verifiers_from_best_papers():
-    """Bulk unassign verifiers from multiple best papers."""
+    """Bulk unassign verifiers from multiple best papers with one DELETE."""
     current_user_id = get_jwt_identity()
     try:
-        data = request.get_json()
-        
+        data = request.get_json(silent=True) or {}
+        best_paper_ids = data.get('best_paper_ids')
+        user_ids = data.get('user_ids')
+
         # Validate input
-        if not data or 'best_paper_ids' not in data or 'user_ids' not in data:
+        if not best_paper_ids or not user_ids:
             error_msg = "Request validation failed: Missing required fields 'best_paper_ids' or 'user_ids' in request body"
             log_audit_event(
                 event_type="best_paper.verifiers.bulk_unassign.failed",
@@ -1536,42 +1536,51 @@ def bulk_unassign_verifiers_from_best_papers():
                 ip_address=request.remote_addr
             )
             return jsonify({"error": error_msg}), 400
-        
-        best_paper_ids = data['best_paper_ids']
-        user_ids = data['user_ids']
-        
-        # Delete assignments
-        assignments_deleted = db.session.query(BestPaperVerifiers).filter(
-            BestPaperVerifiers.best_paper_id.in_(best_paper_ids),
-            BestPaperVerifiers.user_id.in_(user_ids)
-        ).delete(synchronize_session=False)
-        
-        # Explicitly commit the transaction
-        if not safe_commit():
-            error_msg = "Database commit failed during bulk unassignment"
+
+        try:
+            best_paper_ids = list(dict.fromkeys(uuid.UUID(str(item)) for item in best_paper_ids))
+            user_ids = list(dict.fromkeys(uuid.UUID(str(item)) for item in user_ids))
+            review_phase = data.get('review_phase')
+            if review_phase is not None:
+                review_phase = int(review_phase)
+                if review_phase < 1:
+                    raise ValueError("review_phase must be positive")
+        except (TypeError, ValueError):
+            error_msg = "Request validation failed: 'best_paper_ids' and 'user_ids' must be lists of UUIDs and 'review_phase' a positive integer"
             log_audit_event(
                 event_type="best_paper.verifiers.bulk_unassign.failed",
                 user_id=current_user_id,
                 details={"error": error_msg},
                 ip_address=request.remote_addr
             )
-            return jsonify({"error": error_msg}), 500
-        
+            return jsonify({"error": error_msg}), 400
+
+        result = bulk_unassign_verifiers_util(
+            GradingFor.BEST_PAPER,
+            best_paper_ids,
+            user_ids,
+            review_phase=review_phase,
+            actor_id=current_user_id,
+        )
+
         # Log successful bulk unassignment
         log_audit_event(
             event_type="best_paper.verifiers.bulk_unassign.success",
             user_id=current_user_id,
             details={
-                "best_paper_ids": best_paper_ids,
-                "user_ids": user_ids,
-                "assignments_deleted": assignments_deleted
+                "best_paper_ids": [str(item) for item in best_paper_ids],
+                "user_ids": [str(item) for item in user_ids],
+                "review_phase": review_phase,
+                "assignments_deleted": result.changed_count,
+                "assignments_skipped": result.skipped_count
             },
             ip_address=request.remote_addr
         )
-        
+
         return jsonify({
-            "message": f"Successfully deleted {assignments_deleted} assignments",
-            "assignments_deleted": assignments_deleted
+            "message": f"Successfully deleted {result.changed_count} assignments",
+            "assignments_deleted": result.changed_count,
+            "assignments_skipped": result.skipped_count
         }), 200
     except Exception as e:
         db.session.rollback()
@@ -1685,6 +1694,8 @@ def create_paper_excel(papers):
 
 
 @research_bp.route('/best-papers/export-excel', methods=['GET'])
+@statement_timeout('DB_EXPORT_STATEMENT_TIMEOUT_MS')
+@replica_reads()
 @jwt_required()
 @require_roles(Role.ADMIN.value, Role.SUPERADMIN.value)
 def export_papers_excel():
@@ -1744,6 +1755,8 @@ def export_papers_excel():
 
 
 @research_bp.route('/best-papers/export-pdf-zip', methods=['GET'])
+@statement_timeout('DB_EXPORT_STATEMENT_TIMEOUT_MS')
+@replica_reads()
 @jwt_required()
 @require_roles(Role.ADMIN.value, Role.SUPERADMIN.value)
 def export_papers_pdf_zip():
@@ -1859,6 +1872,8 @@ def export_papers_pdf_zip():
 
 
 @research_bp.route('/best-papers/export-with-pdfs', methods=['GET'])
+@statement_timeout('DB_EXPORT_STATEMENT_TIMEOUT_MS')
+@replica_reads()
 @jwt_required()
 @require_roles(Role.ADMIN.value, Role.SUPERADMIN.value)
 def export_papers_with_pdfs():
@@ -1975,6 +1990,8 @@ def export_papers_with_pdfs():
 
 
 @research_bp.route('/best-papers/export-with-grades', methods=['GET'])
+@statement_timeout('DB_EXPORT_STATEMENT_TIMEOUT_MS')
+@replica_reads()
 @jwt_required()
 def export_best_papers_with_grades():
     """Export best papers with per-grader grades into an Excel workbook.
@@ -1989,10 +2006,9 @@ def export_best_papers_with_grades():
         cycle_id = request.args.get('cycle_id')
 
         # Select grading types relevant to best papers
-        q = GradingType.query.filter(GradingType.grading_for == GradingFor.BEST_PAPER)
+        grading_types = grading_type_cache.for_target(GradingFor.BEST_PAPER)
         if grading_type_id:
-            q = q.filter(GradingType.id == grading_type_id)
-        grading_types = q.order_by(GradingType.criteria).all()
+            grading_types = [gt for gt in grading_types if str(gt.id) == grading_type_id]
 
         # Build filters for best papers
         filters = []
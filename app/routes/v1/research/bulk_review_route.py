@@ -0,0 +1,97 @@
+from flask import request, jsonify, current_app
+from flask_jwt_extended import jwt_required
+
+from app.extensions import db
+from app.models.enumerations import Role
+from app.routes.v1.audit_log_route import log_audit_event
+from app.routes.v1.research import research_bp
+from app.routes.v1.user_role_route import _resolve_actor_context
+from app.services.bulk_review_service import (
+    ACTIONS,
+    ENTITY_SLUGS,
+    bulk_advance_phase,
+    bulk_set_status,
+    notify_owners,
+    parse_selection,
+)
+from app.utils.decorator import require_roles
+
+# Cap the id lists copied into the single aggregated audit record.
+_AUDIT_ID_SAMPLE = 200
+
+
+@research_bp.route(
+    '/<any(abstracts, awards, "best-papers"):entity>/bulk/<any(accept, reject, "advance-phase"):action>',
+    methods=['POST'],
+)
+@jwt_required()
+@require_roles(Role.COORDINATOR.value, Role.ADMIN.value, Role.SUPERADMIN.value)
+def bulk_review_action(entity, action):
+    """Accept, reject or advance many submissions in one transaction.
+
+    Body: ``{"ids": [...]}`` or ``{"filter": {"cycle_id": ..., "status": ...,
+    "review_phase": ..., "category_id": ...}}``, plus optional ``dry_run``.
+    Accepting and advancing skip submissions with missing grades for their
+    current phase; the response lists updated and skipped IDs per reason.
+    """
+    grading_for = ENTITY_SLUGS[entity]
+    event_prefix = f"{grading_for.value}.bulk_{action.replace('-', '_')}"
+    actor_id, context = _resolve_actor_context(f"bulk_{action}_{grading_for.value}")
+    payload = request.get_json(silent=True) or {}
+    try:
+        selection = parse_selection(payload)
+    except ValueError as exc:
+        error_msg = f"Validation failed: {exc}"
+        log_audit_event(
+            event_type=f"{event_prefix}.failed",
+            user_id=actor_id,
+            details={"error": error_msg},
+            ip_address=request.remote_addr
+        )
+        return jsonify({"error": error_msg}), 400
+
+    dry_run = bool(payload.get("dry_run"))
+    try:
+        if action == "advance-phase":
+            result = bulk_advance_phase(grading_for, selection, actor_id=actor_id, dry_run=dry_run)
+        else:
+            result = bulk_set_status(
+                grading_for,
+                ACTIONS[action],
+                selection,
+                require_complete=(action == "accept"),
+                actor_id=actor_id,
+                dry_run=dry_run,
+            )
+    except Exception as exc:
+        db.session.rollback()
+        current_app.logger.exception("Error in bulk %s for %s", action, entity)
+        error_msg = f"System error occurred during bulk {action}: {str(exc)}"
+        log_audit_event(
+            event_type=f"{event_prefix}.failed",
+            user_id=actor_id,
+            details={"error": error_msg, "exception_type": type(exc).__name__},
+            ip_address=request.remote_addr
+        )
+        return jsonify({"error": error_msg}), 400
+
+    result["dry_run"] = dry_run
+    if dry_run:
+        return jsonify(result), 200
+
+    log_audit_event(
+        event_type=f"{event_prefix}.success",
+        user_id=actor_id,
+        details={
+            "selection": {k: [str(i) for i in v] if k == "ids" else str(v) for k, v in selection.items()},
+            "updated_count": len(result["updated"]),
+            "skipped_counts": {reason: len(ids) for reason, ids in result["skipped"].items()},
+            "updated_ids": result["updated"][:_AUDIT_ID_SAMPLE],
+        },
+        ip_address=request.remote_addr
+    )
+    try:
+        notify_owners(grading_for, result["updated"], action)
+    except Exception:
+        current_app.logger.exception("Failed to queue bulk %s notifications", action)
+    return jsonify(result), 200
@@ -0,0 +1,130 @@
+from flask import request, jsonify, current_app
+from flask_jwt_extended import jwt_required
+
+from app.models.enumerations import Role
+from app.routes.v1.audit_log_route import log_audit_event
+from app.routes.v1.research import research_bp
+from app.routes.v1.user_role_route import _resolve_actor_context
+from app.services.bulk_review_service import ENTITY_SLUGS
+from app.services.duplicate_detection_service import (
+    cycle_duplicate_report,
+    parse_threshold,
+    similar_submissions,
+)
+from app.utils.decorator import require_roles
+
+
+@research_bp.route(
+    '/<any(abstracts, awards, "best-papers"):entity>/<uuid:submission_id>/similar',
+    methods=['GET'],
+)
+@jwt_required()
+@require_roles(Role.COORDINATOR.value, Role.ADMIN.value, Role.SUPERADMIN.value)
+def get_similar_submissions(entity, submission_id):
+    """Near-duplicates of one submission across abstracts, awards and best papers.
+
+    Query: ``threshold`` (estimated Jaccard similarity, default 0.5),
+    ``limit`` (default 20, max 100) and ``same_cycle=true`` to compare only
+    within the submission's cycle.
+    """
+    grading_for = ENTITY_SLUGS[entity]
+    event_prefix = f"{grading_for.value}.similar"
+    actor_id, context = _resolve_actor_context(f"similar_{grading_for.value}")
+    try:
+        threshold = parse_threshold(request.args.get('threshold'))
+        limit = min(max(int(request.args.get('limit', 20)), 1), 100)
+    except ValueError as exc:
+        error_msg = f"Validation failed: {exc}"
+        log_audit_event(
+            event_type=f"{event_prefix}.failed",
+            user_id=actor_id,
+            details={"error": error_msg, "submission_id": str(submission_id)},
+            ip_address=request.remote_addr
+        )
+        return jsonify({"error": error_msg}), 400
+
+    same_cycle = request.args.get('same_cycle', '').strip().lower() == 'true'
+    try:
+        matches = similar_submissions(
+            grading_for, submission_id, threshold=threshold, limit=limit, same_cycle=same_cycle,
+        )
+    except Exception as exc:
+        current_app.logger.exception("Error finding submissions similar to %s", submission_id)
+        error_msg = f"System error occurred while finding similar submissions: {str(exc)}"
+        log_audit_event(
+            event_type=f"{event_prefix}.failed",
+            user_id=actor_id,
+            details={"error": error_msg, "exception_type": type(exc).__name__},
+            ip_address=request.remote_addr
+        )
+        return jsonify({"error": error_msg}), 400
+
+    if matches is None:
+        error_msg = f"Submission '{submission_id}' not found or not yet fingerprinted"
+        log_audit_event(
+            event_type=f"{event_prefix}.failed",
+            user_id=actor_id,
+            details={"error": error_msg, "submission_id": str(submission_id)},
+            ip_address=request.remote_addr
+        )
+        return jsonify({"error": error_msg}), 404
+    return jsonify({
+        "id": str(submission_id),
+        "entity_type": grading_for.value,
+        "threshold": threshold,
+        "items": matches,
+    }), 200
+
+
+@research_bp.route('/cycles/<uuid:cycle_id>/duplicates', methods=['GET'])
+@jwt_required()
+@require_roles(Role.COORDINATOR.value, Role.ADMIN.value, Role.SUPERADMIN.value)
+def get_cycle_duplicates(cycle_id):
+    """Cycle-wide near-duplicate report: verified pairs and their clusters.
+
+    Query: ``threshold`` (default 0.5) and ``entity`` (repeatable:
+    abstracts, awards, best-papers; defaults to all three).
+    """
+    actor_id, context = _resolve_actor_context("cycle_duplicates")
+    try:
+        threshold = parse_threshold(request.args.get('threshold'))
+        slugs = request.args.getlist('entity')
+        unknown = [slug for slug in slugs if slug not in ENTITY_SLUGS]
+        if unknown:
+            raise ValueError(f"Invalid entity: {', '.join(unknown)}")
+        entity_types = [ENTITY_SLUGS[slug] for slug in slugs]
+    except ValueError as exc:
+        error_msg = f"Validation failed: {exc}"
+        log_audit_event(
+            event_type="cycle.duplicates.failed",
+            user_id=actor_id,
+            details={"error": error_msg, "cycle_id": str(cycle_id)},
+            ip_address=request.remote_addr
+        )
+        return jsonify({"error": error_msg}), 400
+
+    try:
+        report = cycle_duplicate_report(cycle_id, threshold=threshold, entity_types=entity_types or None)
+    except Exception as exc:
+        current_app.logger.exception("Error building duplicate report for cycle %s", cycle_id)
+        error_msg = f"System error occurred while building the duplicate report: {str(exc)}"
+        log_audit_event(
+            event_type="cycle.duplicates.failed",
+            user_id=actor_id,
+            details={"error": error_msg, "exception_type": type(exc).__name__},
+            ip_address=request.remote_addr
+        )
+        return jsonify({"error": error_msg}), 400
+
+    log_audit_event(
+        event_type="cycle.duplicates.success",
+        user_id=actor_id,
+        details={
+            "cycle_id": str(cycle_id),
+            "threshold": threshold,
+            "pairs": len(report["pairs"]),
+            "clusters": len(report["clusters"]),
+        },
+        ip_address=request.remote_addr
+    )
+    return jsonify(report), 200
@@ -1,10 +1,12 @@
 from flask import request, jsonify, current_app
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from app.routes.v1.research import research_bp
-from app.models.Cycle import Grading, GradingType, Abstracts, BestPaper, Awards
+from app.models.Cycle import Grading, Abstracts, BestPaper, Awards
 from app.schemas.grading_schema import GradingSchema
+from app.services.grading_sheet_service import GradingSheetError, parse_sheets, save_grading_sheets
 from app.extensions import db
 from app.utils.decorator import require_roles
+from app.utils import grading_type_cache, sparse_fields
 from app.models.enumerations import Role
 from app.utils.model_utils import audit_log_utils
 import json
@@ -45,7 +47,7 @@ def create_grading():
         # Verify that the grading_type exists
         grading_type_id = data.get('grading_type_id')
         if grading_type_id:
-            grading_type = GradingType.query.get(grading_type_id)
+            grading_type = grading_type_cache.get(grading_type_id)
             if not grading_type:
                 error_msg = "Grading type not found"
                 log_audit_event(
@@ -143,11 +145,76 @@ def create_grading():
         )
         return jsonify({"error": error_msg}), 400
 
+@research_bp.route('/gradings/batch', methods=['POST'])
+@jwt_required()
+@require_roles(Role.VERIFIER.value, Role.ADMIN.value, Role.SUPERADMIN.value)
+def create_gradings_batch():
+    """Save whole grading sheets (all criteria, one or many submissions) at once.
+
+    Body: ``{"sheets": [{"abstract_id": ..., "review_phase": 1,
+    "scores": [{"grading_type_id": ..., "score": 4, "comments": ...}]}]}``
+    (``award_id`` / ``best_paper_id`` for other kinds; a single sheet object
+    is also accepted). Scores are upserted per (submission, verifier,
+    criterion, phase); the response returns the saved sheets.
+    """
+    actor_id = get_jwt_identity()
+    try:
+        rows = parse_sheets(request.get_json(silent=True) or {})
+        sheets = save_grading_sheets(rows, actor_id)
+        db.session.commit()
+    except GradingSheetError as e:
+        db.session.rollback()
+        error_msg = f"Validation failed: {e}"
+        log_audit_event(
+            event_type="grading.batch.failed",
+            user_id=actor_id,
+            details={"error": error_msg, "problems": e.problems[:50]},
+            ip_address=request.remote_addr
+        )
+        return jsonify({"error": error_msg, "problems": e.problems}), 400
+    except Exception as e:
+        db.session.rollback()
+        current_app.logger.exception("Error saving grading sheets")
+        error_msg = str(e)
+        log_audit_event(
+            event_type="grading.batch.failed",
+            user_id=actor_id,
+            details={"error": error_msg, "exception_type": type(e).__name__},
+            ip_address=request.remote_addr
+        )
+        return jsonify({"error": error_msg}), 400
+
+    log_audit_event(
+        event_type="grading.batch.success",
+        user_id=actor_id,
+        details={
+            "scores_saved": len(rows),
+            "sheets": [
+                {key: value for key, value in sheet.items() if key != "grades"}
+                for sheet in sheets
+            ],
+        },
+        ip_address=request.remote_addr
+    )
+    return jsonify({"sheets": sheets, "saved": len(rows)}), 200
+
 @research_bp.route('/gradings', methods=['GET'])
 @jwt_required()
 def get_gradings():
-    """Get all gradings with optional filtering."""
+    """Get all gradings with optional filtering and ``fields=`` / ``include=`` shaping."""
     actor_id = get_jwt_identity()
+    try:
+        fieldset = sparse_fields.parse_fieldset(GradingSchema, request.args)
+    except ValueError as exc:
+        error_msg = f"Validation failed: {exc}"
+        log_audit_event(
+            event_type="grading.list.failed",
+            user_id=actor_id,
+            details={"error": error_msg, "fields": request.args.get('fields'), "include": request.args.get('include')},
+            ip_address=request.remote_addr
+        )
+        return jsonify({"error": error_msg}), 400
+
     try:
         # Get query parameters for filtering
         grading_type_id = request.args.get('grading_type_id')
@@ -156,7 +223,7 @@ def get_gradings():
         award_id = request.args.get('award_id')
         graded_by_id = request.args.get('graded_by_id')
         
-        query = Grading.query
+        query = Grading.query.options(*fieldset.options)
         
         if grading_type_id:
             query = query.filter(Grading.grading_type_id == grading_type_id)
@@ -188,7 +255,7 @@ def get_gradings():
             ip_address=request.remote_addr
         )
         
-        return jsonify(gradings_schema.dump(gradings)), 200
+        return jsonify(fieldset.schema.dump(gradings)), 200
     except Exception as e:
         current_app.logger.exception("Error getting gradings")
         error_msg = str(e)
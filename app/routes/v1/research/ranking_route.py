@@ -0,0 +1,73 @@
+from flask import request, jsonify, current_app
+from flask_jwt_extended import jwt_required
+
+from app.models.enumerations import Role
+from app.routes.v1.audit_log_route import log_audit_event
+from app.routes.v1.research import research_bp
+from app.routes.v1.user_role_route import _resolve_actor_context
+from app.services.bulk_review_service import ENTITY_SLUGS
+from app.services.ranking_service import leaderboard
+from app.utils.decorator import require_roles
+
+
+@research_bp.route(
+    '/cycles/<uuid:cycle_id>/<any(abstracts, awards, "best-papers"):entity>/leaderboard',
+    methods=['GET'],
+)
+@jwt_required()
+@require_roles(Role.COORDINATOR.value, Role.ADMIN.value, Role.SUPERADMIN.value)
+def get_leaderboard(cycle_id, entity):
+    """Ranked submissions of one kind in a cycle.
+
+    Query: ``review_phase`` (default: all phases), ``category_id``, ``page``
+    and ``page_size`` (default 20, max 100). Each item carries the raw
+    weighted ``total``, the grader-normalised ``score`` and the ``rank`` and
+    ``percentile`` within its category.
+    """
+    grading_for = ENTITY_SLUGS[entity]
+    event_prefix = f"{grading_for.value}.leaderboard"
+    actor_id, context = _resolve_actor_context(f"leaderboard_{grading_for.value}")
+    try:
+        page = max(int(request.args.get('page', 1)), 1)
+        page_size = min(max(int(request.args.get('page_size', 20)), 1), 100)
+        review_phase = request.args.get('review_phase', '').strip()
+        review_phase = int(review_phase) if review_phase else None
+    except ValueError as exc:
+        error_msg = f"Validation failed: {exc}"
+        log_audit_event(
+            event_type=f"{event_prefix}.failed",
+            user_id=actor_id,
+            details={"error": error_msg, "cycle_id": str(cycle_id)},
+            ip_address=request.remote_addr
+        )
+        return jsonify({"error": error_msg}), 400
+
+    category_id = request.args.get('category_id', '').strip() or None
+    try:
+        items, total, cached = leaderboard(
+            grading_for,
+            cycle_id,
+            review_phase=review_phase,
+            category_id=category_id,
+            page=page,
+            page_size=page_size,
+        )
+    except Exception as exc:
+        current_app.logger.exception("Error building %s leaderboard for cycle %s", grading_for.value, cycle_id)
+        error_msg = f"System error occurred while building the leaderboard: {str(exc)}"
+        log_audit_event(
+            event_type=f"{event_prefix}.failed",
+            user_id=actor_id,
+            details={"error": error_msg, "exception_type": type(exc).__name__},
+            ip_address=request.remote_addr
+        )
+        return jsonify({"error": error_msg}), 400
+
+    return jsonify({
+        'items': items,
+        'total': total,
+        'page': page,
+        'pages': (total + page_size - 1) // page_size,
+        'page_size': page_size,
+        'cached': cached,
+    }), 200
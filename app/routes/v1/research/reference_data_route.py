@@ -0,0 +1,45 @@
+from flask import request, jsonify, current_app
+from flask_jwt_extended import jwt_required
+
+from app.routes.v1.audit_log_route import log_audit_event
+from app.routes.v1.research import research_bp
+from app.routes.v1.user_role_route import _resolve_actor_context
+from app.services import reference_data_service
+
+
+@research_bp.route('/reference-data', methods=['GET'])
+@jwt_required()
+def get_reference_data():
+    """Cycles, categories, paper categories, grading types and departments in one response.
+
+    The body carries a ``version``; pass it back as ``since=<version>`` to get
+    only the sections changed after it (``"full": false``). Responses carry a
+    strong ETag, so ``If-None-Match`` revalidation returns 304 without a body.
+    """
+    since = request.args.get('since', '').strip()
+    try:
+        since = int(since) if since else None
+        if since is not None and since < 0:
+            raise ValueError("since must be a non-negative version")
+    except ValueError as exc:
+        actor_id, context = _resolve_actor_context("reference_data")
+        error_msg = f"Validation failed: {exc}"
+        log_audit_event(
+            event_type="reference_data.get.failed",
+            user_id=actor_id,
+            details={"error": error_msg, "since": request.args.get('since')},
+            ip_address=request.remote_addr
+        )
+        return jsonify({"error": error_msg}), 400
+
+    try:
+        body, etag = reference_data_service.bundle(since)
+    except Exception as exc:
+        current_app.logger.exception("Error building reference data")
+        return jsonify({"error": f"System error occurred while loading reference data: {str(exc)}"}), 400
+
+    resp = current_app.response_class(body, mimetype='application/json')
+    resp.set_etag(etag)
+    max_age = int(current_app.config.get('REFERENCE_DATA_MAX_AGE', 300))
+    resp.headers['Cache-Control'] = f'private, max-age={max_age}, must-revalidate'
+    return resp.make_conditional(request)
@@ -0,0 +1,69 @@
+import time
+
+from flask import request, jsonify, current_app
+from flask_jwt_extended import get_jwt, jwt_required
+from sqlalchemy.exc import OperationalError
+
+from app.extensions import db
+from app.models.enumerations import Role
+from app.routes.v1.audit_log_route import log_audit_event
+from app.routes.v1.research import research_bp
+from app.routes.v1.user_role_route import _resolve_actor_context
+from app.services.typeahead_service import DEFAULT_LIMIT, PRIVATE_KINDS, SOURCES, typeahead
+from app.utils.db_engine import statement_timeout
+
+_STAFF_ROLES = {Role.COORDINATOR.value, Role.ADMIN.value, Role.SUPERADMIN.value}
+_QUERY_CANCELED = "57014"
+
+
+def _rejected(error_msg, status):
+    # Actor context costs a query, so it is only resolved on the failure path.
+    actor_id, _ = _resolve_actor_context("typeahead")
+    log_audit_event(
+        event_type="typeahead.failed",
+        user_id=actor_id,
+        details={"error": error_msg},
+        ip_address=request.remote_addr
+    )
+    return jsonify({"error": error_msg}), status
+
+
+@research_bp.route('/typeahead', methods=['GET'])
+@jwt_required()
+@statement_timeout('TYPEAHEAD_STATEMENT_TIMEOUT_MS')
+def typeahead_lookup():
+    """Compact ``{"id", "label"}`` suggestions for pickers.
+
+    Query: ``kind`` (users, verifiers, authors, categories,
+    paper-categories), ``q`` and optional ``limit`` (max 25). User kinds are
+    limited to coordinators and admins. A lookup that exceeds the latency
+    budget returns no items with ``timed_out: true`` instead of an error.
+    """
+    started = time.perf_counter()
+    kind = request.args.get('kind', '').strip().lower()
+    q = request.args.get('q', '')
+    if kind not in SOURCES:
+        return _rejected(f"Validation failed: Invalid kind '{kind}'. Valid kinds are {', '.join(SOURCES)}", 400)
+    try:
+        limit = int(request.args.get('limit', DEFAULT_LIMIT))
+    except ValueError:
+        return _rejected(f"Validation failed: Invalid limit '{request.args.get('limit')}'", 400)
+    if kind in PRIVATE_KINDS and not _STAFF_ROLES.intersection(get_jwt().get('roles', [])):
+        return _rejected(f"Access denied: '{kind}' lookups require a coordinator or admin role", 403)
+
+    timed_out = False
+    try:
+        items, cached = typeahead(kind, q, limit)
+    except OperationalError as exc:
+        if getattr(exc.orig, "pgcode", None) != _QUERY_CANCELED:
+            raise
+        db.session.rollback()
+        current_app.logger.warning("typeahead kind=%s exceeded its statement timeout", kind)
+        items, cached, timed_out = [], False, True
+    return jsonify({
+        "kind": kind,
+        "items": items,
+        "cached": cached,
+        "timed_out": timed_out,
+        "took_ms": round((time.perf_counter() - started) * 1000, 1),
+    }), 200
@@ -10,7 +10,8 @@ from app.models.User import UserRole
 from app.models.enumerations import Role
 from app.models.Cycle import Category, PaperCategory
 from app.utils.decorator import require_roles
-from app.extensions import db
+from app.extensions import db, replica_reads
+from app.utils.db_engine import statement_timeout
 from app.schemas.user_schema import UserSchema
 from sqlalchemy import text
 
@@ -695,6 +696,8 @@ def list_audit_logs():
 
 
 @super_api_bp.route('/audit/export', methods=['GET'])
+@statement_timeout('DB_EXPORT_STATEMENT_TIMEOUT_MS')
+@replica_reads()
 @jwt_required()
 @require_roles(Role.SUPERADMIN.value)
 def export_audit_logs():
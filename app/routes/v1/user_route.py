@@ -1,17 +1,19 @@
 # routes/user_routes.py
 
-from app.models.Cycle import AwardVerifiers, BestPaperVerifiers
+from app.models.Cycle import GradingFor
 from flask import Blueprint, request, jsonify, current_app
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from sqlalchemy import or_
 from sqlalchemy.exc import SQLAlchemyError
 import traceback
+import uuid
 from app.schemas.user_schema import UserSchema
 from app.schemas.user_settings_schema import UserSettingsSchema
 from app.utils.decorator import require_roles
 from app.models.User import User, UserSettings, UserType, Role, MAX_OTP_RESENDS, PASSWORD_EXPIRATION_DAYS
 from app.security_utils import rate_limit, ip_and_path_key, audit_log, coerce_uuid
 from app.utils import metrics_cache
+from app.services.verifier_directory_service import list_verifier_directory
 from app.utils.model_utils.user_utils import (
     create_user,
     get_user_by_id,
@@ -443,76 +445,55 @@ def list_verifiers():
 @jwt_required()
 @require_roles(Role.COORDINATOR.value,Role.ADMIN.value, Role.SUPERADMIN.value)
 def list_verifiers_with_params():
-    """Get all users with verifier role with filtering and pagination support."""
+    """Get all users with verifier role with filtering and pagination support.
+
+    Query parameters: ``q``, ``has_abstracts`` / ``has_awards`` /
+    ``has_bestpapers`` (yes|no), ``entity`` + ``category_id`` (verifiers
+    registered for a category), ``sort_by`` (username, email, created_at,
+    abstracts_count, awards_count, bestpapers_count, workload), ``sort_dir``,
+    ``page`` and ``page_size``.
+    """
     try:
         # Get query parameters
         q = request.args.get('q', '').strip()
-        has_abstracts = request.args.get('has_abstracts', '').strip()
         page = int(request.args.get('page', 1))
         page_size = int(request.args.get('page_size', 20))
         sort_by = request.args.get('sort_by', 'created_at')
         sort_dir = request.args.get('sort_dir', 'desc')
-        
+
         # Validate page size
         page_size = min(page_size, 100)  # Limit max page size
         page = max(1, page)  # Ensure page is at least 1
-        
-        # Build query for verifiers
-        query = User.query.join(User.role_associations).filter_by(role=Role.VERIFIER)
-        
-        # Apply search filter
-        if q:
-            search_filter = db.or_(
-                User.username.ilike(f'%{q}%'),
-                User.email.ilike(f'%{q}%'),
-                User.employee_id.ilike(f'%{q}%'),
-                User.mobile.ilike(f'%{q}%')
-            )
-            query = query.filter(search_filter)
-        
-        # Apply has_abstracts filter
-        if has_abstracts:
-            # Import here to avoid circular imports
-            from app.models.Cycle import AbstractVerifiers
-            
-            if has_abstracts.lower() == 'yes':
-                # Only verifiers with assigned abstracts
-                query = query.join(AbstractVerifiers, User.id == AbstractVerifiers.user_id)
-            elif has_abstracts.lower() == 'no':
-                # Only verifiers without assigned abstracts
-                query = query.outerjoin(AbstractVerifiers, User.id == AbstractVerifiers.user_id).filter(AbstractVerifiers.user_id.is_(None))
-        
-        # Apply sorting
-        if sort_by == 'username':
-            order_by = User.username.asc() if sort_dir.lower() == 'asc' else User.username.desc()
-        elif sort_by == 'email':
-            order_by = User.email.asc() if sort_dir.lower() == 'asc' else User.email.desc()
-        else:  # default to created_at
-            order_by = User.created_at.asc() if sort_dir.lower() == 'asc' else User.created_at.desc()
-        
-        query = query.order_by(order_by)
-        
-        # Apply pagination
-        total = query.count()
-        verifiers = query.offset((page - 1) * page_size).limit(page_size).all()
-        
-        # Add abstracts count to each verifier
-        verifiers_data = []
-        for verifier in verifiers:
-            verifier_dict = verifier.to_dict()
-            # Count abstracts assigned to this verifier
-            from app.models.Cycle import AbstractVerifiers
-            abstracts_count = db.session.query(
-                AbstractVerifiers).filter_by(user_id=verifier.id).count()
-            awards_count = db.session.query(
-                AwardVerifiers).filter_by(user_id=verifier.id).count()
-            best_papers_count = db.session.query(
-                BestPaperVerifiers).filter_by(user_id=verifier.id).count()
-            verifier_dict['abstracts_count'] = abstracts_count
-            verifier_dict['awards_count'] = awards_count
-            verifier_dict['bestpapers_count'] = best_papers_count
-            verifiers_data.append(verifier_dict)
-        
+
+        has = {}
+        for param, kind in (
+            ('has_abstracts', GradingFor.ABSTRACT),
+            ('has_awards', GradingFor.AWARD),
+            ('has_bestpapers', GradingFor.BEST_PAPER),
+        ):
+            value = request.args.get(param, '').strip().lower()
+            if value in ('yes', 'no'):
+                has[kind] = value == 'yes'
+
+        category = None
+        category_id = request.args.get('category_id', '').strip()
+        if category_id:
+            entity = request.args.get('entity', GradingFor.ABSTRACT.value).strip().lower()
+            try:
+                category = (GradingFor(entity), uuid.UUID(category_id))
+            except ValueError:
+                return jsonify({"error": f"Invalid entity or category_id: {entity!r}, {category_id!r}"}), 400
+
+        verifiers_data, total = list_verifier_directory(
+            q=q,
+            has=has,
+            category=category,
+            sort_by=sort_by,
+            sort_dir=sort_dir,
+            page=page,
+            page_size=page_size,
+        )
+
         # Prepare response
         response = {
             'items': verifiers_data,
@@ -521,7 +502,7 @@ def list_verifiers_with_params():
             'pages': (total + page_size - 1) // page_size,
             'page_size': page_size
         }
-        
+
         return jsonify(response), 200
     except Exception as e:
         current_app.logger.exception("Error listing verifiers with parameters")
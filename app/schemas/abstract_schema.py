@@ -14,6 +14,7 @@ class AbstractSchema(ma.SQLAlchemyAutoSchema):
         model = Abstracts
         load_instance = True
         include_fk = True
+        exclude = ("search_vec",)
 
     id = fields.String(dump_only=True)
     title = fields.String(required=True)
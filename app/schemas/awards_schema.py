@@ -14,6 +14,7 @@ class AwardsSchema(ma.SQLAlchemyAutoSchema):
         model = Awards
         load_instance = True
         include_fk = True
+        exclude = ("search_vec",)
 
     id = fields.String(dump_only=True)
     title = fields.String(required=True)
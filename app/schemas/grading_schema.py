@@ -1,6 +1,7 @@
 from marshmallow import Schema, fields
 from app.extensions import ma
 from app.models.Cycle import Grading
+from app.utils import grading_type_cache
 
 
 class GradingSchema(ma.SQLAlchemyAutoSchema):
@@ -38,6 +39,10 @@ class GradingSchema(ma.SQLAlchemyAutoSchema):
         }
 
     def get_grading_type(self, obj):
+        # Served from the criteria cache instead of lazy-loading one row per grade.
+        info = grading_type_cache.get(getattr(obj, "grading_type_id", None))
+        if info is not None:
+            return info.to_dict()
         grading_type = getattr(obj, "grading_type", None)
         if not grading_type:
             return None
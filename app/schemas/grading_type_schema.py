@@ -11,6 +11,7 @@ class GradingTypeSchema(ma.SQLAlchemyAutoSchema):
     criteria = fields.Str(required=True, validate=validate.Length(min=1, max=100))
     min_score = fields.Int(required=True)
     max_score = fields.Int(required=True)
+    weight = fields.Float(validate=validate.Range(min=0))
     grading_for = fields.Str(required=True, validate=validate.OneOf(
         choices=['abstract', 'best_paper', 'award']
     ))
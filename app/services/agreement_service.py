@@ -0,0 +1,448 @@
+"""Inter-rater agreement analytics, computed in batch.
+
+For each scope, meaning one (entity type, cycle, review phase, verification
+level), the gradings are loaded with one query into a dense
+submissions × graders × criteria tensor. Scores are scaled to 0-100 by their
+criterion's min/max, and missing ratings are NaN. Every statistic is then a
+handful of NumPy reductions over slices of that tensor:
+
+* Krippendorff's alpha (interval metric) and ICC(1) for each category and
+  criterion, plus the pooled "all categories" and "all criteria" slices;
+* each grader's mean absolute and signed deviation from their co-graders
+  on the submissions and criteria they share.
+
+``refresh_agreement`` compares each scope's grading count and latest
+``updated_on`` with the stamp stored at its last computation and only
+recomputes scopes that changed, so the ``flask agreement-refresh`` job stays
+cheap when run frequently.
+
+With ``AGREEMENT_AUTO_REFRESH`` on, a commit that wrote gradings also
+schedules that refresh for the affected entity types on a background
+thread. ORM writes are noticed by mapper events, and Core writes call
+``mark_changed``. Writes made outside both still wait for the command.
+"""
+from __future__ import annotations
+
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+from flask import current_app, has_app_context
+from sqlalchemy import delete, event, func, insert, select
+from sqlalchemy.orm import Session, object_session
+
+from app.extensions import db
+from app.models.Cycle import Grading, GradingType
+from app.models.GradingAgreement import GradingAgreement, GradingAgreementScope, GraderDisagreement
+from app.models.SubmissionCounter import COUNTED_MODELS
+from app.models.User import User
+from app.models.enumerations import GradingFor
+from app.services.ranking_service import _factorize
+from app.utils.model_utils.review_phase_utils import TARGETS
+
+Scope = Tuple[Any, int, int]  # (cycle id, review phase, verification level)
+
+
+def _pairable(matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Rows (units) rated at least twice, with their rating counts."""
+    counts = np.count_nonzero(~np.isnan(matrix), axis=1)
+    keep = counts >= 2
+    return matrix[keep], counts[keep]
+
+
+def krippendorff_alpha(matrix: np.ndarray) -> Optional[float]:
+    """Interval-metric alpha of a units × raters matrix (NaN = not rated)."""
+    values, m = _pairable(matrix)
+    n = m.sum()
+    if n < 2:
+        return None
+    sums, squares = np.nansum(values, axis=1), np.nansum(values ** 2, axis=1)
+    # sum over ordered pairs i != j of (x_i - x_j)^2 == 2 * (m * sum(x^2) - sum(x)^2)
+    observed = np.sum(2 * (m * squares - sums ** 2) / (m - 1)) / n
+    expected = 2 * (n * squares.sum() - sums.sum() ** 2) / (n * (n - 1))
+    if expected <= 1e-12:
+        return None
+    return float(1 - observed / expected)
+
+
+def icc1(matrix: np.ndarray) -> Optional[float]:
+    """One-way random-effects ICC(1) for unbalanced designs (NaN = not rated)."""
+    values, m = _pairable(matrix)
+    units, n = len(m), m.sum()
+    if units < 2:
+        return None
+    means = np.nansum(values, axis=1) / m
+    grand = np.nansum(values) / n
+    between = np.sum(m * (means - grand) ** 2) / (units - 1)
+    within = np.nansum((values - means[:, None]) ** 2) / (n - units)
+    k0 = (n - np.sum(m ** 2) / n) / (units - 1)
+    denominator = between + (k0 - 1) * within
+    if denominator <= 1e-12:
+        return None
+    return float((between - within) / denominator)
+
+
+def peer_deviation(matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Per rater: ratings on shared units, mean |x - peers' mean| and mean (x - peers' mean)."""
+    present = ~np.isnan(matrix)
+    m = np.count_nonzero(present, axis=1)
+    shared = present & (m >= 2)[:, None]
+    sums = np.nansum(matrix, axis=1)
+    peers = (sums[:, None] - np.nan_to_num(matrix)) / np.maximum(m - 1, 1)[:, None]
+    diff = np.where(shared, matrix - peers, 0.0)
+    ratings = np.count_nonzero(shared, axis=0)
+    safe = np.maximum(ratings, 1)
+    return ratings, np.abs(diff).sum(axis=0) / safe, diff.sum(axis=0) / safe
+
+
+def _scope_stamps(entity_type: GradingFor, cycle_id=None) -> Dict[Scope, Tuple[int, Any]]:
+    target = TARGETS[entity_type]
+    model, fk = target.model, getattr(Grading, target.fk)
+    stmt = (
+        select(
+            model.cycle_id, Grading.review_phase, Grading.verification_level,
+            func.count(Grading.id), func.max(Grading.updated_on),
+        )
+        .join(model, model.id == fk)
+        .group_by(model.cycle_id, Grading.review_phase, Grading.verification_level)
+    )
+    if cycle_id is not None:
+        stmt = stmt.where(model.cycle_id == cycle_id)
+    return {(row[0], row[1], row[2]): (row[3], row[4]) for row in db.session.execute(stmt)}
+
+
+def _stored_stamps(entity_type: GradingFor, cycle_id=None) -> Dict[Scope, Tuple[int, Any]]:
+    scope = GradingAgreementScope
+    stmt = select(
+        scope.cycle_id, scope.review_phase, scope.verification_level, scope.grading_count, scope.graded_through,
+    ).where(scope.entity_type == entity_type)
+    if cycle_id is not None:
+        stmt = stmt.where(scope.cycle_id == cycle_id)
+    return {(row[0], row[1], row[2]): (row[3], row[4]) for row in db.session.execute(stmt)}
+
+
+def build_tensor(rows: List[Tuple]) -> Dict[str, Any]:
+    """Dense submissions × graders × criteria tensor of 0-100 scores.
+
+    ``rows`` are (submission, grader, criterion, category, score, min, max);
+    a later row for the same cell replaces an earlier one.
+    """
+    subs, graders, criteria, categories, scores, lows, highs = zip(*rows)
+    sub_codes, sub_ids = _factorize(subs)
+    grader_codes, grader_ids = _factorize(graders)
+    criterion_codes, criterion_ids = _factorize(criteria)
+    low = np.asarray(lows, dtype=float)
+    span = np.maximum(np.asarray(highs, dtype=float) - low, 1.0)
+    scaled = np.clip((np.asarray(scores, dtype=float) - low) / span, 0.0, 1.0) * 100.0
+
+    tensor = np.full((len(sub_ids), len(grader_ids), len(criterion_ids)), np.nan)
+    cells = np.ravel_multi_index((sub_codes, grader_codes, criterion_codes), tensor.shape)
+    _, from_end = np.unique(cells[::-1], return_index=True)
+    latest = len(cells) - 1 - from_end
+    tensor.flat[cells[latest]] = scaled[latest]
+    sub_category = [None] * len(sub_ids)
+    for code, category in zip(sub_codes, categories):
+        sub_category[code] = category
+    return {
+        "tensor": tensor,
+        "submissions": sub_ids,
+        "graders": grader_ids,
+        "criteria": criterion_ids,
+        "categories": np.asarray(sub_category, dtype=object),
+    }
+
+
+def _slices(data: Dict[str, Any]):
+    """Yield (category id, criterion id, units × graders matrix) for every slice."""
+    tensor = data["tensor"]
+    categories = data["categories"]
+    for category in [None, *dict.fromkeys(categories)]:
+        block = tensor if category is None else tensor[categories == category]
+        # Pooled criteria: one unit per (submission, criterion).
+        yield category, None, block.transpose(0, 2, 1).reshape(-1, block.shape[1])
+        for index, criterion in enumerate(data["criteria"]):
+            yield category, criterion, block[:, :, index]
+
+
+def compute_scope(entity_type: GradingFor, scope: Scope) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Agreement and grader-disagreement rows for one scope (not yet stored)."""
+    cycle_id, review_phase, verification_level = scope
+    target = TARGETS[entity_type]
+    model, fk = target.model, getattr(Grading, target.fk)
+    category_col = getattr(model, COUNTED_MODELS[entity_type][1])
+    rows = db.session.execute(
+        select(
+            fk, Grading.graded_by_id, Grading.grading_type_id, category_col,
+            Grading.score, GradingType.min_score, GradingType.max_score,
+        )
+        .join(GradingType, GradingType.id == Grading.grading_type_id)
+        .join(model, model.id == fk)
+        .where(
+            model.cycle_id == cycle_id,
+            Grading.review_phase == review_phase,
+            Grading.verification_level == verification_level,
+        )
+        .order_by(Grading.updated_on, Grading.id)
+    ).all()
+    if not rows:
+        return [], []
+    data = build_tensor(rows)
+    key = {
+        "entity_type": entity_type,
+        "cycle_id": cycle_id,
+        "review_phase": review_phase,
+        "verification_level": verification_level,
+    }
+
+    agreements = []
+    for category, criterion, matrix in _slices(data):
+        present = ~np.isnan(matrix)
+        agreements.append({
+            **key,
+            "category_id": category,
+            "grading_type_id": criterion,
+            "alpha": krippendorff_alpha(matrix),
+            "icc": icc1(matrix),
+            "units": int(np.count_nonzero(np.count_nonzero(present, axis=1) >= 2)),
+            "graders": int(np.count_nonzero(present.any(axis=0))),
+            "ratings": int(np.count_nonzero(present)),
+        })
+
+    tensor = data["tensor"]
+    pooled = tensor.transpose(0, 2, 1).reshape(-1, tensor.shape[1])
+    ratings, deviation, bias = peer_deviation(pooled)
+    disagreements = [
+        {**key, "graded_by_id": grader, "ratings": int(ratings[i]),
+         "deviation": float(deviation[i]), "bias": float(bias[i])}
+        for i, grader in enumerate(data["graders"])
+        if ratings[i]
+    ]
+    return agreements, disagreements
+
+
+def _clear_scope(connection, entity_type: GradingFor, scope: Scope) -> None:
+    cycle_id, review_phase, verification_level = scope
+    for model in (GradingAgreement, GraderDisagreement, GradingAgreementScope):
+        connection.execute(delete(model.__table__).where(
+            model.entity_type == entity_type,
+            model.cycle_id == cycle_id,
+            model.review_phase == review_phase,
+            model.verification_level == verification_level,
+        ))
+
+
+def refresh_agreement(
+    session=None,
+    *,
+    entity_types: Optional[Iterable[GradingFor]] = None,
+    cycle_id=None,
+    force: bool = False,
+    on_scope: Optional[Callable[[GradingFor, Scope], None]] = None,
+) -> Dict[str, int]:
+    """Recompute the scopes whose gradings changed; one transaction per scope.
+
+    Returns counts of ``refreshed``, ``unchanged`` and ``removed`` scopes.
+    """
+    session = session or db.session
+    totals = {"refreshed": 0, "unchanged": 0, "removed": 0}
+    for entity_type in entity_types or TARGETS:
+        entity_type = GradingFor(entity_type)
+        current = _scope_stamps(entity_type, cycle_id)
+        stored = _stored_stamps(entity_type, cycle_id)
+        for scope, (count, through) in current.items():
+            if not force and stored.get(scope) == (count, through):
+                totals["unchanged"] += 1
+                continue
+            agreements, disagreements = compute_scope(entity_type, scope)
+            connection = session.connection()
+            _clear_scope(connection, entity_type, scope)
+            if agreements:
+                connection.execute(insert(GradingAgreement.__table__), agreements)
+            if disagreements:
+                connection.execute(insert(GraderDisagreement.__table__), disagreements)
+            connection.execute(insert(GradingAgreementScope.__table__).values(
+                entity_type=entity_type, cycle_id=scope[0], review_phase=scope[1],
+                verification_level=scope[2], grading_count=count, graded_through=through,
+            ))
+            session.commit()
+            totals["refreshed"] += 1
+            if on_scope is not None:
+                on_scope(entity_type, scope)
+        for scope in stored.keys() - current.keys():
+            _clear_scope(session.connection(), entity_type, scope)
+            session.commit()
+            totals["removed"] += 1
+    return totals
+
+
+_SESSION_KEY = "agreement_changed"
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_pid: Optional[int] = None
+_pending: Set[GradingFor] = set()
+_lock = threading.Lock()
+
+
+def mark_changed(session: Optional[Session], *entity_types: GradingFor) -> None:
+    """Record that ``session`` wrote gradings; a refresh is scheduled on commit."""
+    if session is not None:
+        session.info.setdefault(_SESSION_KEY, set()).update(GradingFor(t) for t in entity_types)
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """One refresh thread per process (recreated after a gunicorn fork)."""
+    global _executor, _executor_pid
+    if _executor is None or _executor_pid != os.getpid():
+        _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="agreement")
+        _executor_pid = os.getpid()
+        _pending.clear()
+    return _executor
+
+
+def _run_pending(app) -> None:
+    with _lock:
+        entity_types = sorted(_pending, key=lambda t: t.value)
+        _pending.clear()
+    if not entity_types:
+        return
+    with app.app_context():
+        try:
+            refresh_agreement(entity_types=entity_types)
+        except Exception:
+            db.session.rollback()
+            app.logger.exception("agreement refresh failed for %s", [t.value for t in entity_types])
+
+
+def schedule_refresh(entity_types: Iterable[GradingFor]) -> Optional[Future]:
+    """Refresh the stale scopes of ``entity_types`` off the request thread.
+
+    Requests made while a run is still queued are merged into it. Returns
+    the queued run, or None when nothing new was submitted.
+    """
+    app = current_app._get_current_object()
+    if not app.config.get("AGREEMENT_AUTO_REFRESH", False):
+        return None
+    with _lock:
+        executor = _get_executor()
+        queued = bool(_pending)
+        _pending.update(GradingFor(t) for t in entity_types)
+        if queued or not _pending:
+            return None
+        return executor.submit(_run_pending, app)
+
+
+def wait_for_refresh(timeout: Optional[float] = None) -> None:
+    """Block until every refresh scheduled so far by this process has run."""
+    with _lock:
+        executor = _get_executor()
+    executor.submit(lambda: None).result(timeout)
+
+
+def _mark_grading(mapper, connection, target):
+    mark_changed(
+        object_session(target),
+        *(entity_type for entity_type, t in TARGETS.items() if getattr(target, t.fk) is not None),
+    )
+
+
+for _event_name in ("after_insert", "after_update", "after_delete"):
+    event.listen(Grading, _event_name, _mark_grading)
+
+
+@event.listens_for(Session, "after_commit")
+def _refresh_after_commit(session) -> None:
+    changed = session.info.pop(_SESSION_KEY, None)
+    if changed and has_app_context():
+        schedule_refresh(changed)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _forget_after_rollback(session, previous_transaction) -> None:
+    if not session.in_transaction():
+        session.info.pop(_SESSION_KEY, None)
+
+
+def _rounded(value: Optional[float]) -> Optional[float]:
+    return None if value is None else round(value, 4)
+
+
+def agreement_report(
+    entity_type,
+    cycle_id,
+    *,
+    review_phase: Optional[int] = None,
+    verification_level: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Stored statistics for a cycle, with ``stale`` set when grades changed since."""
+    entity_type = GradingFor(entity_type)
+    filters = []
+    for model in (GradingAgreement, GraderDisagreement):
+        conditions = [model.entity_type == entity_type, model.cycle_id == cycle_id]
+        if review_phase is not None:
+            conditions.append(model.review_phase == review_phase)
+        if verification_level is not None:
+            conditions.append(model.verification_level == verification_level)
+        filters.append(conditions)
+
+    agreement = GradingAgreement
+    agreements = [
+        {
+            "review_phase": row.review_phase,
+            "verification_level": row.verification_level,
+            "category_id": str(row.category_id) if row.category_id else None,
+            "grading_type_id": str(row.grading_type_id) if row.grading_type_id else None,
+            "criteria": criteria,
+            "alpha": _rounded(row.alpha),
+            "icc": _rounded(row.icc),
+            "units": row.units,
+            "graders": row.graders,
+            "ratings": row.ratings,
+            "computed_at": row.computed_at.isoformat() if row.computed_at else None,
+        }
+        for row, criteria in db.session.execute(
+            select(agreement, GradingType.criteria)
+            .outerjoin(GradingType, GradingType.id == agreement.grading_type_id)
+            .where(*filters[0])
+            .order_by(
+                agreement.review_phase, agreement.verification_level,
+                agreement.category_id.is_not(None), agreement.category_id,
+                agreement.grading_type_id.is_not(None), GradingType.criteria,
+            )
+        ).all()
+    ]
+
+    grader = GraderDisagreement
+    graders = [
+        {
+            "review_phase": row.review_phase,
+            "verification_level": row.verification_level,
+            "graded_by_id": str(row.graded_by_id),
+            "username": username,
+            "ratings": row.ratings,
+            "deviation": round(row.deviation, 2),
+            "bias": round(row.bias, 2),
+        }
+        for row, username in db.session.execute(
+            select(grader, User.username)
+            .outerjoin(User, User.id == grader.graded_by_id)
+            .where(*filters[1])
+            .order_by(grader.deviation.desc(), grader.graded_by_id)
+        ).all()
+    ]
+
+    def selected(stamps):
+        return {
+            scope: stamp for scope, stamp in stamps.items()
+            if review_phase in (None, scope[1]) and verification_level in (None, scope[2])
+        }
+
+    current = selected(_scope_stamps(entity_type, cycle_id))
+    stored = selected(_stored_stamps(entity_type, cycle_id))
+    return {
+        "cycle_id": str(cycle_id),
+        "entity_type": entity_type.value,
+        "stale": current != stored,
+        "agreements": agreements,
+        "graders": graders,
+    }
@@ -0,0 +1,322 @@
+"""Workload-balanced automatic verifier assignment.
+
+The solver reads everything it needs with a handful of aggregate queries:
+
+* the current assignment load of every verifier across abstracts, awards and
+  best papers (one ``UNION ALL ... GROUP BY``),
+* every verifier's category memberships for the three kinds (one
+  ``UNION ALL``),
+* the open submissions of the cycle and their existing assignments.
+
+A verifier linked to a submission at any phase is never picked for it again
+(the link key is ``(submission, user)``); only links at the current phase
+count toward ``k``.
+
+It then fills each submission up to ``k`` verifiers in memory, always taking
+the least-loaded eligible verifier from a per-category min-heap, and persists
+the plan with one multi-row insert. Submissions with the fewest eligible
+verifiers are placed first so scarce reviewers are not used up elsewhere.
+"""
+from __future__ import annotations
+
+import heapq
+import itertools
+import uuid
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Set
+
+from flask import current_app
+from sqlalchemy import func, literal, select, union_all
+
+from app.extensions import db
+from app.models.Cycle import (
+    user_award_categories,
+    user_categories,
+    user_paper_categories,
+)
+from app.models.SubmissionCounter import COUNTED_MODELS
+from app.models.User import UserRole
+from app.models.enumerations import GradingFor, Role, Status
+from app.utils.model_utils.review_phase_utils import TARGETS
+from app.utils.model_utils.verifier_assignment_utils import insert_assignments, open_verification_window_id
+
+DEFAULT_STATUSES = (Status.PENDING, Status.UNDER_REVIEW)
+
+# entity type -> (membership table, its category column name)
+CATEGORY_MEMBERSHIPS = {
+    GradingFor.ABSTRACT: (user_categories, "category_id"),
+    GradingFor.AWARD: (user_award_categories, "paper_category_id"),
+    GradingFor.BEST_PAPER: (user_paper_categories, "paper_category_id"),
+}
+
+
+def parse_auto_assign_options(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate an auto-assign request body; raises ValueError on bad input."""
+    def _uuid(value, field):
+        try:
+            return uuid.UUID(str(value))
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid {field}: {value!r}")
+
+    def _positive_int(value, field):
+        try:
+            number = int(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid {field}: {value!r}")
+        if number < 1:
+            raise ValueError(f"'{field}' must be a positive integer")
+        return number
+
+    if not payload.get("cycle_id"):
+        raise ValueError("'cycle_id' is required")
+    options: Dict[str, Any] = {"cycle_id": _uuid(payload["cycle_id"], "cycle_id")}
+    per_submission = _positive_int(payload.get("verifiers_per_submission", 2), "verifiers_per_submission")
+    limit = current_app.config.get("AUTO_ASSIGN_MAX_PER_SUBMISSION", 10)
+    if per_submission > limit:
+        raise ValueError(f"'verifiers_per_submission' may not exceed {limit}")
+    options["per_submission"] = per_submission
+    if payload.get("category_id"):
+        options["category_id"] = _uuid(payload["category_id"], "category_id")
+    if payload.get("max_load") is not None:
+        options["max_load"] = _positive_int(payload["max_load"], "max_load")
+    if payload.get("submission_ids"):
+        if not isinstance(payload["submission_ids"], list):
+            raise ValueError("'submission_ids' must be a list")
+        options["submission_ids"] = [_uuid(i, "submission id") for i in payload["submission_ids"]]
+    if payload.get("statuses"):
+        try:
+            options["statuses"] = tuple(Status(str(value).lower()) for value in payload["statuses"])
+        except ValueError:
+            raise ValueError(f"Invalid statuses: {payload['statuses']!r}")
+    return options
+
+
+class Submission(NamedTuple):
+    id: Any
+    category_id: Any
+    owner_id: Any
+    review_phase: int
+    assigned: frozenset  # verifier IDs already assigned at the current phase
+    linked: frozenset = frozenset()  # verifier IDs linked at any phase
+
+
+class Plan(NamedTuple):
+    assignments: Dict[Any, List[Any]]  # submission id -> newly chosen verifier ids
+    unfilled: Dict[Any, int]  # submission id -> seats that could not be filled
+    loads: Dict[Any, int]  # verifier id -> load after the plan
+
+
+def verifier_loads() -> Dict[Any, Dict[str, int]]:
+    """Assignment counts per verifier and kind, from one aggregate query."""
+    parts = [
+        select(literal(kind.value).label("kind"), target.link.user_id.label("user_id"))
+        for kind, target in TARGETS.items()
+    ]
+    assigned = union_all(*parts).subquery()
+    stmt = (
+        select(assigned.c.user_id, assigned.c.kind, func.count())
+        .group_by(assigned.c.user_id, assigned.c.kind)
+    )
+    loads: Dict[Any, Dict[str, int]] = defaultdict(lambda: {kind.value: 0 for kind in TARGETS})
+    for user_id, kind, count in db.session.execute(stmt):
+        loads[user_id][kind] = count
+    return dict(loads)
+
+
+def verifier_categories() -> Dict[GradingFor, Dict[Any, Set[Any]]]:
+    """Category -> verifier IDs for every kind, limited to users holding the verifier role."""
+    parts = []
+    for kind, (table, column) in CATEGORY_MEMBERSHIPS.items():
+        parts.append(
+            select(
+                literal(kind.value).label("kind"),
+                table.c.user_id.label("user_id"),
+                table.c[column].label("category_id"),
+            )
+            .join(UserRole, (UserRole.user_id == table.c.user_id) & (UserRole.role == Role.VERIFIER))
+        )
+    members: Dict[GradingFor, Dict[Any, Set[Any]]] = {kind: defaultdict(set) for kind in CATEGORY_MEMBERSHIPS}
+    for kind, user_id, category_id in db.session.execute(union_all(*parts)):
+        members[GradingFor(kind)][category_id].add(user_id)
+    return members
+
+
+def open_submissions(
+    grading_for: GradingFor,
+    cycle_id,
+    *,
+    category_id=None,
+    statuses: Sequence[Status] = DEFAULT_STATUSES,
+    submission_ids: Optional[Iterable] = None,
+) -> List[Submission]:
+    """Candidate submissions with the verifiers already linked to them, per phase."""
+    target = TARGETS[grading_for]
+    model, link = target.model, target.link
+    category_col = getattr(model, COUNTED_MODELS[grading_for][1])
+    filters = [model.cycle_id == cycle_id, model.status.in_(list(statuses))]
+    if category_id is not None:
+        filters.append(category_col == category_id)
+    if submission_ids is not None:
+        filters.append(model.id.in_(list(submission_ids)))
+    rows = db.session.execute(
+        select(model.id, category_col, model.created_by_id, model.review_phase).where(*filters)
+    ).all()
+    if not rows:
+        return []
+    link_fk = getattr(link, target.fk)
+    phases = {row[0]: row[3] or 1 for row in rows}
+    assigned: Dict[Any, Set[Any]] = defaultdict(set)
+    linked: Dict[Any, Set[Any]] = defaultdict(set)
+    links = db.session.execute(
+        select(link_fk, link.user_id, link.review_phase)
+        .join(model, model.id == link_fk)
+        .where(*filters)
+    )
+    for submission_id, user_id, phase in links:
+        linked[submission_id].add(user_id)
+        if (phase or 1) == phases[submission_id]:
+            assigned[submission_id].add(user_id)
+    return [
+        Submission(
+            row[0], row[1], row[2], phases[row[0]],
+            frozenset(assigned.get(row[0], ())), frozenset(linked.get(row[0], ())),
+        )
+        for row in rows
+    ]
+
+
+def plan_assignments(
+    submissions: Sequence[Submission],
+    eligible: Dict[Any, Set[Any]],
+    loads: Dict[Any, int],
+    *,
+    per_submission: int,
+    max_load: Optional[int] = None,
+) -> Plan:
+    """Fill every submission up to ``per_submission`` verifiers, least-loaded first.
+
+    ``eligible`` maps category -> verifier IDs, ``loads`` verifier -> current
+    load (missing means 0). Owners never review their own submission and a
+    verifier is never chosen twice for the same submission, whatever the
+    phase of the earlier link. Heaps are keyed
+    by (load, tiebreak); entries whose load went stale because the verifier
+    was picked through another category are refreshed lazily on pop.
+    """
+    load = {user_id: loads.get(user_id, 0) for members in eligible.values() for user_id in members}
+    tiebreak = itertools.count()
+    heaps: Dict[Any, list] = {}
+    for category, members in eligible.items():
+        heap = [(load[user_id], str(user_id), next(tiebreak), user_id) for user_id in members]
+        heapq.heapify(heap)
+        heaps[category] = heap
+
+    def need(submission: Submission) -> int:
+        return max(per_submission - len(submission.assigned), 0)
+
+    # Most constrained first: fewest eligible verifiers per open seat.
+    ordered = sorted(
+        (s for s in submissions if need(s)),
+        key=lambda s: (len(eligible.get(s.category_id, ())) - len(s.assigned | s.linked), str(s.id)),
+    )
+    assignments: Dict[Any, List[Any]] = {}
+    unfilled: Dict[Any, int] = {}
+    for submission in ordered:
+        heap = heaps.get(submission.category_id, [])
+        wanted = need(submission)
+        chosen: List[Any] = []
+        deferred = []
+        while heap and len(chosen) < wanted:
+            entry_load, name, _, user_id = heapq.heappop(heap)
+            if entry_load != load[user_id]:
+                heapq.heappush(heap, (load[user_id], name, next(tiebreak), user_id))
+                continue
+            if max_load is not None and entry_load >= max_load:
+                deferred.append((entry_load, name, next(tiebreak), user_id))
+                break  # every remaining entry is at least as loaded
+            if user_id == submission.owner_id or user_id in submission.assigned or user_id in submission.linked:
+                deferred.append((entry_load, name, next(tiebreak), user_id))
+                continue
+            chosen.append(user_id)
+            load[user_id] += 1
+            deferred.append((load[user_id], name, next(tiebreak), user_id))
+        for entry in deferred:
+            heapq.heappush(heap, entry)
+        if chosen:
+            assignments[submission.id] = chosen
+        if len(chosen) < wanted:
+            unfilled[submission.id] = wanted - len(chosen)
+    return Plan(assignments, unfilled, load)
+
+
+def _without_conflicts(plan: Plan, created: Set[tuple]) -> Plan:
+    """``plan`` reduced to the ``created`` pairs; rows the insert skipped become unfilled seats."""
+    assignments: Dict[Any, List[Any]] = {}
+    unfilled = dict(plan.unfilled)
+    load = dict(plan.loads)
+    for submission_id, chosen in plan.assignments.items():
+        kept = [user_id for user_id in chosen if (submission_id, user_id) in created]
+        for user_id in chosen:
+            if (submission_id, user_id) not in created:
+                load[user_id] -= 1
+        if kept:
+            assignments[submission_id] = kept
+        if len(kept) < len(chosen):
+            unfilled[submission_id] = unfilled.get(submission_id, 0) + len(chosen) - len(kept)
+    return Plan(assignments, unfilled, load)
+
+
+def auto_assign(
+    grading_for,
+    cycle_id,
+    *,
+    per_submission: int = 2,
+    category_id=None,
+    statuses: Sequence[Status] = DEFAULT_STATUSES,
+    submission_ids: Optional[Iterable] = None,
+    max_load: Optional[int] = None,
+    actor_id: Optional[str] = None,
+    dry_run: bool = False,
+) -> Dict[str, Any]:
+    """Plan (and unless ``dry_run``, persist) a balanced assignment for one cycle."""
+    grading_for = GradingFor(grading_for)
+    submissions = open_submissions(
+        grading_for, cycle_id, category_id=category_id, statuses=statuses, submission_ids=submission_ids,
+    )
+    loads = {user_id: sum(kinds.values()) for user_id, kinds in verifier_loads().items()}
+    eligible = verifier_categories()[grading_for]
+    plan = plan_assignments(submissions, eligible, loads, per_submission=per_submission, max_load=max_load)
+
+    planned_count = sum(len(chosen) for chosen in plan.assignments.values())
+    created_count = 0
+    if plan.assignments and not dry_run:
+        window_id = open_verification_window_id(grading_for, cycle_id)
+        phases = {s.id: s.review_phase for s in submissions}
+        result = insert_assignments(
+            grading_for,
+            (
+                (submission_id, user_id, phases[submission_id], window_id)
+                for submission_id, chosen in plan.assignments.items()
+                for user_id in chosen
+            ),
+            actor_id=actor_id,
+        )
+        created_count = result.changed_count
+        # A concurrent assignment can take a seat between planning and insert.
+        plan = _without_conflicts(plan, set(result.changed))
+
+    touched = {user_id for chosen in plan.assignments.values() for user_id in chosen}
+    return {
+        "dry_run": dry_run,
+        "submissions_considered": len(submissions),
+        "assignments": {
+            str(submission_id): [str(user_id) for user_id in chosen]
+            for submission_id, chosen in plan.assignments.items()
+        },
+        "planned_count": planned_count,
+        "created_count": created_count,
+        "unfilled": {str(submission_id): seats for submission_id, seats in plan.unfilled.items()},
+        "verifier_loads": {
+            str(user_id): {"before": loads.get(user_id, 0), "after": plan.loads[user_id]}
+            for user_id in touched
+        },
+    }
@@ -0,0 +1,229 @@
+"""Bulk accept / reject / phase advancement for submissions.
+
+Every operation resolves its selection (explicit IDs or a cycle-scoped
+filter) with one query, validates grading completeness with one set-based
+query, applies the change with a single UPDATE, and adjusts the submission
+counters per bucket; the whole batch commits or rolls back together.
+"""
+from __future__ import annotations
+
+import uuid
+from typing import Any, Dict, List, Optional
+
+from flask import current_app
+from sqlalchemy import select, update
+
+from app.extensions import db
+from app.models.SubmissionCounter import COUNTED_MODELS, apply_counter_moves
+from app.models.User import User
+from app.models.enumerations import GradingFor, Status
+from app.services.submission_status_service import invalidate_status_summaries
+from app.utils import metrics_cache
+from app.utils.model_utils.review_phase_utils import (
+    TARGETS,
+    advance_eligible_submissions,
+    eligible_for_advance_select,
+    incomplete_submission_ids,
+)
+from app.utils.services.notify_queue import Notification, enqueue_notifications
+
+ENTITY_SLUGS = {
+    "abstracts": GradingFor.ABSTRACT,
+    "awards": GradingFor.AWARD,
+    "best-papers": GradingFor.BEST_PAPER,
+}
+ENTITY_LABELS = {
+    GradingFor.ABSTRACT: "abstract",
+    GradingFor.AWARD: "award",
+    GradingFor.BEST_PAPER: "best paper",
+}
+ACTIONS = {"accept": Status.ACCEPTED, "reject": Status.REJECTED, "advance-phase": None}
+_FILTER_KEYS = ("cycle_id", "category_id", "status", "review_phase")
+
+
+def _uuid(value, field: str) -> uuid.UUID:
+    try:
+        return uuid.UUID(str(value))
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid {field}: {value!r}")
+
+
+def parse_selection(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate ``{"ids": [...]}`` and/or ``{"filter": {"cycle_id": ..., ...}}``.
+
+    A filter must name a cycle so a malformed request cannot touch every
+    submission in the system.
+    """
+    ids = payload.get("ids")
+    raw_filter = payload.get("filter") or {}
+    if not ids and not raw_filter:
+        raise ValueError("Provide 'ids' or a 'filter' with 'cycle_id'")
+    if not isinstance(raw_filter, dict):
+        raise ValueError("'filter' must be an object")
+    unknown = sorted(set(raw_filter) - set(_FILTER_KEYS))
+    if unknown:
+        raise ValueError(f"Unsupported filter keys: {', '.join(unknown)}")
+
+    selection: Dict[str, Any] = {}
+    if ids:
+        if not isinstance(ids, list):
+            raise ValueError("'ids' must be a list")
+        limit = current_app.config.get("BULK_REVIEW_MAX_IDS", 5000)
+        if len(ids) > limit:
+            raise ValueError(f"At most {limit} ids per request")
+        selection["ids"] = list(dict.fromkeys(_uuid(i, "id") for i in ids))
+    elif "cycle_id" not in raw_filter:
+        raise ValueError("'filter' requires 'cycle_id'")
+
+    if "cycle_id" in raw_filter:
+        selection["cycle_id"] = _uuid(raw_filter["cycle_id"], "cycle_id")
+    if "category_id" in raw_filter:
+        selection["category_id"] = _uuid(raw_filter["category_id"], "category_id")
+    if "status" in raw_filter:
+        try:
+            selection["status"] = Status(str(raw_filter["status"]).lower())
+        except ValueError:
+            raise ValueError(f"Invalid status: {raw_filter['status']!r}")
+    if "review_phase" in raw_filter:
+        try:
+            selection["review_phase"] = int(raw_filter["review_phase"])
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid review_phase: {raw_filter['review_phase']!r}")
+    return selection
+
+
+def _selected_rows(grading_for: GradingFor, selection: Dict[str, Any], *, lock: bool):
+    model = TARGETS[grading_for].model
+    category_col = getattr(model, COUNTED_MODELS[grading_for][1])
+    filters = []
+    if "ids" in selection:
+        filters.append(model.id.in_(selection["ids"]))
+    if "cycle_id" in selection:
+        filters.append(model.cycle_id == selection["cycle_id"])
+    if "category_id" in selection:
+        filters.append(category_col == selection["category_id"])
+    if "status" in selection:
+        filters.append(model.status == selection["status"])
+    if "review_phase" in selection:
+        filters.append(model.review_phase == selection["review_phase"])
+    stmt = select(model.id, model.cycle_id, category_col, model.status, model.review_phase).where(*filters)
+    if lock and db.session.get_bind().dialect.name == "postgresql":
+        stmt = stmt.with_for_update(of=model)
+    return db.session.execute(stmt).all()
+
+
+def _result(selection, rows, updated, **skipped) -> Dict[str, Any]:
+    found = {row[0] for row in rows}
+    result = {
+        "requested": len(selection["ids"]) if "ids" in selection else len(rows),
+        "updated": [str(i) for i in updated],
+        "skipped": {reason: [str(i) for i in ids] for reason, ids in skipped.items()},
+    }
+    if "ids" in selection:
+        result["skipped"]["not_found"] = [str(i) for i in selection["ids"] if i not in found]
+    return result
+
+
+def bulk_set_status(
+    grading_for,
+    new_status: Status,
+    selection: Dict[str, Any],
+    *,
+    require_complete: bool,
+    actor_id: Optional[str] = None,
+    dry_run: bool = False,
+) -> Dict[str, Any]:
+    """Accept or reject every selected submission with one UPDATE."""
+    grading_for = GradingFor(grading_for)
+    model = TARGETS[grading_for].model
+    rows = _selected_rows(grading_for, selection, lock=not dry_run)
+    unchanged = [row[0] for row in rows if row[3] == new_status]
+    candidates = [row for row in rows if row[3] != new_status]
+    incomplete = set()
+    if require_complete and candidates:
+        incomplete = incomplete_submission_ids(grading_for, [row[0] for row in candidates])
+    to_update = [row for row in candidates if row[0] not in incomplete]
+    ids = [row[0] for row in to_update]
+
+    if ids and not dry_run:
+        db.session.execute(
+            update(model)
+            .where(model.id.in_(ids))
+            .values(status=new_status)
+            .execution_options(synchronize_session=False)
+        )
+        apply_counter_moves(
+            db.session.connection(),
+            grading_for,
+            ((row[1], row[2], row[3], row[4], new_status, row[4]) for row in to_update),
+        )
+        db.session.commit()
+        _after_change(grading_for)
+    elif not dry_run:
+        db.session.rollback()  # release row locks
+    return _result(selection, rows, ids, unchanged=unchanged, incomplete=sorted(incomplete, key=str))
+
+
+def bulk_advance_phase(
+    grading_for,
+    selection: Dict[str, Any],
+    *,
+    actor_id: Optional[str] = None,
+    dry_run: bool = False,
+) -> Dict[str, Any]:
+    """Advance every eligible selected submission to its next review phase."""
+    grading_for = GradingFor(grading_for)
+    rows = _selected_rows(grading_for, selection, lock=False)
+    candidate_ids = [row[0] for row in rows]
+    if not candidate_ids:
+        return _result(selection, rows, [])
+    if dry_run:
+        advanced = list(db.session.scalars(
+            eligible_for_advance_select(grading_for, submission_ids=candidate_ids)
+        ))
+    else:
+        advanced = advance_eligible_submissions(
+            grading_for,
+            submission_ids=candidate_ids,
+            actor_id=actor_id,
+        )
+        if advanced:
+            _after_change(grading_for)
+    done = set(advanced)
+    return _result(selection, rows, advanced, not_eligible=[i for i in candidate_ids if i not in done])
+
+
+def _after_change(grading_for: GradingFor) -> None:
+    invalidate_status_summaries(grading_for.value)
+    metrics_cache.invalidate()
+
+
+def notify_owners(grading_for, submission_ids: List, action: str) -> None:
+    """Queue one mail/SMS per affected submission owner (single lookup query)."""
+    if not submission_ids:
+        return
+    grading_for = GradingFor(grading_for)
+    model = TARGETS[grading_for].model
+    label = ENTITY_LABELS[grading_for]
+    rows = db.session.execute(
+        select(model.id, model.title, model.review_phase, User.username, User.email, User.mobile)
+        .join(User, User.id == model.created_by_id)
+        .where(model.id.in_([uuid.UUID(str(i)) for i in submission_ids]))
+    ).all()
+    notes = []
+    for row in rows:
+        if action == "advance-phase":
+            outcome = f"has moved to review phase {row.review_phase}"
+        else:
+            outcome = "has been accepted" if action == "accept" else "has been rejected"
+        notes.append(Notification(
+            email=row.email,
+            mobile=row.mobile,
+            subject=f"Update on your {label} submission",
+            body=(
+                f"Dear {row.username},\n\nYour {label} \"{row.title}\" (ID {row.id}) {outcome}.\n\n"
+                "Best regards,\nResearch Section,AIIMS"
+            ),
+            sms=f"Your {label} id : {row.id} {outcome}.",
+        ))
+    enqueue_notifications(notes)
@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import String, cast, func, literal, null, select, union_all
+
+from app.extensions import db, replica_reads
+from app.models.Cycle import Abstracts, Awards, BestPaper, Category, PaperCategory
+from app.models.Token import Token
+from app.models.User import User, UserRole
+from app.models.SubmissionCounter import SubmissionCounter
+from app.models.enumerations import GradingFor, Role, Status
+from app.utils import metrics_cache
+
+ACTIVE_STATUSES = (Status.PENDING, Status.UNDER_REVIEW)
+RECENT_LIMIT = 5
+
+_SUBMISSION_MODELS = (
+    ("abstracts", Abstracts),
+    ("awards", Awards),
+    ("best_papers", BestPaper),
+)
+_COUNTER_TYPES = {
+    "abstracts": GradingFor.ABSTRACT,
+    "awards": GradingFor.AWARD,
+    "best_papers": GradingFor.BEST_PAPER,
+}
+
+# Every branch of the UNION ALL yields (entity, bucket, total, n1..n6) so the
+# whole dashboard is answered by a single round trip.
+_WIDTH = 6
+
+
+def _row(entity: str, bucket, total, *counts):
+    padded = list(counts) + [null()] * (_WIDTH - len(counts))
+    return [literal(entity).label("entity"), bucket.label("bucket"), total.label("total")] + [
+        c.label(f"n{i + 1}") for i, c in enumerate(padded)
+    ]
+
+
+def _aggregate_statement(now: datetime):
+    week_ago = now - timedelta(days=7)
+    month_ago = now - timedelta(days=30)
+
+    users = select(*_row(
+        "users",
+        cast(null(), String),
+        func.count(),
+        func.count().filter(User.is_active.is_(True)),
+        func.count().filter(User.is_verified.is_(True)),
+        func.count().filter(User.is_email_verified.is_(True)),
+        func.count().filter(User.lock_until > now),
+        func.count().filter(User.created_at >= week_ago),
+        func.count().filter(User.created_at >= month_ago),
+    ))
+
+    role_bucket = cast(UserRole.role, String)
+    roles = select(*_row("roles", role_bucket, func.count())).group_by(role_bucket)
+
+    tokens = select(*_row(
+        "tokens",
+        cast(null(), String),
+        func.count().filter(
+            Token.token_type == "refresh",
+            Token.revoked.is_(False),
+            Token.expires_at > now,
+        ),
+    ))
+
+    branches = [users, roles, tokens]
+    counter_status = cast(SubmissionCounter.status, String)
+    for entity, model in _SUBMISSION_MODELS:
+        # Status totals from the maintained counters; only the last 30 days
+        # of submissions are scanned for the "new" figures.
+        branches.append(
+            select(*_row(entity, counter_status, func.sum(SubmissionCounter.count)))
+            .where(SubmissionCounter.entity_type == _COUNTER_TYPES[entity])
+            .group_by(counter_status)
+        )
+        branches.append(
+            select(*_row(
+                entity,
+                cast(null(), String),
+                func.count(),
+                func.count().filter(model.created_at >= week_ago),
+                func.count(),
+            )).where(model.created_at >= month_ago)
+        )
+    return union_all(*branches)
+
+
+def _status_value(bucket: Optional[str]) -> str:
+    """Map the stored enum name (e.g. ``UNDER_REVIEW``) to its API value."""
+    if bucket is None:
+        return "unknown"
+    try:
+        return Status[bucket].value
+    except KeyError:
+        return str(bucket).lower()
+
+
+def _role_value(bucket: Optional[str]) -> str:
+    try:
+        return Role[bucket].value
+    except KeyError:
+        return str(bucket).lower()
+
+
+def _empty_submissions() -> Dict[str, Any]:
+    return {"total": 0, "active": 0, "by_status": {}, "last_7_days": 0, "last_30_days": 0}
+
+
+def _fold(rows) -> Dict[str, Any]:
+    users: Dict[str, Any] = {}
+    roles: Dict[str, int] = {}
+    active_refresh_tokens = 0
+    submissions = {entity: _empty_submissions() for entity, _ in _SUBMISSION_MODELS}
+    active_values = {s.value for s in ACTIVE_STATUSES}
+
+    for row in rows:
+        if row.entity == "users":
+            users = {
+                "total": row.total or 0,
+                "active": row.n1 or 0,
+                "verified": row.n2 or 0,
+                "email_verified": row.n3 or 0,
+                "locked": row.n4 or 0,
+                "last_7_days": row.n5 or 0,
+                "last_30_days": row.n6 or 0,
+            }
+        elif row.entity == "roles":
+            roles[_role_value(row.bucket)] = row.total or 0
+        elif row.entity == "tokens":
+            active_refresh_tokens = row.total or 0
+        elif row.entity in submissions:
+            entry = submissions[row.entity]
+            if row.bucket is None:
+                entry["last_7_days"] += row.n1 or 0
+                entry["last_30_days"] += row.n2 or 0
+                continue
+            status = _status_value(row.bucket)
+            count = int(row.total or 0)
+            entry["by_status"][status] = entry["by_status"].get(status, 0) + count
+            entry["total"] += count
+            if status in active_values:
+                entry["active"] += count
+
+    users.setdefault("total", 0)
+    users["unverified"] = users["total"] - users.get("verified", 0)
+    users["roles"] = roles
+    submissions["active_total"] = sum(
+        submissions[entity]["active"] for entity, _ in _SUBMISSION_MODELS
+    )
+    return {
+        "users": users,
+        "submissions": submissions,
+        "security": {
+            "active_refresh_tokens": active_refresh_tokens,
+            "locked_users": users.get("locked", 0),
+        },
+    }
+
+
+def _iso(value: Optional[datetime]) -> str:
+    return value.isoformat() if value else ""
+
+
+def _recent_activity() -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    session = db.session
+    recent_users = session.execute(
+        select(User.username, User.email, User.mobile, User.created_at)
+        .order_by(User.created_at.desc())
+        .limit(RECENT_LIMIT)
+    ).all()
+    users = [
+        {"username": u.username or u.email, "created_at": _iso(u.created_at)}
+        for u in recent_users
+    ]
+    activities = [
+        {
+            "title": f"New user: {u.username or u.email}",
+            "subtitle": f"Mobile: {u.mobile or 'N/A'}",
+            "ts": _iso(u.created_at),
+            "icon": "👤",
+        }
+        for u in recent_users[:3]
+    ]
+    sources = (
+        ("Abstract", Abstracts, Category, Abstracts.category_id, "📝"),
+        ("Award", Awards, PaperCategory, Awards.paper_category_id, "🏆"),
+    )
+    for label, model, category, category_fk, icon in sources:
+        rows = session.execute(
+            select(model.title, model.created_at, category.name.label("category"))
+            .outerjoin(category, category.id == category_fk)
+            .order_by(model.created_at.desc())
+            .limit(3)
+        ).all()
+        activities.extend(
+            {
+                "title": f"{label} submitted: {(r.title or '')[:80]}",
+                "subtitle": f"Category: {r.category or ''}",
+                "ts": _iso(r.created_at),
+                "icon": icon,
+            }
+            for r in rows
+        )
+    activities.sort(key=lambda item: item["ts"] or "", reverse=True)
+    return users, activities[:8]
+
+
+def compute_dashboard_metrics() -> Dict[str, Any]:
+    """Run the aggregate query (plus two small "recent" lookups) on the replica."""
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    with replica_reads():
+        rows = db.session.execute(_aggregate_statement(now)).all()
+        recent_users, recent_activities = _recent_activity()
+    payload = _fold(rows)
+    payload["users"]["recent"] = recent_users
+    payload["recent_activities"] = recent_activities
+    payload["generated_at"] = datetime.now(timezone.utc).isoformat()
+    # Sections the legacy dashboard widget still dereferences.
+    payload.setdefault("videos", {"total": 0, "last_30_days": 0, "recent": []})
+    payload.setdefault("surgeons", {"total": 0, "linked": 0})
+    payload.setdefault("favourites", {"total": 0})
+    return payload
+
+
+def get_dashboard_metrics() -> Tuple[Dict[str, Any], str]:
+    """Return ``(payload, etag)`` from the shared cache, computing on a miss."""
+    payload = metrics_cache.get()
+    if payload is None:
+        version = metrics_cache.version()
+        payload = compute_dashboard_metrics()
+        payload["version"] = version
+        metrics_cache.set(payload, for_version=version)
+    return payload, metrics_etag(payload)
+
+
+def metrics_etag(payload: Dict[str, Any]) -> str:
+    body = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha1(body).hexdigest()
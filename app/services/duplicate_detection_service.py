@@ -0,0 +1,252 @@
+"""Near-duplicate lookups over the MinHash/LSH fingerprint tables.
+
+Candidates are the submissions sharing at least one LSH bucket with the
+probe (an index lookup per band, see ``app.models.SubmissionFingerprint``);
+only those candidates have their signatures compared, so neither query grows
+with the square of the number of submissions. Buckets holding more than
+``MAX_BUCKET_SIZE`` submissions (boilerplate titles such as "Case report")
+are ignored by the cycle report to keep its pair count bounded.
+"""
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, func, select, tuple_
+
+from app.extensions import db
+from app.models.SubmissionFingerprint import FINGERPRINTED_MODELS, SubmissionFingerprint, SubmissionLshBucket
+from app.models.SubmissionCounter import COUNTED_MODELS
+from app.models.enumerations import GradingFor
+from app.utils import minhash
+
+DEFAULT_THRESHOLD = 0.5
+MAX_BUCKET_SIZE = 50
+
+# entity type -> public submission number column
+_NUMBER_ATTRS = {
+    GradingFor.ABSTRACT: "abstract_number",
+    GradingFor.AWARD: "award_number",
+    GradingFor.BEST_PAPER: "bestpaper_number",
+}
+
+Key = Tuple[GradingFor, Any]  # (entity type, submission id)
+
+
+def parse_threshold(value: Optional[str]) -> float:
+    """Similarity threshold from a query string; raises ValueError when invalid."""
+    if value in (None, ""):
+        return DEFAULT_THRESHOLD
+    try:
+        threshold = float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid threshold: {value!r}")
+    if not 0 < threshold <= 1:
+        raise ValueError("'threshold' must be greater than 0 and at most 1")
+    return threshold
+
+
+def _signatures(keys: Sequence[Key]) -> Dict[Key, Dict[str, List[int]]]:
+    if not keys:
+        return {}
+    fp = SubmissionFingerprint
+    rows = db.session.execute(
+        select(fp.entity_type, fp.submission_id, fp.field, fp.signature)
+        .where(tuple_(fp.entity_type, fp.submission_id).in_(list(keys)))
+    )
+    found: Dict[Key, Dict[str, List[int]]] = defaultdict(dict)
+    for entity_type, submission_id, field, raw in rows:
+        found[(GradingFor(entity_type), submission_id)][field] = minhash.unpack(raw)
+    return found
+
+
+def _best_match(a: Dict[str, List[int]], b: Dict[str, List[int]]) -> Tuple[float, Optional[str]]:
+    best, best_field = 0.0, None
+    for field in a.keys() & b.keys():
+        score = minhash.similarity(a[field], b[field])
+        if score > best:
+            best, best_field = score, field
+    return best, best_field
+
+
+def _same_bucket(left, right):
+    return and_(left.c.field == right.c.field, left.c.band == right.c.band, left.c.bucket == right.c.bucket)
+
+
+def _describe(keys: Sequence[Key]) -> Dict[Key, Dict[str, Any]]:
+    """Number, title, cycle and status of each submission (one query per kind)."""
+    by_kind: Dict[GradingFor, List[Any]] = defaultdict(list)
+    for entity_type, submission_id in keys:
+        by_kind[entity_type].append(submission_id)
+    described: Dict[Key, Dict[str, Any]] = {}
+    for entity_type, ids in by_kind.items():
+        model = FINGERPRINTED_MODELS[entity_type]
+        category_col = getattr(model, COUNTED_MODELS[entity_type][1])
+        number_col = getattr(model, _NUMBER_ATTRS[entity_type])
+        rows = db.session.execute(
+            select(model.id, number_col, model.title, model.cycle_id, category_col, model.status, model.created_by_id)
+            .where(model.id.in_(ids))
+        )
+        for row in rows:
+            described[(entity_type, row[0])] = {
+                "entity_type": entity_type.value,
+                "id": str(row[0]),
+                "number": row[1],
+                "title": row[2],
+                "cycle_id": str(row[3]),
+                "category_id": str(row[4]),
+                "status": getattr(row[5], "value", row[5]),
+                "created_by_id": str(row[6]),
+            }
+    return described
+
+
+def similar_submissions(
+    entity_type,
+    submission_id,
+    *,
+    threshold: float = DEFAULT_THRESHOLD,
+    limit: int = 20,
+    same_cycle: bool = False,
+) -> Optional[List[Dict[str, Any]]]:
+    """Submissions of any kind estimated at least ``threshold`` similar to one submission.
+
+    Returns None when the submission has no fingerprint (unknown ID or not yet
+    indexed). ``same_cycle`` restricts matches to the submission's cycle.
+    """
+    probe: Key = (GradingFor(entity_type), submission_id)
+    mine = _signatures([probe]).get(probe)
+    if not mine:
+        return None
+
+    own = SubmissionLshBucket.__table__.alias("own")
+    other = SubmissionLshBucket.__table__.alias("other")
+    stmt = (
+        select(other.c.entity_type, other.c.submission_id)
+        .join(own, _same_bucket(own, other))
+        .where(
+            own.c.entity_type == probe[0],
+            own.c.submission_id == probe[1],
+            tuple_(other.c.entity_type, other.c.submission_id) != tuple_(own.c.entity_type, own.c.submission_id),
+        )
+        .distinct()
+    )
+    if same_cycle:
+        fp = SubmissionFingerprint
+        cycle_id = db.session.scalar(
+            select(fp.cycle_id).where(fp.entity_type == probe[0], fp.submission_id == probe[1]).limit(1)
+        )
+        stmt = stmt.where(
+            select(fp.submission_id)
+            .where(fp.entity_type == other.c.entity_type, fp.submission_id == other.c.submission_id, fp.cycle_id == cycle_id)
+            .exists()
+        )
+    candidates = [(GradingFor(kind), sid) for kind, sid in db.session.execute(stmt)]
+
+    scored = []
+    for key, sigs in _signatures(candidates).items():
+        score, field = _best_match(mine, sigs)
+        if score >= threshold:
+            scored.append((score, field, key))
+    scored.sort(key=lambda item: (-item[0], item[2][0].value, str(item[2][1])))
+    scored = scored[:limit]
+    described = _describe([key for _, _, key in scored])
+    return [
+        {**described[key], "similarity": round(score, 3), "matched_on": field}
+        for score, field, key in scored
+        if key in described
+    ]
+
+
+def cycle_duplicate_report(
+    cycle_id,
+    *,
+    threshold: float = DEFAULT_THRESHOLD,
+    entity_types: Optional[Sequence[GradingFor]] = None,
+) -> Dict[str, Any]:
+    """Every near-duplicate pair in a cycle, grouped into clusters.
+
+    Candidate pairs come from one self-join of the bucket table restricted to
+    the cycle's submissions; each pair is then verified against the stored
+    signatures.
+    """
+    fp = SubmissionFingerprint
+    kinds = [GradingFor(kind) for kind in (entity_types or FINGERPRINTED_MODELS)]
+    buckets = SubmissionLshBucket.__table__
+    in_cycle = (
+        select(buckets)
+        .join(fp.__table__, and_(
+            fp.entity_type == buckets.c.entity_type,
+            fp.submission_id == buckets.c.submission_id,
+            fp.field == buckets.c.field,
+        ))
+        .where(fp.cycle_id == cycle_id, buckets.c.entity_type.in_(kinds))
+        .cte("in_cycle")
+    )
+    shared = (
+        select(in_cycle.c.field, in_cycle.c.band, in_cycle.c.bucket)
+        .group_by(in_cycle.c.field, in_cycle.c.band, in_cycle.c.bucket)
+        .having(func.count().between(2, MAX_BUCKET_SIZE))
+        .subquery("shared")
+    )
+    a, b = in_cycle.alias("a"), in_cycle.alias("b")
+    pairs_stmt = (
+        select(a.c.entity_type, a.c.submission_id, b.c.entity_type, b.c.submission_id)
+        .select_from(shared)
+        .join(a, _same_bucket(a, shared))
+        .join(b, _same_bucket(b, shared))
+        .where(tuple_(a.c.entity_type, a.c.submission_id) < tuple_(b.c.entity_type, b.c.submission_id))
+        .distinct()
+    )
+    candidate_pairs = [
+        ((GradingFor(ka), ia), (GradingFor(kb), ib))
+        for ka, ia, kb, ib in db.session.execute(pairs_stmt)
+    ]
+    signatures = _signatures(list({key for pair in candidate_pairs for key in pair}))
+
+    pairs = []
+    for left, right in candidate_pairs:
+        score, field = _best_match(signatures.get(left, {}), signatures.get(right, {}))
+        if score >= threshold:
+            pairs.append((score, field, left, right))
+    pairs.sort(key=lambda item: -item[0])
+
+    # Connected components over the verified pairs.
+    parent: Dict[Key, Key] = {}
+
+    def find(key: Key) -> Key:
+        parent.setdefault(key, key)
+        while parent[key] != key:
+            parent[key] = parent[parent[key]]
+            key = parent[key]
+        return key
+
+    for _, _, left, right in pairs:
+        parent[find(left)] = find(right)
+    members: Dict[Key, List[Key]] = defaultdict(list)
+    for key in parent:
+        members[find(key)].append(key)
+
+    described = _describe(list(parent))
+    return {
+        "cycle_id": str(cycle_id),
+        "threshold": threshold,
+        "candidate_pairs": len(candidate_pairs),
+        "pairs": [
+            {
+                "a": described.get(left, {"entity_type": left[0].value, "id": str(left[1])}),
+                "b": described.get(right, {"entity_type": right[0].value, "id": str(right[1])}),
+                "similarity": round(score, 3),
+                "matched_on": field,
+            }
+            for score, field, left, right in pairs
+        ],
+        "clusters": sorted(
+            (
+                [described.get(key, {"entity_type": key[0].value, "id": str(key[1])}) for key in group]
+                for group in members.values()
+            ),
+            key=len,
+            reverse=True,
+        ),
+    }
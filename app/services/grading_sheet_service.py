@@ -0,0 +1,241 @@
+"""Save a verifier's full grading sheet in one round-trip.
+
+A sheet is every criterion score one verifier gives one submission in one
+review phase. Many sheets are validated together in memory: criteria come
+from one ``app.utils.grading_type_cache`` snapshot per batch, and
+submissions are checked with one query per kind. They are then written with one ``INSERT ... ON CONFLICT DO
+UPDATE`` per kind, keyed on the unique (submission, phase, verifier,
+criterion) grading index, so saving a sheet again replaces its scores
+instead of duplicating them.
+"""
+from __future__ import annotations
+
+import uuid
+from collections import defaultdict
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app.extensions import db
+from app.models.Cycle import Grading
+from app.models.enumerations import GradingFor
+from app.services import agreement_service
+from app.utils import grading_type_cache
+from app.utils.model_utils.review_phase_utils import TARGETS
+
+MAX_SCORES = 500
+
+# request key naming the submission -> entity type
+_TARGET_KEYS = {TARGETS[kind].fk: kind for kind in TARGETS}
+
+
+class GradingSheetError(ValueError):
+    """Raised with every problem found in a batch, not just the first."""
+
+    def __init__(self, problems: List[str]):
+        super().__init__(f"{len(problems)} problem(s): {problems[0]}" if problems else "Invalid grading sheet")
+        self.problems = problems
+
+
+class ScoreRow(NamedTuple):
+    entity_type: GradingFor
+    submission_id: uuid.UUID
+    review_phase: Optional[int]
+    grading_type_id: uuid.UUID
+    score: int
+    comments: Optional[str]
+
+
+def _uuid(value) -> Optional[uuid.UUID]:
+    try:
+        return uuid.UUID(str(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_sheets(payload: Dict[str, Any]) -> List[ScoreRow]:
+    """Flatten ``{"sheets": [...]}`` (or one sheet object) into score rows.
+
+    A sheet is ``{"abstract_id" | "award_id" | "best_paper_id": ...,
+    "review_phase": optional, "scores": [{"grading_type_id", "score",
+    "comments"}]}``; ``review_phase`` defaults to the submission's current
+    phase.
+    """
+    sheets = payload.get("sheets") if "sheets" in payload else [payload]
+    if not isinstance(sheets, list) or not sheets:
+        raise GradingSheetError(["Provide 'sheets' as a non-empty list"])
+
+    rows: List[ScoreRow] = []
+    problems: List[str] = []
+    for i, sheet in enumerate(sheets):
+        where = f"sheets[{i}]"
+        if not isinstance(sheet, dict):
+            problems.append(f"{where}: must be an object")
+            continue
+        targets = [key for key in _TARGET_KEYS if sheet.get(key)]
+        if len(targets) != 1:
+            problems.append(f"{where}: exactly one of abstract_id, best_paper_id or award_id must be provided")
+            continue
+        submission_id = _uuid(sheet[targets[0]])
+        if submission_id is None:
+            problems.append(f"{where}: invalid {targets[0]}")
+            continue
+        review_phase = sheet.get("review_phase")
+        if review_phase is not None and (not isinstance(review_phase, int) or review_phase < 1):
+            problems.append(f"{where}: review_phase must be a positive integer")
+            continue
+        scores = sheet.get("scores")
+        if not isinstance(scores, list) or not scores:
+            problems.append(f"{where}: 'scores' must be a non-empty list")
+            continue
+        for j, entry in enumerate(scores):
+            entry = entry if isinstance(entry, dict) else {}
+            grading_type_id = _uuid(entry.get("grading_type_id"))
+            score = entry.get("score")
+            if grading_type_id is None:
+                problems.append(f"{where}.scores[{j}]: invalid grading_type_id")
+            elif isinstance(score, bool) or not isinstance(score, int):
+                problems.append(f"{where}.scores[{j}]: score must be an integer")
+            else:
+                rows.append(ScoreRow(
+                    _TARGET_KEYS[targets[0]], submission_id, review_phase,
+                    grading_type_id, score, entry.get("comments"),
+                ))
+    if len(rows) > MAX_SCORES:
+        problems.append(f"At most {MAX_SCORES} scores can be saved at once")
+    if problems:
+        raise GradingSheetError(problems)
+    return rows
+
+
+def _validate(rows: List[ScoreRow], criteria: grading_type_cache.Snapshot) -> List[ScoreRow]:
+    """Check criteria and submissions; fill each row's default review phase."""
+    problems: List[str] = []
+    phases: Dict[GradingFor, Dict[uuid.UUID, int]] = {}
+    by_kind: Dict[GradingFor, set] = defaultdict(set)
+    for row in rows:
+        by_kind[row.entity_type].add(row.submission_id)
+    for kind, ids in by_kind.items():
+        model = TARGETS[kind].model
+        phases[kind] = dict(db.session.execute(select(model.id, model.review_phase).where(model.id.in_(ids))).all())
+        for missing in ids - phases[kind].keys():
+            problems.append(f"{kind.value} {missing} not found")
+
+    resolved: List[ScoreRow] = []
+    seen = set()
+    for row in rows:
+        if row.submission_id not in phases[row.entity_type]:
+            continue
+        row = row._replace(review_phase=row.review_phase or phases[row.entity_type][row.submission_id])
+        label = f"{row.entity_type.value} {row.submission_id} criterion {row.grading_type_id}"
+        info = criteria.get(row.grading_type_id)
+        if info is None:
+            problems.append(f"{label}: grading type not found")
+        elif info.grading_for != row.entity_type:
+            problems.append(f"{label}: grading type is for {info.grading_for.value}")
+        elif not info.min_score <= row.score <= info.max_score:
+            problems.append(f"{label}: score must be between {info.min_score} and {info.max_score}")
+        key = (row.entity_type, row.submission_id, row.review_phase, row.grading_type_id)
+        if key in seen:
+            problems.append(f"{label}: scored more than once")
+        seen.add(key)
+        resolved.append(row)
+    if problems:
+        raise GradingSheetError(problems)
+    return resolved
+
+
+def _upsert(kind: GradingFor, values: List[Dict[str, Any]]) -> None:
+    fk = TARGETS[kind].fk
+    table = Grading.__table__
+    key_columns = [fk, "review_phase", "graded_by_id", "grading_type_id"]
+    dialect = db.session.get_bind().dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        insert_fn = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        stmt = insert_fn(table).values(values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=key_columns,
+            set_={
+                "score": stmt.excluded.score,
+                "comments": stmt.excluded.comments,
+                "verification_level": stmt.excluded.verification_level,
+                "updated_at": func.current_timestamp(),
+            },
+        )
+        db.session.execute(stmt)
+        return
+    for row in values:
+        where = [table.c[name] == row[name] for name in key_columns]
+        result = db.session.execute(update(table).where(*where).values(
+            score=row["score"], comments=row["comments"],
+            verification_level=row["verification_level"], updated_at=func.current_timestamp(),
+        ))
+        if not result.rowcount:
+            db.session.execute(table.insert().values(**row))
+
+
+def _sheet(
+    kind: GradingFor, submission_ids, grader_id, criteria: grading_type_cache.Snapshot,
+) -> Dict[tuple, List[Dict[str, Any]]]:
+    fk = getattr(Grading, TARGETS[kind].fk)
+    grades: Dict[tuple, List[Dict[str, Any]]] = defaultdict(list)
+    stmt = (
+        select(
+            fk, Grading.review_phase, Grading.id, Grading.grading_type_id, Grading.score,
+            Grading.comments, Grading.verification_level, Grading.updated_on,
+        )
+        .where(fk.in_(submission_ids), Grading.graded_by_id == grader_id)
+    )
+    for submission_id, phase, grade_id, type_id, score, comments, level, updated_on in db.session.execute(stmt):
+        info = criteria.get(type_id)
+        grades[(submission_id, phase)].append({
+            "id": str(grade_id),
+            "grading_type_id": str(type_id),
+            "criteria": info.criteria if info is not None else None,
+            "score": score,
+            "comments": comments,
+            "verification_level": level,
+            "updated_at": updated_on.isoformat() if updated_on else None,
+        })
+    return grades
+
+
+def save_grading_sheets(rows: List[ScoreRow], grader_id) -> List[Dict[str, Any]]:
+    """Validate and upsert score rows for ``grader_id``; returns the saved sheets.
+
+    Each returned sheet lists every grade the verifier holds for that
+    submission and phase, including criteria scored earlier. The caller
+    commits.
+    """
+    grader_id = uuid.UUID(str(grader_id))
+    criteria = grading_type_cache.snapshot()
+    rows = _validate(rows, criteria)
+    by_kind: Dict[GradingFor, List[Dict[str, Any]]] = defaultdict(list)
+    for row in rows:
+        by_kind[row.entity_type].append({
+            "id": uuid.uuid4(),
+            TARGETS[row.entity_type].fk: row.submission_id,
+            "review_phase": row.review_phase,
+            "graded_by_id": grader_id,
+            "grading_type_id": row.grading_type_id,
+            "score": row.score,
+            "comments": row.comments,
+            "verification_level": criteria.get(row.grading_type_id).verification_level,
+        })
+    for kind, values in by_kind.items():
+        _upsert(kind, values)
+    agreement_service.mark_changed(db.session(), *by_kind)
+
+    sheets = []
+    for kind in by_kind:
+        saved = _sheet(kind, {row.submission_id for row in rows if row.entity_type == kind}, grader_id, criteria)
+        keys = dict.fromkeys((row.submission_id, row.review_phase) for row in rows if row.entity_type == kind)
+        for submission_id, phase in keys:
+            sheets.append({
+                "entity_type": kind.value,
+                TARGETS[kind].fk: str(submission_id),
+                "review_phase": phase,
+                "grades": sorted(saved.get((submission_id, phase), []), key=lambda g: g["criteria"] or ""),
+            })
+    return sheets
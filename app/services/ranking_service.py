@@ -0,0 +1,246 @@
+"""Leaderboards ranking a cycle's submissions from their gradings.
+
+All gradings of one kind in a cycle are read with a single query and turned
+into columnar NumPy arrays; every aggregate below is a ``bincount`` over
+integer group codes rather than a Python loop per submission:
+
+* each grader's total for a submission is the weighted mean of their
+  criterion scores, each scaled to 0-100 by the criterion's min/max score and
+  weighted by ``GradingType.weight``;
+* a submission's ``total`` is the mean of its graders' totals;
+* each grader's totals are z-scored across the submissions they graded, so a
+  harsh or lenient verifier does not move a submission up or down, and a
+  submission's ``score`` is the mean z-score of its graders;
+* submissions are ranked by ``score`` (then ``total``) within their category,
+  with tied submissions sharing a rank, and given a percentile in it.
+
+Results are cached per process under a stamp of the cycle's latest grading
+``updated_on``, grading count and criterion/submission ``updated_at``; any
+grade written by any worker changes the stamp, so the next request
+recomputes.
+"""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from flask import current_app, has_app_context
+from sqlalchemy import func, select
+
+from app.extensions import db
+from app.models.Cycle import Grading, GradingType
+from app.models.SubmissionCounter import COUNTED_MODELS
+from app.models.enumerations import GradingFor
+from app.utils.model_utils.review_phase_utils import TARGETS
+
+_DEFAULT_CACHE_SIZE = 32
+
+# entity type -> public submission number column
+_NUMBER_ATTRS = {
+    GradingFor.ABSTRACT: "abstract_number",
+    GradingFor.AWARD: "award_number",
+    GradingFor.BEST_PAPER: "bestpaper_number",
+}
+
+_lock = threading.Lock()
+_cache: "OrderedDict[Tuple, Tuple[Tuple, List[Dict[str, Any]]]]" = OrderedDict()
+
+
+def _cache_size() -> int:
+    if has_app_context():
+        return int(current_app.config.get("RANKING_CACHE_SIZE", _DEFAULT_CACHE_SIZE))
+    return _DEFAULT_CACHE_SIZE
+
+
+def _scope(entity_type: GradingFor, cycle_id, review_phase: Optional[int]):
+    """Gradings of one kind whose submission belongs to the cycle."""
+    target = TARGETS[entity_type]
+    model = target.model
+    fk = getattr(Grading, target.fk)
+    conditions = [model.cycle_id == cycle_id, GradingType.grading_for == entity_type]
+    if review_phase is not None:
+        conditions.append(Grading.review_phase == review_phase)
+    return model, fk, conditions
+
+
+def _stamp(entity_type: GradingFor, cycle_id, review_phase: Optional[int]) -> Tuple:
+    model, fk, conditions = _scope(entity_type, cycle_id, review_phase)
+    row = db.session.execute(
+        select(
+            func.max(Grading.updated_on),
+            func.count(Grading.id),
+            func.max(GradingType.updated_at),
+            func.max(model.updated_at),
+        )
+        .join(GradingType, GradingType.id == Grading.grading_type_id)
+        .join(model, model.id == fk)
+        .where(*conditions)
+    ).one()
+    return tuple(str(value) for value in row)
+
+
+def _factorize(values: Sequence[Any]) -> Tuple[np.ndarray, List[Any]]:
+    """Integer codes for ``values`` plus the distinct values in first-seen order."""
+    index: Dict[Any, int] = {}
+    codes = np.fromiter((index.setdefault(v, len(index)) for v in values), dtype=np.intp, count=len(values))
+    return codes, list(index)
+
+
+def _group_mean(codes: np.ndarray, values: np.ndarray, size: int, weights: Optional[np.ndarray] = None) -> np.ndarray:
+    weights = np.ones_like(values) if weights is None else weights
+    totals = np.bincount(codes, weights=values * weights, minlength=size)
+    counts = np.bincount(codes, weights=weights, minlength=size)
+    return np.divide(totals, counts, out=np.zeros(size), where=counts > 0)
+
+
+def compute_rankings(
+    submission_ids: Sequence[Any],
+    grader_ids: Sequence[Any],
+    categories: Sequence[Any],
+    scores: Sequence[float],
+    min_scores: Sequence[float],
+    max_scores: Sequence[float],
+    weights: Sequence[float],
+) -> List[Dict[str, Any]]:
+    """Rank submissions from one row per grading (all sequences are parallel).
+
+    Returns one dict per submission with ``total``, ``score``, ``rank``,
+    ``category_size``, ``percentile`` and ``graders``, best score first.
+    """
+    if not len(submission_ids):
+        return []
+    sub_codes, subs = _factorize(submission_ids)
+    grader_codes, graders = _factorize(grader_ids)
+    score = np.asarray(scores, dtype=float)
+    low = np.asarray(min_scores, dtype=float)
+    span = np.maximum(np.asarray(max_scores, dtype=float) - low, 1.0)
+    scaled = np.clip((score - low) / span, 0.0, 1.0) * 100.0
+
+    # One total per (submission, grader) pair: weighted mean over criteria.
+    pair_keys, pair_codes = np.unique(sub_codes * len(graders) + grader_codes, return_inverse=True)
+    pair_total = _group_mean(pair_codes, scaled, len(pair_keys), np.asarray(weights, dtype=float))
+    pair_sub, pair_grader = np.divmod(pair_keys, len(graders))
+
+    # Per-grader z-scores; graders with one submission or no spread contribute 0.
+    grader_count = np.bincount(pair_grader, minlength=len(graders))
+    grader_mean = _group_mean(pair_grader, pair_total, len(graders))
+    deviation = pair_total - grader_mean[pair_grader]
+    grader_std = np.sqrt(_group_mean(pair_grader, deviation ** 2, len(graders)))
+    usable = (grader_count[pair_grader] > 1) & (grader_std[pair_grader] > 1e-9)
+    pair_z = np.divide(deviation, grader_std[pair_grader], out=np.zeros_like(deviation), where=usable)
+
+    total = _group_mean(pair_sub, pair_total, len(subs))
+    normalized = _group_mean(pair_sub, pair_z, len(subs))
+    grader_tally = np.bincount(pair_sub, minlength=len(subs))
+
+    # Competition ranks within each category: sort by category, then score desc.
+    cat_codes, _ = _factorize([categories[i] for i in np.unique(sub_codes, return_index=True)[1]])
+    z_key, total_key = np.round(normalized, 6), np.round(total, 6)
+    order = np.lexsort((-total_key, -z_key, cat_codes))
+    positions = np.arange(len(order))
+    sorted_cat = cat_codes[order]
+    new_cat = np.r_[True, sorted_cat[1:] != sorted_cat[:-1]]
+    new_value = new_cat | np.r_[True, (z_key[order][1:] != z_key[order][:-1]) | (total_key[order][1:] != total_key[order][:-1])]
+    cat_start = np.maximum.accumulate(np.where(new_cat, positions, 0))
+    tie_start = np.maximum.accumulate(np.where(new_value, positions, 0))
+    rank = np.empty(len(order), dtype=np.intp)
+    rank[order] = tie_start - cat_start + 1
+    size = np.bincount(cat_codes)[cat_codes]
+    percentile = np.divide(size - rank, size - 1, out=np.ones(len(subs)), where=size > 1) * 100.0
+
+    categories_by_sub = dict(zip(submission_ids, categories))
+    ranked = [
+        {
+            "id": subs[i],
+            "category_id": categories_by_sub[subs[i]],
+            "graders": int(grader_tally[i]),
+            "total": round(float(total[i]), 2),
+            "score": round(float(normalized[i]), 4),
+            "rank": int(rank[i]),
+            "category_size": int(size[i]),
+            "percentile": round(float(percentile[i]), 1),
+        }
+        for i in np.lexsort((-total_key, -z_key))
+    ]
+    return ranked
+
+
+def _load(entity_type: GradingFor, cycle_id, review_phase: Optional[int]) -> List[Dict[str, Any]]:
+    model, fk, conditions = _scope(entity_type, cycle_id, review_phase)
+    category_col = getattr(model, COUNTED_MODELS[entity_type][1])
+    rows = db.session.execute(
+        select(
+            fk, Grading.graded_by_id, category_col, Grading.score,
+            GradingType.min_score, GradingType.max_score, GradingType.weight,
+        )
+        .join(GradingType, GradingType.id == Grading.grading_type_id)
+        .join(model, model.id == fk)
+        .where(*conditions)
+    ).all()
+    if not rows:
+        return []
+    ranked = compute_rankings(*zip(*rows))
+
+    number_col = getattr(model, _NUMBER_ATTRS[entity_type])
+    details = {
+        row[0]: row[1:]
+        for row in db.session.execute(
+            select(model.id, number_col, model.title, model.status)
+            .where(model.id.in_([item["id"] for item in ranked]))
+        )
+    }
+    for item in ranked:
+        number, title, status = details.get(item["id"], (None, None, None))
+        item.update(
+            id=str(item["id"]),
+            category_id=str(item["category_id"]) if item["category_id"] is not None else None,
+            number=number,
+            title=title,
+            status=getattr(status, "value", status),
+        )
+    return ranked
+
+
+def leaderboard(
+    entity_type,
+    cycle_id,
+    *,
+    review_phase: Optional[int] = None,
+    category_id: Optional[str] = None,
+    page: int = 1,
+    page_size: int = 20,
+) -> Tuple[List[Dict[str, Any]], int, bool]:
+    """Return ``(items, total, cached)`` for one page of a cycle's leaderboard.
+
+    Items are ordered by normalised score, best first; ``category_id`` keeps
+    one category (ranks and percentiles are always within the category).
+    """
+    entity_type = GradingFor(entity_type)
+    key = (entity_type, str(cycle_id), review_phase)
+    stamp = _stamp(entity_type, cycle_id, review_phase)
+    with _lock:
+        hit = _cache.get(key)
+        if hit is not None and hit[0] == stamp:
+            _cache.move_to_end(key)
+    cached = hit is not None and hit[0] == stamp
+    if cached:
+        ranked = hit[1]
+    else:
+        ranked = _load(entity_type, cycle_id, review_phase)
+        with _lock:
+            _cache[key] = (stamp, ranked)
+            _cache.move_to_end(key)
+            while len(_cache) > _cache_size():
+                _cache.popitem(last=False)
+
+    if category_id:
+        ranked = [item for item in ranked if item["category_id"] == str(category_id)]
+    start = (page - 1) * page_size
+    return ranked[start:start + page_size], len(ranked), cached
+
+
+def clear_cache() -> None:
+    with _lock:
+        _cache.clear()
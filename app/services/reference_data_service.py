@@ -0,0 +1,185 @@
+"""Versioned bundle of the rarely-changing reference tables.
+
+Cycles (with their windows), categories, paper categories, grading types and
+departments are served together from an in-process snapshot instead of one
+request and query per table on every page.
+
+Versioning follows ``app.utils.versioned_cache``:
+
+* ORM writes to any of those models record the affected sections on the
+  session. After that session commits or rolls back, the counter is
+  incremented and each section records the counter value it changed at.
+  With ``REDIS_URL`` the counter and the section versions live in Redis
+  (``reference_data:version`` / ``reference_data:parts``) and are shared by
+  every worker. Otherwise they are per process, as with the other caches.
+* A worker rebuilds only the sections whose version moved since its
+  snapshot.
+* ``since=<version>`` returns only the sections changed after that version.
+  ``REFERENCE_DATA_MAX_AGE`` seconds (default 300) bounds how long a change
+  made outside the ORM can go unnoticed.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import object_session
+
+from app.extensions import db
+from app.models.Cycle import Category, Cycle, CycleWindow, GradingType, PaperCategory
+from app.models.User import Department
+from app.utils.versioned_cache import VersionedCache
+
+_versions = VersionedCache("reference_data", max_age_config="REFERENCE_DATA_MAX_AGE", track_parts=True)
+
+_lock = threading.Lock()
+_state: Dict[str, Any] = {
+    "sections": {},             # section -> {"version", "items"} in the snapshot
+    "loaded_at": 0.0,
+    "bundle": None,             # (version, body bytes, etag) of the full bundle
+}
+
+
+def _enum(value):
+    return getattr(value, "value", value)
+
+
+def _cycles() -> List[Dict[str, Any]]:
+    windows: Dict[Any, List[Dict[str, Any]]] = {}
+    for window in db.session.execute(
+        select(CycleWindow.id, CycleWindow.cycle_id, CycleWindow.phase, CycleWindow.start_date, CycleWindow.end_date)
+        .order_by(CycleWindow.start_date, CycleWindow.id)
+    ):
+        windows.setdefault(window.cycle_id, []).append({
+            "id": str(window.id),
+            "phase": _enum(window.phase),
+            "start_date": window.start_date.isoformat(),
+            "end_date": window.end_date.isoformat(),
+        })
+    return [
+        {
+            "id": str(row.id),
+            "name": row.name,
+            "start_date": row.start_date.isoformat(),
+            "end_date": row.end_date.isoformat(),
+            "windows": windows.get(row.id, []),
+        }
+        for row in db.session.execute(
+            select(Cycle.id, Cycle.name, Cycle.start_date, Cycle.end_date).order_by(Cycle.start_date.desc(), Cycle.name)
+        )
+    ]
+
+
+def _named(model) -> Callable[[], List[Dict[str, Any]]]:
+    def load() -> List[Dict[str, Any]]:
+        rows = db.session.execute(select(model.id, model.name).order_by(model.name))
+        return [{"id": str(row.id), "name": row.name} for row in rows]
+    return load
+
+
+def _grading_types() -> List[Dict[str, Any]]:
+    rows = db.session.execute(select(
+        GradingType.id, GradingType.criteria, GradingType.min_score, GradingType.max_score,
+        GradingType.weight, GradingType.grading_for, GradingType.verification_level,
+    ).order_by(GradingType.grading_for, GradingType.verification_level, GradingType.criteria))
+    return [
+        {
+            "id": str(row.id),
+            "criteria": row.criteria,
+            "min_score": row.min_score,
+            "max_score": row.max_score,
+            "weight": row.weight,
+            "grading_for": _enum(row.grading_for),
+            "verification_level": row.verification_level,
+        }
+        for row in rows
+    ]
+
+
+# section name -> loader, in response order
+SECTIONS: Dict[str, Callable[[], List[Dict[str, Any]]]] = {
+    "cycles": _cycles,
+    "categories": _named(Category),
+    "paper_categories": _named(PaperCategory),
+    "grading_types": _grading_types,
+    "departments": _named(Department),
+}
+
+# model -> section its writes invalidate
+_MODEL_SECTIONS = {
+    Cycle: "cycles",
+    CycleWindow: "cycles",
+    Category: "categories",
+    PaperCategory: "paper_categories",
+    GradingType: "grading_types",
+    Department: "departments",
+}
+
+
+def versions() -> Tuple[int, Dict[str, int]]:
+    """``(global version, {section: version it last changed at})``."""
+    return _versions.versions()
+
+
+def invalidate(sections=None) -> int:
+    """Bump the version for ``sections`` (default: all); returns the new version."""
+    return _versions.invalidate(sections or SECTIONS)
+
+
+def _encode(payload: Dict[str, Any]) -> Tuple[bytes, str]:
+    body = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return body, hashlib.sha256(body).hexdigest()
+
+
+def _snapshot() -> Tuple[int, Dict[str, Dict[str, Any]]]:
+    """Current version and sections, reloading only the sections that moved."""
+    version, section_versions = versions()
+    expired = _versions.expired(_state["loaded_at"])
+    with _lock:
+        cached = dict(_state["sections"])
+    stale = [
+        name for name in SECTIONS
+        if expired or name not in cached or cached[name]["version"] != section_versions.get(name, 0)
+    ]
+    if stale:
+        fresh = {name: {"version": section_versions.get(name, 0), "items": SECTIONS[name]()} for name in stale}
+        with _lock:
+            _state["sections"].update(fresh)
+            _state["bundle"] = None
+            if expired:
+                _state["loaded_at"] = time.time()
+            cached = dict(_state["sections"])
+    return version, cached
+
+
+def bundle(since: Optional[int] = None) -> Tuple[bytes, str]:
+    """JSON body and strong ETag of the bundle, or of the delta after ``since``.
+
+    A ``since`` newer than the current version (another deployment, or a
+    worker without Redis) yields the full bundle with ``"full": true``.
+    """
+    version, sections = _snapshot()
+    if since is None or since > version:
+        with _lock:
+            cached = _state["bundle"]
+        if cached is not None and cached[0] == version:
+            return cached[1], cached[2]
+        body, etag = _encode({"version": version, "full": True, "sections": sections})
+        with _lock:
+            _state["bundle"] = (version, body, etag)
+        return body, etag
+    changed = {name: section for name, section in sections.items() if section["version"] > since}
+    return _encode({"version": version, "since": since, "full": False, "sections": changed})
+
+
+def _mark(mapper, connection, target):
+    _versions.mark_changed(object_session(target), _MODEL_SECTIONS[mapper.class_])
+
+
+for _model in _MODEL_SECTIONS:
+    for _event_name in ("after_insert", "after_update", "after_delete"):
+        event.listen(_model, _event_name, _mark)
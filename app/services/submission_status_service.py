@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+
+from flask import current_app
+from sqlalchemy import exists, func, select
+
+from app.extensions import db, replica_reads
+from app.models.Cycle import (
+    AbstractCoordinators,
+    AbstractVerifiers,
+    Abstracts,
+    AwardVerifiers,
+    Awards,
+    BestPaper,
+    BestPaperVerifiers,
+)
+from app.models.SubmissionCounter import SubmissionCounter
+from app.models.enumerations import GradingFor, Role, Status
+
+# entity -> (model, verifier link, verifier fk, coordinator link, coordinator fk)
+# Only abstracts have a coordinator-scoped status view; award and best-paper
+# coordinators see their own submissions, as before.
+_ENTITIES = {
+    "abstract": (Abstracts, AbstractVerifiers, "abstract_id", AbstractCoordinators, "abstract_id"),
+    "award": (Awards, AwardVerifiers, "award_id", None, None),
+    "best_paper": (BestPaper, BestPaperVerifiers, "best_paper_id", None, None),
+}
+
+BREAKDOWN_COLUMNS = {"cycle": "cycle_id", "phase": "review_phase"}
+
+_CACHE_MAX_ENTRIES = 1024  # least recently used entries are evicted beyond this
+_cache: "OrderedDict[Tuple, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def resolve_scope(user, entity: str) -> str:
+    """Role scope used both for the SQL filter and for the cache key."""
+    if user.has_role(Role.ADMIN.value) or user.has_role(Role.SUPERADMIN.value):
+        return "admin"
+    if user.has_role(Role.VERIFIER.value):
+        return "verifier"
+    if user.has_role(Role.COORDINATOR.value) and _ENTITIES[entity][3] is not None:
+        return "coordinator"
+    return "owner"
+
+
+def _scope_filters(entity: str, scope: str, user_id) -> list:
+    model, verifier_link, verifier_fk, coordinator_link, coordinator_fk = _ENTITIES[entity]
+    if scope == "admin":
+        return []
+    if scope == "verifier":
+        return [exists().where(
+            getattr(verifier_link, verifier_fk) == model.id,
+            verifier_link.user_id == user_id,
+        )]
+    if scope == "coordinator":
+        return [exists().where(
+            getattr(coordinator_link, coordinator_fk) == model.id,
+            coordinator_link.user_id == user_id,
+        )]
+    return [model.created_by_id == user_id]
+
+
+def parse_breakdown(raw: Optional[str]) -> Tuple[str, ...]:
+    """Parse ``?breakdown=cycle,phase``; unknown names raise ``ValueError``."""
+    if not raw:
+        return ()
+    names = [part.strip().lower() for part in raw.split(",") if part.strip()]
+    unknown = [name for name in names if name not in BREAKDOWN_COLUMNS]
+    if unknown:
+        raise ValueError(f"Unsupported breakdown: {', '.join(unknown)}")
+    return tuple(name for name in BREAKDOWN_COLUMNS if name in names)
+
+
+def _empty_counts() -> Dict[str, int]:
+    return {status.value: 0 for status in Status}
+
+
+def _status_statement(entity: str, scope: str, user_id, breakdown: Sequence[str]):
+    if scope == "admin":
+        # Unscoped totals come straight from the maintained counters.
+        group_cols = [getattr(SubmissionCounter, BREAKDOWN_COLUMNS[name]) for name in breakdown]
+        return (
+            select(SubmissionCounter.status, *group_cols, func.sum(SubmissionCounter.count))
+            .where(
+                SubmissionCounter.entity_type == GradingFor(entity),
+                SubmissionCounter.count != 0,
+            )
+            .group_by(SubmissionCounter.status, *group_cols)
+        )
+    model = _ENTITIES[entity][0]
+    group_cols = [getattr(model, BREAKDOWN_COLUMNS[name]) for name in breakdown]
+    return (
+        select(model.status, *group_cols, func.count())
+        .where(*_scope_filters(entity, scope, user_id))
+        .group_by(model.status, *group_cols)
+    )
+
+
+def _compute(entity: str, scope: str, user_id, breakdown: Sequence[str]) -> Dict[str, Any]:
+    stmt = _status_statement(entity, scope, user_id, breakdown)
+    with replica_reads():
+        rows = db.session.execute(stmt).all()
+
+    totals = _empty_counts()
+    groups: Dict[Tuple, Dict[str, int]] = {}
+    for row in rows:
+        status, *keys, count = row
+        count = int(count or 0)
+        status_value = Status(status).value
+        totals[status_value] += count
+        if breakdown:
+            groups.setdefault(tuple(keys), _empty_counts())[status_value] += count
+
+    payload: Dict[str, Any] = dict(totals)
+    if breakdown:
+        payload["breakdown"] = [
+            {
+                **{BREAKDOWN_COLUMNS[name]: _plain(key) for name, key in zip(breakdown, keys)},
+                **counts,
+            }
+            for keys, counts in sorted(groups.items(), key=lambda item: tuple(str(k) for k in item[0]))
+        ]
+    return payload
+
+
+def _plain(value):
+    return str(value) if value is not None and not isinstance(value, int) else value
+
+
+def status_summary(
+    entity: str,
+    user,
+    *,
+    breakdown: Iterable[str] = (),
+    ttl: Optional[float] = None,
+) -> Dict[str, Any]:
+    """Counts of ``entity`` submissions by status visible to ``user``.
+
+    One ``SELECT status, count(*) ... GROUP BY status`` with the role scope
+    applied in SQL; the unscoped admin view sums ``submission_counters``
+    instead of touching the submission tables. Results are cached per (entity, scope, user, breakdown)
+    for ``STATUS_SUMMARY_CACHE_SECONDS``; admin results are shared by all
+    admins since their scope does not depend on the user.
+    """
+    if entity not in _ENTITIES:
+        raise ValueError(f"Unknown entity: {entity}")
+    breakdown = tuple(breakdown)
+    scope = resolve_scope(user, entity)
+    user_id = None if scope == "admin" else user.id
+    if ttl is None:
+        ttl = current_app.config.get("STATUS_SUMMARY_CACHE_SECONDS", 10)
+
+    key = (entity, scope, str(user_id) if user_id else None, breakdown)
+    now = time.monotonic()
+    if ttl > 0:
+        with _cache_lock:
+            hit = _cache.get(key)
+            if hit is not None:
+                if hit[0] > now:
+                    _cache.move_to_end(key)
+                else:
+                    del _cache[key]
+        if hit and hit[0] > now:
+            return dict(hit[1])
+
+    payload = _compute(entity, scope, user_id, breakdown)
+    if ttl > 0:
+        with _cache_lock:
+            _cache[key] = (now + ttl, payload)
+            _cache.move_to_end(key)
+            while len(_cache) > _CACHE_MAX_ENTRIES:
+                _cache.popitem(last=False)
+    return dict(payload)
+
+
+def invalidate_status_summaries(entity: Optional[str] = None) -> None:
+    with _cache_lock:
+        if entity is None:
+            _cache.clear()
+        else:
+            for key in [k for k in _cache if k[0] == entity]:
+                _cache.pop(key, None)
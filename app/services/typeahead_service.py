@@ -0,0 +1,173 @@
+"""Search-as-you-type lookups for users, authors and categories.
+
+Every keystroke in the coordinator pickers becomes one narrow query: only the
+ID and label columns are selected, matching uses ``ILIKE`` prefix/substring
+predicates that the ``pg_trgm`` GIN indexes on the searched columns can
+serve, prefix hits rank first and the result is capped at ``limit`` rows.
+
+Results are kept in a small per-worker LRU cache (``TYPEAHEAD_CACHE_SIZE``
+entries, ``TYPEAHEAD_CACHE_SECONDS`` old at most). Writes to the underlying
+models clear the affected kinds in the writing worker; other workers see the
+change when their entries expire.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from flask import current_app, has_app_context
+from sqlalchemy import case, event, exists, func, or_, select
+
+from app.extensions import db
+from app.models.Cycle import Author, Category, PaperCategory
+from app.models.User import User, UserRole
+from app.models.enumerations import Role
+
+DEFAULT_LIMIT = 10
+MAX_LIMIT = 25
+_DEFAULT_CACHE_SIZE = 512
+_DEFAULT_CACHE_SECONDS = 30.0
+
+
+class Source(NamedTuple):
+    model: Any
+    label: Any
+    detail: Optional[Any]  # shown in parentheses after the label
+    fields: Tuple[Any, ...]  # columns matched against the query
+    filters: Tuple[Callable[[], Any], ...] = ()
+
+
+def _active_user():
+    return User.is_active.isnot(False)
+
+
+def _verifier():
+    return exists().where(UserRole.user_id == User.id, UserRole.role == Role.VERIFIER)
+
+
+_USER_FIELDS = (User.username, User.email, User.employee_id, User.mobile)
+
+SOURCES: Dict[str, Source] = {
+    "users": Source(User, User.username, User.email, _USER_FIELDS, (_active_user,)),
+    "verifiers": Source(User, User.username, User.email, _USER_FIELDS, (_active_user, _verifier)),
+    "authors": Source(Author, Author.name, Author.email, (Author.name, Author.email)),
+    "categories": Source(Category, Category.name, None, (Category.name,)),
+    "paper-categories": Source(PaperCategory, PaperCategory.name, None, (PaperCategory.name,)),
+}
+
+# Kinds exposing contact details; the route limits them to staff roles.
+PRIVATE_KINDS = frozenset({"users", "verifiers"})
+
+
+class _LRUCache:
+    """Thread-safe LRU of ``key -> (stored_at, value)`` with a max age."""
+
+    def __init__(self):
+        self._data: "OrderedDict[tuple, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, max_age: float):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] > max_age:
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return entry[1]
+
+    def put(self, key, value, max_size: int) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > max_size:
+                self._data.popitem(last=False)
+
+    def discard(self, kinds) -> None:
+        with self._lock:
+            for key in [key for key in self._data if key[0] in kinds]:
+                del self._data[key]
+
+
+_cache = _LRUCache()
+
+
+def _config(key: str, default):
+    if has_app_context():
+        return current_app.config.get(key, default)
+    return default
+
+
+def _escape_like(q: str) -> str:
+    return q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def normalize_query(q: Optional[str]) -> str:
+    return " ".join((q or "").split()).casefold()
+
+
+def _lookup(source: Source, q: str, limit: int) -> List[Dict[str, str]]:
+    escaped = _escape_like(q)
+    prefix = or_(*(field.ilike(f"{escaped}%", escape="\\") for field in source.fields))
+    contains = or_(*(field.ilike(f"%{escaped}%", escape="\\") for field in source.fields))
+    columns = [source.model.id, source.label] + ([source.detail] if source.detail is not None else [])
+    stmt = (
+        select(*columns)
+        .where(contains, *(make() for make in source.filters))
+        .order_by(case((prefix, 0), else_=1), func.length(source.label), source.label)
+        .limit(limit)
+    )
+    items = []
+    for row in db.session.execute(stmt):
+        label = row[1] or ""
+        if source.detail is not None and row[2]:
+            label = f"{label} ({row[2]})" if label else row[2]
+        items.append({"id": str(row[0]), "label": label})
+    return items
+
+
+def typeahead(kind: str, q: Optional[str], limit: int = DEFAULT_LIMIT) -> Tuple[List[Dict[str, str]], bool]:
+    """Return ``(items, cached)`` for one picker lookup.
+
+    ``items`` are ``{"id", "label"}`` pairs, prefix matches first, then
+    shorter labels. Raises KeyError for an unknown ``kind``.
+    """
+    source = SOURCES[kind]
+    q = normalize_query(q)
+    limit = max(1, min(int(limit), MAX_LIMIT))
+    if not q:
+        return [], False
+    key = (kind, q, limit)
+    max_size = int(_config("TYPEAHEAD_CACHE_SIZE", _DEFAULT_CACHE_SIZE))
+    max_age = float(_config("TYPEAHEAD_CACHE_SECONDS", _DEFAULT_CACHE_SECONDS))
+    if max_size > 0:
+        cached = _cache.get(key, max_age)
+        if cached is not None:
+            return cached, True
+    items = _lookup(source, q, limit)
+    if max_size > 0:
+        _cache.put(key, items, max_size)
+    return items, False
+
+
+def invalidate(kinds: Sequence[str] = tuple(SOURCES)) -> None:
+    """Forget this worker's cached results for ``kinds``."""
+    _cache.discard(frozenset(kinds))
+
+
+def _register(model, kinds: Sequence[str]) -> None:
+    def _drop(mapper, connection, target):
+        invalidate(kinds)
+
+    for name in ("after_insert", "after_update", "after_delete"):
+        event.listen(model, name, _drop)
+
+
+_register(User, ("users", "verifiers"))
+_register(UserRole, ("verifiers",))
+_register(Author, ("authors",))
+_register(Category, ("categories",))
+_register(PaperCategory, ("paper-categories",))
@@ -0,0 +1,107 @@
+"""Conditional GET for the submission detail and list endpoints.
+
+Verifier pages re-fetch the same abstract, award or best paper many times
+while nothing changes. Each endpoint first computes a weak ETag from a few
+aggregates and answers ``If-None-Match`` with 304. That happens before the
+submission and its relationships are loaded, serialised or audited.
+
+* Detail: ``(id, updated_at, max/count of its grades, max/count of its
+  verifier assignments)`` from one row-sized query.
+* List: ``(query string, actor, count/max(updated_at) of the filtered
+  submissions, max/count of their grades and verifier assignments)`` from
+  one statement. The filtered count is returned with the tag so the route
+  can use it as ``total``.
+
+Counts are part of each tag, so deleted grades and unassigned verifiers
+change it even though they leave no timestamp behind. Tags are weak: equal
+tags mean an equivalent representation, not a byte-identical body.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import uuid
+from typing import NamedTuple, Optional, Sequence
+
+from flask import current_app, request
+from sqlalchemy import func, select
+
+from app.extensions import db
+from app.models.Cycle import Grading
+from app.models.enumerations import GradingFor
+from app.utils.model_utils.review_phase_utils import TARGETS
+
+CACHE_CONTROL = "private, no-cache"
+
+
+class ListTag(NamedTuple):
+    etag: str
+    total: int  # filtered submissions
+
+
+def _digest(*parts) -> str:
+    raw = json.dumps(parts, default=str, separators=(",", ":"))
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def detail_etag(grading_for, submission_id) -> Optional[str]:
+    """Weak ETag for one submission; None when the ID is invalid or unknown."""
+    grading_for = GradingFor(grading_for)
+    try:
+        submission_id = uuid.UUID(str(submission_id))
+    except ValueError:
+        return None
+    model, link, fk = TARGETS[grading_for]
+    grade_fk, link_fk = getattr(Grading, fk), getattr(link, fk)
+    row = db.session.execute(
+        select(
+            model.updated_at,
+            select(func.max(Grading.updated_on)).where(grade_fk == model.id).scalar_subquery(),
+            select(func.count()).select_from(Grading).where(grade_fk == model.id).scalar_subquery(),
+            select(func.max(link.assigned_at)).where(link_fk == model.id).scalar_subquery(),
+            select(func.count()).select_from(link).where(link_fk == model.id).scalar_subquery(),
+        ).where(model.id == submission_id)
+    ).first()
+    if row is None:
+        return None
+    return _digest(grading_for.value, str(submission_id), *row)
+
+
+def list_etag(grading_for, filters: Sequence, actor_id) -> ListTag:
+    """Weak ETag and filtered count for a listing as seen by ``actor_id``."""
+    grading_for = GradingFor(grading_for)
+    model, link, fk = TARGETS[grading_for]
+    matched = select(model.id, model.updated_at).where(*filters).cte("matched")
+    ids = select(matched.c.id).correlate(None)
+    grade_fk, link_fk = getattr(Grading, fk), getattr(link, fk)
+
+    def _scalar(stmt):
+        return stmt.correlate(None).scalar_subquery()
+
+    row = db.session.execute(
+        select(
+            func.count(matched.c.id),
+            func.max(matched.c.updated_at),
+            _scalar(select(func.count(Grading.id)).where(grade_fk.in_(ids))),
+            _scalar(select(func.max(Grading.updated_on)).where(grade_fk.in_(ids))),
+            _scalar(select(func.count()).select_from(link).where(link_fk.in_(ids))),
+            _scalar(select(func.max(link.assigned_at)).where(link_fk.in_(ids))),
+        )
+    ).one()
+    args = sorted(request.args.items(multi=True))
+    return ListTag(_digest(grading_for.value, str(actor_id), args, *row), row[0])
+
+
+def not_modified(etag: Optional[str]):
+    """A 304 response when the client already holds ``etag``, else None."""
+    if etag is None or not request.if_none_match.contains_weak(etag):
+        return None
+    return tagged(current_app.response_class(status=304), etag)
+
+
+def tagged(response, etag: Optional[str]):
+    """Attach ``etag`` and the revalidation policy to ``response``."""
+    if etag is not None:
+        response.set_etag(etag, weak=True)
+        response.headers["Cache-Control"] = CACHE_CONTROL
+    return response
@@ -0,0 +1,143 @@
+"""In-process calendar of cycle windows for submission-window checks.
+
+Window definitions change a few times a year but are consulted on every
+submission insert. The calendar keeps, per (cycle, phase), the merged open
+intervals sorted by start date so ``open_window_id`` is a ``bisect`` instead
+of a query.
+
+Freshness follows ``app.utils.versioned_cache``:
+
+* ORM writes to ``CycleWindow`` / ``Cycle`` flag the session; after that
+  session commits the calendar version is bumped (``cycle_calendar:version``
+  in Redis when ``REDIS_URL`` is set, so every worker reloads on its next
+  lookup).
+* A miss is always confirmed against the database, so windows created in the
+  current transaction or by raw SQL never cause a false rejection.
+* ``CYCLE_CALENDAR_MAX_AGE`` seconds (default 300) bounds how long a change
+  made outside the ORM can go unnoticed.
+"""
+from __future__ import annotations
+
+import threading
+import time
+import uuid
+from bisect import bisect_right
+from collections import defaultdict
+from datetime import date
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.Cycle import CycleWindow
+from app.models.enumerations import CyclePhase
+from app.utils.versioned_cache import VersionedCache
+
+_versions = VersionedCache("cycle_calendar", max_age_config="CYCLE_CALENDAR_MAX_AGE")
+
+_lock = threading.Lock()
+_state = {
+    "version": None,   # version the index was built for
+    "loaded_at": 0.0,
+    "index": {},
+}
+
+
+class _Intervals:
+    """Disjoint, sorted date intervals with the window ID that opened each."""
+
+    __slots__ = ("starts", "ends", "ids")
+
+    def __init__(self, windows: List[Tuple[date, date, object]]):
+        self.starts: List[date] = []
+        self.ends: List[date] = []
+        self.ids: List[object] = []
+        for start, end, window_id in sorted(windows, key=lambda w: (w[0], w[1])):
+            if self.ends and start <= self.ends[-1]:
+                self.ends[-1] = max(self.ends[-1], end)  # overlapping windows merge
+                continue
+            self.starts.append(start)
+            self.ends.append(end)
+            self.ids.append(window_id)
+
+    def find(self, on: date):
+        i = bisect_right(self.starts, on) - 1
+        if i >= 0 and self.ends[i] >= on:
+            return self.ids[i]
+        return None
+
+
+def version() -> int:
+    """Current calendar version (shared across workers when Redis is available)."""
+    return _versions.version()
+
+
+def invalidate() -> None:
+    """Drop the local index and tell every worker to reload."""
+    with _lock:
+        _state["version"] = None
+    _versions.invalidate()
+
+
+def _build(connection) -> Dict[Tuple[object, CyclePhase], _Intervals]:
+    grouped: Dict[Tuple[object, CyclePhase], list] = defaultdict(list)
+    rows = connection.execute(select(
+        CycleWindow.id, CycleWindow.cycle_id, CycleWindow.phase, CycleWindow.start_date, CycleWindow.end_date,
+    ))
+    for window_id, cycle_id, phase, start, end in rows:
+        grouped[(cycle_id, CyclePhase(phase))].append((start, end, window_id))
+    return {key: _Intervals(windows) for key, windows in grouped.items()}
+
+
+def _index(connection) -> Dict[Tuple[object, CyclePhase], _Intervals]:
+    current = version()
+    with _lock:
+        fresh = (
+            _state["version"] == current
+            and not _versions.expired(_state["loaded_at"])
+        )
+        if fresh:
+            return _state["index"]
+    index = _build(connection)
+    with _lock:
+        _state.update(index=index, version=current, loaded_at=time.time())
+    return index
+
+
+def _query_open_window(connection, cycle_id, phases: Sequence[CyclePhase], on: date):
+    rows = connection.execute(
+        select(CycleWindow.id, CycleWindow.phase).where(
+            CycleWindow.cycle_id == cycle_id,
+            CycleWindow.phase.in_(list(phases)),
+            CycleWindow.open_on(on),
+        )
+    ).all()
+    by_phase = {CyclePhase(phase): window_id for window_id, phase in rows}
+    return next((by_phase[phase] for phase in phases if phase in by_phase), None)
+
+
+def open_window_id(connection, cycle_id, phases: Sequence[CyclePhase], on: Optional[date] = None):
+    """ID of a window of the cycle open on ``on`` for the first matching phase.
+
+    ``phases`` is tried in order. Hits are served from the calendar; a miss
+    is confirmed with one query on ``connection`` before returning None.
+    """
+    on = on or date.today()
+    if isinstance(cycle_id, str):
+        try:
+            cycle_id = uuid.UUID(cycle_id)
+        except ValueError:
+            return None
+    index = _index(connection)
+    for phase in phases:
+        intervals = index.get((cycle_id, phase))
+        if intervals is not None:
+            window_id = intervals.find(on)
+            if window_id is not None:
+                return window_id
+    return _query_open_window(connection, cycle_id, phases, on)
+
+
+def mark_changed(session: Optional[Session]) -> None:
+    """Record that ``session`` wrote window data; the version bumps on commit."""
+    _versions.mark_changed(session)
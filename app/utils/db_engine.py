@@ -0,0 +1,355 @@
+"""Database engine profiles.
+
+Derives SQLAlchemy pool settings from the gunicorn process model so each
+worker holds only as many connections as it can actually use, optionally
+adapts the engine for PgBouncer transaction pooling, applies per-route
+``statement_timeout`` values, and keeps lightweight pool statistics for the
+``/health/db`` endpoint.
+
+Relevant configuration keys (all optional, see ``Config``):
+
+* ``GUNICORN_WORKERS`` / ``GUNICORN_THREADS`` – process model (falls back to
+  ``WEB_CONCURRENCY`` and the Dockerfile default of 4 sync workers)
+* ``DB_MAX_CONNECTIONS`` – total connection budget shared by all workers
+* ``DB_POOL_SIZE`` / ``DB_MAX_OVERFLOW`` / ``DB_POOL_TIMEOUT`` /
+  ``DB_POOL_RECYCLE`` – explicit overrides of the derived values
+* ``DB_PGBOUNCER_MODE`` – ``transaction`` to run behind PgBouncer in
+  transaction pooling mode
+* ``DB_STATEMENT_TIMEOUT_MS`` – default statement timeout (0 disables)
+* ``DB_SLOW_QUERY_MS`` – log statements slower than this to the
+  ``slow_query`` category (0 disables)
+"""
+from __future__ import annotations
+
+import math
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from flask import current_app, g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.pool import NullPool, QueuePool
+
+PGBOUNCER_TRANSACTION = "transaction"
+
+# Attribute set on view functions by the ``statement_timeout`` decorator.
+_TIMEOUT_ATTR = "_db_statement_timeout_ms"
+
+
+def compute_pool_settings(
+    workers: int,
+    threads: int = 1,
+    *,
+    max_connections: Optional[int] = None,
+    reserved_connections: int = 5,
+) -> Dict[str, int]:
+    """Return ``pool_size``/``max_overflow`` for a single worker process.
+
+    A sync worker serves one request at a time, so it needs ``threads``
+    connections plus a little headroom for background helpers. When a total
+    connection budget is given the per-worker share (after reserving a few
+    connections for maintenance/migrations) caps the pool so that
+    ``workers * (pool_size + max_overflow)`` never exceeds the budget.
+    """
+    workers = max(1, int(workers or 1))
+    threads = max(1, int(threads or 1))
+
+    pool_size = threads
+    max_overflow = max(1, math.ceil(threads / 2))
+
+    if max_connections:
+        budget = max(workers, int(max_connections) - max(0, reserved_connections))
+        per_worker = max(1, budget // workers)
+        pool_size = min(pool_size, per_worker)
+        max_overflow = max(0, min(max_overflow, per_worker - pool_size))
+
+    return {"pool_size": pool_size, "max_overflow": max_overflow}
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that records how long callers wait for a connection."""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            _POOL_STATS.record_wait(time.perf_counter() - started)
+
+
+class PoolStats:
+    """Thread-safe counters describing pool usage in this process."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.checkouts = 0
+            self.checkins = 0
+            self.connects = 0
+            self.invalidations = 0
+            self.wait_count = 0
+            self.wait_total = 0.0
+            self.wait_max = 0.0
+
+    def record_wait(self, seconds: float) -> None:
+        with self._lock:
+            self.wait_count += 1
+            self.wait_total += seconds
+            if seconds > self.wait_max:
+                self.wait_max = seconds
+
+    def incr(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            avg = (self.wait_total / self.wait_count) if self.wait_count else 0.0
+            return {
+                "checkouts_total": self.checkouts,
+                "checkins_total": self.checkins,
+                "connects_total": self.connects,
+                "invalidations_total": self.invalidations,
+                "wait_ms_avg": round(avg * 1000, 3),
+                "wait_ms_max": round(self.wait_max * 1000, 3),
+            }
+
+
+_POOL_STATS = PoolStats()
+
+
+def _resolve_process_model(app) -> Dict[str, int]:
+    cfg = app.config
+    workers = cfg.get("GUNICORN_WORKERS") or cfg.get("WEB_CONCURRENCY") or 4
+    threads = cfg.get("GUNICORN_THREADS") or 1
+    try:
+        workers = int(workers)
+    except (TypeError, ValueError):
+        workers = 4
+    try:
+        threads = int(threads)
+    except (TypeError, ValueError):
+        threads = 1
+    return {"workers": max(1, workers), "threads": max(1, threads)}
+
+
+def build_engine_options(app) -> Dict[str, Any]:
+    """Build ``SQLALCHEMY_ENGINE_OPTIONS`` for the configured database."""
+    cfg = app.config
+    uri = cfg.get("SQLALCHEMY_DATABASE_URI") or ""
+    options: Dict[str, Any] = dict(cfg.get("SQLALCHEMY_ENGINE_OPTIONS") or {})
+
+    # SQLite manages its own pooling (and :memory: needs a singleton pool);
+    # only the dialect-agnostic options make sense there.
+    if uri.startswith("sqlite"):
+        options.setdefault("pool_pre_ping", True)
+        return options
+
+    model = _resolve_process_model(app)
+    sizing = compute_pool_settings(
+        model["workers"],
+        model["threads"],
+        max_connections=cfg.get("DB_MAX_CONNECTIONS") or None,
+    )
+    # Explicit overrides: DB_POOL_SIZE=0 / DB_MAX_OVERFLOW=-1 mean "derive".
+    if int(cfg.get("DB_POOL_SIZE") or 0) > 0:
+        sizing["pool_size"] = int(cfg["DB_POOL_SIZE"])
+    if int(cfg.get("DB_MAX_OVERFLOW", -1)) >= 0:
+        sizing["max_overflow"] = int(cfg["DB_MAX_OVERFLOW"])
+
+    pgbouncer_mode = (cfg.get("DB_PGBOUNCER_MODE") or "").strip().lower()
+    connect_args: Dict[str, Any] = dict(options.get("connect_args") or {})
+
+    if pgbouncer_mode == PGBOUNCER_TRANSACTION:
+        # PgBouncer owns pooling: keep no idle connections in the worker and
+        # never rely on session state (prepared statements, SET) surviving
+        # between transactions.
+        options["poolclass"] = NullPool
+        options.pop("pool_size", None)
+        options.pop("max_overflow", None)
+        options.pop("pool_timeout", None)
+        options["pool_pre_ping"] = False
+        if "+psycopg" in uri and "+psycopg2" not in uri:
+            connect_args["prepare_threshold"] = None
+        elif "+asyncpg" in uri:
+            connect_args["statement_cache_size"] = 0
+            connect_args["prepared_statement_cache_size"] = 0
+        # psycopg2 never issues server-side prepared statements.
+    else:
+        options["poolclass"] = InstrumentedQueuePool
+        options["pool_size"] = sizing["pool_size"]
+        options["max_overflow"] = sizing["max_overflow"]
+        options["pool_timeout"] = int(cfg.get("DB_POOL_TIMEOUT") or 10)
+        options["pool_pre_ping"] = bool(cfg.get("DB_POOL_PRE_PING", True))
+        options["pool_recycle"] = int(cfg.get("DB_POOL_RECYCLE") or 1800)
+        options["pool_use_lifo"] = True
+
+    app_name = cfg.get("APP_NAME")
+    if app_name and uri.startswith("postgresql"):
+        connect_args.setdefault("application_name", str(app_name)[:63])
+    if connect_args:
+        options["connect_args"] = connect_args
+    return options
+
+
+def statement_timeout(milliseconds):
+    """Decorator overriding the statement timeout for a single route.
+
+    ``milliseconds`` is either an int or the name of a config key holding one.
+
+    Example::
+
+        @research_bp.route('/abstracts/export-excel')
+        @statement_timeout(120000)
+        def export_abstracts_excel(): ...
+    """
+    def decorator(fn):
+        setattr(fn, _TIMEOUT_ATTR, milliseconds)
+        return fn
+    return decorator
+
+
+def _timeout_for_request(app) -> int:
+    default = int(app.config.get("DB_STATEMENT_TIMEOUT_MS") or 0)
+    if not has_request_context():
+        return default
+    cached = getattr(g, "_db_statement_timeout_ms", None)
+    if cached is not None:
+        return cached
+    value = default
+    view = app.view_functions.get(request.endpoint) if request.endpoint else None
+    while view is not None:
+        if hasattr(view, _TIMEOUT_ATTR):
+            value = getattr(view, _TIMEOUT_ATTR)
+            if isinstance(value, str):
+                value = app.config.get(value, default)
+            value = int(value or 0)
+            break
+        view = getattr(view, "__wrapped__", None)
+    g._db_statement_timeout_ms = value
+    return value
+
+
+def _apply_statement_timeout(session, transaction, connection):
+    try:
+        if connection.dialect.name != "postgresql":
+            return
+        timeout = _timeout_for_request(current_app._get_current_object())
+        if timeout > 0:
+            # SET LOCAL is scoped to the transaction, which keeps it safe
+            # behind PgBouncer transaction pooling.
+            connection.exec_driver_sql(f"SET LOCAL statement_timeout = {int(timeout)}")
+    except Exception:  # pragma: no cover - never block the request on this
+        current_app.logger.debug("statement_timeout not applied", exc_info=True)
+
+
+def _install_statement_timeout(db) -> None:
+    if not event.contains(db.session, "after_begin", _apply_statement_timeout):
+        event.listen(db.session, "after_begin", _apply_statement_timeout)
+
+
+def _install_pool_listeners(engine) -> None:
+    if getattr(engine, "_pool_stats_installed", False):
+        return
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_conn, record, proxy):
+        _POOL_STATS.incr("checkouts")
+
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(dbapi_conn, record):
+        _POOL_STATS.incr("checkins")
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_conn, record):
+        _POOL_STATS.incr("connects")
+
+    @event.listens_for(engine, "invalidate")
+    def _on_invalidate(dbapi_conn, record, exc):
+        _POOL_STATS.incr("invalidations")
+
+    engine._pool_stats_installed = True
+
+
+def _format_slow_query(statement: str, parameters: Any, limit: int = 2000) -> str:
+    params = repr(parameters)
+    if len(params) > limit:
+        params = params[:limit] + "..."
+    return f"{statement} | params={params}"
+
+
+def _install_slow_query_logger(engine, threshold_ms: int) -> None:
+    """Log statements over ``threshold_ms``; fast statements cost two clock reads."""
+
+    if threshold_ms <= 0 or getattr(engine, "_slow_query_installed", False):
+        return
+    from app.utils.logging_utils import get_logger, lazy
+
+    threshold = threshold_ms / 1000.0
+    logger = get_logger("slow_query")
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start_timer(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("_query_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _check_duration(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info.get("_query_started")
+        if not started:
+            return
+        elapsed = time.perf_counter() - started.pop()
+        if elapsed >= threshold:
+            # Statement text and parameters are only rendered for slow queries.
+            logger.warning(
+                "Slow query %.1fms rows=%s: %s",
+                elapsed * 1000,
+                getattr(cursor, "rowcount", -1),
+                lazy(_format_slow_query, statement, parameters),
+            )
+
+    @event.listens_for(engine, "handle_error")
+    def _discard_timer(exception_context):
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("_query_started"):
+            conn.info["_query_started"].pop()
+
+    engine._slow_query_installed = True
+
+
+def init_db_engine(app, db) -> None:
+    """Store the derived engine options; call before ``db.init_app``."""
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = build_engine_options(app)
+    app.logger.info(
+        "DB engine profile: %s",
+        {k: (v.__name__ if isinstance(v, type) else v)
+         for k, v in app.config["SQLALCHEMY_ENGINE_OPTIONS"].items()
+         if k != "connect_args"},
+    )
+
+
+def attach_db_engine(app, db) -> None:
+    """Install pool and statement-timeout listeners (requires app context)."""
+    with app.app_context():
+        _install_pool_listeners(db.engine)
+        _install_slow_query_logger(db.engine, int(app.config.get("DB_SLOW_QUERY_MS") or 0))
+    _install_statement_timeout(db)
+
+
+def pool_status(engine) -> Dict[str, Any]:
+    """Return a JSON-friendly description of the engine's pool."""
+    pool = engine.pool
+    data: Dict[str, Any] = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        data.update({
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": pool.overflow(),
+            "max_overflow": pool._max_overflow,
+            "timeout": pool.timeout(),
+        })
+    data.update(_POOL_STATS.snapshot())
+    return data
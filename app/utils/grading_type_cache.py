@@ -0,0 +1,171 @@
+"""Process-wide cache of grading criteria (``GradingType`` reference data).
+
+Grading criteria change a handful of times per cycle but are consulted for
+every grade: the score and level validators on ``Grading``, grade creation,
+grading schema dumps and the grade exports. The cache holds an immutable
+``GradingTypeInfo`` per criterion, loaded for the whole table in one query.
+
+Freshness follows ``app.utils.versioned_cache``:
+
+* ORM writes to ``GradingType`` (the grading type routes and utils) flag the
+  session; after that session commits the version is bumped
+  (``grading_types:version`` in Redis when ``REDIS_URL`` is set, so every
+  worker reloads on its next lookup).
+* An ID that is not cached is confirmed against the database, so criteria
+  created in the current transaction or by raw SQL are never rejected.
+* ``GRADING_TYPE_CACHE_MAX_AGE`` seconds (default 300) bounds how long a
+  change made outside the ORM can go unnoticed.
+"""
+from __future__ import annotations
+
+import threading
+import time
+import uuid
+from typing import Dict, List, NamedTuple, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.extensions import db
+from app.models.Cycle import GradingType
+from app.models.enumerations import GradingFor
+from app.utils.versioned_cache import VersionedCache
+
+_versions = VersionedCache("grading_types", max_age_config="GRADING_TYPE_CACHE_MAX_AGE")
+
+_lock = threading.Lock()
+_state = {
+    "version": None,   # version the index was built for
+    "loaded_at": 0.0,
+    "index": {},
+}
+
+
+class GradingTypeInfo(NamedTuple):
+    id: uuid.UUID
+    criteria: str
+    min_score: int
+    max_score: int
+    grading_for: GradingFor
+    verification_level: int
+    weight: float
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "id": str(self.id),
+            "criteria": self.criteria,
+            "min_score": self.min_score,
+            "max_score": self.max_score,
+            "grading_for": self.grading_for,
+            "verification_level": self.verification_level,
+        }
+
+
+_COLUMNS = (
+    GradingType.id,
+    GradingType.criteria,
+    GradingType.min_score,
+    GradingType.max_score,
+    GradingType.grading_for,
+    GradingType.verification_level,
+    GradingType.weight,
+)
+
+
+def _info(row) -> GradingTypeInfo:
+    info = GradingTypeInfo(*row)
+    return info._replace(grading_for=GradingFor(info.grading_for))
+
+
+def version() -> int:
+    """Current cache version (shared across workers when Redis is available)."""
+    return _versions.version()
+
+
+def invalidate() -> None:
+    """Drop the local index and tell every worker to reload."""
+    with _lock:
+        _state["version"] = None
+    _versions.invalidate()
+
+
+def _index() -> Dict[uuid.UUID, GradingTypeInfo]:
+    current = version()
+    with _lock:
+        fresh = (
+            _state["version"] == current
+            and not _versions.expired(_state["loaded_at"])
+        )
+        if fresh:
+            return _state["index"]
+    index = {row[0]: _info(row) for row in db.session.execute(select(*_COLUMNS))}
+    with _lock:
+        _state.update(index=index, version=current, loaded_at=time.time())
+    return index
+
+
+def _coerce(grading_type_id) -> Optional[uuid.UUID]:
+    if grading_type_id is None or isinstance(grading_type_id, uuid.UUID):
+        return grading_type_id
+    try:
+        return uuid.UUID(str(grading_type_id))
+    except ValueError:
+        return None
+
+
+def _confirm(grading_type_id: uuid.UUID) -> Optional[GradingTypeInfo]:
+    row = db.session.execute(select(*_COLUMNS).where(GradingType.id == grading_type_id)).first()
+    return _info(row) if row is not None else None
+
+
+class Snapshot:
+    """Criteria resolved once for a loop or batch; lookups are dict reads.
+
+    IDs missing from the index are confirmed against the database once each,
+    as in ``get``.
+    """
+
+    __slots__ = ("_index", "_misses")
+
+    def __init__(self, index: Dict[uuid.UUID, GradingTypeInfo]):
+        self._index = index
+        self._misses: Dict[uuid.UUID, Optional[GradingTypeInfo]] = {}
+
+    def get(self, grading_type_id) -> Optional[GradingTypeInfo]:
+        grading_type_id = _coerce(grading_type_id)
+        if grading_type_id is None:
+            return None
+        info = self._index.get(grading_type_id)
+        if info is not None:
+            return info
+        if grading_type_id not in self._misses:
+            self._misses[grading_type_id] = _confirm(grading_type_id)
+        return self._misses[grading_type_id]
+
+
+def snapshot() -> Snapshot:
+    """The current index, checked for freshness once, for repeated lookups."""
+    return Snapshot(_index())
+
+
+def get(grading_type_id) -> Optional[GradingTypeInfo]:
+    """Criterion by ID (UUID or string); None when it does not exist."""
+    grading_type_id = _coerce(grading_type_id)
+    if grading_type_id is None:
+        return None
+    info = _index().get(grading_type_id)
+    return info if info is not None else _confirm(grading_type_id)
+
+
+def for_target(grading_for) -> List[GradingTypeInfo]:
+    """Criteria for one kind of submission, ordered by criteria text."""
+    grading_for = GradingFor(grading_for)
+    return sorted(
+        (info for info in _index().values() if info.grading_for == grading_for),
+        key=lambda info: info.criteria,
+    )
+
+
+def mark_changed(session: Optional[Session]) -> None:
+    """Record that ``session`` wrote grading types; the version bumps on commit."""
+    _versions.mark_changed(session)
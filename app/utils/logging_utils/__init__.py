@@ -7,12 +7,15 @@ Usage:
     log.info("user created", extra={"user_id": user.id})
 """
 
+from .lazy import LazySQL, lazy
 from .manager import (
     LogCategory,
     LoggerManager,
     archive_logs,
+    archive_metrics,
     clear_all_logs,
     clear_log,
+    flush_logger,
     get_logger,
     get_log_context,
     init_logger,
@@ -26,6 +29,8 @@ from .manager import (
 )
 
 __all__ = [
+    "LazySQL",
+    "lazy",
     "LogCategory",
     "LoggerManager",
     "get_logger",
@@ -40,5 +45,7 @@ __all__ = [
     "clear_log",
     "clear_all_logs",
     "archive_logs",
+    "archive_metrics",
     "shutdown_logger",
+    "flush_logger",
 ]
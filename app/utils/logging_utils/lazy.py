@@ -0,0 +1,71 @@
+"""
+Deferred log-argument helpers.
+
+Logging only formats its arguments when a record is actually emitted, so
+expensive values should be wrapped instead of computed up front:
+
+    logger.debug("Executing %r", LazySQL(query))
+    logger.info("Snapshot %s", lazy(build_snapshot, instance))
+
+Neither wrapper does any work unless the message passes the level check.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+
+class lazy:
+    """Call ``fn(*args, **kwargs)`` only when the log message is rendered."""
+
+    __slots__ = ("_fn", "_args", "_kwargs")
+
+    def __init__(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        self._fn = fn
+        self._args = args
+        self._kwargs = kwargs
+
+    def __str__(self) -> str:
+        return str(self._fn(*self._args, **self._kwargs))
+
+    def __repr__(self) -> str:
+        return repr(self._fn(*self._args, **self._kwargs))
+
+
+class LazySQL:
+    """Render a Query/Select as SQL text only when formatted.
+
+    ``literal_binds`` inlines parameter values (PostgreSQL dialect by default,
+    matching production); statements that cannot be rendered that way fall
+    back to the plain parameterised form.
+    """
+
+    __slots__ = ("_statement", "_dialect", "_literal_binds")
+
+    def __init__(self, statement: Any, *, dialect: Any = None, literal_binds: bool = True) -> None:
+        self._statement = statement
+        self._dialect = dialect
+        self._literal_binds = literal_binds
+
+    def render(self) -> str:
+        stmt = getattr(self._statement, "statement", self._statement)
+        dialect = self._dialect
+        if dialect is None:
+            from sqlalchemy.dialects import postgresql
+
+            dialect = postgresql.dialect()
+        try:
+            if self._literal_binds:
+                return str(stmt.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+        except Exception:
+            pass
+        try:
+            return str(stmt.compile(dialect=dialect))
+        except Exception:
+            return str(stmt)
+
+    def __str__(self) -> str:
+        return self.render()
+
+    def __repr__(self) -> str:
+        return self.render()
@@ -1,19 +1,30 @@
 from __future__ import annotations
 
+import atexit
+import copy
 import json
 import logging
 import os
+import queue
+import threading
+import time
+import weakref
 import zipfile
 from contextlib import contextmanager
 from contextvars import ContextVar
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from logging.handlers import TimedRotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Sequence
 
 from flask import Flask, current_app
 
+try:  # POSIX advisory locks; other platforms fall back to an exclusive lock file
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
 
 _CORE_LOG_RECORD_FIELDS = {
     "name",
@@ -105,6 +116,15 @@ def log_context(**fields: Any):
         _log_context.reset(token)
 
 
+def _record_context(record: logging.LogRecord) -> Dict[str, Any]:
+    # Records handed to the async writer thread carry a snapshot of the
+    # caller's context; the ContextVar itself is not visible there.
+    captured = getattr(record, "_log_context", None)
+    if captured is not None:
+        return captured
+    return _log_context.get()
+
+
 class ContextAwareFormatter(logging.Formatter):
     """Formatter that can emit JSON or text logs enriched with contextual fields."""
 
@@ -125,7 +145,7 @@ class ContextAwareFormatter(logging.Formatter):
             return self._format_json(record)
 
         base = super().format(record)
-        context = _log_context.get()
+        context = _record_context(record)
         if context:
             ctx = " ".join(f"{key}={value}" for key, value in sorted(context.items()))
             base = f"{base} | {ctx}"
@@ -145,12 +165,14 @@ class ContextAwareFormatter(logging.Formatter):
                 continue
             payload[key] = value
 
-        context = _log_context.get()
+        context = _record_context(record)
         if context:
             payload.setdefault("context", {}).update(context)
 
         if record.exc_info:
             payload["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload["exception"] = record.exc_text
         if record.stack_info:
             payload["stack"] = self.formatStack(record.stack_info)
 
@@ -179,6 +201,85 @@ DEFAULT_CATEGORIES: Dict[str, LogCategory] = {
 }
 
 
+class _BoundedQueueHandler(QueueHandler):
+    """QueueHandler that never blocks the caller indefinitely.
+
+    With the ``drop`` policy a full queue discards the new record; with
+    ``block`` the caller waits up to ``block_timeout`` seconds first. Every
+    discarded record is counted so operators can size the queue.
+    """
+
+    def __init__(self, log_queue: "queue.Queue[logging.LogRecord]", *, policy: str, block_timeout: float) -> None:
+        super().__init__(log_queue)
+        self.policy = policy
+        self.block_timeout = block_timeout
+        self.dropped = 0
+        self._drop_lock = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Resolve everything that depends on the calling thread now: the
+        # message arguments, traceback text and the contextual fields.
+        message = record.getMessage()
+        prepared = copy.copy(record)
+        prepared.msg = message
+        prepared.message = message
+        prepared.args = None
+        if record.exc_info:
+            prepared.exc_text = logging.Formatter().formatException(record.exc_info)
+        prepared.exc_info = None
+        prepared._log_context = dict(_log_context.get())
+        return prepared
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            if self.policy == "block":
+                self.queue.put(record, timeout=self.block_timeout)
+            else:
+                self.queue.put_nowait(record)
+        except queue.Full:
+            with self._drop_lock:
+                self.dropped += 1
+
+
+class _DispatchHandler(logging.Handler):
+    """Writer-thread handler forwarding records to per-logger targets."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._targets: Dict[str, List[logging.Handler]] = {}
+        self.default_targets: List[logging.Handler] = []
+
+    def set_targets(self, logger_name: str, handlers: Sequence[logging.Handler]) -> None:
+        self._targets[logger_name] = list(handlers)
+
+    def remove_targets(self, logger_name: str) -> List[logging.Handler]:
+        return self._targets.pop(logger_name, [])
+
+    def all_targets(self) -> List[logging.Handler]:
+        seen: List[logging.Handler] = []
+        for handlers in list(self._targets.values()) + [self.default_targets]:
+            for handler in handlers:
+                if handler not in seen:
+                    seen.append(handler)
+        return seen
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        self.emit(record)
+        return True
+
+    def emit(self, record: logging.LogRecord) -> None:
+        for handler in self._targets.get(record.name, self.default_targets):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+    def flush(self) -> None:
+        for handler in self.all_targets():
+            try:
+                handler.flush()
+            except Exception:
+                pass
+
+
 class LoggerManager:
     """
     Manages per-category loggers with timed rotation, contextual support,
@@ -209,6 +310,10 @@ class LoggerManager:
         date_format: Optional[str] = None,
         file_handler_level: Optional[int] = None,
         static_fields: Optional[Dict[str, Any]] = None,
+        async_enabled: bool = False,
+        queue_size: int = 10000,
+        queue_drop_policy: str = "drop",
+        queue_block_timeout: float = 0.05,
     ) -> None:
         self._base_dir = base_dir
         self._rotation_when = rotation_when
@@ -234,6 +339,34 @@ class LoggerManager:
         self._loggers: Dict[str, logging.Logger] = {}
         self._last_archive_check: Optional[datetime] = None
         self._console_handler: Optional[logging.Handler] = None
+        self._async_enabled = async_enabled
+        self._queue_size = max(1, int(queue_size or 1))
+        self._queue_drop_policy = queue_drop_policy if queue_drop_policy in {"drop", "block"} else "drop"
+        self._queue_block_timeout = max(0.0, float(queue_block_timeout or 0.0))
+        self._queue_handler: Optional[_BoundedQueueHandler] = None
+        self._dispatcher: Optional[_DispatchHandler] = None
+        self._listener: Optional[QueueListener] = None
+        self._listener_pid: Optional[int] = None
+        self._async_lock = threading.Lock()
+        self._archiver_thread: Optional[threading.Thread] = None
+        self._archiver_stop: Optional[threading.Event] = None
+        self._archiver_pid: Optional[int] = None
+        self._archive_metrics: Dict[str, Any] = {
+            "runs_total": 0,
+            "skipped_locked_total": 0,
+            "last_run_at": None,
+            "last_duration_seconds": 0.0,
+            "duration_seconds_total": 0.0,
+            "last_files_archived": 0,
+            "files_archived_total": 0,
+            "bytes_in_total": 0,
+            "bytes_out_total": 0,
+            "bytes_saved_total": 0,
+        }
+        # id(logger) -> (logger, handlers moved behind the queue)
+        self._attached: Dict[int, Any] = {}
+        if async_enabled and hasattr(os, "register_at_fork"):
+            _restart_after_fork(self)
 
     @property
     def base_dir(self) -> Path:
@@ -246,6 +379,10 @@ class LoggerManager:
                 return Path(cfg_dir)
         return Path(os.getenv("LOGGING_BASE_DIR", "/tmp/research_excellence_logs"))
 
+    @property
+    def auto_archive_after_days(self) -> Optional[int]:
+        return self._auto_archive_after_days
+
     @property
     def archive_dir(self) -> Path:
         if self._archive_dir:
@@ -269,6 +406,8 @@ class LoggerManager:
 
         category_key = category.lower()
         if category_key in self._loggers:
+            if self._async_enabled:
+                self._ensure_async()  # cached before a fork: the writer thread is gone
             return self._loggers[category_key]
 
         spec = self._categories.get(category_key)
@@ -296,23 +435,147 @@ class LoggerManager:
         handler_level = self._file_handler_level or level
         handler.setLevel(handler_level)
         handler.setFormatter(self._build_formatter(json_format=self._json_format))
-        logger.addHandler(handler)
+        targets: List[logging.Handler] = [handler]
 
         if self._enable_console:
-            console_handler = self._ensure_console_handler()
-            if console_handler not in logger.handlers:
-                logger.addHandler(console_handler)
+            targets.append(self._ensure_console_handler())
 
         app_logger = _resolve_app_logger()
         if self._mirror_app_handlers and app_logger and app_logger.handlers:
-            for app_handler in app_logger.handlers:
-                if app_handler not in logger.handlers:
-                    logger.addHandler(app_handler)
+            for app_handler in self._direct_handlers(app_logger):
+                if app_handler not in targets:
+                    targets.append(app_handler)
+
+        if self._async_enabled:
+            queue_handler = self._ensure_async()
+            self._dispatcher.set_targets(logger_name, targets)
+            if queue_handler not in logger.handlers:
+                logger.addHandler(queue_handler)
+        else:
+            for target in targets:
+                if target not in logger.handlers:
+                    logger.addHandler(target)
 
         self._loggers[category_key] = logger
-        self._maybe_auto_archive()
         return logger
 
+    # ------------------------------------------------------------------
+    # Asynchronous (queue) mode
+    # ------------------------------------------------------------------
+    @property
+    def async_enabled(self) -> bool:
+        return self._async_enabled
+
+    def _ensure_async(self) -> _BoundedQueueHandler:
+        """Start (or restart after fork) the single writer thread for this process."""
+
+        pid = os.getpid()
+        if self._queue_handler is not None and self._listener_pid == pid:
+            return self._queue_handler
+        with self._async_lock:
+            if self._queue_handler is not None and self._listener_pid == pid:
+                return self._queue_handler
+            # Threads do not survive fork(): a gunicorn worker inheriting a
+            # manager from the master gets a fresh queue and listener.
+            log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(self._queue_size)
+            dispatcher = self._dispatcher or _DispatchHandler()
+            if self._queue_handler is None:
+                self._queue_handler = _BoundedQueueHandler(
+                    log_queue,
+                    policy=self._queue_drop_policy,
+                    block_timeout=self._queue_block_timeout,
+                )
+            else:
+                self._queue_handler.queue = log_queue
+            listener = QueueListener(log_queue, dispatcher, respect_handler_level=False)
+            listener.start()
+            self._dispatcher = dispatcher
+            self._listener = listener
+            self._listener_pid = pid
+            return self._queue_handler
+
+    def _after_fork_in_child(self) -> None:
+        """Restart the writer thread in a forked child (e.g. gunicorn ``--preload`` workers)."""
+
+        # The parent's lock may have been held by a thread that does not exist here.
+        self._async_lock = threading.Lock()
+        self._listener = None
+        if self._queue_handler is not None and self._listener_pid is not None:
+            self._ensure_async()
+
+    def _direct_handlers(self, logger: logging.Logger) -> List[logging.Handler]:
+        """Handlers that actually write for ``logger`` (not our queue handler)."""
+
+        attached = self._attached.get(id(logger))
+        if attached is not None:
+            return list(attached[1])
+        return [h for h in logger.handlers if h is not self._queue_handler]
+
+    def attach_app_logger(self, logger: logging.Logger) -> None:
+        """Move ``logger``'s handlers (e.g. the Flask app logger) behind the queue.
+
+        Records from loggers without dedicated targets (``log_structured``,
+        wired library loggers) fall back to these handlers in the writer thread.
+        """
+
+        if not self._async_enabled:
+            return
+        queue_handler = self._ensure_async()
+        direct = self._direct_handlers(logger)
+        self._attached[id(logger)] = (logger, direct)
+        self._dispatcher.set_targets(logger.name, direct)
+        self._dispatcher.default_targets = direct
+        for handler in list(logger.handlers):
+            if handler is not queue_handler:
+                logger.removeHandler(handler)
+        if queue_handler not in logger.handlers:
+            logger.addHandler(queue_handler)
+
+    def queue_stats(self) -> Dict[str, Any]:
+        """Return queue depth, capacity and dropped-record count for this process."""
+
+        handler = self._queue_handler
+        if not self._async_enabled or handler is None:
+            return {"async": False}
+        return {
+            "async": True,
+            "pid": self._listener_pid,
+            "depth": handler.queue.qsize(),
+            "capacity": self._queue_size,
+            "policy": self._queue_drop_policy,
+            "dropped": handler.dropped,
+        }
+
+    def flush(self) -> None:
+        """Drain the queue and flush every underlying handler (blocking)."""
+
+        with self._async_lock:
+            listener = self._listener
+            if listener is None or self._listener_pid != os.getpid():
+                return
+            listener.stop()  # processes everything already enqueued
+            if self._dispatcher:
+                self._dispatcher.flush()
+            listener.start()
+
+    def _stop_async(self) -> None:
+        with self._async_lock:
+            listener, self._listener = self._listener, None
+            if listener is not None and self._listener_pid == os.getpid():
+                try:
+                    listener.stop()
+                except Exception:
+                    pass
+            dispatcher = self._dispatcher
+            if dispatcher is not None:
+                dispatcher.flush()
+            handler = self._queue_handler
+            if handler is not None and handler.dropped:
+                logging.getLogger(__name__).warning(
+                    "Async log queue dropped %s records (capacity=%s)", handler.dropped, self._queue_size
+                )
+            self._listener_pid = None
+
     def _build_formatter(self, *, json_format: bool) -> ContextAwareFormatter:
         return ContextAwareFormatter(
             fmt=self._text_format,
@@ -329,19 +592,65 @@ class LoggerManager:
             self._console_handler = handler
         return self._console_handler
 
-    def _maybe_auto_archive(self) -> None:
+    def run_scheduled_archive(self, *, force: bool = False) -> Optional[Dict[str, Any]]:
+        """Archive old logs if auto-archiving is configured and due.
+
+        Called by the maintenance runner (``flask logs-archive`` or the
+        background archiver thread), never from the logging hot path.
+        Returns the run summary, or ``None`` when nothing was due.
+        """
+
         if not self._auto_archive_enabled or self._auto_archive_after_days is None:
-            return
+            return None
 
         now = datetime.now(timezone.utc)
         if (
-            self._last_archive_check is not None
+            not force
+            and self._last_archive_check is not None
             and now - self._last_archive_check < self._archive_check_interval
         ):
-            return
+            return None
 
-        self.archive_logs(older_than_days=self._auto_archive_after_days)
         self._last_archive_check = now
+        self.archive_logs(older_than_days=self._auto_archive_after_days)
+        return self.archive_metrics()
+
+    def start_archiver(self, *, poll_seconds: Optional[float] = None) -> Optional[threading.Thread]:
+        """Start a daemon thread that periodically runs the scheduled archive.
+
+        Safe to call from every gunicorn worker: the cross-process lock in
+        ``archive_logs`` lets exactly one of them do the work per cycle.
+        """
+
+        if not self._auto_archive_enabled or self._auto_archive_after_days is None:
+            return None
+        with self._async_lock:
+            thread = self._archiver_thread
+            if thread is not None and thread.is_alive() and self._archiver_pid == os.getpid():
+                return thread
+            interval = poll_seconds or self._archive_check_interval.total_seconds()
+            stop = threading.Event()
+
+            def _loop() -> None:
+                while not stop.wait(interval):
+                    try:
+                        self.run_scheduled_archive(force=True)
+                    except Exception:
+                        logging.getLogger(__name__).exception("Log archive run failed")
+
+            thread = threading.Thread(target=_loop, name="log-archiver", daemon=True)
+            thread.start()
+            self._archiver_thread = thread
+            self._archiver_stop = stop
+            self._archiver_pid = os.getpid()
+            return thread
+
+    def stop_archiver(self) -> None:
+        stop = self._archiver_stop
+        if stop is not None:
+            stop.set()
+        self._archiver_thread = None
+        self._archiver_stop = None
 
     def _iter_log_files(self, categories: Optional[Iterable[str]] = None) -> Sequence[Path]:
         log_dir = self.base_dir
@@ -385,11 +694,74 @@ class LoggerManager:
                 continue
         return deleted
 
+    @contextmanager
+    def _archive_lock(self, lock_dir: Path):
+        """Non-blocking cross-process lock; yields False if another process holds it."""
+
+        lock_dir.mkdir(parents=True, exist_ok=True)
+        lock_path = lock_dir / ".archive.lock"
+        if fcntl is not None:
+            fd = os.open(lock_path, os.O_CREAT | os.O_RDWR, 0o644)
+            try:
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except OSError:
+                    yield False
+                    return
+                try:
+                    yield True
+                finally:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+            finally:
+                os.close(fd)
+            return
+        try:  # pragma: no cover - non-POSIX fallback
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:  # pragma: no cover
+            yield False
+            return
+        try:  # pragma: no cover
+            yield True
+        finally:  # pragma: no cover
+            os.close(fd)
+            try:
+                lock_path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _active_log_names(self) -> set:
+        # Files currently written by a handler; archiving (and unlinking) them
+        # would make the handler write into a deleted inode.
+        return {spec.filename for spec in self._categories.values()}
+
+    @staticmethod
+    def _stream_to_zip(source: Path, target: Path, *, chunk_size: int) -> int:
+        """Compress ``source`` into ``target`` chunk by chunk; return bytes written."""
+
+        partial = target.with_name(target.name + ".part")
+        with source.open("rb") as src, zipfile.ZipFile(
+            partial, mode="w", compression=zipfile.ZIP_DEFLATED, compresslevel=6
+        ) as zf:
+            info = zipfile.ZipInfo.from_file(source, arcname=source.name, strict_timestamps=False)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            with zf.open(info, mode="w", force_zip64=True) as dst:
+                while True:
+                    chunk = src.read(chunk_size)
+                    if not chunk:
+                        break
+                    dst.write(chunk)
+                    # Yield the GIL between chunks so request threads in the
+                    # same process are not starved by a large archive.
+                    time.sleep(0)
+        os.replace(partial, target)
+        return target.stat().st_size
+
     def archive_logs(
         self,
         *,
         older_than_days: int,
         destination_dir: Optional[str] = None,
+        chunk_size: int = 1024 * 1024,
     ) -> List[Path]:
         if older_than_days < 0:
             raise ValueError("older_than_days must be non-negative")
@@ -399,38 +771,115 @@ class LoggerManager:
 
         cutoff = datetime.now(timezone.utc) - timedelta(days=older_than_days)
         archives: List[Path] = []
+        started = time.perf_counter()
+        bytes_in = 0
+        bytes_out = 0
+
+        with self._archive_lock(dest_dir) as acquired:
+            if not acquired:
+                self._record_archive_metrics(skipped_locked=True)
+                return archives
+
+            active = self._active_log_names()
+            for log_path in self._iter_log_files():
+                if log_path.name in active:
+                    continue
+                try:
+                    stat = log_path.stat()
+                except FileNotFoundError:
+                    continue
+
+                mtime = datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc)
+                if mtime > cutoff:
+                    continue
+
+                timestamp = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
+                archive_name = dest_dir / f"{log_path.name}_{timestamp}.zip"
+
+                try:
+                    written = self._stream_to_zip(log_path, archive_name, chunk_size=chunk_size)
+                except FileNotFoundError:
+                    continue
+
+                try:
+                    log_path.unlink()
+                except FileNotFoundError:
+                    pass
+
+                bytes_in += stat.st_size
+                bytes_out += written
+                archives.append(archive_name)
+
+            self._record_archive_metrics(
+                duration=time.perf_counter() - started,
+                files=len(archives),
+                bytes_in=bytes_in,
+                bytes_out=bytes_out,
+                dest_dir=dest_dir,
+            )
 
-        for log_path in self._iter_log_files():
-            try:
-                mtime = datetime.fromtimestamp(log_path.stat().st_mtime, tz=timezone.utc)
-            except FileNotFoundError:
-                continue
-
-            if mtime > cutoff:
-                continue
-
-            timestamp = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
-            archive_name = dest_dir / f"{log_path.stem}_{timestamp}.zip"
-
-            with zipfile.ZipFile(
-                archive_name,
-                mode="w",
-                compression=zipfile.ZIP_DEFLATED,
-            ) as zf:
-                zf.write(log_path, arcname=log_path.name)
+        return archives
 
+    def _record_archive_metrics(
+        self,
+        *,
+        duration: float = 0.0,
+        files: int = 0,
+        bytes_in: int = 0,
+        bytes_out: int = 0,
+        skipped_locked: bool = False,
+        dest_dir: Optional[Path] = None,
+    ) -> None:
+        m = self._archive_metrics
+        if skipped_locked:
+            m["skipped_locked_total"] += 1
+            return
+        m["runs_total"] += 1
+        m["last_run_at"] = datetime.now(timezone.utc).isoformat()
+        m["last_duration_seconds"] = round(duration, 4)
+        m["duration_seconds_total"] = round(m["duration_seconds_total"] + duration, 4)
+        m["last_files_archived"] = files
+        m["files_archived_total"] += files
+        m["bytes_in_total"] += bytes_in
+        m["bytes_out_total"] += bytes_out
+        m["bytes_saved_total"] += max(0, bytes_in - bytes_out)
+        # Persist next to the archives so any process (or the CLI) can read
+        # the figures from the last run, whichever worker performed it.
+        if dest_dir is not None:
             try:
-                log_path.unlink()
-            except FileNotFoundError:
+                tmp = dest_dir / ".archive_metrics.json.tmp"
+                tmp.write_text(json.dumps(m), encoding="utf-8")
+                os.replace(tmp, dest_dir / "archive_metrics.json")
+            except OSError:
                 pass
 
-            archives.append(archive_name)
+    def archive_metrics(self) -> Dict[str, Any]:
+        """Archive counters for this process merged over the last persisted run."""
 
-        return archives
+        data: Dict[str, Any] = {}
+        path = self.archive_dir / "archive_metrics.json"
+        try:
+            data["last_persisted"] = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            data["last_persisted"] = None
+        data["process"] = dict(self._archive_metrics)
+        return data
 
     def shutdown(self) -> None:
+        self.stop_archiver()
+        self._stop_async()
         for key in list(self._loggers.keys()):
             self._detach_logger(key)
+        # Give attached loggers their direct handlers back.
+        for logger, handlers in self._attached.values():
+            if self._queue_handler is not None:
+                logger.removeHandler(self._queue_handler)
+            for handler in handlers:
+                if handler not in logger.handlers:
+                    logger.addHandler(handler)
+        self._attached = {}
+        if self._dispatcher is not None:
+            self._dispatcher.default_targets = []
         if self._console_handler:
             try:
                 self._console_handler.close()
@@ -442,12 +891,31 @@ class LoggerManager:
         logger = self._loggers.pop(category_key, None)
         if not logger:
             return
-        for handler in list(logger.handlers):
+        handlers = list(logger.handlers)
+        if self._dispatcher is not None:
+            handlers.extend(self._dispatcher.remove_targets(logger.name))
+        for handler in handlers:
+            logger.removeHandler(handler)
+            # Shared handlers (queue, console, app handlers) are owned elsewhere.
+            if handler is self._queue_handler or handler is self._console_handler:
+                continue
+            if any(handler in hs for _, hs in self._attached.values()):
+                continue
             try:
                 handler.close()
             except Exception:
                 pass
-            logger.removeHandler(handler)
+
+
+def _restart_after_fork(manager: LoggerManager) -> None:
+    ref = weakref.ref(manager)
+
+    def _after_in_child() -> None:
+        live = ref()
+        if live is not None:
+            live._after_fork_in_child()
+
+    os.register_at_fork(after_in_child=_after_in_child)
 
 
 def _to_int(value: Optional[Any], *, default: Optional[int] = None) -> Optional[int]:
@@ -561,10 +1029,18 @@ def init_logger(app: Flask) -> LoggerManager:
         date_format=app.config.get("LOGGING_DATE_FORMAT"),
         file_handler_level=_to_level(app.config.get("LOGGING_FILE_LEVEL")),
         static_fields=static_fields,
+        async_enabled=_to_bool(app.config.get("LOGGING_ASYNC", False), default=False),
+        queue_size=_to_int(app.config.get("LOGGING_QUEUE_SIZE"), default=10000) or 10000,
+        queue_drop_policy=str(app.config.get("LOGGING_QUEUE_DROP_POLICY") or "drop").strip().lower(),
     )
 
     shutdown_logger()
     _manager = manager
+    if manager.async_enabled:
+        manager.attach_app_logger(app.logger)
+    if _to_bool(app.config.get("LOGGING_ARCHIVE_BACKGROUND", False), default=False):
+        manager.start_archiver()
+    _register_exit_hook()
     return _manager
 
 
@@ -589,7 +1065,11 @@ def logger_manager() -> LoggerManager:
             text_format=os.getenv("LOGGING_TEXT_FORMAT"),
             date_format=os.getenv("LOGGING_DATE_FORMAT"),
             file_handler_level=_to_level(os.getenv("LOGGING_FILE_LEVEL")),
+            async_enabled=_to_bool(os.getenv("LOGGING_ASYNC"), default=False),
+            queue_size=_to_int(os.getenv("LOGGING_QUEUE_SIZE"), default=10000) or 10000,
+            queue_drop_policy=(os.getenv("LOGGING_QUEUE_DROP_POLICY") or "drop").strip().lower(),
         )
+        _register_exit_hook()
     return _manager
 
 
@@ -601,6 +1081,26 @@ def shutdown_logger() -> None:
     _manager = None
 
 
+def flush_logger() -> None:
+    """Drain the async queue (if any) and flush all handlers of this process."""
+
+    if _manager is not None:
+        _manager.flush()
+
+
+_exit_hook_registered = False
+
+
+def _register_exit_hook() -> None:
+    # Stop the writer thread and flush files when the process exits so no
+    # queued records are lost (gunicorn workers also call this from
+    # gunicorn.conf.py:worker_exit).
+    global _exit_hook_registered
+    if not _exit_hook_registered:
+        atexit.register(shutdown_logger)
+        _exit_hook_registered = True
+
+
 def get_logger(category: str) -> logging.Logger:
     return logger_manager().get_logger(category)
 
@@ -624,5 +1124,9 @@ def archive_logs(
     )
 
 
+def archive_metrics() -> Dict[str, Any]:
+    return logger_manager().archive_metrics()
+
+
 def register_category(name: str, filename: Optional[str] = None) -> LogCategory:
     return logger_manager().register_category(name, filename=filename)
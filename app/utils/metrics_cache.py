@@ -1,11 +1,17 @@
-"""Lightweight in-process cache for admin dashboard metrics.
+"""Shared, versioned cache for admin dashboard metrics.
 
 Provides get/set/invalidate so writers across modules can invalidate without
-import cycles. This is intentionally simple; for multi-process deployments,
-back this with Redis in the future.
+import cycles. ``invalidate()`` bumps a version counter; cached payloads are
+stored under that version so every worker stops serving stale data as soon as
+any worker records a change.
+
+When Redis is reachable (``REDIS_URL``) the payload and the version live there
+and are shared by all gunicorn workers. Otherwise the cache falls back to the
+original per-process dictionary.
 """
 from __future__ import annotations
 
+import json
 from typing import Any, Optional
 import time
 
@@ -13,14 +19,57 @@ _CACHE = {
     'ts': 0.0,      # epoch seconds
     'ttl': 30.0,    # seconds; keep short to avoid stale UI
     'data': None,   # cached payload (dict)
+    'version': 0,   # local version (used when Redis is unavailable)
 }
 
+_REDIS_VERSION_KEY = 'metrics:dashboard:version'
+_REDIS_DATA_KEY = 'metrics:dashboard:data:{version}'
+_REDIS_RETRY_AFTER = 30.0  # seconds to wait before retrying a failed Redis
+_redis_down_until = 0.0
+
+
+def _redis():
+    global _redis_down_until
+    if time.time() < _redis_down_until:
+        return None
+    try:
+        from app.security_utils import init_redis
+        return init_redis()
+    except Exception:
+        _redis_down_until = time.time() + _REDIS_RETRY_AFTER
+        return None
+
+
+def _redis_failed() -> None:
+    global _redis_down_until
+    _redis_down_until = time.time() + _REDIS_RETRY_AFTER
+
 
 def configure_ttl(seconds: float) -> None:
     _CACHE['ttl'] = max(1.0, float(seconds))
 
 
+def version() -> int:
+    """Current metrics version (shared across workers when Redis is available)."""
+    client = _redis()
+    if client is not None:
+        try:
+            raw = client.get(_REDIS_VERSION_KEY)
+            return int(raw or 0)
+        except Exception:
+            _redis_failed()
+    return _CACHE['version']
+
+
 def get() -> Optional[Any]:
+    client = _redis()
+    if client is not None:
+        try:
+            current = int(client.get(_REDIS_VERSION_KEY) or 0)
+            raw = client.get(_REDIS_DATA_KEY.format(version=current))
+            return json.loads(raw) if raw else None
+        except Exception:
+            _redis_failed()
     now = time.time()
     data = _CACHE['data']
     if data is None:
@@ -30,7 +79,24 @@ def get() -> Optional[Any]:
     return None
 
 
-def set(data: Any) -> None:
+def set(data: Any, *, for_version: Optional[int] = None) -> None:
+    """Store ``data``; ``for_version`` (read before computing) prevents a slow
+    computation from overwriting the cache after a concurrent invalidation."""
+    client = _redis()
+    if client is not None:
+        try:
+            current = int(client.get(_REDIS_VERSION_KEY) or 0)
+            if for_version is None or for_version == current:
+                client.setex(
+                    _REDIS_DATA_KEY.format(version=current),
+                    int(_CACHE['ttl']),
+                    json.dumps(data, default=str),
+                )
+            return
+        except Exception:
+            _redis_failed()
+    if for_version is not None and for_version != _CACHE['version']:
+        return
     _CACHE['data'] = data
     _CACHE['ts'] = time.time()
 
@@ -38,4 +104,10 @@ def set(data: Any) -> None:
 def invalidate() -> None:
     _CACHE['data'] = None
     _CACHE['ts'] = 0.0
-
+    _CACHE['version'] += 1
+    client = _redis()
+    if client is not None:
+        try:
+            client.incr(_REDIS_VERSION_KEY)
+        except Exception:
+            _redis_failed()
@@ -0,0 +1,108 @@
+"""MinHash signatures and LSH banding for near-duplicate text detection.
+
+A signature is ``NUM_PERM`` 32-bit minima of universal hashes over the
+text's shingles; the fraction of equal positions between two signatures
+estimates the Jaccard similarity of their shingle sets. Splitting the
+signature into ``BANDS`` bands of ``ROWS`` values and hashing each band gives
+bucket keys: two texts share at least one bucket with probability
+``1 - (1 - s**ROWS) ** BANDS``, which rises steeply around
+``(1 / BANDS) ** (1 / ROWS)`` (about 0.42 here), so candidate pairs come from
+an index lookup instead of comparing every pair.
+
+Hashes are seeded constants, so signatures are stable across processes and
+can be stored. ``signature`` runs in the flush of every submission insert or
+update, so the ``NUM_PERM x shingles`` hash matrix is evaluated with NumPy in
+``uint64``: ``(a * x + b) mod (2**61 - 1)`` is split so no product overflows
+and reduced with the Mersenne identity ``2**61 = 1``, giving exactly the
+values of the integer formula.
+"""
+from __future__ import annotations
+
+import hashlib
+import random
+import re
+import unicodedata
+import zlib
+from array import array
+from typing import Iterable, List, Sequence, Set
+
+import numpy as np
+
+NUM_PERM = 128
+BANDS = 32
+ROWS = NUM_PERM // BANDS
+
+_PRIME = (1 << 61) - 1
+_MAX32 = (1 << 32) - 1
+_rng = random.Random(0x5EED)
+_PERMUTATIONS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)]
+_WORD = re.compile(r"\w+")
+
+_P = np.uint64(_PRIME)
+_A = np.array([a for a, _ in _PERMUTATIONS], dtype=np.uint64)[:, None]
+_A_HI, _A_LO = _A >> np.uint64(32), _A & np.uint64(_MAX32)  # a = a_hi * 2**32 + a_lo, a_hi < 2**29
+_B = np.array([b for _, b in _PERMUTATIONS], dtype=np.uint64)[:, None]
+_LOW29 = np.uint64((1 << 29) - 1)
+
+
+def normalize(text: str) -> List[str]:
+    """Lower-cased, accent-stripped word tokens."""
+    folded = unicodedata.normalize("NFKD", text or "").encode("ascii", "ignore").decode("ascii")
+    return _WORD.findall(folded.lower())
+
+
+def word_shingles(text: str, k: int = 3) -> Set[str]:
+    words = normalize(text)
+    if len(words) <= k:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i:i + k]) for i in range(len(words) - k + 1)}
+
+
+def char_shingles(text: str, k: int = 4) -> Set[str]:
+    """Character k-grams; short texts such as titles need finer shingles than words."""
+    joined = " ".join(normalize(text))
+    if len(joined) <= k:
+        return {joined} if joined else set()
+    return {joined[i:i + k] for i in range(len(joined) - k + 1)}
+
+
+def _mod_prime(values: np.ndarray) -> np.ndarray:
+    """``values mod (2**61 - 1)`` for uint64 ``values``."""
+    folded = (values & _P) + (values >> np.uint64(61))
+    return np.where(folded >= _P, folded - _P, folded)
+
+
+def signature(shingles: Iterable[str]) -> List[int]:
+    """MinHash signature of a shingle set; empty sets give an all-max signature."""
+    x = np.fromiter((zlib.crc32(shingle.encode("utf-8")) for shingle in shingles), dtype=np.uint64)
+    if not x.size:
+        return [_MAX32] * NUM_PERM
+    high = _A_HI * x  # < 2**61; times 2**32 it wraps past 2**61 = 1
+    shifted = (high >> np.uint64(29)) + ((high & _LOW29) << np.uint64(32))
+    hashed = _mod_prime(shifted + _mod_prime(_A_LO * x) + _B)  # every sum < 2**63
+    return (hashed.min(axis=1) & np.uint64(_MAX32)).tolist()
+
+
+def pack(sig: Sequence[int]) -> bytes:
+    return array("I", sig).tobytes()
+
+
+def unpack(raw: bytes) -> List[int]:
+    values = array("I")
+    values.frombytes(raw)
+    return values.tolist()
+
+
+def band_buckets(sig: Sequence[int]) -> List[int]:
+    """One signed 64-bit bucket key per band."""
+    buckets = []
+    for band in range(BANDS):
+        chunk = array("I", sig[band * ROWS:(band + 1) * ROWS]).tobytes()
+        digest = hashlib.blake2b(bytes([band]) + chunk, digest_size=8).digest()
+        buckets.append(int.from_bytes(digest, "big", signed=True))
+    return buckets
+
+
+def similarity(a: Sequence[int], b: Sequence[int]) -> float:
+    """Estimated Jaccard similarity of two signatures."""
+    return sum(1 for x, y in zip(a, b) if x == y) / NUM_PERM
@@ -6,7 +6,7 @@ from typing import Dict, Optional, Sequence
 from sqlalchemy.orm import joinedload
 
 from app.extensions import db
-from app.models.Cycle import Abstracts
+from app.models.Cycle import Abstracts, GradingFor
 from app.models.User import User
 from app.security_utils import audit_log
 from app.utils.logging_utils import get_logger, log_context
@@ -20,6 +20,7 @@ from .base import (
     list_instances,
     update_instance,
 )
+from .review_phase_utils import is_grading_complete
 
 logger = get_logger("abstract_utils")
 
@@ -87,10 +88,15 @@ def list_abstracts(
     filters: Optional[Sequence] = None,
     eager: bool = False,
     order_by=None,
+    limit: Optional[int] = None,
+    offset: Optional[int] = None,
+    query_options: Optional[Sequence] = None,
     actor_id: Optional[str] = None,
     context: Optional[Dict[str, object]] = None,
+    use_replica: bool = False,
 ) -> Sequence[Abstracts]:
-    options = (
+    # Explicit options (e.g. from app.utils.sparse_fields) replace ``eager``.
+    options = query_options if query_options is not None else (
         [
             joinedload(Abstracts.authors),
             joinedload(Abstracts.verifiers),
@@ -102,16 +108,21 @@ def list_abstracts(
     ctx = {
         "function": "list_abstracts",
         "eager": eager,
+        "limit": limit,
+        "offset": offset,
         **(context or {}),
     }
     abstracts = list_instances(
         Abstracts,
         filters=filters,
         order_by=order_by,
+        limit=limit,
+        offset=offset,
         query_options=options,
         actor_id=actor_id,
         event_name="abstract.list",
         context=ctx,
+        use_replica=use_replica,
     )
     with log_context(module="abstract_utils", action="list_abstracts", actor_id=actor_id):
         logger.info("list_abstracts complete eager=%s count=%s", eager, len(abstracts))
@@ -516,43 +527,13 @@ def get_current_phase_verifiers(abstract: Abstracts) -> Sequence[User]:
         return []
 
 
-def can_advance_to_next_phase(abstract: Abstracts,actor_id) -> bool:
-    """Check if an abstract can advance to the next review phase based on grading completeness"""
-    from app.models.Cycle import AbstractVerifiers, Grading, GradingType
-    current_phase = abstract.review_phase
-    
-    # Get all verifiers assigned to the current phase
-    verifier_assignments = AbstractVerifiers.query.filter_by(
-        abstract_id=abstract.id,
-        review_phase=current_phase
-    ).all()
-    
-    if not verifier_assignments:
-        # If no verifiers are assigned to this phase, we can advance
-        return True
-    
-    # Get all grading types for abstracts
-    grading_types = GradingType.query.filter_by(grading_for='abstract').all()
-    
-    # For each verifier in the current phase, check if they have submitted grades
-    for assignment in verifier_assignments:
-        verifier_id = assignment.user_id
+def can_advance_to_next_phase(abstract: Abstracts, actor_id=None) -> bool:
+    """Check if an abstract can advance to the next review phase based on grading completeness.
 
-        # Check if all required grading types have been graded by this verifier in this phase
-        for grading_type in grading_types:
-            grade_exists = Grading.query.filter_by(
-                abstract_id=abstract.id,
-                grading_type_id=grading_type.id,
-                graded_by_id=verifier_id,
-                review_phase=current_phase
-            ).first()
-            
-            if not grade_exists:
-                # Not all grades have been submitted by all verifiers for this phase
-                return False
-    
-    # If all verifiers have submitted all required grades for this phase, we can advance
-    return True
+    One anti-join over the current phase's verifier assignments and grading
+    types; a phase without assigned verifiers counts as complete.
+    """
+    return is_grading_complete(GradingFor.ABSTRACT, abstract)
 
 
 def submit_abstract_for_review(abstract: Abstracts, actor_id: Optional[str] = None) -> Abstracts:
@@ -6,7 +6,7 @@ from typing import Dict, Optional, Sequence
 from sqlalchemy.orm import joinedload
 
 from app.extensions import db
-from app.models.Cycle import Awards
+from app.models.Cycle import Awards, GradingFor
 from app.models.User import User
 from app.security_utils import audit_log
 from app.utils.logging_utils import get_logger, log_context
@@ -20,6 +20,7 @@ from .base import (
     list_instances,
     update_instance,
 )
+from .review_phase_utils import is_grading_complete
 
 logger = get_logger("award_utils")
 
@@ -89,10 +90,13 @@ def list_awards(
     order_by=None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
+    query_options: Optional[Sequence] = None,
     actor_id: Optional[str] = None,
     context: Optional[Dict[str, object]] = None,
+    use_replica: bool = False,
 ) -> Sequence[Awards]:
-    options = (
+    # Explicit options (e.g. from app.utils.sparse_fields) replace ``eager``.
+    options = query_options if query_options is not None else (
         [
             joinedload(Awards.author),
             joinedload(Awards.verifiers),
@@ -118,6 +122,7 @@ def list_awards(
         actor_id=actor_id,
         event_name="award.list",
         context=ctx,
+        use_replica=use_replica,
     )
     with log_context(module="award_utils", action="list_awards", actor_id=actor_id):
         logger.info("list_awards complete eager=%s count=%s", eager, len(awards))
@@ -349,38 +354,10 @@ def remove_coordinator(
     return award
 
 
-def can_advance_to_next_phase(award: Awards, actor_id) -> bool:
-    """Check if an award can advance to the next review phase based on grading completeness"""
-    from app.models.Cycle import AwardVerifiers, Grading, GradingType
-    current_phase = award.review_phase
-    
-    # Get all verifiers assigned to the current phase
-    verifier_assignments = AwardVerifiers.query.filter_by(
-        award_id=award.id,
-        review_phase=current_phase
-    ).all()
-    
-    if not verifier_assignments:
-        # If no verifiers are assigned to this phase, we can advance
-        return True
-    
-    # Get all grading types for awards
-    grading_types = GradingType.query.filter_by(grading_for='award').all()
-    
-    # For each verifier in the current phase, check if they have submitted grades
-    for assignment in verifier_assignments:
-        verifier_id = assignment.user_id
-        # Check if all required grading types have been graded by this verifier in this phase
-        for grading_type in grading_types:
-            grade_exists = Grading.query.filter_by(
-                award_id=award.id,
-                grading_type_id=grading_type.id,
-                graded_by_id=verifier_id,
-                review_phase=current_phase
-            ).first()
-            
-            if not grade_exists:
-                return False
-    
-    # If all verifiers have submitted all required grades for this phase, we can advance
-    return True
\ No newline at end of file
+def can_advance_to_next_phase(award: Awards, actor_id=None) -> bool:
+    """Check if an award can advance to the next review phase based on grading completeness.
+
+    One anti-join over the current phase's verifier assignments and grading
+    types; a phase without assigned verifiers counts as complete.
+    """
+    return is_grading_complete(GradingFor.AWARD, award)
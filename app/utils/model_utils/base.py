@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 import json
+import logging
+from contextlib import nullcontext
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Type, TypeVar, Union
 
 from sqlalchemy.orm import Query
 
-from app.extensions import db
+from app.extensions import db, replica_reads
 from app.security_utils import audit_log
-from app.utils.logging_utils import get_logger, log_context
+from app.utils.logging_utils import LazySQL, get_logger, log_context
 
 ModelType = TypeVar("ModelType", bound=db.Model)
 
@@ -112,12 +114,13 @@ def create_instance(
                     },
                 )
 
-            logger.info(
-                "Created %s target_id=%s commit=%s",
-                model_cls.__name__,
-                _instance_identity(instance),
-                commit,
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Created %s target_id=%s commit=%s",
+                    model_cls.__name__,
+                    _instance_identity(instance),
+                    commit,
+                )
             return instance
         except Exception:
             logger.exception("Failed to create %s attributes=%s", model_cls.__name__, sanitized_attrs)
@@ -171,9 +174,13 @@ def list_instances(
     actor_id: Optional[str] = None,
     event_name: Optional[str] = None,
     context: Optional[Dict[str, Any]] = None,
+    use_replica: bool = False,
 ) -> List[ModelType]:
     """
     List model instances subject to optional filters, ordering, and paging.
+
+    ``use_replica`` routes the read to the replica bind when one is configured
+    and the session has not written recently.
     """
 
     logger = get_logger("model_utils")
@@ -184,7 +191,7 @@ def list_instances(
             "Listing info %s\n filters=%s\n order=%s\n limit=%s\n offset=%s\n options=%s",
             model_cls.__name__,
             filter_desc,
-            str(order_by),
+            order_by,
             limit,
             offset,
             len(query_options or []),
@@ -211,13 +218,12 @@ def list_instances(
 
         if limit is not None:
             query = query.limit(limit)
-        from sqlalchemy.dialects import postgresql
-
-        logger.info("Executing list query for %s", query.statement.compile(
-            dialect=postgresql.dialect(),
-            compile_kwargs={"literal_binds": True}
-        ))
-        results = list(query)
+        # Rendering SQL with literal binds is expensive; only do it when the
+        # DEBUG line will actually be written.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Executing list query for %s", LazySQL(query))
+        with (replica_reads() if use_replica else nullcontext()):
+            results = list(query)
         logger.info("Listed %s count=%s", model_cls.__name__, len(results))
         _emit_audit(
             action,
@@ -253,17 +259,19 @@ def update_instance(
     logger = get_logger("model_utils")
     model_name = instance.__class__.__name__
     action = event_name or f"{model_name.lower()}.update"
-    before = {key: _serialize_value(getattr(instance, key, None)) for key in attributes}
+    # The "before" snapshot only feeds the audit record written on commit.
+    before = {key: _serialize_value(getattr(instance, key, None)) for key in attributes} if commit else {}
     sanitized_attrs = _sanitize_payload(attributes)
     with log_context(**_build_context(model_name, "update", actor_id, context)):
-        logger.info(
-            "Updating %s target_id=%s attributes=%s commit=%s flush=%s",
-            model_name,
-            _instance_identity(instance),
-            sanitized_attrs,
-            commit,
-            flush,
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Updating %s target_id=%s attributes=%s commit=%s flush=%s",
+                model_name,
+                _instance_identity(instance),
+                sanitized_attrs,
+                commit,
+                flush,
+            )
         try:
             for key, value in attributes.items():
                 setattr(instance, key, value)
@@ -285,12 +293,13 @@ def update_instance(
                     },
                 )
 
-            logger.info(
-                "Updated %s target_id=%s commit=%s",
-                model_name,
-                _instance_identity(instance),
-                commit,
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Updated %s target_id=%s commit=%s",
+                    model_name,
+                    _instance_identity(instance),
+                    commit,
+                )
             return instance
         except Exception:
             logger.exception(
@@ -338,10 +347,11 @@ def delete_instance(
                 return
 
             identity = _instance_identity(instance)
+            # Column snapshot is only needed for the audit record on commit.
             snapshot = {
                 column.key: _serialize_value(getattr(instance, column.key, None))
                 for column in instance.__table__.columns  # type: ignore[attr-defined]
-            } if hasattr(instance, "__table__") else {}
+            } if commit and hasattr(instance, "__table__") else {}
 
             logger.info("Deleting %s target_id=%s", model_cls.__name__, identity)
             db.session.delete(instance)
@@ -6,7 +6,7 @@ from typing import Dict, Optional, Sequence
 from sqlalchemy.orm import joinedload
 
 from app.extensions import db
-from app.models.Cycle import BestPaper
+from app.models.Cycle import BestPaper, GradingFor
 from app.models.User import User
 from app.security_utils import audit_log
 from app.utils.logging_utils import get_logger, log_context
@@ -20,6 +20,7 @@ from .base import (
     list_instances,
     update_instance,
 )
+from .review_phase_utils import is_grading_complete
 
 logger = get_logger("best_paper_utils")
 
@@ -92,10 +93,13 @@ def list_best_papers(
     order_by=None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
+    query_options: Optional[Sequence] = None,
     actor_id: Optional[str] = None,
     context: Optional[Dict[str, object]] = None,
+    use_replica: bool = False,
 ) -> Sequence[BestPaper]:
-    options = (
+    # Explicit options (e.g. from app.utils.sparse_fields) replace ``eager``.
+    options = query_options if query_options is not None else (
         [
             joinedload(BestPaper.author),
             joinedload(BestPaper.verifiers),
@@ -121,6 +125,7 @@ def list_best_papers(
         actor_id=actor_id,
         event_name="best_paper.list",
         context=ctx,
+        use_replica=use_replica,
     )
     with log_context(module="best_paper_utils", action="list_best_papers", actor_id=actor_id):
         logger.info("list_best_papers complete eager=%s count=%s", eager, len(best_papers))
@@ -356,39 +361,10 @@ def remove_coordinator(
     return best_paper
 
 
-def can_advance_to_next_phase(best_paper: BestPaper, actor_id) -> bool:
-    """Check if an award can advance to the next review phase based on grading completeness"""
-    from app.models.Cycle import BestPaperVerifiers, Grading, GradingType
-    current_phase = best_paper.review_phase
+def can_advance_to_next_phase(best_paper: BestPaper, actor_id=None) -> bool:
+    """Check if a best paper can advance to the next review phase based on grading completeness.
 
-    # Get all verifiers assigned to the current phase
-    verifier_assignments = BestPaperVerifiers.query.filter_by(
-        best_paper_id=best_paper.id,
-        review_phase=current_phase
-    ).all()
-
-    if not verifier_assignments:
-        # If no verifiers are assigned to this phase, we can advance
-        return True
-
-    # Get all grading types for awards
-    grading_types = GradingType.query.filter_by(grading_for='best_paper').all()
-
-    # For each verifier in the current phase, check if they have submitted grades
-    for assignment in verifier_assignments:
-        verifier_id = assignment.user_id
-
-        # Check if all required grading types have been graded by this verifier in this phase
-        for grading_type in grading_types:
-            grade_exists = Grading.query.filter_by(
-                best_paper_id=best_paper.id,
-                grading_type_id=grading_type.id,
-                graded_by_id=verifier_id,
-                review_phase=current_phase
-            ).first()
-
-            if not grade_exists:
-                return False
-
-    # If all verifiers have submitted all required grades for this phase, we can advance
-    return True
+    One anti-join over the current phase's verifier assignments and grading
+    types; a phase without assigned verifiers counts as complete.
+    """
+    return is_grading_complete(GradingFor.BEST_PAPER, best_paper)
@@ -216,12 +216,7 @@ def list_windows(
     if phase is not None:
         filters.append(CycleWindow.phase == phase)
     if reference_date is not None:
-        filters.extend(
-            (
-                CycleWindow.start_date <= reference_date,
-                CycleWindow.end_date >= reference_date,
-            )
-        )
+        filters.append(CycleWindow.open_on(reference_date))
     results = list_instances(
         CycleWindow,
         filters=filters,
@@ -262,8 +257,7 @@ def getActiveCycleForSubmission(
         .join(CycleWindow, CycleWindow.cycle_id == Cycle.id)
         .filter(
             CycleWindow.phase == CyclePhase.SUBMISSION,
-            CycleWindow.start_date <= reference_date,
-            CycleWindow.end_date >= reference_date,
+            CycleWindow.open_on(reference_date),
         )
         .order_by(CycleWindow.start_date.asc(), Cycle.name.asc())
     )
@@ -308,8 +302,7 @@ def list_active_cycles_by_phase(
         .join(CycleWindow, CycleWindow.cycle_id == Cycle.id)
         .filter(
             CycleWindow.phase == phase,
-            CycleWindow.start_date <= reference_date,
-            CycleWindow.end_date >= reference_date,
+            CycleWindow.open_on(reference_date),
         )
         .order_by(CycleWindow.start_date.asc())
     )
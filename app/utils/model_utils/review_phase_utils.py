@@ -0,0 +1,221 @@
+"""Set-based grading completeness and phase advancement.
+
+A submission may leave its current review phase once every verifier assigned
+to that phase has graded every grading type of the submission's kind. The
+helpers here answer that question for one or many submissions with a single
+anti-join::
+
+    verifier assignments (current phase) x grading types
+    WHERE NOT EXISTS (matching grade)
+
+instead of one ``Grading`` lookup per (verifier, grading type) pair.
+"""
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Set
+
+from sqlalchemy import and_, exists, select, update
+from sqlalchemy.orm import aliased
+
+from app.extensions import db
+from app.models.Cycle import (
+    AbstractVerifiers,
+    Abstracts,
+    AwardVerifiers,
+    Awards,
+    BestPaper,
+    BestPaperVerifiers,
+    Grading,
+    GradingFor,
+    GradingType,
+)
+from app.models.SubmissionCounter import COUNTED_MODELS, apply_counter_moves
+from app.models.enumerations import Status
+from app.utils.logging_utils import get_logger, log_context
+
+logger = get_logger("review_phase_utils")
+
+
+class _Target(NamedTuple):
+    model: type
+    link: type
+    fk: str  # submission FK name on both the verifier link and Grading
+
+
+TARGETS: Dict[GradingFor, _Target] = {
+    GradingFor.ABSTRACT: _Target(Abstracts, AbstractVerifiers, "abstract_id"),
+    GradingFor.AWARD: _Target(Awards, AwardVerifiers, "award_id"),
+    GradingFor.BEST_PAPER: _Target(BestPaper, BestPaperVerifiers, "best_paper_id"),
+}
+
+ADVANCEABLE_STATUSES = (Status.UNDER_REVIEW,)
+
+
+class MissingGrade(NamedTuple):
+    submission_id: object
+    verifier_id: object
+    grading_type_id: object
+
+
+def _target(grading_for) -> _Target:
+    return TARGETS[GradingFor(grading_for)]
+
+
+def _missing_grades_select(grading_for, submission_filters: Sequence = ()):
+    """(submission, verifier, grading type) triples still lacking a grade."""
+    grading_for = GradingFor(grading_for)
+    target = _target(grading_for)
+    model, link = target.model, target.link
+    link_fk = getattr(link, target.fk)
+    grade_fk = getattr(Grading, target.fk)
+    graded = exists().where(
+        grade_fk == link_fk,
+        Grading.grading_type_id == GradingType.id,
+        Grading.graded_by_id == link.user_id,
+        Grading.review_phase == model.review_phase,
+    )
+    return (
+        select(
+            link_fk.label("submission_id"),
+            link.user_id.label("verifier_id"),
+            GradingType.id.label("grading_type_id"),
+        )
+        .select_from(link)
+        .join(model, and_(model.id == link_fk, link.review_phase == model.review_phase))
+        .join(GradingType, GradingType.grading_for == grading_for)
+        .where(~graded, *submission_filters)
+    )
+
+
+def _submission_filters(model, submission_ids, cycle_id) -> List:
+    filters = []
+    if submission_ids is not None:
+        filters.append(model.id.in_(list(submission_ids)))
+    if cycle_id is not None:
+        filters.append(model.cycle_id == cycle_id)
+    return filters
+
+
+def missing_grades(
+    grading_for,
+    submission_ids: Optional[Iterable] = None,
+    *,
+    cycle_id=None,
+) -> List[MissingGrade]:
+    """Every missing (submission, verifier, grading type) triple, in one query."""
+    model = _target(grading_for).model
+    stmt = _missing_grades_select(grading_for, _submission_filters(model, submission_ids, cycle_id))
+    return [MissingGrade(*row) for row in db.session.execute(stmt)]
+
+
+def incomplete_submission_ids(
+    grading_for,
+    submission_ids: Optional[Iterable] = None,
+    *,
+    cycle_id=None,
+) -> Set:
+    """IDs of submissions whose current phase still has missing grades."""
+    model = _target(grading_for).model
+    inner = _missing_grades_select(grading_for, _submission_filters(model, submission_ids, cycle_id)).subquery()
+    return set(db.session.scalars(select(inner.c.submission_id).distinct()))
+
+
+def is_grading_complete(grading_for, submission) -> bool:
+    """True when the submission's current phase has no missing grades.
+
+    A phase without verifier assignments counts as complete.
+    """
+    model = _target(grading_for).model
+    stmt = _missing_grades_select(grading_for, [model.id == submission.id]).limit(1)
+    return db.session.execute(stmt).first() is None
+
+
+def eligible_for_advance_select(
+    grading_for,
+    *,
+    submission_ids: Optional[Iterable] = None,
+    cycle_id=None,
+    statuses: Sequence[Status] = ADVANCEABLE_STATUSES,
+    require_assignments: bool = True,
+):
+    """SELECT of submission IDs that may move to their next review phase."""
+    target = _target(grading_for)
+    model, link = target.model, target.link
+    sub = aliased(model, name="candidate")
+    missing = _missing_grades_select(grading_for, [model.id == sub.id])
+    filters = _submission_filters(sub, submission_ids, cycle_id)
+    filters.append(sub.status.in_(list(statuses)))
+    filters.append(~missing.exists())
+    if require_assignments:
+        filters.append(exists().where(
+            getattr(link, target.fk) == sub.id,
+            link.review_phase == sub.review_phase,
+        ))
+    return select(sub.id).where(*filters)
+
+
+def advance_eligible_submissions(
+    grading_for,
+    *,
+    cycle_id=None,
+    submission_ids: Optional[Iterable] = None,
+    statuses: Sequence[Status] = ADVANCEABLE_STATUSES,
+    require_assignments: bool = True,
+    actor_id: Optional[str] = None,
+    commit: bool = True,
+) -> List:
+    """Move every eligible submission to its next phase in one transaction.
+
+    Eligible means: in ``statuses``, matching the cycle / id filter, with no
+    missing grades for the current phase and (by default) at least one
+    verifier assigned to it. Eligible rows are locked, advanced with a single
+    UPDATE, and the submission counters are adjusted per bucket. Returns the
+    advanced submission IDs.
+    """
+    grading_for = GradingFor(grading_for)
+    model = _target(grading_for).model
+    category_col = getattr(model, COUNTED_MODELS[grading_for][1])
+    eligible = eligible_for_advance_select(
+        grading_for,
+        submission_ids=submission_ids,
+        cycle_id=cycle_id,
+        statuses=statuses,
+        require_assignments=require_assignments,
+    )
+    session = db.session
+    with log_context(module="review_phase_utils", action="advance_eligible_submissions", actor_id=actor_id):
+        locked = select(model.id, model.cycle_id, category_col, model.status, model.review_phase).where(
+            model.id.in_(eligible.scalar_subquery())
+        )
+        if session.get_bind().dialect.name == "postgresql":
+            locked = locked.with_for_update(of=model)
+        rows = session.execute(locked).all()
+        if not rows:
+            logger.info("advance_eligible_submissions nothing to advance grading_for=%s", grading_for.value)
+            return []
+
+        ids = [row[0] for row in rows]
+        session.execute(
+            update(model)
+            .where(model.id.in_(ids))
+            .values(review_phase=model.review_phase + 1, status=Status.UNDER_REVIEW)
+            .execution_options(synchronize_session=False)
+        )
+        apply_counter_moves(
+            session.connection(),
+            grading_for,
+            ((row[1], row[2], row[3], row[4], Status.UNDER_REVIEW, row[4] + 1) for row in rows),
+        )
+        # Objects already loaded in this session must not keep the old phase.
+        advanced = set(ids)
+        for instance in list(session.identity_map.values()):
+            if isinstance(instance, model) and instance.id in advanced:
+                session.expire(instance, ["review_phase", "status"])
+        if commit:
+            session.commit()
+        logger.info(
+            "advance_eligible_submissions complete grading_for=%s advanced=%s",
+            grading_for.value,
+            len(ids),
+        )
+    return ids
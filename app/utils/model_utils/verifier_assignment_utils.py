@@ -0,0 +1,274 @@
+"""Set-based verifier assignment for abstracts, awards and best papers.
+
+Assigning V verifiers to S submissions is one ``INSERT ... SELECT ... ON
+CONFLICT DO NOTHING RETURNING`` over (submissions x users); the statement
+copies each submission's current review phase and resolves its cycle's
+verification window itself, so no row is loaded into Python. Unassigning is a
+single ``DELETE ... RETURNING``. Both report which pairs actually changed.
+"""
+from __future__ import annotations
+
+from datetime import date
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from sqlalchemy import case, delete, exists, func, insert, literal, select
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app.extensions import db
+from app.models.Cycle import CycleWindow, GradingFor
+from app.models.User import User, UserRole
+from app.models.enumerations import CyclePhase, Role
+from app.services.submission_status_service import invalidate_status_summaries
+from app.utils.logging_utils import get_logger, log_context
+
+from .review_phase_utils import TARGETS
+
+logger = get_logger("verifier_assignment_utils")
+
+VERIFICATION_PHASES: Dict[GradingFor, CyclePhase] = {
+    GradingFor.ABSTRACT: CyclePhase.ABSTRACT_VERIFICATION,
+    GradingFor.AWARD: CyclePhase.AWARD_VERIFICATION,
+    GradingFor.BEST_PAPER: CyclePhase.BEST_PAPER_VERIFICATION,
+}
+
+
+class AssignmentResult(NamedTuple):
+    requested: int
+    changed: List[Tuple[object, object]]  # (submission_id, user_id)
+
+    @property
+    def changed_count(self) -> int:
+        return len(self.changed)
+
+    @property
+    def skipped_count(self) -> int:
+        return self.requested - len(self.changed)
+
+
+class TargetCheck(NamedTuple):
+    missing_submissions: List[str]
+    missing_users: List[str]
+    non_verifiers: List[str]
+
+
+def check_assignment_targets(grading_for, submission_ids: Sequence, user_ids: Sequence) -> TargetCheck:
+    """Report unknown submissions, unknown users and non-verifiers (two queries)."""
+    model = TARGETS[GradingFor(grading_for)].model
+    found_submissions = {str(i) for i in db.session.scalars(select(model.id).where(model.id.in_(submission_ids)))}
+    is_verifier = exists().where(UserRole.user_id == User.id, UserRole.role == Role.VERIFIER)
+    users = dict(db.session.execute(select(User.id, is_verifier).where(User.id.in_(user_ids))).all())
+    found_users = {str(i): flag for i, flag in users.items()}
+    return TargetCheck(
+        missing_submissions=[str(i) for i in submission_ids if str(i) not in found_submissions],
+        missing_users=[str(i) for i in user_ids if str(i) not in found_users],
+        non_verifiers=[str(i) for i in user_ids if found_users.get(str(i)) is False],
+    )
+
+
+def verifier_counts(grading_for, submission_ids: Iterable) -> Dict[object, int]:
+    """Assigned verifiers per submission (one grouped query); absent IDs have none."""
+    _, link, fk = TARGETS[GradingFor(grading_for)]
+    submission_ids = list(submission_ids)
+    if not submission_ids:
+        return {}
+    column = getattr(link, fk)
+    return dict(db.session.execute(
+        select(column, func.count()).where(column.in_(submission_ids)).group_by(column)
+    ).all())
+
+
+def _window_select(grading_for: GradingFor, cycle_id, on_date: date):
+    """Open verification window for a cycle, preferring the kind-specific phase."""
+    specific = VERIFICATION_PHASES[grading_for]
+    return (
+        select(CycleWindow.id)
+        .where(
+            CycleWindow.cycle_id == cycle_id,
+            CycleWindow.phase.in_([specific, CyclePhase.VERIFICATION]),
+            CycleWindow.open_on(on_date),
+        )
+        .order_by(case((CycleWindow.phase == specific, 0), else_=1), CycleWindow.start_date.desc())
+        .limit(1)
+    )
+
+
+def _window_subquery(grading_for: GradingFor, model, on_date: date):
+    """Correlated lookup of the open verification window for the submission's cycle."""
+    return _window_select(grading_for, model.cycle_id, on_date).scalar_subquery()
+
+
+def open_verification_window_id(grading_for, cycle_id, on_date: Optional[date] = None):
+    """ID of the verification window open on ``on_date`` (today), or None."""
+    stmt = _window_select(GradingFor(grading_for), cycle_id, on_date or date.today())
+    return db.session.scalar(stmt)
+
+
+def insert_assignments(
+    grading_for,
+    rows: Iterable[Tuple[object, object, int, object]],
+    *,
+    actor_id: Optional[str] = None,
+    commit: bool = True,
+) -> AssignmentResult:
+    """Insert precomputed ``(submission_id, user_id, review_phase, cycle_window_id)`` rows.
+
+    One multi-row ``INSERT ... ON CONFLICT DO NOTHING RETURNING``; pairs that
+    already exist are counted as skipped.
+    """
+    grading_for = GradingFor(grading_for)
+    target = TARGETS[grading_for]
+    link = target.link
+    link_fk = getattr(link, target.fk)
+    values = [
+        {target.fk: submission_id, "user_id": user_id, "review_phase": phase, "cycle_window_id": window_id}
+        for submission_id, user_id, phase, window_id in rows
+    ]
+    if not values:
+        return AssignmentResult(0, [])
+    session = db.session
+    dialect = session.get_bind().dialect.name
+    with log_context(module="verifier_assignment_utils", action="insert_assignments", actor_id=actor_id):
+        if dialect in ("postgresql", "sqlite"):
+            insert_fn = postgresql.insert if dialect == "postgresql" else sqlite.insert
+            stmt = insert_fn(link).values(values).on_conflict_do_nothing()
+            created = [tuple(row) for row in session.execute(stmt.returning(link_fk, link.user_id))]
+        else:
+            wanted = {(row[target.fk], row["user_id"]) for row in values}
+            taken = set(session.execute(
+                select(link_fk, link.user_id).where(link_fk.in_({pair[0] for pair in wanted}))
+            ).all())
+            fresh = [row for row in values if (row[target.fk], row["user_id"]) not in taken]
+            if fresh:
+                session.execute(insert(link), fresh)
+            created = [(row[target.fk], row["user_id"]) for row in fresh]
+        if commit:
+            session.commit()
+        invalidate_status_summaries(grading_for.value)
+        logger.info(
+            "insert_assignments grading_for=%s requested=%s created=%s",
+            grading_for.value,
+            len(values),
+            len(created),
+        )
+    return AssignmentResult(len(values), created)
+
+
+def bulk_assign_verifiers(
+    grading_for,
+    submission_ids: Iterable,
+    user_ids: Iterable,
+    *,
+    review_phase: Optional[int] = None,
+    cycle_window_id=None,
+    on_date: Optional[date] = None,
+    actor_id: Optional[str] = None,
+    commit: bool = True,
+) -> AssignmentResult:
+    """Create every missing (submission, verifier) assignment in one statement.
+
+    ``review_phase`` defaults to each submission's current phase and
+    ``cycle_window_id`` to the verification window of its cycle that is open
+    on ``on_date`` (today). Existing pairs are left untouched and counted as
+    skipped; unknown submission or user IDs simply produce no rows.
+    """
+    grading_for = GradingFor(grading_for)
+    target = TARGETS[grading_for]
+    model, link = target.model, target.link
+    submission_ids = list(dict.fromkeys(submission_ids))
+    user_ids = list(dict.fromkeys(user_ids))
+    if not submission_ids or not user_ids:
+        return AssignmentResult(0, [])
+
+    link_fk = getattr(link, target.fk)
+    phase = model.review_phase if review_phase is None else literal(review_phase)
+    window = (
+        _window_subquery(grading_for, model, on_date or date.today())
+        if cycle_window_id is None
+        else literal(cycle_window_id, CycleWindow.id.type)
+    )
+    pairs = (
+        select(
+            model.id,
+            User.id,
+            phase,
+            window,
+            func.current_timestamp(),
+        )
+        .select_from(model)
+        .join(User, User.id.in_(user_ids))
+        .where(model.id.in_(submission_ids))
+    )
+    columns = [target.fk, "user_id", "review_phase", "cycle_window_id", "assigned_at"]
+    session = db.session
+    dialect = session.get_bind().dialect.name
+    with log_context(module="verifier_assignment_utils", action="bulk_assign_verifiers", actor_id=actor_id):
+        if dialect in ("postgresql", "sqlite"):
+            insert_fn = postgresql.insert if dialect == "postgresql" else sqlite.insert
+            stmt = insert_fn(link).from_select(columns, pairs).on_conflict_do_nothing()
+        else:
+            taken = exists().where(link_fk == model.id, link.user_id == User.id)
+            stmt = insert(link).from_select(columns, pairs.where(~taken))
+        created = [tuple(row) for row in session.execute(stmt.returning(link_fk, link.user_id))]
+        requested = session.execute(
+            select(func.count()).select_from(pairs.with_only_columns(model.id, User.id).subquery())
+        ).scalar_one()
+        if commit:
+            session.commit()
+        invalidate_status_summaries(grading_for.value)
+        logger.info(
+            "bulk_assign_verifiers grading_for=%s requested=%s created=%s",
+            grading_for.value,
+            requested,
+            len(created),
+        )
+    return AssignmentResult(requested, created)
+
+
+def bulk_unassign_verifiers(
+    grading_for,
+    submission_ids: Iterable,
+    user_ids: Iterable,
+    *,
+    review_phase: Optional[int] = None,
+    actor_id: Optional[str] = None,
+    commit: bool = True,
+) -> AssignmentResult:
+    """Delete every matching assignment with one ``DELETE ... RETURNING``."""
+    grading_for = GradingFor(grading_for)
+    target = TARGETS[grading_for]
+    link = target.link
+    link_fk = getattr(link, target.fk)
+    submission_ids = list(dict.fromkeys(submission_ids))
+    user_ids = list(dict.fromkeys(user_ids))
+    if not submission_ids or not user_ids:
+        return AssignmentResult(0, [])
+
+    filters = [link_fk.in_(submission_ids), link.user_id.in_(user_ids)]
+    if review_phase is not None:
+        filters.append(link.review_phase == review_phase)
+    session = db.session
+    with log_context(module="verifier_assignment_utils", action="bulk_unassign_verifiers", actor_id=actor_id):
+        removed = [
+            tuple(row)
+            for row in session.execute(
+                delete(link)
+                .where(*filters)
+                .returning(link_fk, link.user_id)
+                .execution_options(synchronize_session=False)
+            )
+        ]
+        # Loaded submissions must not keep serving the old verifier lists.
+        touched = {row[0] for row in removed}
+        for instance in list(session.identity_map.values()):
+            if isinstance(instance, target.model) and instance.id in touched:
+                session.expire(instance, ["verifiers"])
+        if commit:
+            session.commit()
+        invalidate_status_summaries(grading_for.value)
+        logger.info(
+            "bulk_unassign_verifiers grading_for=%s requested=%s removed=%s",
+            grading_for.value,
+            len(submission_ids) * len(user_ids),
+            len(removed),
+        )
+    return AssignmentResult(len(submission_ids) * len(user_ids), removed)
@@ -0,0 +1,61 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, NamedTuple, Optional
+
+from flask import current_app
+
+from .mail import send_mail
+from .sms import send_sms
+
+
+class Notification(NamedTuple):
+    email: Optional[str]
+    mobile: Optional[str]
+    subject: str
+    body: str
+    sms: Optional[str] = None
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_pid: Optional[int] = None
+_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """One delivery thread per process (recreated after a gunicorn fork)."""
+    global _executor, _executor_pid
+    with _lock:
+        if _executor is None or _executor_pid != os.getpid():
+            _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="notify")
+            _executor_pid = os.getpid()
+        return _executor
+
+
+def _deliver(app, notifications) -> None:
+    with app.app_context():
+        for note in notifications:
+            try:
+                if note.email:
+                    send_mail(note.email, note.subject, note.body)
+                if note.mobile and note.sms:
+                    send_sms(note.mobile, note.sms)
+            except Exception:
+                app.logger.exception("notify_queue: delivery failed email=%s", note.email)
+
+
+def enqueue_notifications(notifications: Iterable[Notification]):
+    """Send mail/SMS off the request thread.
+
+    Bulk operations touch hundreds of owners; delivering inline would hold the
+    request (and its DB transaction) for the duration of every upstream call.
+    With ``NOTIFY_ASYNC`` disabled the batch is delivered inline.
+    """
+    batch = list(notifications)
+    if not batch:
+        return None
+    app = current_app._get_current_object()
+    if not app.config.get("NOTIFY_ASYNC", True):
+        _deliver(app, batch)
+        return None
+    return _get_executor().submit(_deliver, app, batch)
@@ -0,0 +1,175 @@
+"""Sparse fieldsets (``fields=`` / ``include=``) for the research list endpoints.
+
+List responses used to dump every nested relation: full users for creator,
+updater, verifiers and coordinators, plus every grade. A client can now name
+the shape it needs, and both halves of the work follow from that shape:
+
+* the serializer is the endpoint's schema narrowed with marshmallow ``only``;
+* the loader options come from the same narrowed schema. Each relation it
+  still dumps is ``selectinload``-ed, chained through nested schemas.
+  Requested top-level columns, plus the keys those relations need, are
+  loaded with ``load_only``.
+
+Unrequested relations are therefore neither loaded nor serialised.
+
+Contract (comma-separated, both optional):
+
+* ``fields=id,title,verifiers.username``: top-level fields. Dotted names
+  narrow a nested relation, and naming a relation includes it.
+* ``include=category,grades``: relations to embed. With ``include`` alone,
+  every scalar field is returned plus just those relations.
+
+``id`` is always returned. Without either parameter the endpoint keeps its
+full, legacy shape, loaded the same way.
+"""
+from __future__ import annotations
+
+import threading
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from marshmallow import fields as ma_fields
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.orm import load_only, selectinload
+
+from app.models.Cycle import Grading
+
+MAX_DEPTH = 3
+MAX_CACHED_SCHEMAS = 256  # shapes come from clients; do not grow without bound
+
+# Method fields that are named after a relationship but served without it.
+_NOT_LOADED = {
+    (Grading, "grading_type"),  # app.utils.grading_type_cache
+}
+
+_schema_lock = threading.Lock()
+_schemas: Dict[tuple, object] = {}
+
+
+class FieldSet(NamedTuple):
+    schema: object                 # narrowed schema instance (many=True)
+    options: Tuple[object, ...]    # loader options for the listing query
+    extras: Optional[frozenset]    # route-computed keys requested; None: all
+
+
+def _split(value: Optional[str]) -> List[str]:
+    return [part.strip() for part in (value or "").split(",") if part.strip()]
+
+
+def _attribute(mapper, field_name: str, field):
+    """Mapper property behind a schema field, following synonyms; or None."""
+    key = field.attribute or field_name
+    seen = set()
+    while key in mapper.synonyms and key not in seen:
+        seen.add(key)
+        key = mapper.synonyms[key].name
+    return mapper.attrs.get(key) if key in mapper.attrs.keys() else None
+
+
+def _relationship(mapper, field_name: str, field):
+    prop = _attribute(mapper, field_name, field)
+    if prop is None or prop.key not in mapper.relationships.keys():
+        return None
+    if (mapper.class_, prop.key) in _NOT_LOADED:
+        return None
+    return prop
+
+
+def _nested_schema(field):
+    if isinstance(field, ma_fields.List):
+        field = field.inner
+    return field.schema if isinstance(field, ma_fields.Nested) else None
+
+
+def _loaders(schema, model, parent=None, depth: int = 0) -> List[object]:
+    """``selectinload`` chains for every relation ``schema`` will dump."""
+    mapper = sa_inspect(model)
+    options: List[object] = []
+    seen = set()
+    for name, field in schema.dump_fields.items():
+        prop = _relationship(mapper, name, field)
+        if prop is None or prop.key in seen:
+            continue
+        seen.add(prop.key)
+        attr = getattr(model, prop.key)
+        loader = parent.selectinload(attr) if parent is not None else selectinload(attr)
+        nested = _nested_schema(field)
+        children = (
+            _loaders(nested, prop.mapper.class_, loader, depth + 1)
+            if nested is not None and depth + 1 < MAX_DEPTH
+            else []
+        )
+        options.extend(children or [loader])
+    return options
+
+
+def _columns(schema, model) -> Optional[List[object]]:
+    """Columns the narrowed top-level dump reads; None when that is unknown."""
+    mapper = sa_inspect(model)
+    keys = {prop.key for prop in mapper.column_attrs if prop.columns[0].primary_key}
+    for name, field in schema.dump_fields.items():
+        prop = _attribute(mapper, name, field)
+        if prop is not None and prop.key in mapper.relationships.keys():
+            # Loaded relations and cache-served ones both need their keys.
+            keys.update(mapper.get_property_by_column(col).key for col in prop.local_columns)
+        elif prop is not None and prop.key in mapper.column_attrs.keys():
+            keys.add(prop.key)
+        else:
+            return None  # a property or method we cannot see through
+    return [getattr(model, key) for key in sorted(keys)]
+
+
+def _schema(schema_cls, only: Optional[Tuple[str, ...]]):
+    key = (schema_cls, only)
+    with _schema_lock:
+        cached = _schemas.get(key)
+    if cached is None:
+        cached = schema_cls(many=True, only=only)  # ValueError for unknown nested names
+        with _schema_lock:
+            if len(_schemas) < MAX_CACHED_SCHEMAS:
+                cached = _schemas.setdefault(key, cached)
+    return cached
+
+
+def parse_fieldset(schema_cls, args, *, extras: Iterable[str] = ()) -> FieldSet:
+    """Schema and loader options for the shape requested in ``args``.
+
+    ``extras`` are keys the route adds itself (e.g. ``verifiers_count``).
+    Raises ValueError for unknown names.
+    """
+    model = schema_cls.opts.model
+    mapper = sa_inspect(model)
+    extras = frozenset(extras)
+    requested, included = _split(args.get("fields")), _split(args.get("include"))
+    if not requested and not included:
+        schema = _schema(schema_cls, None)
+        return FieldSet(schema, tuple(_loaders(schema, model)), None)
+
+    full = _schema(schema_cls, None)
+    relations = {name for name, field in full.dump_fields.items() if _relationship(mapper, name, field) is not None}
+    unknown = [name for name in included if name not in relations]
+    unknown += [
+        name for name in requested
+        if (name.split(".")[0] not in full.dump_fields and name not in extras)
+        or ("." in name and name.split(".")[0] not in relations)
+    ]
+    if unknown:
+        raise ValueError(f"Unknown field(s): {', '.join(unknown)}")
+
+    if requested:
+        only = [name for name in requested if name not in extras]
+        wanted_extras = frozenset(name for name in requested if name in extras)
+    else:
+        only = [name for name in full.dump_fields if name not in relations]
+        wanted_extras = extras
+    only = tuple(sorted({"id", *only, *included}))
+    schema = _schema(schema_cls, only)
+    options = _loaders(schema, model)
+    columns = _columns(schema, model)
+    if columns is not None:
+        options.append(load_only(*columns))
+    return FieldSet(schema, tuple(options), wanted_extras)
+
+
+def wants(fieldset: FieldSet, key: str) -> bool:
+    """Whether the route should add its own ``key`` to each item."""
+    return fieldset.extras is None or key in fieldset.extras
@@ -0,0 +1,167 @@
+"""Version counter shared by the in-process reference caches.
+
+``app.utils.cycle_calendar``, ``app.utils.grading_type_cache`` and
+``app.services.reference_data_service`` each keep a per-worker copy of a
+rarely-changing table. They all use this class to decide when that copy is
+stale:
+
+* ORM writes flag the session (``mark_changed``). After that session
+  commits the version is bumped. With ``REDIS_URL`` the version lives in
+  Redis (``<name>:version``), so every worker reloads on its next lookup;
+  otherwise it is per process.
+* A rollback of a flagged session also bumps the version, because a reload
+  inside the rolled-back transaction may have seen its writes.
+* Callers can name the parts of the cache a write touched. Each part
+  records the version it last changed at (``<name>:parts`` in Redis), so a
+  cache can reload only those parts.
+* The version is read at most once per request and, outside requests, at
+  most once every ``recheck`` seconds, not on every lookup. A bump made
+  by this process is seen immediately.
+* ``max_age_config`` seconds bound how long a change made outside the ORM
+  can go unnoticed.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+from flask import current_app, g, has_app_context, has_request_context
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+_REDIS_RETRY_AFTER = 30.0
+_DEFAULT_MAX_AGE = 300.0
+_DEFAULT_RECHECK = 1.0
+
+Versions = Tuple[int, Dict[str, int]]
+
+
+class VersionedCache:
+    """Redis-or-local version counter with session-flag invalidation."""
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        max_age_config: str,
+        track_parts: bool = False,
+        recheck: float = _DEFAULT_RECHECK,
+    ):
+        self.name = name
+        self.max_age_config = max_age_config
+        self.track_parts = track_parts
+        self.recheck = recheck
+        self._version_key = f"{name}:version"
+        self._parts_key = f"{name}:parts"
+        self._session_key = f"{name}_changed"
+        self._lock = threading.Lock()
+        self._local: Versions = (0, {})           # used when Redis is unavailable
+        self._checked: Optional[Tuple[float, Versions]] = None
+        self._redis_down_until = 0.0
+        event.listen(Session, "after_commit", self._after_commit)
+        event.listen(Session, "after_soft_rollback", self._after_soft_rollback)
+
+    def _redis(self):
+        if time.time() < self._redis_down_until:
+            return None
+        try:
+            from app.security_utils import init_redis
+            return init_redis()
+        except Exception:
+            self._redis_failed()
+            return None
+
+    def _redis_failed(self) -> None:
+        self._redis_down_until = time.time() + _REDIS_RETRY_AFTER
+
+    def _read(self) -> Versions:
+        client = self._redis()
+        if client is not None:
+            try:
+                if not self.track_parts:
+                    return int(client.get(self._version_key) or 0), {}
+                pipe = client.pipeline()
+                pipe.get(self._version_key)
+                pipe.hgetall(self._parts_key)
+                raw_version, raw_parts = pipe.execute()
+                parts = {
+                    (part.decode() if isinstance(part, bytes) else part): int(value)
+                    for part, value in (raw_parts or {}).items()
+                }
+                return int(raw_version or 0), parts
+            except Exception:
+                self._redis_failed()
+        with self._lock:
+            return self._local[0], dict(self._local[1])
+
+    def _memo(self) -> Optional[dict]:
+        if not has_request_context():
+            return None
+        memo = getattr(g, "_cache_versions", None)
+        if memo is None:
+            memo = g._cache_versions = {}
+        return memo
+
+    def versions(self) -> Versions:
+        """``(version, {part: version it last changed at})``."""
+        memo = self._memo()
+        if memo is not None:
+            if self.name not in memo:
+                memo[self.name] = self._read()
+            return memo[self.name]
+        now = time.monotonic()
+        checked = self._checked
+        if checked is not None and now - checked[0] < self.recheck:
+            return checked[1]
+        current = self._read()
+        self._checked = (now, current)
+        return current
+
+    def version(self) -> int:
+        """Current version (shared across workers when Redis is available)."""
+        return self.versions()[0]
+
+    def invalidate(self, parts: Iterable[str] = ()) -> int:
+        """Bump the version (recording it on ``parts``); returns the new version."""
+        parts = list(parts)
+        with self._lock:
+            version = self._local[0] + 1
+            self._local = (version, {**self._local[1], **{part: version for part in parts}})
+        client = self._redis()
+        if client is not None:
+            try:
+                version = int(client.incr(self._version_key))
+                if parts:
+                    client.hset(self._parts_key, mapping={part: version for part in parts})
+            except Exception:
+                self._redis_failed()
+        self._checked = None
+        memo = self._memo()
+        if memo is not None:
+            memo.pop(self.name, None)
+        return version
+
+    def max_age(self) -> float:
+        if has_app_context():
+            return float(current_app.config.get(self.max_age_config, _DEFAULT_MAX_AGE))
+        return _DEFAULT_MAX_AGE
+
+    def expired(self, loaded_at: float) -> bool:
+        return time.time() - loaded_at >= self.max_age()
+
+    def mark_changed(self, session: Optional[Session], *parts: str) -> None:
+        """Record that ``session`` wrote cached data; the version bumps on commit."""
+        if session is not None:
+            session.info.setdefault(self._session_key, set()).update(parts)
+
+    def _after_commit(self, session) -> None:
+        parts = session.info.pop(self._session_key, None)
+        if parts is not None:
+            self.invalidate(parts)
+
+    def _after_soft_rollback(self, session, previous_transaction) -> None:
+        if not session.in_transaction():
+            parts = session.info.pop(self._session_key, None)
+            if parts is not None:
+                self.invalidate(parts)
@@ -0,0 +1,18 @@
+"""Gunicorn settings picked up automatically from the working directory.
+
+Command-line flags (e.g. ``-w 4`` in the Dockerfile) still take precedence.
+"""
+import os
+
+
+threads = int(os.getenv("GUNICORN_THREADS", "1"))
+
+
+def worker_exit(server, worker):
+    # Drain the async log queue and flush file handlers before the worker
+    # process goes away (atexit may not run on every exit path).
+    try:
+        from app.utils.logging_utils import shutdown_logger
+        shutdown_logger()
+    except Exception:
+        pass
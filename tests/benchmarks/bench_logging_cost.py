@@ -0,0 +1,88 @@
+"""Per-call cost of ``list_instances`` and of the log arguments around it.
+
+Run from the repository root:
+
+    python -m tests.benchmarks.bench_logging_cost
+
+Calls the real ``list_instances`` on a filtered, paged Abstracts list against
+a throwaway SQLite database, with the ``model_utils`` logger at WARNING (the
+production default) and at DEBUG. It then times the argument work on its own:
+
+- ``filter_desc``: ``str()`` of every filter clause. Still paid on every
+  call, because the audit record stores it.
+- ``sql render``: the literal-bind PostgreSQL compile that used to run on
+  every call and now only runs when the DEBUG line is written.
+
+The query itself and the audit commit dominate the totals; the saving at
+WARNING is the render cost, which the old code added on top of that total.
+At DEBUG the SQL is only rendered when some handler accepts DEBUG records.
+"""
+import logging
+import os
+import tempfile
+import timeit
+
+N = 500
+
+_tmp = tempfile.mkdtemp(prefix="bench_logging_cost_")
+os.environ.setdefault("LOGGING_BASE_DIR", _tmp)
+os.environ.setdefault("LOGGING_CONSOLE_ENABLED", "false")
+
+from flask import Flask  # noqa: E402
+
+from app.extensions import db  # noqa: E402
+from app.models.Cycle import Abstracts  # noqa: E402
+from app.models.enumerations import Status  # noqa: E402
+from app.utils.logging_utils import LazySQL, get_logger  # noqa: E402
+from app.utils.model_utils.base import list_instances  # noqa: E402
+
+
+def _filters():
+    return [
+        Abstracts.status.in_([Status.PENDING, Status.UNDER_REVIEW]),
+        Abstracts.title.ilike("%cardio%"),
+    ]
+
+
+def _app():
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{os.path.join(_tmp, 'bench.db')}"
+    db.init_app(app)
+    with app.app_context():
+        tables = [t for t in db.metadata.sorted_tables if t.name != "cycle_windows"]
+        db.metadata.create_all(db.engine, tables=tables)
+    return app
+
+
+def _per_call(fn):
+    fn()  # warm caches
+    return timeit.timeit(fn, number=N) / N * 1e6
+
+
+def main():
+    app = _app()
+    filters = _filters()
+    order_by = Abstracts.created_at.desc()
+    logger = get_logger("model_utils")
+
+    def call():
+        list_instances(Abstracts, filters=filters, order_by=order_by, limit=20, offset=40)
+
+    with app.app_context():
+        query = db.session.query(Abstracts).filter(*filters).order_by(order_by).offset(40).limit(20)
+        desc = _per_call(lambda: [str(f) for f in filters])
+        render = _per_call(lambda: LazySQL(query).render())
+        saved_level = logger.level
+        try:
+            for level in (logging.WARNING, logging.DEBUG):
+                logger.setLevel(level)
+                total = _per_call(call)
+                print(f"list_instances {logging.getLevelName(level):8s} {total:8.1f}us/call")
+        finally:
+            logger.setLevel(saved_level)
+        print(f"  filter_desc (every call)     {desc:8.1f}us")
+        print(f"  sql render  (DEBUG only now) {render:8.1f}us")
+
+
+if __name__ == "__main__":
+    main()
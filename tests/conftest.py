@@ -1,6 +1,8 @@
 import pytest
 import os
 import sys
+from flask import Flask
+from sqlalchemy import text
 from app import create_app
 from app.extensions import db
 from app.models.User import User, Role
@@ -61,4 +63,38 @@ def create_admin_user(app):
             db.session.add(user)
             db.session.commit()
             return user
-    return _create_admin_user
\ No newline at end of file
+    return _create_admin_user
+
+
+# cycle_windows has a DATERANGE exclusion constraint SQLite cannot render; this
+# stand-in has the columns the window checks read.
+CYCLE_WINDOWS_STANDIN = (
+    "CREATE TABLE cycle_windows (id CHAR(32) PRIMARY KEY, cycle_id CHAR(32), "
+    "phase VARCHAR(40), start_date DATE, end_date DATE)"
+)
+
+
+@pytest.fixture(scope='function')
+def sqlite_app(tmp_path):
+    """Build a bare Flask app on a throwaway SQLite database.
+
+    ``tables`` picks what to create: None for every table except
+    cycle_windows, otherwise an iterable of models or tables (empty for
+    none). ``cycle_windows=True`` adds the stand-in table; extra keyword
+    arguments go to the app config.
+    """
+    def _sqlite_app(tables=None, *, cycle_windows=False, **config):
+        app = Flask(__name__)
+        app.config.update(SQLALCHEMY_DATABASE_URI=f"sqlite:///{tmp_path / 'app.db'}", **config)
+        db.init_app(app)
+        with app.app_context():
+            if tables is None:
+                tables = [t for t in db.metadata.sorted_tables if t.name != "cycle_windows"]
+            tables = [getattr(t, "__table__", t) for t in tables]
+            if tables:
+                db.metadata.create_all(db.engine, tables=tables)
+            if cycle_windows:
+                with db.engine.begin() as conn:
+                    conn.execute(text(CYCLE_WINDOWS_STANDIN))
+        return app
+    return _sqlite_app
@@ -0,0 +1,131 @@
+import itertools
+import uuid
+
+import numpy as np
+from sqlalchemy import insert
+
+from app.extensions import db
+from app.models.Cycle import Abstracts, Category, Grading, GradingType
+from app.models.enumerations import GradingFor
+from app.services.agreement_service import (
+    agreement_report,
+    icc1,
+    krippendorff_alpha,
+    peer_deviation,
+    refresh_agreement,
+    wait_for_refresh,
+)
+
+NAN = np.nan
+
+
+def _naive_alpha(matrix):
+    units = [[x for x in row if not np.isnan(x)] for row in matrix]
+    units = [u for u in units if len(u) >= 2]
+    values = [x for u in units for x in u]
+    n = len(values)
+    observed = sum(
+        sum((a - b) ** 2 for a, b in itertools.permutations(u, 2)) / (len(u) - 1) for u in units
+    ) / n
+    expected = sum((a - b) ** 2 for a, b in itertools.permutations(values, 2)) / (n * (n - 1))
+    return 1 - observed / expected
+
+
+def _seed():
+    """Four abstracts graded on two criteria by three graders, in one scope."""
+    cycle_id, category_id = uuid.uuid4(), uuid.uuid4()
+    db.session.execute(insert(Category.__table__).values(id=category_id, name="Cardiology"))
+    criteria = [uuid.uuid4(), uuid.uuid4()]
+    for name, criterion in zip(("Novelty", "Method"), criteria):
+        db.session.execute(insert(GradingType.__table__).values(
+            id=criterion, criteria=name, min_score=0, max_score=10, grading_for="ABSTRACT",
+        ))
+    abstracts = [uuid.uuid4() for _ in range(4)]
+    for number, abstract_id in enumerate(abstracts, start=10000):
+        db.session.execute(insert(Abstracts.__table__).values(
+            id=abstract_id, title=f"Abstract {number}", content="text", category_id=category_id,
+            cycle_id=cycle_id, created_by_id=uuid.uuid4(), status="UNDER_REVIEW",
+            review_phase=1, abstract_number=number,
+        ))
+    graders = [uuid.uuid4() for _ in range(3)]
+    # Two graders agree closely; the third scores against the grain.
+    sheets = {graders[0]: (2, 4, 6, 8), graders[1]: (3, 4, 7, 8), graders[2]: (9, 1, 2, 5)}
+    for grader, scores in sheets.items():
+        for abstract_id, score in zip(abstracts, scores):
+            for criterion in criteria:
+                db.session.execute(insert(Grading.__table__).values(
+                    id=uuid.uuid4(), score=score, grading_type_id=criterion,
+                    abstract_id=abstract_id, graded_by_id=grader,
+                ))
+    db.session.commit()
+    return cycle_id, abstracts, criteria, graders
+
+
+class TestAgreement:
+    """Vectorised agreement statistics and their incremental refresh."""
+
+    def test_statistics_match_their_definitions(self):
+        matrix = np.array([
+            [1, 2, 1, NAN],
+            [4, 4, NAN, 5],
+            [NAN, 7, 6, 7],
+            [2, NAN, NAN, NAN],  # single rating: not pairable
+            [9, 8, 9, 9],
+        ], dtype=float)
+        assert abs(krippendorff_alpha(matrix) - _naive_alpha(matrix)) < 1e-9
+        assert krippendorff_alpha(np.array([[3, 3], [5, 5.0]])) == 1.0
+        assert krippendorff_alpha(np.array([[3, 3], [3, 3.0]])) is None
+
+        balanced = np.array([[9, 2, 5, 8], [6, 1, 3, 2], [8, 4, 6, 8], [7, 1, 2, 6], [10, 5, 6, 9], [6, 2, 4, 7.0]])
+        k = balanced.shape[1]
+        means = balanced.mean(axis=1)
+        msb = k * ((means - balanced.mean()) ** 2).sum() / (len(balanced) - 1)
+        msw = ((balanced - means[:, None]) ** 2).sum() / (balanced.size - len(balanced))
+        assert abs(icc1(balanced) - (msb - msw) / (msb + (k - 1) * msw)) < 1e-9
+
+        ratings, deviation, bias = peer_deviation(np.array([[50, 50, 80], [20, 20, NAN], [NAN, NAN, 10.0]]))
+        assert ratings.tolist() == [2, 2, 1]
+        assert deviation.tolist() == [7.5, 7.5, 30.0] and bias.tolist() == [-7.5, -7.5, 30.0]
+
+    def test_refresh_recomputes_only_changed_scopes(self, sqlite_app):
+        app = sqlite_app()
+        with app.app_context():
+            cycle_id, abstracts, criteria, graders = _seed()
+
+            assert agreement_report(GradingFor.ABSTRACT, cycle_id)["stale"]
+            assert refresh_agreement() == {"refreshed": 1, "unchanged": 0, "removed": 0}
+            report = agreement_report(GradingFor.ABSTRACT, cycle_id)
+            assert not report["stale"]
+            # (all + one category) x (pooled + two criteria)
+            assert len(report["agreements"]) == 6
+            pooled = report["agreements"][0]
+            assert pooled["category_id"] is None and pooled["grading_type_id"] is None
+            assert pooled["units"] == 8 and pooled["graders"] == 3 and pooled["ratings"] == 24
+            assert {item["criteria"] for item in report["agreements"][1:3]} == {"Method", "Novelty"}
+            assert report["graders"][0]["graded_by_id"] == str(graders[2])
+
+            assert refresh_agreement() == {"refreshed": 0, "unchanged": 1, "removed": 0}
+            db.session.execute(insert(Grading.__table__).values(
+                id=uuid.uuid4(), score=5, grading_type_id=criteria[0], abstract_id=abstracts[0],
+                graded_by_id=uuid.uuid4(), review_phase=2,
+            ))
+            db.session.commit()
+            assert agreement_report(GradingFor.ABSTRACT, cycle_id)["stale"]
+            assert not agreement_report(GradingFor.ABSTRACT, cycle_id, review_phase=1)["stale"]
+            assert refresh_agreement() == {"refreshed": 1, "unchanged": 1, "removed": 0}
+
+    def test_grading_commit_schedules_a_refresh(self, sqlite_app):
+        app = sqlite_app(AGREEMENT_AUTO_REFRESH=True)
+        with app.app_context():
+            cycle_id, abstracts, criteria, _ = _seed()  # Core inserts: nothing scheduled
+            wait_for_refresh(10)
+            assert agreement_report(GradingFor.ABSTRACT, cycle_id)["stale"]
+
+            db.session.add(Grading(
+                score=6, grading_type_id=criteria[1], abstract_id=abstracts[1], graded_by_id=uuid.uuid4(),
+            ))
+            db.session.commit()
+            wait_for_refresh(10)
+            report = agreement_report(GradingFor.ABSTRACT, cycle_id)
+            assert not report["stale"]
+            assert report["agreements"][0]["ratings"] == 25
@@ -0,0 +1,144 @@
+import logging
+import os
+import queue
+import zipfile
+
+import pytest
+
+from app.utils.logging_utils import LoggerManager, log_context
+from app.utils.logging_utils.manager import _BoundedQueueHandler
+
+
+def _manager(tmp_path, **kwargs):
+    return LoggerManager(
+        base_dir=str(tmp_path),
+        enable_console=False,
+        mirror_app_handlers=False,
+        auto_archive_enabled=False,
+        async_enabled=True,
+        **kwargs,
+    )
+
+
+class TestAsyncLogging:
+    """Queue-backed category loggers."""
+
+    def test_records_reach_category_file_after_flush(self, tmp_path):
+        manager = _manager(tmp_path)
+        try:
+            log = manager.get_logger("submission")
+            with log_context(action="create"):
+                log.info("abstract %s saved", 42)
+            manager.flush()
+            content = (tmp_path / "submission.log").read_text()
+            assert "abstract 42 saved" in content
+            assert "action=create" in content
+        finally:
+            manager.shutdown()
+
+    def test_shutdown_drains_queue(self, tmp_path):
+        manager = _manager(tmp_path)
+        log = manager.get_logger("activity")
+        for i in range(200):
+            log.info("event %s", i)
+        manager.shutdown()
+        lines = (tmp_path / "activity.log").read_text().splitlines()
+        assert len(lines) == 200
+
+    def test_full_queue_drops_and_counts(self):
+        handler = _BoundedQueueHandler(queue.Queue(1), policy="drop", block_timeout=0)
+        record = logging.LogRecord("app.x", logging.INFO, __file__, 1, "m", None, None)
+        handler.handle(record)
+        handler.handle(record)
+        assert handler.dropped == 1
+
+    def test_queue_stats_report_capacity(self, tmp_path):
+        manager = _manager(tmp_path, queue_size=50)
+        try:
+            manager.get_logger("auth")
+            stats = manager.queue_stats()
+            assert stats["async"] is True
+            assert stats["capacity"] == 50
+            assert stats["dropped"] == 0
+        finally:
+            manager.shutdown()
+
+    def test_cached_logger_restarts_writer_after_fork(self, tmp_path):
+        manager = _manager(tmp_path)
+        try:
+            log = manager.get_logger("submission")
+            # What a forked worker inherits: the listener thread did not survive.
+            manager._listener.stop()
+            manager._listener_pid = -1
+            assert manager.get_logger("submission") is log
+            assert manager.queue_stats()["pid"] == os.getpid()
+            log.info("after fork")
+            manager.flush()
+            assert "after fork" in (tmp_path / "submission.log").read_text()
+        finally:
+            manager.shutdown()
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="needs fork()")
+    def test_forked_child_gets_its_own_writer(self, tmp_path):
+        manager = _manager(tmp_path)
+        try:
+            log = manager.get_logger("activity")
+            log.info("parent")
+            manager.flush()
+            pid = os.fork()
+            if pid == 0:  # child: log through the inherited logger, report via exit code
+                code = 1
+                try:
+                    log.info("child %s", os.getpid())
+                    manager.flush()
+                    code = 0 if manager.queue_stats()["pid"] == os.getpid() else 2
+                finally:
+                    os._exit(code)
+            _, status = os.waitpid(pid, 0)
+            assert os.waitstatus_to_exitcode(status) == 0
+            assert f"child {pid}" in (tmp_path / "activity.log").read_text()
+        finally:
+            manager.shutdown()
+
+
+class TestLogArchiving:
+    """Archiving runs outside get_logger and reports metrics."""
+
+    def test_get_logger_does_not_archive(self, tmp_path):
+        stale = tmp_path / "auth.log.2020-01-01"
+        stale.write_text("old\n")
+        os.utime(stale, (1577836800, 1577836800))
+        manager = LoggerManager(base_dir=str(tmp_path), enable_console=False,
+                                mirror_app_handlers=False, auto_archive_after_days=1)
+        try:
+            manager.get_logger("auth")
+            assert stale.exists()
+        finally:
+            manager.shutdown()
+
+    def test_archive_streams_rotated_files_and_records_savings(self, tmp_path):
+        rotated = tmp_path / "auth.log.2020-01-01"
+        rotated.write_text("line\n" * 5000)
+        os.utime(rotated, (1577836800, 1577836800))
+        active = tmp_path / "auth.log"
+        active.write_text("current\n")
+        os.utime(active, (1577836800, 1577836800))
+        manager = LoggerManager(base_dir=str(tmp_path), enable_console=False, mirror_app_handlers=False)
+
+        archives = manager.archive_logs(older_than_days=1, chunk_size=1024)
+
+        assert [a.name.startswith("auth.log.2020-01-01") for a in archives] == [True]
+        assert not rotated.exists()
+        assert active.exists()
+        with zipfile.ZipFile(archives[0]) as zf:
+            assert zf.read("auth.log.2020-01-01") == b"line\n" * 5000
+        stats = manager.archive_metrics()
+        assert stats["process"]["bytes_saved_total"] > 0
+        assert stats["last_persisted"]["files_archived_total"] == 1
+
+    def test_archive_skips_when_lock_is_held(self, tmp_path):
+        manager = LoggerManager(base_dir=str(tmp_path), enable_console=False, mirror_app_handlers=False)
+        with manager._archive_lock(manager.archive_dir) as acquired:
+            assert acquired
+            assert manager.archive_logs(older_than_days=0) == []
+        assert manager.archive_metrics()["process"]["skipped_locked_total"] == 1
@@ -0,0 +1,144 @@
+import uuid
+
+from sqlalchemy import insert, select
+
+from app.extensions import db
+from app.models.Cycle import AbstractVerifiers, Abstracts, AwardVerifiers, user_categories
+from app.models.User import User, UserRole
+from app.models.enumerations import GradingFor, Role, Status
+from app.services import auto_assignment_service as auto
+
+
+def _verifier(category_id):
+    user_id = uuid.uuid4()
+    db.session.execute(insert(User.__table__).values(
+        id=user_id, username=f"u{user_id.hex[:8]}", email=f"{user_id.hex[:8]}@example.org",
+        employee_id=user_id.hex[:10], mobile=str(user_id.int)[:10], password_hash="x",
+    ))
+    db.session.execute(insert(UserRole.__table__).values(user_id=user_id, role=Role.VERIFIER.name))
+    db.session.execute(insert(user_categories).values(user_id=user_id, category_id=category_id))
+    return user_id
+
+
+def _sub(category, owner=None, assigned=(), linked=()):
+    return auto.Submission(uuid.uuid4(), category, owner or uuid.uuid4(), 1, frozenset(assigned), frozenset(linked))
+
+
+class TestAutoAssignmentPlan:
+    """Heap-based planner: balanced, category-restricted, never the owner."""
+
+    def test_balances_load_across_verifiers(self):
+        category = uuid.uuid4()
+        v1, v2, v3 = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        submissions = [_sub(category) for _ in range(6)]
+        plan = auto.plan_assignments(
+            submissions, {category: {v1, v2, v3}}, {v1: 4}, per_submission=2,
+        )
+        assert all(len(chosen) == 2 for chosen in plan.assignments.values())
+        assert plan.unfilled == {}
+        # 12 seats on top of an initial load of 4 for v1: everyone ends at 16/3 +- 1.
+        assert sorted(plan.loads.values()) == [5, 5, 6]
+
+    def test_respects_owner_existing_and_max_load(self):
+        category, other = uuid.uuid4(), uuid.uuid4()
+        v1, v2 = uuid.uuid4(), uuid.uuid4()
+        own = _sub(category, owner=v1)
+        half = _sub(category, assigned=[v2])
+        foreign = _sub(other)
+        plan = auto.plan_assignments(
+            [own, half, foreign], {category: {v1, v2}}, {}, per_submission=2, max_load=1,
+        )
+        assert plan.assignments == {own.id: [v2], half.id: [v1]}
+        assert plan.unfilled == {own.id: 1, foreign.id: 2}
+
+    def test_skips_verifiers_linked_at_an_earlier_phase(self):
+        category = uuid.uuid4()
+        earlier, fresh = uuid.uuid4(), uuid.uuid4()
+        submission = _sub(category, linked=[earlier])
+        plan = auto.plan_assignments([submission], {category: {earlier, fresh}}, {}, per_submission=2)
+        assert plan.assignments == {submission.id: [fresh]}
+        assert plan.unfilled == {submission.id: 1}
+
+
+class TestAutoAssign:
+    """Aggregate loading plus one bulk insert; dry run writes nothing."""
+
+    def test_dry_run_then_persist(self, sqlite_app):
+        app = sqlite_app(cycle_windows=True)
+        with app.app_context():
+            cycle, category = uuid.uuid4(), uuid.uuid4()
+            busy, idle = _verifier(category), _verifier(category)
+            abstracts = []
+            for number in range(3):
+                abstract_id = uuid.uuid4()
+                db.session.execute(insert(Abstracts.__table__).values(
+                    id=abstract_id, title="t", content="c", category_id=category, cycle_id=cycle,
+                    created_by_id=uuid.uuid4(), status=Status.PENDING.name, review_phase=1,
+                    abstract_number=number + 1,
+                ))
+                abstracts.append(abstract_id)
+            db.session.execute(insert(AwardVerifiers.__table__).values(
+                award_id=uuid.uuid4(), user_id=busy, review_phase=1,
+            ))
+            db.session.commit()
+
+            assert auto.verifier_loads()[busy] == {"abstract": 0, "award": 1, "best_paper": 0}
+            preview = auto.auto_assign(GradingFor.ABSTRACT, cycle, per_submission=1, dry_run=True)
+            assert preview["planned_count"] == 3 and preview["created_count"] == 0
+            assert db.session.scalars(select(AbstractVerifiers.user_id)).all() == []
+
+            result = auto.auto_assign(GradingFor.ABSTRACT, cycle, per_submission=1)
+            assert result["created_count"] == 3
+            assigned = db.session.scalars(select(AbstractVerifiers.user_id)).all()
+            assert sorted(assigned.count(user) for user in (busy, idle)) == [1, 2]
+            assert assigned.count(idle) == 2
+
+            again = auto.auto_assign(GradingFor.ABSTRACT, cycle, per_submission=1)
+            assert again["planned_count"] == 0
+
+    def _phase_two_abstract(self, category, cycle, phase_one_verifier):
+        abstract_id = uuid.uuid4()
+        db.session.execute(insert(Abstracts.__table__).values(
+            id=abstract_id, title="t", content="c", category_id=category, cycle_id=cycle,
+            created_by_id=uuid.uuid4(), status=Status.UNDER_REVIEW.name, review_phase=2,
+            abstract_number=1,
+        ))
+        db.session.execute(insert(AbstractVerifiers.__table__).values(
+            abstract_id=abstract_id, user_id=phase_one_verifier, review_phase=1,
+        ))
+        db.session.commit()
+        return abstract_id
+
+    def test_earlier_phase_verifier_is_not_picked_again(self, sqlite_app):
+        app = sqlite_app(cycle_windows=True)
+        with app.app_context():
+            cycle, category = uuid.uuid4(), uuid.uuid4()
+            earlier, fresh = _verifier(category), _verifier(category)
+            abstract_id = self._phase_two_abstract(category, cycle, earlier)
+
+            [submission] = auto.open_submissions(GradingFor.ABSTRACT, cycle)
+            assert submission.assigned == frozenset() and submission.linked == {earlier}
+
+            result = auto.auto_assign(GradingFor.ABSTRACT, cycle, per_submission=2)
+            assert result["assignments"] == {str(abstract_id): [str(fresh)]}
+            assert result["created_count"] == 1
+            assert result["unfilled"] == {str(abstract_id): 1}
+            phases = dict(db.session.execute(
+                select(AbstractVerifiers.user_id, AbstractVerifiers.review_phase)
+            ).all())
+            assert phases == {earlier: 1, fresh: 2}
+
+    def test_insert_conflicts_are_reported_as_unfilled(self, sqlite_app, monkeypatch):
+        app = sqlite_app(cycle_windows=True)
+        with app.app_context():
+            cycle, category = uuid.uuid4(), uuid.uuid4()
+            taken = _verifier(category)
+            abstract_id = self._phase_two_abstract(category, cycle, taken)
+            # As if the link was added after the submissions were read.
+            stale = [s._replace(linked=frozenset()) for s in auto.open_submissions(GradingFor.ABSTRACT, cycle)]
+            monkeypatch.setattr(auto, "open_submissions", lambda *args, **kwargs: stale)
+
+            result = auto.auto_assign(GradingFor.ABSTRACT, cycle, per_submission=1)
+            assert result["planned_count"] == 1 and result["created_count"] == 0
+            assert result["assignments"] == {}
+            assert result["unfilled"] == {str(abstract_id): 1}
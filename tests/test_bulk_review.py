@@ -0,0 +1,122 @@
+import uuid
+
+import pytest
+from sqlalchemy import insert, select
+
+from app.extensions import db
+from app.models.Cycle import AbstractVerifiers, Abstracts, Grading, GradingType
+from app.models.SubmissionCounter import SubmissionCounter, recount_submission_counters
+from app.models.enumerations import GradingFor, Status
+from app.services import bulk_review_service as bulk
+
+
+class _Seed:
+    def __init__(self):
+        self.cycle = uuid.uuid4()
+        self.category = uuid.uuid4()
+        self.verifier = uuid.uuid4()
+        self.type_id = uuid.uuid4()
+        self._number = 20000
+        db.session.execute(insert(GradingType.__table__).values(
+            id=self.type_id, criteria="c", max_score=10, grading_for=GradingFor.ABSTRACT.name,
+        ))
+
+    def abstract(self, *, graded, status=Status.UNDER_REVIEW):
+        self._number += 1
+        abstract_id = uuid.uuid4()
+        db.session.execute(insert(Abstracts.__table__).values(
+            id=abstract_id, title="t", content="c", category_id=self.category,
+            cycle_id=self.cycle, created_by_id=uuid.uuid4(), status=status.name,
+            review_phase=1, abstract_number=self._number,
+        ))
+        db.session.execute(insert(AbstractVerifiers.__table__).values(
+            abstract_id=abstract_id, user_id=self.verifier, review_phase=1,
+        ))
+        if graded:
+            db.session.execute(insert(Grading.__table__).values(
+                id=uuid.uuid4(), score=5, grading_type_id=self.type_id, abstract_id=abstract_id,
+                graded_by_id=self.verifier, review_phase=1,
+            ))
+        return abstract_id
+
+
+def _counters(cycle_id):
+    return {
+        (row.status, row.review_phase): row.count
+        for row in db.session.scalars(select(SubmissionCounter).where(SubmissionCounter.cycle_id == cycle_id))
+        if row.count
+    }
+
+
+class TestBulkReview:
+    """Bulk accept / reject / advance: one UPDATE, set-based completeness check."""
+
+    def test_parse_selection_validation(self, sqlite_app):
+        app = sqlite_app(BULK_REVIEW_MAX_IDS=3, NOTIFY_ASYNC=False)
+        with app.app_context():
+            with pytest.raises(ValueError):
+                bulk.parse_selection({})
+            with pytest.raises(ValueError):
+                bulk.parse_selection({"filter": {"status": "pending"}})
+            with pytest.raises(ValueError):
+                bulk.parse_selection({"filter": {"cycle_id": str(uuid.uuid4()), "owner": "x"}})
+            with pytest.raises(ValueError):
+                bulk.parse_selection({"ids": [str(uuid.uuid4()) for _ in range(4)]})
+            with pytest.raises(ValueError):
+                bulk.parse_selection({"ids": ["not-a-uuid"]})
+            cycle_id = uuid.uuid4()
+            selection = bulk.parse_selection({"filter": {"cycle_id": str(cycle_id), "status": "UNDER_REVIEW"}})
+            assert selection == {"cycle_id": cycle_id, "status": Status.UNDER_REVIEW}
+
+    def test_accept_skips_incomplete_and_moves_counters(self, sqlite_app):
+        app = sqlite_app(BULK_REVIEW_MAX_IDS=3, NOTIFY_ASYNC=False)
+        with app.app_context():
+            seed = _Seed()
+            done, partial = seed.abstract(graded=True), seed.abstract(graded=False)
+            accepted = seed.abstract(graded=True, status=Status.ACCEPTED)
+            recount_submission_counters()
+            db.session.commit()
+            missing = uuid.uuid4()
+            selection = {"ids": [done, partial, accepted, missing]}
+
+            preview = bulk.bulk_set_status(GradingFor.ABSTRACT, Status.ACCEPTED, selection,
+                                           require_complete=True, dry_run=True)
+            assert preview["updated"] == [str(done)]
+            assert db.session.get(Abstracts, done).status == Status.UNDER_REVIEW
+            db.session.rollback()
+
+            result = bulk.bulk_set_status(GradingFor.ABSTRACT, Status.ACCEPTED, selection, require_complete=True)
+            assert result["updated"] == [str(done)]
+            assert result["skipped"] == {
+                "unchanged": [str(accepted)],
+                "incomplete": [str(partial)],
+                "not_found": [str(missing)],
+            }
+            statuses = dict(db.session.execute(select(Abstracts.id, Abstracts.status)).all())
+            assert statuses[done] == Status.ACCEPTED
+            assert statuses[partial] == Status.UNDER_REVIEW
+            assert _counters(seed.cycle) == {(Status.ACCEPTED, 1): 2, (Status.UNDER_REVIEW, 1): 1}
+
+    def test_reject_by_filter_and_advance(self, sqlite_app):
+        app = sqlite_app(BULK_REVIEW_MAX_IDS=3, NOTIFY_ASYNC=False)
+        with app.app_context():
+            seed = _Seed()
+            done, partial = seed.abstract(graded=True), seed.abstract(graded=False)
+            pending = seed.abstract(graded=False, status=Status.PENDING)
+            recount_submission_counters()
+            db.session.commit()
+
+            result = bulk.bulk_advance_phase(GradingFor.ABSTRACT, {"cycle_id": seed.cycle})
+            assert result["updated"] == [str(done)]
+            assert sorted(result["skipped"]["not_eligible"]) == sorted([str(partial), str(pending)])
+
+            result = bulk.bulk_set_status(
+                GradingFor.ABSTRACT, Status.REJECTED,
+                {"cycle_id": seed.cycle, "status": Status.PENDING}, require_complete=False,
+            )
+            assert result["updated"] == [str(pending)]
+            assert _counters(seed.cycle) == {
+                (Status.UNDER_REVIEW, 2): 1,
+                (Status.UNDER_REVIEW, 1): 1,
+                (Status.REJECTED, 1): 1,
+            }
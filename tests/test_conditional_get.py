@@ -0,0 +1,91 @@
+import uuid
+
+from flask import jsonify
+from sqlalchemy import delete, event, insert, update
+
+from app.extensions import db
+from app.models.Cycle import AbstractVerifiers, Abstracts, Category, Grading, GradingType
+from app.models.enumerations import GradingFor
+from app.utils import conditional_get
+
+
+def _seed():
+    category = uuid.uuid4()
+    db.session.execute(insert(Category.__table__).values(id=category, name="Cardiology"))
+    criterion = uuid.uuid4()
+    db.session.execute(insert(GradingType.__table__).values(
+        id=criterion, criteria="Novelty", min_score=1, max_score=5, grading_for="ABSTRACT",
+    ))
+    abstract_ids = [uuid.uuid4(), uuid.uuid4()]
+    for number, abstract_id in enumerate(abstract_ids, start=10000):
+        db.session.execute(insert(Abstracts.__table__).values(
+            id=abstract_id, title=f"Stents {number}", content="text", category_id=category,
+            cycle_id=uuid.uuid4(), created_by_id=uuid.uuid4(), status="UNDER_REVIEW", abstract_number=number,
+        ))
+    db.session.commit()
+    return abstract_ids, criterion
+
+
+class TestConditionalGet:
+    """Weak ETags for submission detail and list responses."""
+
+    def test_detail_tag_tracks_row_grades_and_verifier_assignments(self, sqlite_app):
+        app = sqlite_app()
+        with app.app_context():
+            (abstract_id, other_id), criterion = _seed()
+            tags = [conditional_get.detail_etag(GradingFor.ABSTRACT, abstract_id)]
+            assert conditional_get.detail_etag(GradingFor.ABSTRACT, str(abstract_id)) == tags[0]
+            assert conditional_get.detail_etag(GradingFor.ABSTRACT, uuid.uuid4()) is None
+            assert conditional_get.detail_etag(GradingFor.ABSTRACT, "not-a-uuid") is None
+
+            verifier = uuid.uuid4()
+            db.session.execute(insert(AbstractVerifiers.__table__).values(abstract_id=abstract_id, user_id=verifier))
+            tags.append(conditional_get.detail_etag(GradingFor.ABSTRACT, abstract_id))
+            db.session.execute(insert(Grading.__table__).values(
+                id=uuid.uuid4(), abstract_id=abstract_id, grading_type_id=criterion,
+                graded_by_id=verifier, score=4, review_phase=1,
+            ))
+            tags.append(conditional_get.detail_etag(GradingFor.ABSTRACT, abstract_id))
+            assert len(set(tags)) == 3
+            # Deletions leave no timestamp behind but still change the tag back.
+            db.session.execute(delete(Grading.__table__))
+            assert conditional_get.detail_etag(GradingFor.ABSTRACT, abstract_id) == tags[1]
+            db.session.execute(delete(AbstractVerifiers.__table__))
+            assert conditional_get.detail_etag(GradingFor.ABSTRACT, abstract_id) == tags[0]
+
+            other = conditional_get.detail_etag(GradingFor.ABSTRACT, other_id)
+            db.session.execute(update(Abstracts.__table__).where(Abstracts.id == other_id).values(title="Valves"))
+            assert conditional_get.detail_etag(GradingFor.ABSTRACT, other_id) == other  # updated_at unchanged by raw SQL
+            db.session.execute(update(Abstracts.__table__).where(Abstracts.id == other_id).values(
+                updated_at=db.func.datetime("now", "+1 minute"),
+            ))
+            assert conditional_get.detail_etag(GradingFor.ABSTRACT, other_id) != other
+
+    def test_list_tag_depends_on_filters_and_short_circuits_with_304(self, sqlite_app):
+        app = sqlite_app()
+        with app.app_context():
+            (abstract_id, _), _ = _seed()
+            actor = uuid.uuid4()
+            statements = []
+            event.listen(db.engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+            with app.test_request_context("/abstracts?page=1"):
+                everything, total = conditional_get.list_etag(GradingFor.ABSTRACT, [], actor)
+                assert total == 2 and len(statements) == 1  # tag and count from one statement
+                one, total = conditional_get.list_etag(GradingFor.ABSTRACT, [Abstracts.id == abstract_id], actor)
+                assert everything != one and total == 1
+                assert conditional_get.list_etag(GradingFor.ABSTRACT, [], uuid.uuid4()).etag != everything
+            with app.test_request_context("/abstracts?page=2"):
+                assert conditional_get.list_etag(GradingFor.ABSTRACT, [], actor).etag != everything
+            db.session.execute(insert(AbstractVerifiers.__table__).values(abstract_id=abstract_id, user_id=actor))
+            with app.test_request_context("/abstracts?page=1"):
+                assert conditional_get.list_etag(GradingFor.ABSTRACT, [], actor).etag != everything
+            db.session.rollback()
+
+            with app.test_request_context("/abstracts?page=1", headers={"If-None-Match": f'W/"{everything}"'}):
+                cached = conditional_get.not_modified(everything)
+                assert cached.status_code == 304
+                assert cached.headers["ETag"] == f'W/"{everything}"'
+                assert cached.headers["Cache-Control"] == conditional_get.CACHE_CONTROL
+                assert conditional_get.not_modified(one) is None
+                fresh = conditional_get.tagged(jsonify({}), one)
+                assert fresh.headers["ETag"] == f'W/"{one}"'
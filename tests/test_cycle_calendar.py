@@ -0,0 +1,90 @@
+import uuid
+from datetime import date, timedelta
+
+from sqlalchemy import event, text
+
+from app.extensions import db
+from app.models.enumerations import CyclePhase
+from app.utils import cycle_calendar
+
+
+def _window(cycle_id, phase, start, end):
+    window_id = uuid.uuid4()
+    db.session.execute(
+        text("INSERT INTO cycle_windows VALUES (:id, :cycle, :phase, :start, :end)"),
+        {"id": window_id.hex, "cycle": cycle_id.hex, "phase": phase, "start": start, "end": end},
+    )
+    return window_id
+
+
+class TestCycleCalendar:
+    """Bisect lookups over cached windows with version-stamped invalidation."""
+
+    def test_intervals_merge_and_bisect(self):
+        d = date(2026, 1, 1)
+        a, b, c = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        intervals = cycle_calendar._Intervals([
+            (d + timedelta(days=20), d + timedelta(days=30), c),
+            (d, d + timedelta(days=5), a),
+            (d + timedelta(days=3), d + timedelta(days=10), b),
+        ])
+        assert intervals.starts == [d, d + timedelta(days=20)]
+        assert intervals.find(d + timedelta(days=8)) == a
+        assert intervals.find(d + timedelta(days=15)) is None
+        assert intervals.find(d + timedelta(days=30)) == c
+        assert intervals.find(d - timedelta(days=1)) is None
+
+    def test_hits_are_cached_until_invalidated(self, sqlite_app):
+        app = sqlite_app((), cycle_windows=True)
+        with app.app_context():
+            cycle = uuid.uuid4()
+            today = date.today()
+            window = _window(cycle, "ABSTRACT_SUBMISSION", today - timedelta(days=1), today + timedelta(days=1))
+            db.session.commit()
+            cycle_calendar.invalidate()
+            phases = (CyclePhase.ABSTRACT_SUBMISSION, CyclePhase.SUBMISSION)
+
+            conn = db.session.connection()
+            assert cycle_calendar.open_window_id(conn, cycle, phases, today) == window
+            statements = []
+            event.listen(db.engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+            assert cycle_calendar.open_window_id(conn, str(cycle), phases, today) == window
+            assert statements == []
+
+            # A miss is confirmed against the database.
+            later = today + timedelta(days=5)
+            assert cycle_calendar.open_window_id(conn, cycle, phases, later) is None
+            assert len(statements) == 1
+
+            db.session.execute(text("DELETE FROM cycle_windows"))
+            cycle_calendar.mark_changed(db.session)
+            db.session.commit()
+            assert cycle_calendar.open_window_id(db.session.connection(), cycle, phases, today) is None
+
+    def test_rollback_of_flagged_session_invalidates(self, sqlite_app):
+        app = sqlite_app((), cycle_windows=True)
+        with app.app_context():
+            before = cycle_calendar.version()
+            cycle_calendar.mark_changed(db.session)
+            db.session.execute(text("SELECT 1"))
+            db.session.rollback()
+            assert cycle_calendar.version() == before + 1
+            db.session.commit()
+            assert cycle_calendar.version() == before + 1
+
+
+class TestWindowOpenOn:
+    """Range containment renders as ``win @>`` on PostgreSQL only."""
+
+    def test_dialect_rendering_and_constraint(self):
+        from sqlalchemy import select
+        from sqlalchemy.dialects import postgresql, sqlite
+        from sqlalchemy.schema import CreateTable
+
+        from app.models.Cycle import CycleWindow
+
+        stmt = select(CycleWindow.id).where(CycleWindow.open_on(date(2026, 1, 1)))
+        assert "cycle_windows.win @> " in str(stmt.compile(dialect=postgresql.dialect()))
+        assert "cycle_windows.start_date <= ?" in str(stmt.compile(dialect=sqlite.dialect()))
+        ddl = str(CreateTable(CycleWindow.__table__).compile(dialect=postgresql.dialect()))
+        assert "EXCLUDE USING gist (cycle_id WITH =, phase WITH =, win WITH &&)" in ddl
@@ -0,0 +1,82 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.extensions import db
+from app.models.Cycle import Abstracts, Awards, BestPaper, Category, PaperCategory
+from app.models.SubmissionCounter import SubmissionCounter
+from app.models.Token import Token
+from app.models.User import User, UserRole
+from app.models.enumerations import Role
+from app.services import dashboard_metrics_service as svc
+from app.utils import metrics_cache
+
+_TABLES = (User, UserRole, Token, Category, PaperCategory, Abstracts, Awards, BestPaper, SubmissionCounter)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    metrics_cache.invalidate()
+
+
+def _seed():
+    now = datetime.utcnow()
+    admin = User(username="admin", email="a@example.org", mobile="9000000001",
+                 is_active=True, is_verified=True, created_at=now - timedelta(days=2))
+    old = User(username="old", email="o@example.org", mobile="9000000002",
+               is_active=False, is_verified=False, created_at=now - timedelta(days=60),
+               lock_until=now + timedelta(hours=1))
+    db.session.add_all([admin, old])
+    db.session.flush()
+    db.session.add_all([
+        UserRole(user_id=admin.id, role=Role.ADMIN),
+        UserRole(user_id=old.id, role=Role.USER),
+        Token(token_type="refresh", user_id=admin.id, token_hash="h1",
+              expires_at=now + timedelta(days=1)),
+        Token(token_type="refresh", user_id=old.id, token_hash="h2", revoked=True,
+              expires_at=now + timedelta(days=1)),
+    ])
+    db.session.commit()
+    return admin
+
+
+class TestDashboardMetrics:
+    """Single-query dashboard aggregate and its versioned cache."""
+
+    def test_aggregate_counts(self, sqlite_app):
+        app = sqlite_app(_TABLES)
+        with app.app_context():
+            _seed()
+            m = svc.compute_dashboard_metrics()
+        assert m["users"]["total"] == 2
+        assert m["users"]["active"] == 1
+        assert m["users"]["unverified"] == 1
+        assert m["users"]["locked"] == 1
+        assert m["users"]["last_7_days"] == 1
+        assert m["users"]["roles"] == {"admin": 1, "user": 1}
+        assert m["security"]["active_refresh_tokens"] == 1
+        assert m["submissions"]["active_total"] == 0
+        assert [u["username"] for u in m["users"]["recent"]] == ["admin", "old"]
+
+    def test_cache_serves_until_invalidated(self, sqlite_app):
+        app = sqlite_app(_TABLES)
+        with app.app_context():
+            _seed()
+            first, etag = svc.get_dashboard_metrics()
+            db.session.add(User(username="new", email="n@example.org", mobile="9000000003"))
+            db.session.commit()
+            cached, cached_etag = svc.get_dashboard_metrics()
+            assert cached["users"]["total"] == 2 and cached_etag == etag
+            metrics_cache.invalidate()
+            fresh, fresh_etag = svc.get_dashboard_metrics()
+        assert fresh["users"]["total"] == 3
+        assert fresh["version"] > first["version"]
+        assert fresh_etag != etag
+
+    def test_stale_computation_is_not_cached(self, sqlite_app):
+        app = sqlite_app(_TABLES)
+        with app.app_context():
+            version = metrics_cache.version()
+            metrics_cache.invalidate()
+            metrics_cache.set({"users": {}}, for_version=version)
+            assert metrics_cache.get() is None
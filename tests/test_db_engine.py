@@ -0,0 +1,54 @@
+from types import SimpleNamespace
+
+from sqlalchemy.pool import NullPool
+
+from app.utils.db_engine import (
+    InstrumentedQueuePool,
+    build_engine_options,
+    compute_pool_settings,
+)
+
+
+def _app(**config):
+    return SimpleNamespace(config=config)
+
+
+class TestPoolSizing:
+    """Pool sizing derived from the gunicorn process model."""
+
+    def test_sync_workers_get_one_connection_plus_overflow(self):
+        assert compute_pool_settings(4, 1) == {"pool_size": 1, "max_overflow": 1}
+
+    def test_threads_scale_pool(self):
+        assert compute_pool_settings(2, 8) == {"pool_size": 8, "max_overflow": 4}
+
+    def test_connection_budget_caps_all_workers(self):
+        sizing = compute_pool_settings(8, 8, max_connections=45)
+        assert 8 * (sizing["pool_size"] + sizing["max_overflow"]) <= 45 - 5
+
+
+class TestEngineOptions:
+    """Engine options per deployment profile."""
+
+    def test_sqlite_keeps_default_pooling(self):
+        opts = build_engine_options(_app(SQLALCHEMY_DATABASE_URI="sqlite:///:memory:"))
+        assert "pool_size" not in opts
+        assert "poolclass" not in opts
+
+    def test_postgres_uses_instrumented_pool(self):
+        opts = build_engine_options(_app(
+            SQLALCHEMY_DATABASE_URI="postgresql://u:p@db/x",
+            GUNICORN_WORKERS=4, GUNICORN_THREADS=4, DB_MAX_OVERFLOW=-1,
+        ))
+        assert opts["poolclass"] is InstrumentedQueuePool
+        assert opts["pool_size"] == 4
+        assert opts["max_overflow"] == 2
+
+    def test_pgbouncer_transaction_mode_disables_prepared_statements(self):
+        opts = build_engine_options(_app(
+            SQLALCHEMY_DATABASE_URI="postgresql+psycopg://u:p@bouncer/x",
+            DB_PGBOUNCER_MODE="transaction",
+        ))
+        assert opts["poolclass"] is NullPool
+        assert "pool_size" not in opts
+        assert opts["connect_args"]["prepare_threshold"] is None
@@ -0,0 +1,103 @@
+import uuid
+import zlib
+
+from sqlalchemy import func, insert, select
+
+from app.extensions import db
+from app.models.Cycle import Abstracts, Author, Awards, Category, PaperCategory
+from app.models.SubmissionFingerprint import SubmissionLshBucket, rebuild_fingerprints
+from app.models.enumerations import GradingFor
+from app.services.duplicate_detection_service import cycle_duplicate_report, similar_submissions
+from app.utils import minhash
+
+BODY = (
+    "We report outcomes of drug eluting stents in elderly patients with diabetes "
+    "followed for two years at a tertiary care centre, with major adverse cardiac "
+    "events as the primary end point and bleeding as the secondary end point."
+)
+
+
+def _seed(cycle_id, offset=0):
+    category, paper_category, author = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    db.session.execute(insert(Author.__table__).values(id=author, name="Meera Rao"))
+    db.session.execute(insert(Category.__table__).values(id=category, name=f"Cardiology {offset}"))
+    db.session.execute(insert(PaperCategory.__table__).values(id=paper_category, name=f"Clinical {offset}"))
+    ids = {}
+    abstracts = {
+        "original": ("Drug eluting stents in elderly diabetics", BODY),
+        "resubmitted": ("Drug-eluting stents in elderly diabetic patients", BODY.replace("two years", "24 months")),
+        "unrelated": ("Sleep quality among night shift nurses", "A survey of sleep and fatigue in nursing staff."),
+    }
+    for number, (key, (title, content)) in enumerate(abstracts.items(), start=10000 + offset):
+        ids[key] = uuid.uuid4()
+        db.session.execute(insert(Abstracts.__table__).values(
+            id=ids[key], title=title, content=content, category_id=category,
+            cycle_id=cycle_id, created_by_id=uuid.uuid4(), status="PENDING",
+            review_phase=1, abstract_number=number,
+        ))
+    ids["award"] = uuid.uuid4()
+    db.session.execute(insert(Awards.__table__).values(
+        id=ids["award"], title="Drug eluting stents in elderly diabetics", paper_category_id=paper_category, author_id=author,
+        cycle_id=cycle_id, created_by_id=uuid.uuid4(), status="PENDING", award_number=20000 + offset,
+    ))
+    db.session.commit()
+    return ids
+
+
+class TestDuplicateDetection:
+    """MinHash signatures, LSH candidate lookups and the cycle-wide report."""
+
+    def test_signatures_estimate_jaccard_similarity(self):
+        near = minhash.signature(minhash.word_shingles(BODY))
+        edited = minhash.signature(minhash.word_shingles(BODY.replace("two years", "24 months")))
+        other = minhash.signature(minhash.word_shingles("A survey of sleep and fatigue in nursing staff."))
+        assert minhash.similarity(near, edited) > 0.6
+        assert minhash.similarity(near, other) < 0.1
+        assert minhash.unpack(minhash.pack(near)) == near
+        shared = set(minhash.band_buckets(near)) & set(minhash.band_buckets(edited))
+        assert shared and len(minhash.band_buckets(near)) == minhash.BANDS
+
+    def test_vectorised_signature_matches_the_integer_formula(self):
+        shingles = minhash.word_shingles(BODY) | minhash.char_shingles(BODY)
+        hashes = [zlib.crc32(shingle.encode("utf-8")) for shingle in shingles]
+        expected = [
+            min((a * x + b) % minhash._PRIME for x in hashes) & minhash._MAX32
+            for a, b in minhash._PERMUTATIONS
+        ]
+        assert minhash.signature(shingles) == expected  # stored signatures stay valid
+        assert minhash.signature(set()) == [minhash._MAX32] * minhash.NUM_PERM
+
+    def test_similar_submissions_match_across_kinds(self, sqlite_app):
+        app = sqlite_app()
+        with app.app_context():
+            cycle_id = uuid.uuid4()
+            ids = _seed(cycle_id)
+            assert rebuild_fingerprints(batch_size=2) == {"abstract": 3, "award": 1, "best_paper": 0}
+
+            matches = similar_submissions(GradingFor.ABSTRACT, ids["original"], threshold=0.4)
+            found = {(item["entity_type"], item["id"]): item for item in matches}
+            assert set(found) == {("abstract", str(ids["resubmitted"])), ("award", str(ids["award"]))}
+            assert found[("award", str(ids["award"]))]["matched_on"] == "title"
+            assert found[("award", str(ids["award"]))]["number"] == 20000
+            assert similar_submissions(GradingFor.ABSTRACT, uuid.uuid4()) is None
+            # Rebuilding replaces rather than duplicates bucket rows.
+            count = db.session.scalar(select(func.count()).select_from(SubmissionLshBucket))
+            rebuild_fingerprints()
+            assert db.session.scalar(select(func.count()).select_from(SubmissionLshBucket)) == count
+
+    def test_cycle_report_groups_verified_pairs_into_clusters(self, sqlite_app):
+        app = sqlite_app()
+        with app.app_context():
+            cycle_id = uuid.uuid4()
+            ids = _seed(cycle_id)
+            _seed(uuid.uuid4(), offset=10)  # identical texts in another cycle stay out of the report
+            rebuild_fingerprints()
+
+            report = cycle_duplicate_report(cycle_id, threshold=0.4)
+            assert report["candidate_pairs"] >= len(report["pairs"]) == 3
+            assert len(report["clusters"]) == 1
+            assert {item["id"] for item in report["clusters"][0]} == {
+                str(ids["original"]), str(ids["resubmitted"]), str(ids["award"]),
+            }
+            abstracts_only = cycle_duplicate_report(cycle_id, threshold=0.4, entity_types=[GradingFor.ABSTRACT])
+            assert len(abstracts_only["pairs"]) == 1
@@ -0,0 +1,97 @@
+import uuid
+
+import pytest
+from sqlalchemy import func, insert, select
+
+from app.extensions import db
+from app.models.Cycle import Abstracts, Awards, Category, Grading, GradingType
+from app.models.enumerations import GradingFor
+from app.services import agreement_service
+from app.services.grading_sheet_service import GradingSheetError, parse_sheets, save_grading_sheets
+from app.utils import grading_type_cache
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    grading_type_cache.invalidate()
+
+
+def _seed():
+    category = uuid.uuid4()
+    db.session.execute(insert(Category.__table__).values(id=category, name="Cardiology"))
+    criteria = {name: uuid.uuid4() for name in ("Novelty", "Method", "Award impact")}
+    for name, criterion in criteria.items():
+        db.session.execute(insert(GradingType.__table__).values(
+            id=criterion, criteria=name, min_score=1, max_score=5,
+            grading_for="AWARD" if name == "Award impact" else "ABSTRACT",
+        ))
+    abstract_id = uuid.uuid4()
+    db.session.execute(insert(Abstracts.__table__).values(
+        id=abstract_id, title="Stents", content="text", category_id=category, cycle_id=uuid.uuid4(),
+        created_by_id=uuid.uuid4(), status="UNDER_REVIEW", review_phase=2, abstract_number=10000,
+    ))
+    db.session.commit()
+    return abstract_id, criteria
+
+
+class TestGradingSheets:
+    """Batch grading: in-memory validation and a single upsert per kind."""
+
+    def test_sheet_is_upserted_and_returned_whole(self, sqlite_app, monkeypatch):
+        app = sqlite_app()
+        with app.app_context():
+            abstract_id, criteria = _seed()
+            index_reads = []
+            real_index = grading_type_cache._index
+            monkeypatch.setattr(grading_type_cache, "_index", lambda: index_reads.append(1) or real_index())
+            grader = uuid.uuid4()
+            first = save_grading_sheets(parse_sheets({
+                "abstract_id": str(abstract_id),
+                "scores": [{"grading_type_id": str(criteria["Novelty"]), "score": 4, "comments": "good"}],
+            }), grader)
+            assert db.session.info[agreement_service._SESSION_KEY] == {GradingFor.ABSTRACT}
+            db.session.commit()
+            assert first[0]["review_phase"] == 2  # defaults to the submission's current phase
+            novelty_id = first[0]["grades"][0]["id"]
+
+            sheets = save_grading_sheets(parse_sheets({"sheets": [{
+                "abstract_id": str(abstract_id),
+                "scores": [
+                    {"grading_type_id": str(criteria["Novelty"]), "score": 5},
+                    {"grading_type_id": str(criteria["Method"]), "score": 2},
+                ],
+            }]}), grader)
+            db.session.commit()
+            grades = sheets[0]["grades"]
+            assert len(index_reads) == 2  # one criteria snapshot per batch, not per score
+            assert [(g["criteria"], g["score"]) for g in grades] == [("Method", 2), ("Novelty", 5)]
+            assert grades[1]["id"] == novelty_id and grades[1]["comments"] is None
+            assert db.session.scalar(select(func.count()).select_from(Grading)) == 2
+
+    def test_every_problem_is_reported_and_nothing_is_written(self, sqlite_app):
+        app = sqlite_app()
+        with app.app_context():
+            abstract_id, criteria = _seed()
+            with pytest.raises(GradingSheetError) as excinfo:
+                parse_sheets({"sheets": [{"abstract_id": "nope", "scores": []}, {"scores": [{}]}]})
+            assert len(excinfo.value.problems) == 2
+
+            rows = parse_sheets({"sheets": [
+                {"abstract_id": str(abstract_id), "scores": [
+                    {"grading_type_id": str(criteria["Novelty"]), "score": 9},
+                    {"grading_type_id": str(criteria["Award impact"]), "score": 3},
+                    {"grading_type_id": str(criteria["Method"]), "score": 3},
+                    {"grading_type_id": str(criteria["Method"]), "score": 4},
+                ]},
+                {"award_id": str(uuid.uuid4()), "scores": [{"grading_type_id": str(criteria["Award impact"]), "score": 3}]},
+            ]})
+            with pytest.raises(GradingSheetError) as excinfo:
+                save_grading_sheets(rows, uuid.uuid4())
+            problems = excinfo.value.problems
+            assert len(problems) == 4
+            assert any("between 1 and 5" in p for p in problems)
+            assert any("grading type is for award" in p for p in problems)
+            assert any("scored more than once" in p for p in problems)
+            assert any(p.startswith("award ") and p.endswith("not found") for p in problems)
+            assert db.session.scalar(select(func.count()).select_from(Grading)) == 0
+            assert db.session.scalar(select(func.count()).select_from(Awards)) == 0
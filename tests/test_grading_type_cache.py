@@ -0,0 +1,105 @@
+import uuid
+
+import pytest
+from sqlalchemy import event, insert
+
+from app.extensions import db
+from app.models.Cycle import Grading, GradingType
+from app.models.enumerations import GradingFor
+from app.schemas.grading_schema import GradingSchema
+from app.utils import grading_type_cache
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    grading_type_cache.invalidate()
+
+
+class TestGradingTypeCache:
+    """Cached grading criteria for validators, schemas and exports."""
+
+    def test_validators_read_the_cache_instead_of_querying(self, sqlite_app):
+        app = sqlite_app()
+        with app.app_context():
+            novelty = GradingType(criteria="Novelty", min_score=0, max_score=10, grading_for=GradingFor.ABSTRACT)
+            db.session.add(novelty)
+            db.session.commit()
+            criterion_id = novelty.id
+            db.session.expunge_all()
+
+            statements = []
+            event.listen(db.engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+            for score in (3, 7, 10):
+                grade = Grading(grading_type_id=criterion_id)
+                grade.score = score
+                grade.verification_level = 1
+            assert len(statements) == 1  # the one-time load of the criteria table
+            with pytest.raises(ValueError, match="maximum"):
+                Grading(grading_type_id=criterion_id).score = 11
+            with pytest.raises(ValueError, match="verification level"):
+                Grading(grading_type_id=criterion_id).verification_level = 2
+            dumped = GradingSchema().get_grading_type(Grading(grading_type_id=criterion_id))
+            assert dumped["criteria"] == "Novelty" and dumped["max_score"] == 10
+            assert len(statements) == 1
+
+    def test_orm_writes_bump_the_version_and_misses_hit_the_database(self, sqlite_app):
+        app = sqlite_app()
+        with app.app_context():
+            method = GradingType(criteria="Method", min_score=0, max_score=5, grading_for=GradingFor.AWARD)
+            db.session.add_all([
+                method,
+                GradingType(criteria="Impact", min_score=0, max_score=5, grading_for=GradingFor.AWARD),
+                GradingType(criteria="Clarity", min_score=0, max_score=5, grading_for=GradingFor.ABSTRACT),
+            ])
+            db.session.commit()
+            assert [info.criteria for info in grading_type_cache.for_target(GradingFor.AWARD)] == ["Impact", "Method"]
+            assert grading_type_cache.get(str(method.id)).max_score == 5
+
+            method.max_score = 20
+            db.session.commit()
+            assert grading_type_cache.get(method.id).max_score == 20
+
+            # Raw inserts bypass the version bump but are still found on a miss.
+            raw_id = uuid.uuid4()
+            db.session.execute(insert(GradingType.__table__).values(
+                id=raw_id, criteria="Ethics", min_score=0, max_score=3, grading_for="AWARD",
+            ))
+            assert grading_type_cache.get(raw_id).criteria == "Ethics"
+            assert grading_type_cache.get(uuid.uuid4()) is None
+            assert grading_type_cache.get("not-a-uuid") is None
+
+    def test_version_is_read_once_per_request_and_snapshots_skip_it(self, sqlite_app, monkeypatch):
+        class FakeRedis:
+            def __init__(self):
+                self.gets = 0
+                self.value = 0
+
+            def get(self, key):
+                self.gets += 1
+                return self.value
+
+            def incr(self, key):
+                self.value += 1
+                return self.value
+
+        app = sqlite_app()
+        redis = FakeRedis()
+        monkeypatch.setattr(grading_type_cache._versions, "_redis", lambda: redis)
+        with app.app_context():
+            novelty = GradingType(criteria="Novelty", min_score=0, max_score=10, grading_for=GradingFor.ABSTRACT)
+            db.session.add(novelty)
+            db.session.commit()
+            with app.test_request_context("/gradings"):
+                for _ in range(50):
+                    assert grading_type_cache.get(novelty.id).criteria == "Novelty"
+                assert redis.gets == 1
+                novelty.max_score = 5
+                db.session.commit()  # this worker's own bump is seen at once
+                assert grading_type_cache.get(novelty.id).max_score == 5
+                assert redis.gets == 2
+
+            redis.gets = 0
+            criteria = grading_type_cache.snapshot()
+            assert [criteria.get(novelty.id).max_score for _ in range(50)] == [5] * 50
+            assert criteria.get(uuid.uuid4()) is None and criteria.get("nope") is None
+            assert redis.gets <= 1
@@ -0,0 +1,96 @@
+import uuid
+
+import pytest
+from sqlalchemy import insert, update
+
+from app.extensions import db
+from app.models.Cycle import Abstracts, Category, Grading, GradingType
+from app.models.enumerations import GradingFor
+from app.services import ranking_service
+from app.services.ranking_service import compute_rankings, leaderboard
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    ranking_service.clear_cache()
+
+
+def _grades(rows):
+    """(submission, grader, category, score) rows on one 0-10 criterion."""
+    subs, graders, cats, scores = zip(*rows)
+    n = len(rows)
+    return compute_rankings(subs, graders, cats, scores, [0] * n, [10] * n, [1.0] * n)
+
+
+class TestRanking:
+    """Weighted totals, per-grader normalisation and per-category ranks."""
+
+    def test_harsh_grader_does_not_sink_their_submissions(self):
+        # "harsh" scores everything 3 points lower than "fair" would.
+        ranked = _grades([
+            ("a", "fair", "c1", 9), ("b", "fair", "c1", 6), ("c", "fair", "c1", 5),
+            ("d", "harsh", "c1", 5), ("e", "harsh", "c1", 3),
+        ])
+        by_id = {item["id"]: item for item in ranked}
+        assert by_id["d"]["total"] < by_id["b"]["total"]
+        assert by_id["d"]["score"] > by_id["b"]["score"]
+        assert by_id["a"]["rank"] == 1 and by_id["a"]["percentile"] == 100.0
+        assert ranked[0]["id"] == "a"
+        assert sorted(item["rank"] for item in ranked) == [1, 2, 3, 4, 5]
+
+    def test_weights_ties_and_categories(self):
+        subs = ["a", "a", "b", "b", "c", "c"]
+        graders = ["g"] * 6
+        cats = ["x", "x", "x", "x", "y", "y"]
+        # Criterion 2 (0-5, weight 3) dominates criterion 1 (0-10, weight 1).
+        scores = [10, 1, 0, 4, 5, 3]
+        ranked = compute_rankings(subs, graders, cats, scores, [0, 0] * 3, [10, 5] * 3, [1.0, 3.0] * 3)
+        by_id = {item["id"]: item for item in ranked}
+        assert by_id["a"]["total"] == 40.0 and by_id["b"]["total"] == 60.0
+        assert (by_id["b"]["rank"], by_id["a"]["rank"], by_id["c"]["rank"]) == (1, 2, 1)
+        assert by_id["c"]["category_size"] == 1 and by_id["c"]["percentile"] == 100.0
+
+        tied = _grades([("a", "g", "x", 7), ("b", "g", "x", 7), ("c", "g", "x", 2)])
+        assert sorted(item["rank"] for item in tied) == [1, 1, 3]
+        assert compute_rankings([], [], [], [], [], [], []) == []
+
+    def test_leaderboard_is_cached_until_a_grade_changes(self, sqlite_app):
+        app = sqlite_app()
+        with app.app_context():
+            cycle_id, category_id, criterion = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+            db.session.execute(insert(Category.__table__).values(id=category_id, name="Cardiology"))
+            db.session.execute(insert(GradingType.__table__).values(
+                id=criterion, criteria="Novelty", min_score=0, max_score=10, grading_for="ABSTRACT",
+            ))
+            abstracts = [uuid.uuid4() for _ in range(3)]
+            for number, abstract_id in enumerate(abstracts, start=10000):
+                db.session.execute(insert(Abstracts.__table__).values(
+                    id=abstract_id, title=f"Abstract {number}", content="text", category_id=category_id,
+                    cycle_id=cycle_id, created_by_id=uuid.uuid4(), status="UNDER_REVIEW",
+                    review_phase=1, abstract_number=number,
+                ))
+            grader = uuid.uuid4()
+            grade_ids = []
+            for abstract_id, score in zip(abstracts, (4, 8, 6)):
+                grade_ids.append(uuid.uuid4())
+                db.session.execute(insert(Grading.__table__).values(
+                    id=grade_ids[-1], score=score, grading_type_id=criterion, abstract_id=abstract_id,
+                    graded_by_id=grader,
+                ))
+            db.session.commit()
+
+            items, total, cached = leaderboard(GradingFor.ABSTRACT, cycle_id, page_size=2)
+            assert not cached and total == 3
+            assert [item["number"] for item in items] == [10001, 10002]
+            assert items[0]["category_id"] == str(category_id) and items[0]["status"] == "under_review"
+            assert leaderboard(GradingFor.ABSTRACT, cycle_id, page_size=2)[2]
+            assert leaderboard(GradingFor.ABSTRACT, uuid.uuid4()) == ([], 0, False)
+
+            db.session.execute(update(Grading.__table__).where(Grading.id == grade_ids[0]).values(score=10))
+            db.session.execute(insert(Grading.__table__).values(
+                id=uuid.uuid4(), score=0, grading_type_id=criterion, abstract_id=abstracts[1],
+                graded_by_id=uuid.uuid4(),
+            ))
+            db.session.commit()
+            items, _, cached = leaderboard(GradingFor.ABSTRACT, cycle_id, page=1, page_size=1)
+            assert not cached and items[0]["number"] == 10000
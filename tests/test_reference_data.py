@@ -0,0 +1,90 @@
+import json
+from datetime import date
+
+import pytest
+from sqlalchemy import event
+
+from app.extensions import db
+from app.models.Cycle import Category, Cycle, GradingType
+from app.models.User import Department
+from app.models.enumerations import GradingFor
+from app.services import reference_data_service
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    reference_data_service.invalidate()
+
+
+def _load(since=None):
+    body, etag = reference_data_service.bundle(since)
+    return json.loads(body), etag
+
+
+class TestReferenceData:
+    """Versioned reference-data bundle and its delta mode."""
+
+    def test_bundle_is_served_from_the_snapshot_until_a_table_changes(self, sqlite_app):
+        app = sqlite_app(cycle_windows=True)
+        with app.app_context():
+            db.session.add_all([
+                Cycle(name="2026", start_date=date(2026, 1, 1), end_date=date(2026, 12, 31)),
+                Category(name="Oncology"),
+                Department(name="Surgery"),
+                GradingType(criteria="Novelty", min_score=0, max_score=10, grading_for=GradingFor.ABSTRACT),
+            ])
+            db.session.commit()
+            first, etag = _load()
+            assert first["full"] is True
+            assert [c["name"] for c in first["sections"]["cycles"]["items"]] == ["2026"]
+            assert first["sections"]["grading_types"]["items"][0]["grading_for"] == "abstract"
+            assert first["sections"]["departments"]["items"] == [
+                {"id": first["sections"]["departments"]["items"][0]["id"], "name": "Surgery"}
+            ]
+
+            statements = []
+            event.listen(db.engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+            again, same_etag = _load()
+            assert statements == [] and same_etag == etag and again == first
+
+            db.session.add(Category(name="Cardiology"))
+            db.session.commit()
+            updated, new_etag = _load()
+            assert new_etag != etag and updated["version"] > first["version"]
+            assert [c["name"] for c in updated["sections"]["categories"]["items"]] == ["Cardiology", "Oncology"]
+            reads = [sql for sql in statements if sql.startswith("SELECT")]
+            assert len(reads) == 1 and "FROM categories" in reads[0]  # only that section reloads
+
+    def test_since_returns_only_sections_changed_after_the_version(self, sqlite_app):
+        app = sqlite_app(cycle_windows=True)
+        with app.app_context():
+            base, _ = _load()
+            department = Department(name="Medicine")
+            db.session.add(department)
+            db.session.commit()
+            delta, _ = _load(base["version"])
+            assert delta["full"] is False
+            assert list(delta["sections"]) == ["departments"]
+            assert delta["sections"]["departments"]["items"][0]["name"] == "Medicine"
+
+            unchanged, _ = _load(delta["version"])
+            assert unchanged["sections"] == {}
+
+            department.name = "Internal Medicine"
+            db.session.rollback()
+            assert _load(delta["version"])[0]["sections"] == {}
+
+            ahead, _ = _load(delta["version"] + 100)
+            assert ahead["full"] is True and set(ahead["sections"]) == set(reference_data_service.SECTIONS)
+
+    def test_rollback_drops_rows_the_snapshot_saw_uncommitted(self, sqlite_app):
+        app = sqlite_app(cycle_windows=True)
+        with app.app_context():
+            db.session.add(Category(name="Draft"))
+            db.session.flush()
+            seen, _ = _load()
+            assert [c["name"] for c in seen["sections"]["categories"]["items"]] == ["Draft"]
+            db.session.rollback()
+            after, _ = _load()
+            assert after["sections"]["categories"]["items"] == []
+            assert after["version"] > seen["version"]
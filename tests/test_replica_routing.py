@@ -0,0 +1,54 @@
+import pytest
+from sqlalchemy import literal_column, select, table, text
+
+from app.extensions import db, replica_reads
+from app.models.AuditLog import AuditLog
+from app.models.Cycle import Category
+
+
+@pytest.fixture
+def routed_app(sqlite_app, tmp_path):
+    app = sqlite_app((AuditLog, Category), SQLALCHEMY_BINDS={"replica": f"sqlite:///{tmp_path / 'replica.db'}"})
+    with app.app_context():
+        for key, label in ((None, "primary"), ("replica", "replica")):
+            with db.engines[key].begin() as conn:
+                conn.execute(text("CREATE TABLE origin (name TEXT)"))
+                conn.execute(text("INSERT INTO origin VALUES (:n)"), {"n": label})
+    return app
+
+
+def _origin():
+    stmt = select(literal_column("name")).select_from(table("origin"))
+    return db.session.execute(stmt).scalar()
+
+
+class TestReplicaRouting:
+    """Opt-in replica reads with read-your-writes pinning."""
+
+    def test_reads_default_to_primary(self, routed_app):
+        app = routed_app
+        with app.app_context():
+            assert _origin() == "primary"
+
+    def test_replica_reads_block_uses_replica(self, routed_app):
+        app = routed_app
+        with app.app_context():
+            with replica_reads():
+                assert _origin() == "replica"
+            assert _origin() == "primary"
+
+    def test_write_pins_session_to_primary(self, routed_app):
+        app = routed_app
+        with app.test_request_context():
+            db.session.add(Category(name="Oncology"))
+            db.session.flush()
+            with replica_reads():
+                assert _origin() == "primary"
+
+    def test_audit_writes_do_not_pin(self, routed_app):
+        app = routed_app
+        with app.test_request_context():
+            db.session.add(AuditLog(event="export"))
+            db.session.commit()
+            with replica_reads():
+                assert _origin() == "replica"
@@ -0,0 +1,96 @@
+import uuid
+
+from sqlalchemy import insert, select
+
+from app.extensions import db
+from app.models.Cycle import AbstractVerifiers, Abstracts, Grading, GradingType
+from app.models.SubmissionCounter import SubmissionCounter, recount_submission_counters
+from app.models.enumerations import GradingFor, Status
+from app.utils.model_utils import review_phase_utils as rp
+
+
+class _Seed:
+    def __init__(self):
+        self.cycle = uuid.uuid4()
+        self.category = uuid.uuid4()
+        self.types = [uuid.uuid4(), uuid.uuid4()]
+        self._number = 10000
+        for type_id in self.types:
+            db.session.execute(insert(GradingType.__table__).values(
+                id=type_id, criteria="c", max_score=10, grading_for=GradingFor.ABSTRACT.name,
+            ))
+
+    def abstract(self, status=Status.UNDER_REVIEW, cycle=None):
+        self._number += 1
+        abstract_id = uuid.uuid4()
+        db.session.execute(insert(Abstracts.__table__).values(
+            id=abstract_id, title="t", content="c", category_id=self.category,
+            cycle_id=cycle or self.cycle, created_by_id=uuid.uuid4(), status=status.name,
+            review_phase=1, abstract_number=self._number,
+        ))
+        return abstract_id
+
+    def assign(self, abstract_id, verifier_id):
+        db.session.execute(insert(AbstractVerifiers.__table__).values(
+            abstract_id=abstract_id, user_id=verifier_id, review_phase=1,
+        ))
+
+    def grade(self, abstract_id, verifier_id, type_ids=None):
+        for type_id in type_ids or self.types:
+            db.session.execute(insert(Grading.__table__).values(
+                id=uuid.uuid4(), score=5, grading_type_id=type_id, abstract_id=abstract_id,
+                graded_by_id=verifier_id, review_phase=1,
+            ))
+
+
+class TestGradingCompleteness:
+    """Anti-join over (verifier assignment x grading type) without a grade."""
+
+    def test_missing_pairs_and_completeness(self, sqlite_app):
+        app = sqlite_app()
+        with app.app_context():
+            seed = _Seed()
+            done, partial, unassigned = seed.abstract(), seed.abstract(), seed.abstract()
+            v1, v2 = uuid.uuid4(), uuid.uuid4()
+            for abstract_id in (done, partial):
+                seed.assign(abstract_id, v1)
+                seed.assign(abstract_id, v2)
+            seed.grade(done, v1)
+            seed.grade(done, v2)
+            seed.grade(partial, v1)
+            seed.grade(partial, v2, type_ids=seed.types[:1])
+
+            missing = rp.missing_grades(GradingFor.ABSTRACT, [done, partial, unassigned])
+            assert missing == [rp.MissingGrade(partial, v2, seed.types[1])]
+            assert rp.incomplete_submission_ids(GradingFor.ABSTRACT, cycle_id=seed.cycle) == {partial}
+            assert rp.is_grading_complete(GradingFor.ABSTRACT, db.session.get(Abstracts, done))
+            assert not rp.is_grading_complete(GradingFor.ABSTRACT, db.session.get(Abstracts, partial))
+            assert rp.is_grading_complete(GradingFor.ABSTRACT, db.session.get(Abstracts, unassigned))
+
+    def test_bulk_advance_moves_only_complete_submissions(self, sqlite_app):
+        app = sqlite_app()
+        with app.app_context():
+            seed = _Seed()
+            done, partial, unassigned = seed.abstract(), seed.abstract(), seed.abstract()
+            pending = seed.abstract(status=Status.PENDING)
+            other_cycle = seed.abstract(cycle=uuid.uuid4())
+            verifier = uuid.uuid4()
+            for abstract_id in (done, partial, pending, other_cycle):
+                seed.assign(abstract_id, verifier)
+            for abstract_id in (done, pending, other_cycle):
+                seed.grade(abstract_id, verifier)
+            recount_submission_counters()
+            db.session.commit()
+
+            advanced = rp.advance_eligible_submissions(GradingFor.ABSTRACT, cycle_id=seed.cycle)
+            assert advanced == [done]
+            phases = dict(db.session.execute(select(Abstracts.id, Abstracts.review_phase)).all())
+            assert phases[done] == 2
+            assert phases[partial] == phases[unassigned] == phases[pending] == phases[other_cycle] == 1
+
+            counters = {
+                (row.status, row.review_phase): row.count
+                for row in db.session.scalars(select(SubmissionCounter).where(SubmissionCounter.cycle_id == seed.cycle))
+            }
+            assert counters[(Status.UNDER_REVIEW, 2)] == 1
+            assert counters[(Status.UNDER_REVIEW, 1)] == 2
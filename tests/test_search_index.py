@@ -0,0 +1,111 @@
+import uuid
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex
+
+from app.extensions import db
+from app.models.Cycle import Abstracts, Awards, Category
+from app.models.SearchIndex import rebuild_search_vectors, search, search_document
+from app.models.enumerations import GradingFor
+
+
+def _pg(clause):
+    return str(clause.compile(dialect=postgresql.dialect()))
+
+
+class TestSearchIndex:
+    """Weighted tsvector documents, ranked search and the SQLite fallback."""
+
+    def test_document_weights_fields_and_optional_unaccent(self):
+        sql = _pg(update(Awards).values(search_vec=search_document(GradingFor.AWARD, Awards, unaccent=True)))
+        assert sql.count("setweight(to_tsvector(CAST(") == 3
+        assert "unaccent(coalesce(awards.title" in sql
+        assert "WHERE authors.id = awards.author_id" in sql
+        assert "WHERE paper_categories.id = awards.paper_category_id" in sql
+        assert "unaccent" not in _pg(search_document(GradingFor.ABSTRACT, Abstracts))
+
+    def test_postgres_search_uses_indexed_operators(self):
+        match = search(GradingFor.ABSTRACT, "tumour markers", dialect="postgresql", unaccent=False)
+        condition = _pg(match.condition)
+        assert "abstracts.search_vec @@ websearch_to_tsquery(" in condition
+        assert "<%% abstracts.title" in condition
+        assert "ts_rank_cd(abstracts.search_vec" in _pg(match.rank)
+        indexes = {index.name: _pg(CreateIndex(index)) for index in Abstracts.__table__.indexes}
+        assert "USING gin (search_vec)" in indexes["ix_abstracts_search_vec"]
+        assert "USING gin (title gin_trgm_ops)" in indexes["ix_abstracts_title_trgm"]
+
+    def test_tsquery_is_unaccented_only_when_documents_are(self):
+        plain = search(GradingFor.AWARD, "étude", dialect="postgresql", unaccent=False)
+        assert "unaccent" not in _pg(plain.condition) + _pg(plain.rank)
+
+        match = search(GradingFor.AWARD, "étude", dialect="postgresql", unaccent=True)
+        condition, rank = _pg(match.condition), _pg(match.rank)
+        assert "websearch_to_tsquery(CAST(%(param_1)s AS REGCONFIG), unaccent(" in condition
+        assert condition.count("unaccent(") == 1
+        # The raw title is matched with the raw query, so substrings keep their accents.
+        assert "awards.title ILIKE %(title_1)s" in condition
+        assert "%(param_2)s <%% awards.title" in condition
+        assert "word_similarity(%(word_similarity_1)s, awards.title)" in rank
+
+    def test_fallback_matches_body_and_category_and_ranks_titles_first(self, sqlite_app):
+        app = sqlite_app()
+        with app.app_context():
+            cardiology, other = uuid.uuid4(), uuid.uuid4()
+            db.session.execute(insert(Category.__table__), [
+                {"id": cardiology, "name": "Cardiology"},
+                {"id": other, "name": "Other"},
+            ])
+            rows = {
+                "title": ("Stent outcomes", "text", other),
+                "body": ("Registry", "long follow-up of stent patients", other),
+                "category": ("Registry 2", "text", cardiology),
+                "miss": ("Unrelated", "100% unrelated", other),
+            }
+            ids = {}
+            for number, (key, (title, content, category)) in enumerate(rows.items(), start=10000):
+                ids[key] = uuid.uuid4()
+                db.session.execute(insert(Abstracts.__table__).values(
+                    id=ids[key], title=title, content=content, category_id=category,
+                    cycle_id=uuid.uuid4(), created_by_id=uuid.uuid4(), status="PENDING",
+                    review_phase=1, abstract_number=number,
+                ))
+
+            def find(q):
+                match = search(GradingFor.ABSTRACT, q)
+                stmt = select(Abstracts.id).where(match.condition).order_by(match.rank.desc(), Abstracts.title)
+                return db.session.scalars(stmt).all()
+
+            assert find("stent") == [ids["title"], ids["body"]]
+            assert find("cardio") == [ids["category"]]
+            assert find("%") == [ids["miss"]]  # wildcards are matched literally
+            assert find("_") == []
+
+    def test_reindex_walks_batches(self, sqlite_app, monkeypatch):
+        app = sqlite_app()
+        with app.app_context():
+            category = uuid.uuid4()
+            db.session.execute(insert(Category.__table__).values(id=category, name="C"))
+            for number in range(5):
+                db.session.execute(insert(Abstracts.__table__).values(
+                    id=uuid.uuid4(), title=f"t{number}", content="c", category_id=category,
+                    cycle_id=uuid.uuid4(), created_by_id=uuid.uuid4(), status="PENDING",
+                    review_phase=1, abstract_number=10000 + number,
+                ))
+            db.session.commit()
+            # SQLite has no tsvector; substitute the title so the batching can be checked.
+            monkeypatch.setattr("app.models.SearchIndex.has_unaccent", lambda connection: False)
+            monkeypatch.setattr(
+                "app.models.SearchIndex.search_document",
+                lambda entity_type, source, **kw: source.title,
+            )
+            progress = []
+            totals = rebuild_search_vectors(
+                entity_types=[GradingFor.ABSTRACT],
+                batch_size=2,
+                on_batch=lambda entity_type, done: progress.append(done),
+            )
+            assert totals == {"abstract": 5}
+            assert progress == [2, 4, 5]
+            vectors = db.session.execute(select(Abstracts.title, Abstracts.search_vec)).all()
+            assert all(title == vec for title, vec in vectors)
@@ -0,0 +1,109 @@
+import uuid
+
+import pytest
+from sqlalchemy import event, insert
+
+from app.extensions import db
+from app.models.Cycle import AbstractVerifiers, Abstracts, Category, Grading, GradingType
+from app.models.User import User
+from app.models.enumerations import GradingFor
+from app.schemas.abstract_schema import AbstractSchema
+from app.schemas.grading_schema import GradingSchema
+from app.utils import grading_type_cache, sparse_fields
+from app.utils.model_utils.verifier_assignment_utils import verifier_counts
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    grading_type_cache.invalidate()
+
+
+def _seed():
+    category = uuid.uuid4()
+    db.session.execute(insert(Category.__table__).values(id=category, name="Cardiology"))
+    users = [uuid.uuid4(), uuid.uuid4()]
+    for n, user_id in enumerate(users):
+        db.session.execute(insert(User.__table__).values(
+            id=user_id, username=f"verifier{n}", email=f"v{n}@example.org", mobile=f"98765432{n}0",
+            password_hash="x",
+        ))
+    criterion = uuid.uuid4()
+    db.session.execute(insert(GradingType.__table__).values(
+        id=criterion, criteria="Novelty", min_score=1, max_score=5, grading_for="ABSTRACT",
+    ))
+    abstract_ids = [uuid.uuid4(), uuid.uuid4()]
+    for number, abstract_id in enumerate(abstract_ids, start=10000):
+        db.session.execute(insert(Abstracts.__table__).values(
+            id=abstract_id, title=f"Stents {number}", content="long text", category_id=category,
+            cycle_id=uuid.uuid4(), created_by_id=users[0], status="UNDER_REVIEW", abstract_number=number,
+        ))
+    for user_id in users:
+        db.session.execute(insert(AbstractVerifiers.__table__).values(abstract_id=abstract_ids[0], user_id=user_id))
+    db.session.execute(insert(Grading.__table__).values(
+        id=uuid.uuid4(), abstract_id=abstract_ids[0], grading_type_id=criterion,
+        graded_by_id=users[1], score=4, review_phase=1,
+    ))
+    db.session.commit()
+    return abstract_ids
+
+
+def _listing(fieldset, model=Abstracts):
+    statements = []
+    listener = lambda *args: statements.append(args[2])  # noqa: E731
+    event.listen(db.engine, "before_cursor_execute", listener)
+    try:
+        rows = db.session.query(model).options(*fieldset.options).order_by(model.id).all()
+        dumped = fieldset.schema.dump(rows)
+    finally:
+        event.remove(db.engine, "before_cursor_execute", listener)
+    return dumped, statements
+
+
+class TestSparseFields:
+    """fields= / include= drive both the loader options and the serializer."""
+
+    def test_requested_shape_limits_columns_relations_and_output(self, sqlite_app):
+        app = sqlite_app()
+        with app.app_context():
+            abstract_ids = _seed()
+            fieldset = sparse_fields.parse_fieldset(
+                AbstractSchema, {"fields": "title,verifiers.username,verifiers_count"}, extras=("verifiers_count",),
+            )
+            dumped, statements = _listing(fieldset)
+            assert {tuple(sorted(item)) for item in dumped} == {("id", "title", "verifiers")}
+            assert sorted(v["username"] for v in dumped[0]["verifiers"] + dumped[1]["verifiers"]) == [
+                "verifier0", "verifier1",
+            ]
+            assert len(statements) == 2  # submissions + one selectin for verifiers
+            assert "content" not in statements[0] and "gradings" not in " ".join(statements)
+            assert sparse_fields.wants(fieldset, "verifiers_count")
+            assert verifier_counts(GradingFor.ABSTRACT, abstract_ids) == {abstract_ids[0]: 2}
+
+            scalars = sparse_fields.parse_fieldset(AbstractSchema, {"include": "category"})
+            dumped, statements = _listing(scalars)
+            assert "content" in dumped[0] and dumped[0]["category"]["name"] == "Cardiology"
+            assert "verifiers" not in dumped[0] and "created_by" not in dumped[0]
+            assert not any("abstract_verifiers" in sql for sql in statements)
+
+    def test_default_shape_is_unchanged_and_unknown_names_are_rejected(self, sqlite_app):
+        app = sqlite_app()
+        with app.app_context():
+            _seed()
+            legacy = sparse_fields.parse_fieldset(AbstractSchema, {})
+            dumped, _ = _listing(legacy)
+            assert dumped == AbstractSchema(many=True).dump(
+                db.session.query(Abstracts).order_by(Abstracts.id).all()
+            )
+            assert legacy.extras is None and sparse_fields.wants(legacy, "verifiers_count")
+
+            grades = sparse_fields.parse_fieldset(GradingSchema, {"fields": "score,grading_type"})
+            dumped, statements = _listing(grades, Grading)
+            assert dumped[0]["grading_type"]["criteria"] == "Novelty" and set(dumped[0]) == {
+                "id", "score", "grading_type",
+            }
+            assert len(statements) == 1  # criteria come from the cache, not a join
+
+            for args in ({"fields": "nope"}, {"include": "title"}, {"fields": "title.length"},
+                         {"fields": "verifiers.nope"}):
+                with pytest.raises(ValueError):
+                    sparse_fields.parse_fieldset(AbstractSchema, args)
@@ -0,0 +1,86 @@
+import uuid
+from datetime import date, timedelta
+
+from sqlalchemy import select, text
+
+from app.extensions import db
+from app.models.Cycle import Abstracts
+from app.models.SubmissionCounter import SubmissionCounter, recount_submission_counters
+from app.models.enumerations import GradingFor, Status
+
+
+def _open_window(cycle_id):
+    db.session.execute(
+        text("INSERT INTO cycle_windows VALUES (:id, :cycle, 'ABSTRACT_SUBMISSION', :start, :end)"),
+        {"id": uuid.uuid4().hex, "cycle": cycle_id.hex,
+         "start": date.today() - timedelta(days=1), "end": date.today() + timedelta(days=1)},
+    )
+
+
+def _counts():
+    rows = db.session.execute(
+        select(SubmissionCounter.status, SubmissionCounter.review_phase, SubmissionCounter.count)
+        .where(SubmissionCounter.entity_type == GradingFor.ABSTRACT, SubmissionCounter.count != 0)
+    ).all()
+    return {(status.value, phase): count for status, phase, count in rows}
+
+
+class TestSubmissionCounters:
+    """Counters follow ORM inserts, status moves, phase moves and deletes."""
+
+    def _abstract(self, cycle_id, category_id, number):
+        abstract = Abstracts(title="t", content="c", cycle_id=cycle_id, category_id=category_id,
+                             abstract_number=number, created_by_id=uuid.uuid4())
+        db.session.add(abstract)
+        return abstract
+
+    def test_counters_track_writes(self, sqlite_app):
+        app = sqlite_app(cycle_windows=True)
+        with app.app_context():
+            cycle_id, category_id = uuid.uuid4(), uuid.uuid4()
+            _open_window(cycle_id)
+            first = self._abstract(cycle_id, category_id, 1)
+            second = self._abstract(cycle_id, category_id, 2)
+            db.session.commit()
+            assert _counts() == {("pending", 1): 2}
+
+            first.status = Status.UNDER_REVIEW
+            db.session.commit()
+            assert _counts() == {("pending", 1): 1, ("under_review", 1): 1}
+
+            first.review_phase = 2
+            first.status = Status.ACCEPTED
+            db.session.commit()
+            assert _counts() == {("pending", 1): 1, ("accepted", 2): 1}
+
+            db.session.delete(second)
+            db.session.commit()
+            assert _counts() == {("accepted", 2): 1}
+
+    def test_rolled_back_write_leaves_counters_alone(self, sqlite_app):
+        app = sqlite_app(cycle_windows=True)
+        with app.app_context():
+            cycle_id = uuid.uuid4()
+            _open_window(cycle_id)
+            db.session.commit()
+            self._abstract(cycle_id, uuid.uuid4(), 1)
+            db.session.flush()
+            db.session.rollback()
+            assert _counts() == {}
+
+    def test_recount_repairs_drift(self, sqlite_app):
+        app = sqlite_app(cycle_windows=True)
+        with app.app_context():
+            cycle_id = uuid.uuid4()
+            _open_window(cycle_id)
+            self._abstract(cycle_id, uuid.uuid4(), 1)
+            db.session.commit()
+            # Bulk updates bypass mapper events.
+            db.session.execute(Abstracts.__table__.update().values(status=Status.REJECTED.name))
+            db.session.commit()
+            assert _counts() == {("pending", 1): 1}
+
+            totals = recount_submission_counters()
+            db.session.commit()
+            assert totals["abstract"] == 1
+            assert _counts() == {("rejected", 1): 1}
@@ -0,0 +1,123 @@
+import uuid
+
+import pytest
+from sqlalchemy import insert
+
+from app.extensions import db
+from app.models.Cycle import AbstractCoordinators, AbstractVerifiers, Abstracts, Awards, BestPaper
+from app.models.SubmissionCounter import SubmissionCounter, recount_submission_counters
+from app.models.User import User, UserRole
+from app.models.enumerations import Role, Status
+from app.services import submission_status_service as svc
+
+_TABLES = (
+    User, UserRole, Abstracts, AbstractVerifiers, AbstractCoordinators,
+    Awards, BestPaper, SubmissionCounter,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    svc.invalidate_status_summaries()
+
+
+def _user(name, role):
+    user = User(username=name, email=f"{name}@example.org", mobile=str(uuid.uuid4().int)[:10])
+    db.session.add(user)
+    db.session.flush()
+    db.session.add(UserRole(user_id=user.id, role=role))
+    return user
+
+
+_numbers = iter(range(10000, 20000))
+
+
+def _abstract(owner, status, cycle_id, phase=1):
+    abstract_id = uuid.uuid4()
+    # Core insert: skips the submission-window check, which needs cycle windows.
+    db.session.execute(insert(Abstracts.__table__).values(
+        id=abstract_id, title="t", content="c", category_id=uuid.uuid4(),
+        cycle_id=cycle_id, created_by_id=owner.id, status=status.name, review_phase=phase,
+        abstract_number=next(_numbers),
+    ))
+    return abstract_id
+
+
+def _recount():
+    # Core inserts bypass the counter listeners; the admin view reads counters.
+    recount_submission_counters()
+
+
+class TestStatusSummary:
+    """Role-scoped GROUP BY status counters."""
+
+    def _seed(self):
+        cycle_a, cycle_b = uuid.uuid4(), uuid.uuid4()
+        admin = _user("admin", Role.ADMIN)
+        owner = _user("owner", Role.USER)
+        other = _user("other", Role.USER)
+        verifier = _user("verifier", Role.VERIFIER)
+        mine = _abstract(owner, Status.PENDING, cycle_a)
+        _abstract(owner, Status.ACCEPTED, cycle_b, phase=2)
+        _abstract(other, Status.PENDING, cycle_a)
+        _abstract(other, Status.REJECTED, cycle_a)
+        db.session.add(AbstractVerifiers(abstract_id=mine, user_id=verifier.id))
+        _recount()
+        db.session.commit()
+        return admin, owner, verifier, cycle_a
+
+    def test_scopes_are_applied_in_sql(self, sqlite_app):
+        app = sqlite_app(_TABLES)
+        with app.app_context():
+            admin, owner, verifier, _ = self._seed()
+            assert svc.status_summary("abstract", admin) == {
+                "pending": 2, "under_review": 0, "accepted": 1, "rejected": 1,
+            }
+            assert svc.status_summary("abstract", owner)["accepted"] == 1
+            assert svc.status_summary("abstract", owner)["rejected"] == 0
+            assert svc.status_summary("abstract", verifier) == {
+                "pending": 1, "under_review": 0, "accepted": 0, "rejected": 0,
+            }
+
+    def test_breakdown_by_cycle_and_phase(self, sqlite_app):
+        app = sqlite_app(_TABLES)
+        with app.app_context():
+            admin, _, _, cycle_a = self._seed()
+            result = svc.status_summary("abstract", admin, breakdown=svc.parse_breakdown("phase,cycle"))
+        rows = {(r["cycle_id"], r["review_phase"]): r for r in result["breakdown"]}
+        assert rows[(str(cycle_a), 1)]["pending"] == 2
+        assert rows[(str(cycle_a), 1)]["rejected"] == 1
+        assert result["pending"] == 2
+
+    def test_results_are_cached_per_scope(self, sqlite_app):
+        app = sqlite_app(_TABLES)
+        with app.app_context():
+            admin, owner, _, cycle_a = self._seed()
+            assert svc.status_summary("abstract", admin, ttl=60)["pending"] == 2
+            _abstract(owner, Status.PENDING, cycle_a)
+            _recount()
+            db.session.commit()
+            assert svc.status_summary("abstract", admin, ttl=60)["pending"] == 2
+            assert svc.status_summary("abstract", owner, ttl=60)["pending"] == 2
+            svc.invalidate_status_summaries("abstract")
+            assert svc.status_summary("abstract", admin, ttl=60)["pending"] == 3
+
+    def test_cache_evicts_least_recently_used_beyond_the_limit(self, sqlite_app, monkeypatch):
+        monkeypatch.setattr(svc, "_CACHE_MAX_ENTRIES", 2)
+        app = sqlite_app(_TABLES)
+        with app.app_context():
+            admin, owner, verifier, _ = self._seed()
+            svc.status_summary("abstract", admin, ttl=60)
+            svc.status_summary("abstract", owner, ttl=60)
+            svc.status_summary("abstract", admin, ttl=60)  # hit: admin becomes most recent
+            svc.status_summary("abstract", verifier, ttl=60)
+            users = [key[2] for key in svc._cache]
+            assert users == [None, str(verifier.id)]  # owner's entry was evicted
+
+    def test_unknown_breakdown_is_rejected(self):
+        try:
+            svc.parse_breakdown("cycle,category")
+        except ValueError as exc:
+            assert "category" in str(exc)
+        else:
+            raise AssertionError("expected ValueError")
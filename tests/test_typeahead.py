@@ -0,0 +1,94 @@
+import uuid
+
+import pytest
+from sqlalchemy import event, insert
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex
+
+from app.extensions import db
+from app.models.Cycle import Author, Category
+from app.models.User import User, UserRole
+from app.models.enumerations import Role
+from app.services import typeahead_service
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    typeahead_service.invalidate()
+
+
+def _user(username, email, *, verifier=False, active=True):
+    user_id = uuid.uuid4()
+    db.session.execute(insert(User.__table__).values(
+        id=user_id, username=username, email=email, employee_id=f"E{user_id.hex[:8]}",
+        mobile=user_id.hex[:10], password_hash="x", is_active=active,
+    ))
+    if verifier:
+        db.session.execute(insert(UserRole.__table__).values(user_id=user_id, role=Role.VERIFIER.name))
+    return str(user_id)
+
+
+class TestTypeahead:
+    """Picker lookups: prefix-first ranking, compact labels and the per-worker LRU."""
+
+    def test_prefix_matches_rank_first_and_labels_are_compact(self, sqlite_app):
+        app = sqlite_app()
+        with app.app_context():
+            anand = _user("anand", "anand@example.org", verifier=True)
+            _user("dr_anandi", "da@example.org", verifier=True)
+            rajanand = _user("rajanand", "r@example.org")
+            _user("anant", "old@example.org", verifier=True, active=False)
+            db.session.commit()
+
+            items, cached = typeahead_service.typeahead("users", "  ANAN ")
+            assert not cached
+            assert items[0] == {"id": anand, "label": "anand (anand@example.org)"}
+            assert [item["label"].split(" ")[0] for item in items] == ["anand", "rajanand", "dr_anandi"]
+
+            verifiers, _ = typeahead_service.typeahead("verifiers", "anan")
+            assert rajanand not in {item["id"] for item in verifiers}
+            assert len(verifiers) == 2
+            # LIKE wildcards in the query are literal.
+            underscored, _ = typeahead_service.typeahead("users", "r_a")
+            assert [item["label"] for item in underscored] == ["dr_anandi (da@example.org)"]
+            assert typeahead_service.typeahead("users", "   ") == ([], False)
+
+    def test_results_are_cached_until_the_model_changes(self, sqlite_app):
+        app = sqlite_app()
+        with app.app_context():
+            db.session.add(Category(name="Cardiology"))
+            db.session.commit()
+            statements = []
+            event.listen(db.engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+            first, cached = typeahead_service.typeahead("categories", "card", limit=5)
+            assert [item["label"] for item in first] == ["Cardiology"] and not cached
+            again, cached = typeahead_service.typeahead("categories", "CARD", limit=5)
+            assert again == first and cached
+            assert len(statements) == 1
+
+            db.session.add(Category(name="Cardiac Surgery"))
+            db.session.commit()
+            fresh, cached = typeahead_service.typeahead("categories", "card", limit=5)
+            assert not cached
+            assert [item["label"] for item in fresh] == ["Cardiology", "Cardiac Surgery"]
+
+    def test_cache_evicts_least_recently_used(self, sqlite_app):
+        app = sqlite_app(TYPEAHEAD_CACHE_SIZE=2)
+        with app.app_context():
+            db.session.execute(insert(Author.__table__).values(id=uuid.uuid4(), name="Meera Rao", email=None))
+            db.session.commit()
+            for q in ("me", "ra", "me", "rao"):  # "ra" is the least recently used when "rao" arrives
+                typeahead_service.typeahead("authors", q)
+            assert typeahead_service.typeahead("authors", "me")[1]
+            assert not typeahead_service.typeahead("authors", "ra")[1]
+
+    def test_indexes_render_for_postgres(self):
+        indexes = {
+            index.name: str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+            for table in (User.__table__, Author.__table__)
+            for index in table.indexes
+        }
+        for column in ("username", "email", "employee_id", "mobile"):
+            assert f"USING gin ({column} gin_trgm_ops)" in indexes[f"ix_users_{column}_trgm"]
+        assert "(lower(name), lower(email))" in indexes["ix_authors_lower_name_email"]
@@ -0,0 +1,93 @@
+import uuid
+from datetime import date, timedelta
+
+from sqlalchemy import insert, select, text
+
+from app.extensions import db
+from app.models.Cycle import AbstractVerifiers, Abstracts
+from app.models.User import User, UserRole
+from app.models.enumerations import GradingFor, Role, Status
+from app.utils.model_utils import verifier_assignment_utils as va
+
+
+def _window(cycle_id, phase):
+    window_id = uuid.uuid4()
+    db.session.execute(
+        text("INSERT INTO cycle_windows VALUES (:id, :cycle, :phase, :start, :end)"),
+        {"id": window_id.hex, "cycle": cycle_id.hex, "phase": phase,
+         "start": date.today() - timedelta(days=1), "end": date.today() + timedelta(days=1)},
+    )
+    return window_id
+
+
+def _user(*roles):
+    user_id = uuid.uuid4()
+    db.session.execute(insert(User.__table__).values(
+        id=user_id, username=f"u{user_id.hex[:8]}", email=f"{user_id.hex[:8]}@example.org",
+        employee_id=user_id.hex[:10], mobile=str(user_id.int)[:10], password_hash="x",
+    ))
+    for role in roles:
+        db.session.execute(insert(UserRole.__table__).values(user_id=user_id, role=role.name))
+    return user_id
+
+
+def _abstract(cycle_id, number, review_phase=1):
+    abstract_id = uuid.uuid4()
+    db.session.execute(insert(Abstracts.__table__).values(
+        id=abstract_id, title="t", content="c", category_id=uuid.uuid4(), cycle_id=cycle_id,
+        created_by_id=uuid.uuid4(), status=Status.UNDER_REVIEW.name, review_phase=review_phase,
+        abstract_number=number,
+    ))
+    return abstract_id
+
+
+class TestVerifierAssignment:
+    """INSERT ... ON CONFLICT DO NOTHING RETURNING / DELETE ... RETURNING."""
+
+    def test_assign_reports_created_and_skipped(self, sqlite_app):
+        app = sqlite_app(cycle_windows=True)
+        with app.app_context():
+            cycle = uuid.uuid4()
+            _window(cycle, "VERIFICATION")
+            window = _window(cycle, "ABSTRACT_VERIFICATION")
+            first, second = _abstract(cycle, 1), _abstract(cycle, 2, review_phase=2)
+            v1, v2 = _user(Role.VERIFIER), _user(Role.VERIFIER)
+            db.session.execute(insert(AbstractVerifiers.__table__).values(
+                abstract_id=first, user_id=v1, review_phase=1,
+            ))
+            db.session.commit()
+
+            result = va.bulk_assign_verifiers(GradingFor.ABSTRACT, [first, second, uuid.uuid4()], [v1, v2])
+            assert result.requested == 4
+            assert sorted(result.changed) == sorted([(first, v2), (second, v1), (second, v2)])
+            assert result.skipped_count == 1
+
+            rows = db.session.execute(select(
+                AbstractVerifiers.abstract_id, AbstractVerifiers.user_id,
+                AbstractVerifiers.review_phase, AbstractVerifiers.cycle_window_id,
+            )).all()
+            by_pair = {(row[0], row[1]): row[2:] for row in rows}
+            assert by_pair[(second, v2)] == (2, window)
+            assert by_pair[(first, v1)] == (1, None)
+
+            again = va.bulk_assign_verifiers(GradingFor.ABSTRACT, [first, second], [v1, v2])
+            assert again.changed == [] and again.skipped_count == 4
+
+    def test_unassign_and_target_check(self, sqlite_app):
+        app = sqlite_app(cycle_windows=True)
+        with app.app_context():
+            cycle = uuid.uuid4()
+            first, second = _abstract(cycle, 1), _abstract(cycle, 2)
+            verifier, plain = _user(Role.VERIFIER), _user(Role.USER)
+            db.session.commit()
+
+            check = va.check_assignment_targets(GradingFor.ABSTRACT, [first, uuid.UUID(int=1)], [verifier, plain])
+            assert check.missing_submissions == [str(uuid.UUID(int=1))]
+            assert check.missing_users == []
+            assert check.non_verifiers == [str(plain)]
+
+            va.bulk_assign_verifiers(GradingFor.ABSTRACT, [first, second], [verifier])
+            result = va.bulk_unassign_verifiers(GradingFor.ABSTRACT, [first, second], [verifier, plain])
+            assert sorted(result.changed) == sorted([(first, verifier), (second, verifier)])
+            assert result.skipped_count == 2
+            assert db.session.scalars(select(AbstractVerifiers.abstract_id)).all() == []
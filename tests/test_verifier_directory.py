@@ -0,0 +1,61 @@
+import uuid
+
+from sqlalchemy import event, insert
+
+from app.extensions import db
+from app.models.Cycle import AbstractVerifiers, AwardVerifiers, user_categories
+from app.models.User import User, UserRole
+from app.models.enumerations import GradingFor, Role
+from app.services.verifier_directory_service import list_verifier_directory
+
+
+def _user(name, *roles):
+    user_id = uuid.uuid4()
+    db.session.execute(insert(User.__table__).values(
+        id=user_id, username=name, email=f"{name}@example.org",
+        employee_id=user_id.hex[:10], mobile=str(user_id.int)[:10], password_hash="x",
+    ))
+    for role in roles:
+        db.session.execute(insert(UserRole.__table__).values(user_id=user_id, role=role.name))
+    return user_id
+
+
+class TestVerifierDirectory:
+    """Counts joined as aggregates; workload sorting and filters in SQL."""
+
+    def test_counts_sorting_and_filters(self, sqlite_app):
+        app = sqlite_app()
+        with app.app_context():
+            heavy = _user("heavy", Role.VERIFIER, Role.COORDINATOR)
+            light = _user("light", Role.VERIFIER)
+            idle = _user("idle", Role.VERIFIER)
+            _user("plain", Role.USER)
+            for _ in range(3):
+                db.session.execute(insert(AbstractVerifiers.__table__).values(
+                    abstract_id=uuid.uuid4(), user_id=heavy, review_phase=1,
+                ))
+            db.session.execute(insert(AwardVerifiers.__table__).values(
+                award_id=uuid.uuid4(), user_id=heavy, review_phase=1,
+            ))
+            db.session.execute(insert(AwardVerifiers.__table__).values(
+                award_id=uuid.uuid4(), user_id=light, review_phase=1,
+            ))
+            category = uuid.uuid4()
+            db.session.execute(insert(user_categories).values(user_id=idle, category_id=category))
+            db.session.commit()
+
+            statements = []
+            event.listen(db.engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+            items, total = list_verifier_directory(sort_by="workload", sort_dir="desc")
+            assert len(statements) == 3  # count, page, roles for the whole page
+            assert total == 3
+            assert [item["username"] for item in items] == ["heavy", "light", "idle"]
+            assert (items[0]["abstracts_count"], items[0]["awards_count"], items[0]["workload"]) == (3, 1, 4)
+            assert sorted(items[0]["roles"]) == ["coordinator", "verifier"]
+
+            items, total = list_verifier_directory(has={GradingFor.ABSTRACT: False}, sort_by="username", sort_dir="asc")
+            assert [item["username"] for item in items] == ["idle", "light"]
+            items, total = list_verifier_directory(category=(GradingFor.ABSTRACT, category))
+            assert [item["username"] for item in items] == ["idle"]
+            items, total = list_verifier_directory(sort_by="workload", sort_dir="asc", page=2, page_size=2)
+            assert total == 3 and [item["username"] for item in items] == ["heavy"]